@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class StreamFrameType(str, Enum):
+    """Kinds of frames emitted by a streaming ESP32 voice turn."""
+
+    TRANSCRIPT = "transcript"
+    SENTENCE = "sentence"
+    AUDIO = "audio"
+    COMPLETE = "complete"
+
+
+@dataclass
+class ESP32StreamFrame:
+    """A single frame of a streamed voice turn sent back to an ESP32 device.
+
+    Text frames (transcript, sentence, complete) are sent to the device as
+    JSON messages; audio frames carry raw audio bytes for the sentence with
+    the same ``sequence`` number.
+
+    Attributes:
+        frame_type: The kind of frame
+        sequence: Index of the sentence this frame belongs to
+        text: Transcribed or generated text, if any
+        audio: Audio bytes for ``AUDIO`` frames
+        safe: Whether the content passed every safety check
+    """
+
+    frame_type: StreamFrameType
+    sequence: int = 0
+    text: str | None = None
+    audio: bytes = b""
+    safe: bool = True
+
+    @property
+    def is_audio(self) -> bool:
+        return self.frame_type == StreamFrameType.AUDIO
+
+    def to_message(self) -> dict[str, Any]:
+        """Returns the JSON-serializable control message for text frames."""
+        return {
+            "type": self.frame_type.value,
+            "sequence": self.sequence,
+            "text": self.text,
+            "safe": self.safe,
+        }
@@ -6,8 +6,12 @@ from src.application.interfaces.read_model_interfaces import (
     IChildProfileReadModelStore,
     create_child_profile_read_model,
 )
+from src.domain.events.child_profile_deleted import ChildProfileDeleted
 from src.domain.events.child_profile_updated import ChildProfileUpdated
 from src.domain.events.child_registered import ChildRegistered
+from src.infrastructure.read_models.child_profile_projection import (
+    ChildProfileProjection,
+)
 
 """
 Child Profile Event Handlers for AI Teddy Bear
@@ -30,8 +34,22 @@ class ChildProfileEventHandlers:
     async operations to prevent blocking the event loop.
     """
 
-    def __init__(self, read_model_store: IChildProfileReadModelStore) -> None:
+    def __init__(
+        self,
+        read_model_store: IChildProfileReadModelStore,
+        projection: ChildProfileProjection | None = None,
+    ) -> None:
         self.read_model_store = read_model_store
+        # With a projection, events only signal which profile changed; the
+        # projection replays that profile's new events from the event store,
+        # so duplicate or out-of-order deliveries cannot corrupt the read model
+        self.projection = projection
+
+    def subscribe(self, event_bus) -> None:
+        """Register the handlers for the child profile events on ``event_bus``."""
+        event_bus.subscribe(ChildRegistered, self.handle_child_registered)
+        event_bus.subscribe(ChildProfileUpdated, self.handle_child_profile_updated)
+        event_bus.subscribe(ChildProfileDeleted, self.handle_child_profile_deleted)
 
     async def handle_child_registered(self, event: ChildRegistered) -> None:
         """Handle child registration event with async database operations.
@@ -44,6 +62,9 @@ class ChildProfileEventHandlers:
         - Error handling to prevent event loop blocking
 
         """
+        if self.projection is not None:
+            await self.projection.project(event.child_id)
+            return
         try:
             child_read_model = create_child_profile_read_model(
                 child_id=event.child_id,
@@ -72,6 +93,9 @@ class ChildProfileEventHandlers:
         - Early return if no changes needed
 
         """
+        if self.projection is not None:
+            await self.projection.project(event.child_id)
+            return
         try:
             existing_model = await self._async_get_by_id(event.child_id)
             if not existing_model:
@@ -107,6 +131,23 @@ class ChildProfileEventHandlers:
             logger.error(f"Failed to handle child profile update: {e}")
             raise
 
+    async def handle_child_profile_deleted(self, event: ChildProfileDeleted) -> None:
+        """Handle child profile deletion by dropping the read model row.
+
+        Args:
+            event: ChildProfileDeleted domain event
+
+        """
+        if self.projection is not None:
+            await self.projection.project(event.child_id)
+            return
+        try:
+            await self.read_model_store.async_delete(event.child_id)
+            logger.debug("Child profile deleted from read model")
+        except Exception as e:
+            logger.error(f"Failed to handle child profile deletion: {e}")
+            raise
+
     async def _async_save(self, model: IChildProfileReadModel) -> None:
         """Async wrapper for save operation to prevent blocking.
 
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any, Protocol
 from uuid import UUID
 
@@ -15,6 +16,16 @@ class AIProvider(Protocol):
         child_preferences: ChildPreferences,
     ) -> str: ...
 
+    def stream_response(
+        self,
+        child_id: UUID,
+        conversation_history: list[str],
+        current_input: str,
+        child_preferences: ChildPreferences,
+    ) -> AsyncIterator[str]:
+        """Yields the response as incremental text deltas."""
+        ...
+
     async def analyze_sentiment(self, text: str) -> float: ...
 
     async def analyze_emotion(self, text: str) -> str: ...
@@ -32,6 +43,20 @@ class AIProvider(Protocol):
 
     async def evaluate_educational_value(self, text: str) -> dict[str, Any]: ...
 
+    async def analyze_safety(
+        self,
+        text: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Runs every safety analysis of ``text`` in one call.
+
+        Optional; providers that implement it return a structured verdict
+        with ``toxicity`` (0.0-1.0), ``emotion`` (a label),
+        ``educational_value`` (``score`` and ``topics``) and, when context
+        is given, ``context`` (``is_personal_info``, ``is_sensitive_topic``).
+        """
+        ...
+
     async def determine_activity_type(
         self,
         text: str,
@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import UUID
+
+
+@dataclass
+class ConversationTurn:
+    """One exchange between a child and the teddy."""
+
+    child_text: str
+    response_text: str
+    at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+@dataclass
+class ConversationContext:
+    """Bounded conversation context kept per child.
+
+    Attributes:
+        rolling_summary: Compact summary of the turns older than recent_turns
+        recent_turns: Latest turns, oldest first
+        pending_turns: Turns dropped from recent_turns but not summarized yet
+    """
+
+    rolling_summary: str = ""
+    recent_turns: list[ConversationTurn] = field(default_factory=list)
+    pending_turns: list[ConversationTurn] = field(default_factory=list)
+
+
+class ConversationContextStore(ABC):
+    """Abstract base class for per-child conversation context storage"""
+
+    @abstractmethod
+    async def get(self, child_id: UUID) -> ConversationContext | None:
+        """Get the conversation context of a child
+
+        Args:
+            child_id: The child whose context to read
+
+        Returns:
+            The stored context, or None if the child has none yet
+        """
+
+    @abstractmethod
+    async def save(self, child_id: UUID, context: ConversationContext) -> None:
+        """Replace the conversation context of a child
+
+        Args:
+            child_id: The child whose context to write
+            context: The new context
+        """
+
+    @abstractmethod
+    async def delete(self, child_id: UUID) -> None:
+        """Delete the conversation context of a child
+
+        Args:
+            child_id: The child whose context to delete
+        """
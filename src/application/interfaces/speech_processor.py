@@ -1,7 +1,16 @@
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 
 class SpeechProcessor(Protocol):
     async def speech_to_text(self, audio_data: bytes, language: str) -> str: ...
 
+    async def stream_speech_to_text(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: str,
+    ) -> str:
+        """Transcribes audio while it is still arriving, returning the final text."""
+        ...
+
     async def text_to_speech(self, text: str, voice_id: str) -> bytes: ...
@@ -6,6 +6,7 @@ service. It ensures that all AI interactions are child-safe, context-aware,
 and tailored to the child's preferences.
 """
 
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from src.application.dto.ai_response import AIResponse
@@ -17,17 +18,35 @@ from src.common.exceptions import (
 )
 
 from src.application.interfaces.ai_provider import AIProvider
+from src.application.interfaces.conversation_context_store import (
+    ConversationContext,
+)
 from src.application.interfaces.safety_monitor import (
     SafetyLevel,
     SafetyMonitor,
 )
 from src.application.interfaces.text_to_speech_service import TextToSpeechService
+from src.application.services.ai.context_window import (
+    ContextAssembler,
+    ContextWindowManager,
+)
+from src.application.services.ai.sentence_segmenter import (
+    SentenceSegmenter,
+    iter_sentences,
+)
 from src.application.services.core.conversation_service import ConversationService
 from src.domain.value_objects.child_preferences import ChildPreferences
 from src.infrastructure.logging_config import get_logger
 
 logger = get_logger(__name__, component="ai_orchestration")
 
+UNSAFE_INPUT_REPLY = "I can't talk about that."
+UNSAFE_OUTPUT_REPLY = "I have a better idea!"
+PROVIDER_ERROR_REPLY = (
+    "I'm sorry, I'm having trouble understanding right now. "
+    "Can we talk about something else?"
+)
+
 
 class AIOrchestrationService:
     """Orchestrates AI services for child-safe AI interactions."""
@@ -38,6 +57,8 @@ class AIOrchestrationService:
         safety_monitor: SafetyMonitor,
         conversation_service: ConversationService,
         tts_service: TextToSpeechService | None = None,
+        context_window: ContextWindowManager | None = None,
+        context_assembler: ContextAssembler | None = None,
     ):
         """Initializes the AI Orchestration Service.
 
@@ -46,12 +67,55 @@ class AIOrchestrationService:
             safety_monitor: Child safety monitoring and content filtering.
             conversation_service: Service for managing conversation history.
             tts_service: Optional text-to-speech conversion service.
+            context_window: Optional per-child recent turns and rolling
+                summary, added to the history sent to the provider.
+            context_assembler: Token budget for the history sent to the
+                provider; a default budget is used with a context window.
 
         """
         self.ai_provider = ai_provider
         self.safety_monitor = safety_monitor
         self.conversation_service = conversation_service
         self.tts_service = tts_service
+        self.context_window = context_window
+        if context_assembler is None and context_window is not None:
+            context_assembler = ContextAssembler()
+        self.context_assembler = context_assembler
+
+    def is_text_safe(self, text: str) -> bool:
+        """Returns whether ``text`` passes the child-safety text check."""
+        return self.safety_monitor.check_text_safety(text) == SafetyLevel.SAFE
+
+    async def build_context(
+        self,
+        child_id: UUID,
+        conversation_history: list[str],
+        current_input: str,
+    ) -> list[str]:
+        """Fits the child's stored context and the given history into the token budget.
+
+        Args:
+            child_id: Unique identifier for the child.
+            conversation_history: History entries from the caller, oldest first.
+            current_input: Child's current input/question.
+
+        Returns:
+            The history entries to send to the provider, oldest first.
+
+        """
+        if self.context_assembler is None:
+            return conversation_history
+        context = ConversationContext()
+        if self.context_window is not None:
+            try:
+                context = await self.context_window.get_context(child_id)
+            except Exception as e:
+                logger.warning(f"Failed to load conversation context: {e}")
+        return self.context_assembler.assemble(
+            context,
+            current_input,
+            conversation_history,
+        )
 
     async def get_ai_response(
         self,
@@ -77,9 +141,14 @@ class AIOrchestrationService:
         # 1. Input safety check
         input_safety = self.safety_monitor.check_text_safety(current_input)
         if input_safety != SafetyLevel.SAFE:
-            return AIResponse.safe_fallback("I can't talk about that.")
+            return AIResponse.safe_fallback(UNSAFE_INPUT_REPLY)
 
         # 2. Generate AI response
+        conversation_history = await self.build_context(
+            child_id,
+            conversation_history,
+            current_input,
+        )
         try:
             raw_response = await self.ai_provider.generate_response(
                 conversation_history,
@@ -92,9 +161,7 @@ class AIOrchestrationService:
             ApplicationException,
         ) as e:  # Assuming these specific exceptions from external_apis or a custom exception module
             logger.error(f"AI provider error: {e}", exc_info=True)
-            return AIResponse.safe_fallback(
-                "I'm sorry, I'm having trouble understanding right now. Can we talk about something else?",
-            )
+            return AIResponse.safe_fallback(PROVIDER_ERROR_REPLY)
         except Exception as e:
             logger.critical(
                 f"Unexpected error during AI response generation: {e}",
@@ -107,7 +174,7 @@ class AIOrchestrationService:
         # 3. Output safety check
         output_safety = self.safety_monitor.check_text_safety(raw_response)
         if output_safety != SafetyLevel.SAFE:
-            return AIResponse.safe_fallback("I have a better idea!")
+            return AIResponse.safe_fallback(UNSAFE_OUTPUT_REPLY)
 
         # 4. Generate audio if TTS service is available
         audio_content = None
@@ -135,3 +202,90 @@ class AIOrchestrationService:
             audio=audio_content,
             safety_level=output_safety,
         )
+
+    async def stream_ai_response(
+        self,
+        child_id: UUID,
+        conversation_history: list[str],
+        current_input: str,
+        child_preferences: ChildPreferences,
+        segmenter: SentenceSegmenter | None = None,
+    ) -> AsyncIterator[str]:
+        """Streams a child-safe AI response one approved sentence at a time.
+
+        The input is safety-checked before the provider is called, and every
+        sentence is safety-checked before it is yielded, so callers can send
+        each sentence to TTS as soon as it arrives. If a sentence fails the
+        check, a safe redirect is yielded instead and the stream ends; text
+        already yielded was approved on its own.
+
+        Providers without ``stream_response`` fall back to a single
+        ``generate_response`` call that is segmented the same way.
+
+        Args:
+            child_id: Unique identifier for the child.
+            conversation_history: Previous conversation context.
+            current_input: Child's current input/question.
+            child_preferences: Child's personalization settings.
+            segmenter: Optional segmenter controlling sentence sizes.
+
+        Yields:
+            Safety-approved response sentences.
+
+        """
+        if not self.is_text_safe(current_input):
+            yield UNSAFE_INPUT_REPLY
+            return
+
+        conversation_history = await self.build_context(
+            child_id,
+            conversation_history,
+            current_input,
+        )
+        deltas = self._stream_provider_deltas(
+            child_id,
+            conversation_history,
+            current_input,
+            child_preferences,
+        )
+        try:
+            async for sentence in iter_sentences(deltas, segmenter):
+                if not self.is_text_safe(sentence):
+                    logger.warning(
+                        f"Blocked unsafe streamed sentence for child {child_id}",
+                    )
+                    yield UNSAFE_OUTPUT_REPLY
+                    return
+                yield sentence
+        except (ServiceUnavailableError, TimeoutError, ApplicationException) as e:
+            logger.error(f"AI provider streaming error: {e}", exc_info=True)
+            yield PROVIDER_ERROR_REPLY
+        finally:
+            await deltas.aclose()
+
+    async def _stream_provider_deltas(
+        self,
+        child_id: UUID,
+        conversation_history: list[str],
+        current_input: str,
+        child_preferences: ChildPreferences,
+    ) -> AsyncIterator[str]:
+        stream_response = getattr(self.ai_provider, "stream_response", None)
+        # Providers that subclass the protocol inherit its non-streaming stub
+        inherited_stub = (
+            getattr(stream_response, "__func__", None) is AIProvider.stream_response
+        )
+        if stream_response is None or inherited_stub:
+            yield await self.ai_provider.generate_response(
+                conversation_history,
+                current_input,
+                child_preferences,
+            )
+            return
+        async for delta in stream_response(
+            child_id,
+            conversation_history,
+            current_input,
+            child_preferences,
+        ):
+            yield delta
@@ -0,0 +1,235 @@
+"""Bounded conversation context for AI turns.
+
+The prompt of a turn should not grow with the number of conversations a
+child has had. Each child's context is a small ring of recent turns plus a
+compact rolling summary of everything older, stored together so a turn
+reads it in one lookup. The assembler then fits that context into a token
+budget for the provider call.
+"""
+
+import asyncio
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
+from uuid import UUID
+
+from src.application.interfaces.conversation_context_store import (
+    ConversationContext,
+    ConversationContextStore,
+    ConversationTurn,
+)
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="ai_orchestration")
+
+# Folds turns into a summary: (previous summary, turns) -> new summary
+Summarizer = Callable[[str, list[ConversationTurn]], Awaitable[str]]
+TokenCounter = Callable[[str], int]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count; LLM tokenizers average about four characters per token."""
+    return -(-len(text) // 4)
+
+
+def format_turn(turn: ConversationTurn) -> str:
+    """Renders a turn as one conversation history entry."""
+    return f"Child: {turn.child_text}\nTeddy: {turn.response_text}"
+
+
+class ExtractiveSummarizer:
+    """Summarizer that needs no model call.
+
+    Keeps the beginning of each side of every turn and drops the oldest
+    text once the summary is longer than ``max_chars``.
+    """
+
+    SEPARATOR = " | "
+
+    def __init__(self, max_chars: int = 1200, turn_chars: int = 80) -> None:
+        self.max_chars = max_chars
+        self.turn_chars = turn_chars
+
+    async def __call__(self, summary: str, turns: list[ConversationTurn]) -> str:
+        parts = [summary] if summary else []
+        parts.extend(
+            f"{turn.child_text[: self.turn_chars]} / {turn.response_text[: self.turn_chars]}"
+            for turn in turns
+        )
+        combined = self.SEPARATOR.join(parts)
+        if len(combined) <= self.max_chars:
+            return combined
+        combined = combined[-self.max_chars :]
+        # Start at a turn boundary rather than in the middle of one
+        boundary = combined.find(self.SEPARATOR)
+        return combined[boundary + len(self.SEPARATOR) :] if boundary >= 0 else combined
+
+
+class InMemoryConversationContextStore(ConversationContextStore):
+    """Conversation contexts kept in process memory."""
+
+    def __init__(self) -> None:
+        self._contexts: dict[UUID, ConversationContext] = {}
+
+    async def get(self, child_id: UUID) -> ConversationContext | None:
+        return self._contexts.get(child_id)
+
+    async def save(self, child_id: UUID, context: ConversationContext) -> None:
+        self._contexts[child_id] = context
+
+    async def delete(self, child_id: UUID) -> None:
+        self._contexts.pop(child_id, None)
+
+
+class ContextWindowManager:
+    """Maintains each child's recent-turn ring and rolling summary.
+
+    Turns pushed out of the ring are collected and folded into the summary
+    every ``summarize_every`` turns, so the summarizer, possibly a model
+    call, runs once per batch rather than on every turn.
+    """
+
+    def __init__(
+        self,
+        store: ConversationContextStore,
+        max_recent_turns: int = 8,
+        summarize_every: int = 8,
+        summarizer: Summarizer | None = None,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            store: Where contexts are persisted
+            max_recent_turns: Size of the recent-turns ring
+            summarize_every: Dropped turns collected before the summary is refreshed
+            summarizer: Folds turns into the summary; extractive by default
+        """
+        if max_recent_turns < 1 or summarize_every < 1:
+            raise ValueError("max_recent_turns and summarize_every must be positive")
+        self.store = store
+        self.max_recent_turns = max_recent_turns
+        self.summarize_every = summarize_every
+        self.summarizer = summarizer or ExtractiveSummarizer()
+        self._locks: weakref.WeakValueDictionary[UUID, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def get_context(self, child_id: UUID) -> ConversationContext:
+        """Context of a child; empty if the child has none yet."""
+        return await self.store.get(child_id) or ConversationContext()
+
+    async def record_turn(
+        self,
+        child_id: UUID,
+        child_text: str,
+        response_text: str,
+    ) -> ConversationContext:
+        """Adds a turn to the ring, refreshing the summary when a batch is due."""
+        lock = self._locks.get(child_id)
+        if lock is None:
+            lock = self._locks[child_id] = asyncio.Lock()
+        async with lock:
+            context = await self.get_context(child_id)
+            context.recent_turns.append(ConversationTurn(child_text, response_text))
+            overflow = len(context.recent_turns) - self.max_recent_turns
+            if overflow > 0:
+                context.pending_turns.extend(context.recent_turns[:overflow])
+                del context.recent_turns[:overflow]
+            if len(context.pending_turns) >= self.summarize_every:
+                await self._refresh_summary(child_id, context)
+            await self.store.save(child_id, context)
+            return context
+
+    async def forget(self, child_id: UUID) -> None:
+        """Deletes the context of a child."""
+        await self.store.delete(child_id)
+
+    async def _refresh_summary(self, child_id: UUID, context: ConversationContext) -> None:
+        try:
+            context.rolling_summary = await self.summarizer(
+                context.rolling_summary,
+                context.pending_turns,
+            )
+            context.pending_turns = []
+        except Exception as e:
+            logger.warning(f"Failed to refresh conversation summary for child {child_id}: {e}")
+            # Retry with the next turn, but keep the context bounded meanwhile
+            del context.pending_turns[: -self.summarize_every * 4]
+
+
+class ContextAssembler:
+    """Fits a child's context into the token budget of one provider call.
+
+    Up to ``summary_share`` of the budget goes to the rolling summary, since
+    it is the only trace of older conversations. The rest is filled with
+    turns, newest first, and then with any extra history entries. Entries
+    are returned oldest first, as providers expect.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 1024,
+        summary_share: float = 0.25,
+        count_tokens: TokenCounter = estimate_tokens,
+    ) -> None:
+        self.token_budget = token_budget
+        self.summary_share = summary_share
+        self.count_tokens = count_tokens
+
+    def assemble(
+        self,
+        context: ConversationContext,
+        current_input: str = "",
+        history: Sequence[str] = (),
+    ) -> list[str]:
+        """Conversation history entries for the provider, within the budget.
+
+        Args:
+            context: The child's stored context
+            current_input: The child's input, whose tokens count against the budget
+            history: Extra history entries, oldest first, used if room is left
+
+        Returns:
+            History entries, oldest first
+        """
+        remaining = self.token_budget - self.count_tokens(current_input)
+
+        summary = ""
+        if context.rolling_summary:
+            prefix = "Earlier conversations: "
+            rolling_summary = self._truncate(
+                context.rolling_summary,
+                int(remaining * self.summary_share) - self.count_tokens(prefix),
+            )
+            if rolling_summary:
+                summary = prefix + rolling_summary
+                remaining -= self.count_tokens(summary)
+
+        turns = self._newest_within(
+            [format_turn(turn) for turn in [*context.pending_turns, *context.recent_turns]],
+            remaining,
+        )
+        remaining -= sum(self.count_tokens(turn) for turn in turns)
+        extra = self._newest_within(list(history), remaining)
+
+        return ([summary] if summary else []) + extra + turns
+
+    def _newest_within(self, entries: list[str], budget: int) -> list[str]:
+        """The newest entries whose total fits the budget, oldest first."""
+        selected: list[str] = []
+        for entry in reversed(entries):
+            cost = self.count_tokens(entry)
+            if cost > budget:
+                break
+            budget -= cost
+            selected.append(entry)
+        selected.reverse()
+        return selected
+
+    def _truncate(self, text: str, budget: int) -> str:
+        """Drops the oldest part of ``text`` until it fits the budget."""
+        if budget <= 0:
+            return ""
+        while text and self.count_tokens(text) > budget:
+            excess = self.count_tokens(text) - budget
+            text = text[max(excess * 4, 1) :]
+        return text
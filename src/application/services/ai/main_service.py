@@ -1,8 +1,16 @@
+import json
 import logging
 from datetime import datetime
 from typing import Any
 
 from src.application.dto.ai_response import AIResponse
+from src.infrastructure.caching.ai_response_cache import (
+    ai_response_cache_key,
+    depersonalize,
+    get_ai_response_cache,
+    personalize,
+)
+from src.infrastructure.caching.tiered_cache import TieredCache
 from .utils import AIServiceUtils
 
 try:
@@ -21,6 +29,11 @@ Enterprise-grade AI service for child-safe interactions following hexagonal arch
 logger = logging.getLogger(__name__)
 
 
+def _json_escape(text: str) -> str:
+    """Escape text the way it appears inside a JSON string."""
+    return json.dumps(text)[1:-1]
+
+
 class AITeddyBearService:
     """Production-grade AI service for child-safe interactions.
     Features:
@@ -32,11 +45,19 @@ class AITeddyBearService:
     - Comprehensive error handling.
     """
 
-    def __init__(self, openai_api_key: str, redis_cache=None, settings=None) -> None:
+    def __init__(
+        self,
+        openai_api_key: str,
+        redis_cache=None,
+        settings=None,
+        response_cache: TieredCache | None = None,
+    ) -> None:
         if not openai_api_key:
             raise ValueError("OpenAI API key is required for production use")
         self.client = AsyncOpenAI(api_key=openai_api_key)
         self.redis_cache = redis_cache
+        # Shared L1/L2 cache keyed on the prompt and age band, not the child
+        self.response_cache = response_cache or get_ai_response_cache(redis_cache)
         self.settings = settings
         # AI model configuration
         self.model = "gpt-4-turbo-preview"
@@ -64,7 +85,12 @@ class AITeddyBearService:
         context: list[dict[str, str]] | None = None,
         parent_guidelines: str | None = None,
     ) -> AIResponse:
-        """Generate safe, age-appropriate AI response."""
+        """Generate safe, age-appropriate AI response.
+
+        Identical concurrent requests (same normalized prompt, age band and
+        safety profile) share one moderation call and one completion; see
+        ``response_cache.metrics.coalesced`` for the calls saved.
+        """
         start_time = datetime.utcnow()
         # Input validation
         if child_age > 13:
@@ -73,67 +99,102 @@ class AITeddyBearService:
             )
         if not message or not message.strip():
             raise ValueError("Message cannot be empty")
-        # Check cache first
-        cache_key = self._generate_cache_key(message, child_age, child_name)
-        if self.redis_cache:
-            cached_response = await self._get_cached_response(cache_key)
-            if cached_response:
-                cached_response.cached = True
-                return cached_response
+        cache_key = self._generate_cache_key(
+            message,
+            child_age,
+            parent_guidelines,
+            context,
+        )
+        generated: list[AIResponse] = []
 
-        try:
-            # Content moderation check
-            moderation_result = await self._moderate_content(message)
-            if not moderation_result["safe"]:
-                raise ValueError(
-                    f"Content flagged by moderation: "
-                    f"{moderation_result['categories']}",
-                )
-            # Generate age-appropriate system prompt
-            system_prompt = self._create_system_prompt(
+        async def _generate() -> str | None:
+            response = await self._generate_uncached(
+                message,
                 child_age,
                 child_name,
+                context,
                 parent_guidelines,
+                start_time,
             )
-            # Prepare conversation messages
-            messages = [{"role": "system", "content": system_prompt}]
-            # Add context if provided
-            if context:
-                for ctx in context[-5:]:  # Last 5 messages for context
-                    messages.append(ctx)
-            messages.append({"role": "user", "content": message})
-            # Call OpenAI API
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                presence_penalty=0.6,
-                frequency_penalty=0.5,
-            )
-            ai_content = response.choices[0].message.content
-            # Post-process and validate response
-            processed_response = await self._post_process_response(
-                ai_content,
-                child_age,
-                moderation_result,
-            )
-            # Calculate processing time
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
-            processed_response.processing_time = processing_time
-            # Cache the response
-            if self.redis_cache:
-                await self._cache_response(cache_key, processed_response)
-            logger.info(
-                "AI response generated for child age %s, processing time: %.3fs",
-                child_age,
-                processing_time,
-            )
-            return processed_response
+            generated.append(response)
+            if response.moderation_flags:
+                return None
+            return depersonalize(response.model_dump_json(), _json_escape(child_name))
+
+        try:
+            payload = await self.response_cache.get_or_load(cache_key, _generate)
         except Exception as e:
             logger.error(f"AI service error: {e}")
             # Return safe fallback response
             return await self._get_fallback_response(child_name, child_age)
+        if generated:
+            return generated[0]
+        if payload is None:
+            # Another request generated a response that must not be shared.
+            return await self._get_fallback_response(child_name, child_age)
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+        cached_response = AIResponse.model_validate_json(
+            personalize(payload, _json_escape(child_name)),
+        )
+        cached_response.cached = True
+        return cached_response
+
+    async def _generate_uncached(
+        self,
+        message: str,
+        child_age: int,
+        child_name: str,
+        context: list[dict[str, str]] | None,
+        parent_guidelines: str | None,
+        start_time: datetime,
+    ) -> AIResponse:
+        """Moderate the message and generate a fresh response from the model."""
+        # Content moderation check
+        moderation_result = await self._moderate_content(message)
+        if not moderation_result["safe"]:
+            raise ValueError(
+                f"Content flagged by moderation: "
+                f"{moderation_result['categories']}",
+            )
+        # Generate age-appropriate system prompt
+        system_prompt = self._create_system_prompt(
+            child_age,
+            child_name,
+            parent_guidelines,
+        )
+        # Prepare conversation messages
+        messages = [{"role": "system", "content": system_prompt}]
+        # Add context if provided
+        if context:
+            for ctx in context[-5:]:  # Last 5 messages for context
+                messages.append(ctx)
+        messages.append({"role": "user", "content": message})
+        # Call OpenAI API
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            presence_penalty=0.6,
+            frequency_penalty=0.5,
+        )
+        ai_content = response.choices[0].message.content
+        # Post-process and validate response
+        processed_response = await self._post_process_response(
+            ai_content,
+            child_age,
+            moderation_result,
+        )
+        # Calculate processing time
+        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        processed_response.processing_time = processing_time
+        logger.info(
+            "AI response generated for child age %s, processing time: %.3fs",
+            child_age,
+            processing_time,
+        )
+        return processed_response
 
     async def _moderate_content(self, content: str) -> dict[str, Any]:
         """Use OpenAI moderation API to check content safety."""
@@ -244,33 +305,20 @@ class AITeddyBearService:
         """Get age group classification."""
         return AIServiceUtils.get_age_group(age)
 
-    def _generate_cache_key(self, message: str, age: int, name: str) -> str:
-        """Generate cache key for response."""
-        return AIServiceUtils.generate_cache_key(message, age, name)
-
-    async def _get_cached_response(self, cache_key: str) -> AIResponse | None:
-        """Get cached response if available."""
-        try:
-            if self.redis_cache:
-                cached_data = await self.redis_cache.get(cache_key)
-                if cached_data:
-                    return AIResponse.model_validate_json(cached_data)
-        except Exception as e:
-            logger.warning(f"Cache retrieval error: {e}")
-        return None
-
-    async def _cache_response(self, cache_key: str, response: AIResponse) -> None:
-        """Cache the response for future use."""
-        try:
-            if self.redis_cache:
-                # Cache for 1 hour
-                await self.redis_cache.setex(
-                    cache_key,
-                    3600,
-                    response.model_dump_json(),
-                )
-        except Exception as e:
-            logger.warning(f"Cache storage error: {e}")
+    def _generate_cache_key(
+        self,
+        message: str,
+        age: int,
+        parent_guidelines: str | None = None,
+        context: list[dict[str, str]] | None = None,
+    ) -> str:
+        """Generate the name-independent cache key for a response."""
+        return ai_response_cache_key(
+            message,
+            self._get_age_group(age),
+            safety_profile=parent_guidelines or "",
+            context=context[-5:] if context else None,
+        )
 
     async def _get_fallback_response(
         self,
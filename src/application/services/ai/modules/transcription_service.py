@@ -1,12 +1,13 @@
 import asyncio
 import logging
 import os
-import re
 import tempfile
 import time
 from datetime import datetime
 from typing import Any
 
+from src.domain.safety.pattern_matcher import Lexicon, PatternHit, SafetyPatternMatcher
+
 """Production - grade audio transcription service with child safety filtering"""
 
 logger = logging.getLogger(__name__)
@@ -49,10 +50,13 @@ class TranscriptionService:
         # Child safety patterns to filter out
         self.unsafe_patterns = [
             r"\b(?:password|secret|address|phone)\b",
-            r"\b(?:meet\\s+me|where\\s+do\\s+you\\s+live)\b",
-            r"\b(?:send\\s+photo|personal\\s+information)\b",
-            r"\b(?:credit\\s+card|bank\\s+account)\b",
+            r"\b(?:meet\s+me|where\s+do\s+you\s+live)\b",
+            r"\b(?:send\s+photo|personal\s+information)\b",
+            r"\b(?:credit\s+card|bank\s+account)\b",
         ]
+        self._unsafe_matcher = SafetyPatternMatcher(
+            [Lexicon("unsafe", tuple(self.unsafe_patterns), regex=True, whole_words=False)],
+        )
 
     def _initialize_engines(self):
         """Initialize available transcription engines."""
@@ -269,13 +273,19 @@ class TranscriptionService:
         warnings = []
         if not self.content_filter_enabled:
             return {"text": text, "safe": True, "warnings": warnings}
-        # Check for unsafe patterns
-        for pattern in self.unsafe_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                warnings.append(f"Potentially unsafe content detected: {pattern}")
-                # Replace with safe alternative
-                text = re.sub(pattern, "[FILTERED]", text, flags=re.IGNORECASE)
+        # Check for unsafe patterns and replace them in a single pass
+        matched_patterns: list[str] = []
+
+        def _filter(hit: PatternHit) -> str:
+            if hit.term not in matched_patterns:
+                matched_patterns.append(hit.term)
+            return "[FILTERED]"
+
+        text = self._unsafe_matcher.sub(text, _filter)
+        warnings.extend(
+            f"Potentially unsafe content detected: {pattern}"
+            for pattern in matched_patterns
+        )
         # Additional safety checks
         if len(text.strip()) == 0:
             return {"text": "", "safe": True, "warnings": warnings}
@@ -0,0 +1,118 @@
+"""Incremental sentence segmentation for streamed AI responses.
+
+LLM providers emit responses as a stream of small text deltas. The voice
+pipeline wants whole sentences: each sentence is safety-checked and sent to
+text-to-speech on its own, so the device can start speaking after the first
+sentence instead of after the whole response.
+"""
+
+from collections.abc import AsyncIterator
+
+# Terminal punctuation for the languages supported by the teddy (English,
+# Arabic and a few CJK marks that occasionally appear in stories).
+SENTENCE_TERMINATORS = frozenset(".!?؟。！？\n")
+# Characters that may trail a terminator and still belong to the sentence.
+CLOSING_CHARACTERS = frozenset("\"')]”’»")
+# Soft break points used when a sentence grows past ``max_length``.
+SOFT_BREAKS = (", ", "; ", ": ", "، ", " ")
+
+
+class SentenceSegmenter:
+    """Accumulates streamed text and emits complete sentences.
+
+    A terminator only ends a sentence once the next character is known to be
+    whitespace, so decimals such as ``3.5`` and abbreviations glued to the
+    following token are not split. Sentences shorter than ``min_length`` are
+    merged with the next one to avoid many tiny TTS requests, and text that
+    runs past ``max_length`` without a terminator is broken at the last soft
+    break so time-to-first-audio stays bounded.
+    """
+
+    def __init__(self, min_length: int = 1, max_length: int = 240) -> None:
+        if min_length < 1:
+            raise ValueError("min_length must be at least 1")
+        if max_length <= min_length:
+            raise ValueError("max_length must be greater than min_length")
+        self.min_length = min_length
+        self.max_length = max_length
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        """Adds a text delta and returns the sentences it completed."""
+        if not text:
+            return []
+        self._buffer += text
+        sentences: list[str] = []
+        while True:
+            boundary = self._find_boundary()
+            if boundary is None:
+                break
+            candidate = self._buffer[:boundary].strip()
+            if len(candidate) < self.min_length:
+                # Too short on its own; wait for more text after it.
+                next_boundary = self._find_boundary(start=boundary)
+                if next_boundary is None:
+                    break
+                boundary = next_boundary
+                candidate = self._buffer[:boundary].strip()
+            self._buffer = self._buffer[boundary:].lstrip()
+            if candidate:
+                sentences.append(candidate)
+        if len(self._buffer) > self.max_length:
+            forced = self._force_split()
+            if forced:
+                sentences.append(forced)
+        return sentences
+
+    def flush(self) -> str | None:
+        """Returns whatever text is left once the stream has ended."""
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return remainder or None
+
+    def _find_boundary(self, start: int = 0) -> int | None:
+        buffer = self._buffer
+        index = start
+        while index < len(buffer):
+            if buffer[index] in SENTENCE_TERMINATORS:
+                end = index + 1
+                while end < len(buffer) and (
+                    buffer[end] in SENTENCE_TERMINATORS
+                    or buffer[end] in CLOSING_CHARACTERS
+                ):
+                    end += 1
+                if buffer[index] == "\n":
+                    return end
+                if end < len(buffer) and buffer[end].isspace():
+                    return end
+                index = end
+                continue
+            index += 1
+        return None
+
+    def _force_split(self) -> str | None:
+        window = self._buffer[: self.max_length]
+        for separator in SOFT_BREAKS:
+            position = window.rfind(separator)
+            if position >= self.min_length:
+                split_at = position + len(separator)
+                head = self._buffer[:split_at].strip()
+                self._buffer = self._buffer[split_at:]
+                return head or None
+        head = window.strip()
+        self._buffer = self._buffer[self.max_length :]
+        return head or None
+
+
+async def iter_sentences(
+    deltas: AsyncIterator[str],
+    segmenter: SentenceSegmenter | None = None,
+) -> AsyncIterator[str]:
+    """Groups an async stream of text deltas into complete sentences."""
+    segmenter = segmenter or SentenceSegmenter()
+    async for delta in deltas:
+        for sentence in segmenter.feed(delta):
+            yield sentence
+    remainder = segmenter.flush()
+    if remainder:
+        yield remainder
@@ -1,3 +1,21 @@
+from functools import lru_cache
+
+from src.domain.safety.pattern_matcher import Lexicon, SafetyPatternMatcher
+
+_POSITIVE_WORDS = ("fun", "learn", "play", "happy", "friend", "adventure")
+_POSITIVE_MATCHER = SafetyPatternMatcher(
+    [Lexicon("positive", _POSITIVE_WORDS, inflections=True)],
+)
+_YOUNG_CHILD_MATCHER = SafetyPatternMatcher(
+    [Lexicon("restricted", ("kill", "death", "scary"), whole_words=False)],
+)
+
+
+@lru_cache(maxsize=32)
+def _banned_topics_matcher(banned_topics: tuple[str, ...]) -> SafetyPatternMatcher:
+    return SafetyPatternMatcher([Lexicon("banned", banned_topics, whole_words=False)])
+
+
 class AIServiceUtils:
     """Utility class providing helper methods for AI service."""
 
@@ -15,23 +33,11 @@ class AIServiceUtils:
         score = 0.9
 
         # Check for banned topics
-        content_lower = content.lower()
-        for topic in banned_topics:
-            if topic in content_lower:
-                score -= 0.2
+        matcher = _banned_topics_matcher(tuple(banned_topics))
+        score -= 0.2 * len(matcher.categories(content).get("banned", []))
 
         # Positive content indicators
-        positive_words = [
-            "fun",
-            "learn",
-            "play",
-            "happy",
-            "friend",
-            "adventure",
-        ]
-        for word in positive_words:
-            if word in content_lower:
-                score += 0.02
+        score += 0.02 * len(_POSITIVE_MATCHER.categories(content).get("positive", []))
 
         return max(0.0, min(1.0, score))
 
@@ -40,10 +46,8 @@ class AIServiceUtils:
         """Simple age appropriateness check."""
         if age < 5:
             # For very young children, restrict complex words
-            restricted_words = ["kill", "death", "scary"]
-            for word in restricted_words:
-                if word in content.lower():
-                    return False
+            if _YOUNG_CHILD_MATCHER.search(content):
+                return False
         return True
 
     @staticmethod
@@ -88,10 +92,3 @@ class AIServiceUtils:
         if age <= 13:
             return "preteen"
         return "adult"
-
-    @staticmethod
-    def generate_cache_key(message: str, age: int, name: str) -> str:
-        """Generate cache key for AI response caching."""
-        safe_name = name.lower().replace(" ", "_")
-        safe_message = message.lower().replace(" ", "_")[:30]
-        return f"ai_response:{safe_name}:{age}:{safe_message}"
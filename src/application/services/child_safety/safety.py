@@ -5,8 +5,15 @@ content detection, toxicity analysis, emotional impact assessment, and
 educational value evaluation. It is dependent on an `AIProvider` for core
 AI analysis capabilities and integrates with `PerformanceMonitor` for metrics.
 It ensures that all AI responses and user inputs adhere to strict child safety guidelines and COPPA compliance.
+
+The AI-backed analyzers run concurrently under one shared deadline. In
+short-circuit mode the remaining analyzers are cancelled as soon as one of
+them returns a blocking verdict, and providers that implement
+``analyze_safety`` can answer every analysis in a single batched call.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from src.application.interfaces.ai_provider import AIProvider
@@ -21,6 +28,7 @@ from src.domain.models.safety_models import (
     SafetyConfig,
     ToxicityResult,
 )
+from src.domain.safety.pattern_matcher import Lexicon, SafetyPatternMatcher
 from src.infrastructure.logging_config import get_logger
 from src.infrastructure.monitoring.performance_monitor import (
     PerformanceMonitor,
@@ -28,6 +36,19 @@ from src.infrastructure.monitoring.performance_monitor import (
 
 logger = get_logger(__name__, component="services")
 
+_RISK_ORDER = list(RiskLevel)
+
+# Analyzers whose verdict decides whether content is safe. If one of them
+# does not finish before the deadline the content is blocked (fail closed);
+# the others are informational and are only recorded as timed out.
+SAFETY_CRITICAL_ANALYZERS = frozenset({"toxicity", "context"})
+
+
+def _raise_risk(result: SafetyAnalysisResult, level: RiskLevel) -> None:
+    """Raises the overall risk level of ``result`` to at least ``level``."""
+    if _RISK_ORDER.index(level) > _RISK_ORDER.index(result.overall_risk_level):
+        result.overall_risk_level = level
+
 
 class SafetyService:
     """Service for advanced content filtering and safety analysis."""
@@ -37,6 +58,9 @@ class SafetyService:
         config: SafetyConfig,
         ai_provider: AIProvider,
         performance_monitor: PerformanceMonitor,
+        deadline_seconds: float | None = None,
+        short_circuit: bool = True,
+        batched: bool = False,
     ) -> None:
         """Initializes the safety service.
 
@@ -44,11 +68,32 @@ class SafetyService:
             config: Safety configuration with filtering rules and thresholds.
             ai_provider: AI provider for advanced content analysis (toxicity, emotion, etc.).
             performance_monitor: Centralized monitor for collecting metrics.
+            deadline_seconds: Shared deadline for all AI-backed analyzers;
+                defaults to ``config.external_api_timeout``.
+            short_circuit: Cancel the remaining analyzers once one of them
+                returns a blocking verdict.
+            batched: Use a single ``analyze_safety`` provider call when the
+                provider supports it.
 
         """
         self.config = config
         self.ai_provider = ai_provider
         self.performance_monitor = performance_monitor
+        self.deadline_seconds = deadline_seconds or config.external_api_timeout
+        self.short_circuit = short_circuit
+        self.batched = batched
+        self.logger = logger
+        # Blacklisted keywords match anywhere, including inside longer words
+        # ("kill" in "killer"), so the compiled matcher keeps recall
+        self.keyword_matcher = SafetyPatternMatcher(
+            [
+                Lexicon(
+                    "blacklist",
+                    tuple(config.keyword_blacklist),
+                    whole_words=False,
+                ),
+            ],
+        )
         # self.metrics dictionary removed as metrics are now handled by
         # PerformanceMonitor.
 
@@ -69,26 +114,21 @@ class SafetyService:
                 logger.error("Invalid SafetyAnalysisResult object provided")
                 raise ValueError("Valid SafetyAnalysisResult required for analysis")
 
-            harmful_keywords = self.config.keyword_blacklist
-            content_lower = content.lower()
-            detected_keywords = [
-                keyword for keyword in harmful_keywords if keyword in content_lower
-            ]
+            detected_keywords = self.keyword_matcher.categories(content).get(
+                "blacklist", [],
+            )
 
             if detected_keywords:
                 result.is_safe = False
-                result.risk_level = RiskLevel.HIGH
-                result.content_category = ContentCategory.HARMFUL_CONTENT
-                result.modifications.append(
+                _raise_risk(result, RiskLevel.HIGH)
+                result.content_category = ContentCategory.INAPPROPRIATE
+                result.required_modifications.append(
                     ContentModification(
-                        type="redaction",
-                        description=f"Detected harmful keywords: {detected_keywords}",
+                        modification_type="redaction",
+                        reason=f"Detected harmful keywords: {detected_keywords}",
                     ),
                 )
                 logger.warning(f"Harmful content detected: {detected_keywords}")
-            else:
-                result.is_safe = True
-                result.risk_level = RiskLevel.NONE
 
         except (
             ValueError,
@@ -98,27 +138,17 @@ class SafetyService:
                 f"Validation or type error during harmful content analysis: {e}",
                 exc_info=True,
             )
+            if not isinstance(result, SafetyAnalysisResult):
+                raise
+            self._record_error(result, f"Input/type validation error: {e!s}")
             result.is_safe = False
-            result.risk_level = RiskLevel.CRITICAL
-            result.modifications.append(
-                ContentModification(
-                    type="error",
-                    description=f"Input/type validation error: {e!s}",
-                ),
-            )
         except Exception as e:  # Catching any other unexpected errors
             logger.critical(
                 f"Unexpected critical error during harmful content analysis: {e}",
                 exc_info=True,
             )
+            self._record_error(result, f"Unexpected analysis error: {e!s}")
             result.is_safe = False
-            result.risk_level = RiskLevel.CRITICAL
-            result.modifications.append(
-                ContentModification(
-                    type="error",
-                    description=f"Unexpected analysis error: {e!s}",
-                ),
-            )
 
     async def _analyze_toxicity(self, content: str, result: SafetyAnalysisResult):
         """Analyzes content for toxicity levels using the AI provider.
@@ -130,28 +160,30 @@ class SafetyService:
         """
         try:
             toxicity_score = await self.ai_provider.analyze_toxicity(content)
-            result.toxicity_result = ToxicityResult(score=toxicity_score)
-            if toxicity_score > self.config.toxicity_threshold:
-                result.is_safe = False
-                result.risk_level = max(result.risk_level, RiskLevel.MEDIUM)
-                result.content_category = ContentCategory.TOXIC_CONTENT
-                result.modifications.append(
-                    ContentModification(
-                        type="flag",
-                        description=f"Toxicity score: {toxicity_score}",
-                    ),
-                )
-                self.logger.warning(f"Toxicity detected: score={toxicity_score}")
+            self._apply_toxicity(float(toxicity_score), result)
         except Exception as e:
             self.logger.error(f"Error during toxicity analysis: {e}", exc_info=True)
+            self._record_error(result, f"Toxicity analysis error: {e!s}")
+            result.is_safe = False
+
+    def _apply_toxicity(self, toxicity_score: float, result: SafetyAnalysisResult):
+        is_toxic = toxicity_score > self.config.toxicity_threshold
+        result.toxicity_result = ToxicityResult(
+            score=toxicity_score,
+            is_toxic=is_toxic,
+            threshold=self.config.toxicity_threshold,
+        )
+        if is_toxic:
             result.is_safe = False
-            result.risk_level = RiskLevel.CRITICAL
-            result.modifications.append(
+            _raise_risk(result, RiskLevel.MEDIUM)
+            result.content_category = ContentCategory.INAPPROPRIATE
+            result.required_modifications.append(
                 ContentModification(
-                    type="error",
-                    description=f"Toxicity analysis error: {e!s}",
+                    modification_type="flag",
+                    reason=f"Toxicity score: {toxicity_score}",
                 ),
             )
+            self.logger.warning(f"Toxicity detected: score={toxicity_score}")
 
     async def _analyze_emotional_impact(
         self,
@@ -167,30 +199,27 @@ class SafetyService:
         """
         try:
             sentiment_label = await self.ai_provider.analyze_emotion(content)
-            # Assuming AIProvider.analyze_emotion provides a simple label.
-            # In a real scenario, this might return a more detailed object
-            # including scores.
-            emotional_impact = EmotionalImpact(
-                sentiment=sentiment_label,
-                emotions={},
-            )  # Populate emotions based on real API response
-            result.emotional_impact = emotional_impact
-            self.logger.debug(f"Emotional impact analysis complete: {sentiment_label}")
+            self._apply_emotional_impact(str(sentiment_label), result)
         except Exception as e:
             self.logger.error(
                 f"Error during emotional impact analysis: {e}",
                 exc_info=True,
             )
             result.emotional_impact = EmotionalImpact(
-                sentiment="error",
+                sentiment_label="error",
             )  # Indicate error state
-            result.risk_level = max(result.risk_level, RiskLevel.CRITICAL)
-            result.modifications.append(
-                ContentModification(
-                    type="error",
-                    description=f"Emotional analysis error: {e!s}",
-                ),
-            )
+            self._record_error(result, f"Emotional analysis error: {e!s}")
+
+    def _apply_emotional_impact(
+        self,
+        sentiment_label: str,
+        result: SafetyAnalysisResult,
+    ):
+        # Assuming AIProvider.analyze_emotion provides a simple label.
+        # In a real scenario, this might return a more detailed object
+        # including scores.
+        result.emotional_impact = EmotionalImpact(sentiment_label=sentiment_label)
+        self.logger.debug(f"Emotional impact analysis complete: {sentiment_label}")
 
     async def _analyze_educational_value(
         self,
@@ -208,29 +237,29 @@ class SafetyService:
             educational_value_data = await self.ai_provider.evaluate_educational_value(
                 content,
             )
-            educational_value = EducationalValue(
-                score=educational_value_data.get("score", 0.0),
-                topics=educational_value_data.get("topics", []),
-            )  # Populate other fields if available from API
-            result.educational_value = educational_value
-            self.logger.debug(
-                f"Educational value analysis complete: {educational_value}",
-            )
+            self._apply_educational_value(educational_value_data, result)
         except Exception as e:
             self.logger.error(
                 f"Error during educational value assessment: {e}",
                 exc_info=True,
             )
             result.educational_value = EducationalValue(
-                score=0.0,
+                educational_score=0.0,
             )  # Indicate error state
-            result.risk_level = max(result.risk_level, RiskLevel.CRITICAL)
-            result.modifications.append(
-                ContentModification(
-                    type="error",
-                    description=f"Educational value analysis error: {e!s}",
-                ),
-            )
+            self._record_error(result, f"Educational value analysis error: {e!s}")
+
+    def _apply_educational_value(
+        self,
+        educational_value_data: dict[str, Any],
+        result: SafetyAnalysisResult,
+    ):
+        result.educational_value = EducationalValue(
+            educational_score=educational_value_data.get("score", 0.0),
+            topics=educational_value_data.get("topics", []),
+        )  # Populate other fields if available from API
+        self.logger.debug(
+            f"Educational value analysis complete: {result.educational_value}",
+        )
 
     async def _analyze_context(
         self,
@@ -245,38 +274,166 @@ class SafetyService:
 
         """
         try:
-            # Assuming AIProvider.analyze_context returns a dictionary that can
-            # be used to construct ContextAnalysis
+            # Assuming AIProvider.analyze_context returns a dictionary with
+            # personal-information and sensitive-topic flags
             context_result = await self.ai_provider.analyze_context(context)
-            context_analysis = ContextAnalysis(
-                is_personal_info=context_result.get("is_personal_info", False),
-                is_sensitive_topic=context_result.get("is_sensitive_topic", False),
-            )
-            result.context_analysis = context_analysis
-            self.logger.debug(f"Context analysis complete: {context_analysis}")
+            self._apply_context(context_result, result)
         except Exception as e:
             self.logger.error(f"Error during context analysis: {e}", exc_info=True)
             result.context_analysis = ContextAnalysis(
                 context_safe=False,
             )  # Indicate error state
-            result.risk_level = max(result.risk_level, RiskLevel.CRITICAL)
-            result.modifications.append(
-                ContentModification(
-                    type="error",
-                    description=f"Context analysis error: {e!s}",
-                ),
+            self._record_error(result, f"Context analysis error: {e!s}")
+            result.is_safe = False
+
+    def _apply_context(
+        self,
+        context_result: dict[str, Any],
+        result: SafetyAnalysisResult,
+    ):
+        is_personal_info = bool(context_result.get("is_personal_info", False))
+        is_sensitive_topic = bool(context_result.get("is_sensitive_topic", False))
+        result.context_analysis = ContextAnalysis(
+            context_safe=not (is_personal_info or is_sensitive_topic),
+        )
+        result.additional_info["context"] = {
+            "is_personal_info": is_personal_info,
+            "is_sensitive_topic": is_sensitive_topic,
+        }
+        if is_personal_info:
+            result.is_safe = False
+            result.parent_notification_required = True
+            _raise_risk(result, RiskLevel.HIGH)
+            result.content_category = ContentCategory.PERSONAL
+        self.logger.debug(f"Context analysis complete: {result.context_analysis}")
+
+    @staticmethod
+    def _record_error(result: SafetyAnalysisResult, reason: str) -> None:
+        _raise_risk(result, RiskLevel.CRITICAL)
+        result.required_modifications.append(
+            ContentModification(modification_type="error", reason=reason),
+        )
+
+    @staticmethod
+    def _is_blocking(result: SafetyAnalysisResult) -> bool:
+        """Whether the verdict so far already blocks the content."""
+        return not result.is_safe
+
+    async def _run_analyzers(
+        self,
+        analyzers: dict[str, Callable[[], Awaitable[None]]],
+        result: SafetyAnalysisResult,
+        deadline: float,
+        short_circuit: bool,
+    ) -> None:
+        """Runs analyzers concurrently until they finish or the deadline passes.
+
+        Each analyzer records its own findings on ``result`` and handles its
+        own provider errors.
+        """
+        loop = asyncio.get_running_loop()
+        pending = {
+            asyncio.create_task(analyzer(), name=f"safety:{name}"): name
+            for name, analyzer in analyzers.items()
+        }
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                done = set()
+                if remaining > 0:
+                    done, _ = await asyncio.wait(
+                        pending.keys(),
+                        timeout=remaining,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                if not done:
+                    self._record_timeout(list(pending.values()), result)
+                    return
+                for task in done:
+                    del pending[task]
+                    task.result()
+                if pending and short_circuit and self._is_blocking(result):
+                    skipped = sorted(pending.values())
+                    result.additional_info["short_circuited"] = skipped
+                    logger.info(f"Safety analysis short-circuited, skipped {skipped}")
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _record_timeout(
+        self,
+        analyzer_names: list[str],
+        result: SafetyAnalysisResult,
+    ) -> None:
+        names = sorted(analyzer_names)
+        logger.warning(f"Safety analyzers timed out: {names}")
+        result.additional_info["timed_out"] = names
+        result.required_modifications.append(
+            ContentModification(
+                modification_type="timeout",
+                reason=f"Analysis deadline exceeded: {names}",
+            ),
+        )
+        if SAFETY_CRITICAL_ANALYZERS.intersection(names):
+            result.is_safe = False
+            _raise_risk(result, RiskLevel.HIGH)
+
+    async def _analyze_batched(
+        self,
+        content: str,
+        context: dict[str, Any] | None,
+        result: SafetyAnalysisResult,
+        deadline: float,
+    ) -> bool:
+        """Runs every analysis in one ``analyze_safety`` provider call.
+
+        Returns:
+            False if the provider call failed and the caller should fall
+            back to the individual analyzers.
+
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            verdict = await asyncio.wait_for(
+                self.ai_provider.analyze_safety(content, context),
+                timeout=max(deadline - loop.time(), 0),
             )
+        except asyncio.TimeoutError:
+            analyzers = ["toxicity", "emotion", "educational_value"]
+            self._record_timeout(analyzers + (["context"] if context else []), result)
+            return True
+        except Exception as e:
+            logger.warning(f"Batched safety analysis failed, falling back: {e}")
+            return False
+        self._apply_toxicity(float(verdict.get("toxicity", 1.0)), result)
+        self._apply_emotional_impact(str(verdict.get("emotion", "neutral")), result)
+        self._apply_educational_value(verdict.get("educational_value") or {}, result)
+        if context:
+            self._apply_context(verdict.get("context") or {}, result)
+        result.additional_info["batched"] = True
+        return True
 
     async def analyze_content(
         self,
         content: str,
         context: dict[str, Any] | None = None,
+        short_circuit: bool | None = None,
+        batched: bool | None = None,
     ) -> SafetyAnalysisResult:
         """Performs a comprehensive safety analysis on the given content.
 
+        The keyword check runs first; the AI-backed analyzers then run
+        concurrently under ``deadline_seconds``. Safety-critical analyzers
+        that miss the deadline block the content.
+
         Args:
             content: The content string to analyze.
             context: Optional. Additional context for analysis.
+            short_circuit: Overrides the service's short-circuit mode.
+            batched: Overrides the service's batched mode.
 
         Returns:
             A SafetyAnalysisResult object containing the analysis findings.
@@ -286,16 +443,40 @@ class SafetyService:
             result="total_checked",
         )  # Increment total safety checks
 
-        result = SafetyAnalysisResult(original_content=content)
+        short_circuit = self.short_circuit if short_circuit is None else short_circuit
+        batched = self.batched if batched is None else batched
+        deadline = asyncio.get_running_loop().time() + self.deadline_seconds
+        result = SafetyAnalysisResult(additional_info={"original_content": content})
 
         # Note: _analyze_harmful_content is synchronous and does not use
-        # AIProvider, so it remains synchronous.
+        # AIProvider, so it runs first and may make the AI calls unnecessary.
         self._analyze_harmful_content(content, result)
-        await self._analyze_toxicity(content, result)
-        await self._analyze_emotional_impact(content, result)
-        await self._analyze_educational_value(content, result)
-        if context:
-            await self._analyze_context(context, result)
+        if short_circuit and self._is_blocking(result):
+            result.additional_info["short_circuited"] = ["ai_analysis"]
+        else:
+            handled = False
+            if batched and hasattr(self.ai_provider, "analyze_safety"):
+                handled = await self._analyze_batched(
+                    content,
+                    context,
+                    result,
+                    deadline,
+                )
+            if not handled:
+                analyzers = {
+                    "toxicity": lambda: self._analyze_toxicity(content, result),
+                    "emotion": lambda: self._analyze_emotional_impact(content, result),
+                    "educational_value": lambda: self._analyze_educational_value(
+                        content,
+                        result,
+                    ),
+                }
+                if context:
+                    analyzers["context"] = lambda: self._analyze_context(
+                        context,
+                        result,
+                    )
+                await self._run_analyzers(analyzers, result, deadline, short_circuit)
 
         if not result.is_safe:
             await self.performance_monitor.record_safety_check(
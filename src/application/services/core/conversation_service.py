@@ -55,18 +55,48 @@ class ConversationService:
         await self.conversation_repo.save(conversation)
         return conversation
 
-    async def get_conversation_history(self, child_id: UUID) -> list[Conversation]:
+    async def get_conversation_history(
+        self,
+        child_id: UUID,
+        limit: int | None = None,
+    ) -> list[Conversation]:
         """Retrieves the conversation history for a child.
 
         Args:
             child_id: The ID of the child.
+            limit: Optional maximum number of latest conversations to return.
 
         Returns:
             A list of conversation objects for the child.
 
         """
+        if limit is not None:
+            return await self.conversation_repo.find_recent_by_child_id(
+                child_id,
+                limit,
+            )
         return await self.conversation_repo.find_by_child_id(child_id)
 
+    async def get_conversation_summaries(
+        self,
+        child_id: UUID,
+        limit: int = 20,
+    ) -> list[str]:
+        """Retrieves the summaries of a child's latest conversations.
+
+        Args:
+            child_id: The ID of the child.
+            limit: Maximum number of summaries to return.
+
+        Returns:
+            The conversation summaries, without the full conversations.
+
+        """
+        return await self.conversation_repo.find_summaries_by_child_id(
+            child_id,
+            limit,
+        )
+
     async def _get_conversation_by_id(self, conversation_id: UUID) -> Conversation:
         """Retrieves a conversation by its ID with error handling.
 
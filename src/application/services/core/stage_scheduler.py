@@ -0,0 +1,166 @@
+"""Dependency-aware scheduling of the stages of a single request.
+
+A request such as an ESP32 voice turn is a small DAG of async stages:
+transcription, profile and history reads, AI generation and TTS. The
+``StageScheduler`` starts every stage as soon as the stages it depends on
+have finished, so independent reads overlap instead of running back to
+back, and records a timing span for each stage.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="stage_scheduler")
+
+StageFunction = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Timing span of one stage, relative to the start of the run."""
+
+    name: str
+    started_ms: float
+    duration_ms: float
+    succeeded: bool
+
+    @property
+    def finished_ms(self) -> float:
+        return self.started_ms + self.duration_ms
+
+
+@dataclass
+class StageRun:
+    """Results and timing spans of a completed scheduler run."""
+
+    results: dict[str, Any] = field(default_factory=dict)
+    timings: list[StageTiming] = field(default_factory=list)
+    total_ms: float = 0.0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.results[name]
+
+    def summary(self) -> str:
+        """Returns a compact ``stage=ms`` summary for logging."""
+        spans = " ".join(
+            f"{timing.name}={timing.duration_ms:.1f}ms" for timing in self.timings
+        )
+        return f"total={self.total_ms:.1f}ms {spans}".strip()
+
+
+@dataclass(frozen=True)
+class _Stage:
+    name: str
+    func: StageFunction
+    depends_on: tuple[str, ...]
+
+
+class StageScheduler:
+    """Runs a DAG of async stages with maximal concurrency.
+
+    Each stage is an async callable receiving a mapping of the results of
+    the stages it depends on. A stage starts as soon as all its dependencies
+    have completed. If any stage raises, the stages still running are
+    cancelled and the original exception is re-raised, so callers see the
+    same errors as with sequential code.
+
+    Example:
+        ```python
+        scheduler = StageScheduler()
+        scheduler.add("profile", lambda _: repo.get_by_id(child_id))
+        scheduler.add("history", lambda _: service.get_history(child_id))
+        scheduler.add(
+            "reply",
+            lambda deps: ai.reply(deps["profile"], deps["history"]),
+            depends_on=("profile", "history"),
+        )
+        run = await scheduler.run()
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._stages: dict[str, _Stage] = {}
+
+    def add(
+        self,
+        name: str,
+        func: StageFunction,
+        depends_on: Iterable[str] = (),
+    ) -> "StageScheduler":
+        """Registers a stage. Dependencies must be registered first."""
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' is already registered")
+        dependencies = tuple(depends_on)
+        missing = [dep for dep in dependencies if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {missing}")
+        self._stages[name] = _Stage(name, func, dependencies)
+        return self
+
+    async def run(self) -> StageRun:
+        """Executes all stages and returns their results and timing spans."""
+        run = StageRun()
+        origin = time.perf_counter()
+        pending = dict(self._stages)
+        running: dict[asyncio.Task, str] = {}
+
+        def _start_ready() -> None:
+            for name, stage in list(pending.items()):
+                if all(dep in run.results for dep in stage.depends_on):
+                    inputs = {dep: run.results[dep] for dep in stage.depends_on}
+                    task = asyncio.create_task(
+                        self._timed(stage, inputs, origin, run.timings),
+                        name=f"stage:{name}",
+                    )
+                    running[task] = name
+                    del pending[name]
+
+        try:
+            _start_ready()
+            while running:
+                done, _ = await asyncio.wait(
+                    running.keys(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    name = running.pop(task)
+                    run.results[name] = task.result()
+                _start_ready()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        run.timings.sort(key=lambda timing: timing.started_ms)
+        run.total_ms = (time.perf_counter() - origin) * 1000
+        return run
+
+    @staticmethod
+    async def _timed(
+        stage: _Stage,
+        inputs: dict[str, Any],
+        origin: float,
+        timings: list[StageTiming],
+    ) -> Any:
+        started = time.perf_counter()
+        succeeded = False
+        try:
+            result = await stage.func(inputs)
+            succeeded = True
+            return result
+        finally:
+            finished = time.perf_counter()
+            timings.append(
+                StageTiming(
+                    name=stage.name,
+                    started_ms=(started - origin) * 1000,
+                    duration_ms=(finished - started) * 1000,
+                    succeeded=succeeded,
+                ),
+            )
@@ -5,6 +5,8 @@ functionalities to provide a seamless audio interaction experience. It ensures
 that all audio is processed safely and efficiently.
 """
 
+from collections.abc import AsyncIterator
+
 from src.application.interfaces.safety_monitor import SafetyMonitor
 from src.application.interfaces.speech_processor import SpeechProcessor
 from src.application.interfaces.text_to_speech_service import (
@@ -56,6 +58,52 @@ class AudioProcessingService:
         safety_level = await self.safety_monitor.check_audio_safety(audio_data)
         return transcription, safety_level
 
+    async def process_audio_stream(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: str,
+    ) -> tuple[str, SafetyLevel]:
+        """Processes audio that arrives as a stream of chunks.
+
+        Speech processors that implement ``stream_speech_to_text`` transcribe
+        while chunks are still arriving; the others receive the buffered
+        utterance once the stream ends. Either way the complete audio is
+        safety-checked, exactly as in ``process_audio_input``.
+
+        Args:
+            audio_chunks: The audio chunks of a single utterance.
+            language: The language of the audio.
+
+        Returns:
+            A tuple containing the transcription and the safety level.
+
+        """
+        received: list[bytes] = []
+
+        async def _tee() -> AsyncIterator[bytes]:
+            async for chunk in audio_chunks:
+                received.append(chunk)
+                yield chunk
+
+        stream_speech_to_text = getattr(
+            self.speech_processor,
+            "stream_speech_to_text",
+            None,
+        )
+        if stream_speech_to_text is not None:
+            transcription = await stream_speech_to_text(_tee(), language)
+            audio_data = b"".join(received)
+        else:
+            async for _ in _tee():
+                pass
+            audio_data = b"".join(received)
+            transcription = await self.speech_processor.speech_to_text(
+                audio_data,
+                language,
+            )
+        safety_level = await self.safety_monitor.check_audio_safety(audio_data)
+        return transcription, safety_level
+
     async def generate_audio_response(self, text: str, voice_id: str) -> bytes:
         """Generates an audio response from text.
 
@@ -70,8 +118,44 @@ class AudioProcessingService:
         try:
             return await self.tts_service.text_to_speech(text, voice_id)
         except Exception as e:
-            self.logger.error(
+            logger.error(
                 f"Failed to generate audio response for text: '{text[:50]}...' with voice_id: {voice_id}. Error: {e}",
                 exc_info=True,
             )
             return b""
+
+    async def stream_audio_response(
+        self,
+        text: str,
+        voice_id: str,
+    ) -> AsyncIterator[bytes]:
+        """Generates an audio response as a stream of chunks.
+
+        TTS services that implement ``stream_text_to_speech`` yield audio as
+        the provider produces it, so playback can start after the first
+        chunk; the others yield the complete response as a single chunk.
+        Like ``generate_audio_response``, failures are logged and end the
+        stream instead of raising.
+
+        Args:
+            text: The text to convert to speech.
+            voice_id: The ID of the voice to use.
+
+        Yields:
+            Audio chunks in playback order.
+
+        """
+        stream_text_to_speech = getattr(self.tts_service, "stream_text_to_speech", None)
+        if stream_text_to_speech is None:
+            audio = await self.generate_audio_response(text, voice_id)
+            if audio:
+                yield audio
+            return
+        try:
+            async for chunk in stream_text_to_speech(text, voice_id):
+                yield chunk
+        except Exception as e:
+            logger.error(
+                f"Failed to stream audio response for text: '{text[:50]}...' with voice_id: {voice_id}. Error: {e}",
+                exc_info=True,
+            )
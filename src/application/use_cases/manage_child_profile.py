@@ -5,7 +5,12 @@ from src.application.dto.child_data import ChildData
 from src.domain.entities.child_profile import ChildProfile
 from src.infrastructure.persistence.child_repository import ChildRepository
 from src.infrastructure.messaging.kafka_event_bus import KafkaEventBus
+from src.infrastructure.performance.batch_loader import BatchLoader, request_loader
+from src.infrastructure.read_models.child_profile_projection import (
+    ChildProfileProjection,
+)
 from src.infrastructure.read_models.child_profile_read_model import (
+    ChildProfileReadModel,
     ChildProfileReadModelStore,
 )
 
@@ -16,10 +21,14 @@ class ManageChildProfileUseCase:
         child_repository: ChildRepository,
         child_profile_read_model_store: ChildProfileReadModelStore,
         event_bus: KafkaEventBus,
+        projection: ChildProfileProjection | None = None,
     ):
         self.child_repository = child_repository
         self.child_profile_read_model_store = child_profile_read_model_store
         self.event_bus = event_bus
+        # Projecting right after a save lets callers read their own writes
+        # without waiting for the event handlers or the background catch-up
+        self.projection = projection
 
     async def create_child_profile(
         self,
@@ -28,8 +37,10 @@ class ManageChildProfileUseCase:
         preferences: dict[str, Any],
     ) -> ChildData:
         child = ChildProfile.create(name, age, preferences)
+        events = list(child.get_uncommitted_events())
         await self.child_repository.save(child)
-        for event in child.get_uncommitted_events():
+        await self._project(child.id)
+        for event in events:
             await self.event_bus.publish(event)
         return ChildData(
             id=child.id,
@@ -39,16 +50,27 @@ class ManageChildProfileUseCase:
         )
 
     async def get_child_profile(self, child_id: UUID) -> ChildData | None:
-        child_read_model = self.child_profile_read_model_store.get_by_id(child_id)
+        """Fetch a profile from the read model.
+
+        Profiles requested concurrently within a request are read together.
+        """
+        child_read_model = await self._profile_loader().load(child_id)
         if child_read_model:
-            return ChildData(
-                id=child_read_model.id,
-                name=child_read_model.name,
-                age=child_read_model.age,
-                preferences=child_read_model.preferences,
-            )
+            return self._to_child_data(child_read_model)
         return None
 
+    async def list_child_profiles(self, child_ids: list[UUID]) -> list[ChildData]:
+        """Fetch several profiles from the read model in one lookup.
+
+        Used by parent dashboards; unknown ids are skipped.
+        """
+        read_models = await self._profile_loader().load_many(child_ids)
+        return [
+            self._to_child_data(read_models[child_id])
+            for child_id in child_ids
+            if read_models[child_id] is not None
+        ]
+
     async def update_child_profile(
         self,
         child_id: UUID,
@@ -61,8 +83,11 @@ class ManageChildProfileUseCase:
         )  # Use write model for update
         if child:
             child.update_profile(name, age, preferences)
+            events = list(child.get_uncommitted_events())
             await self.child_repository.save(child)
-            for event in child.get_uncommitted_events():
+            await self._project(child_id)
+            self._profile_loader().clear(child_id)
+            for event in events:
                 await self.event_bus.publish(event)
             # Retrieve from read model after update for consistency
             return await self.get_child_profile(child_id)
@@ -71,9 +96,32 @@ class ManageChildProfileUseCase:
     async def delete_child_profile(self, child_id: UUID) -> bool:
         child = await self.child_repository.get_by_id(child_id)
         if child:
-            await self.child_repository.delete(child_id)
-            # In a full event-sourced system, a ChildDeleted event would be published here
-            # and the read model would handle the deletion.
-            self.child_profile_read_model_store.delete(child_id)
+            child.delete()
+            events = list(child.get_uncommitted_events())
+            await self.child_repository.save(child)
+            await self._project(child_id)
+            await self.child_profile_read_model_store.async_delete(child_id)
+            self._profile_loader().clear(child_id)
+            for event in events:
+                await self.event_bus.publish(event)
             return True
         return False
+
+    def _profile_loader(self) -> BatchLoader:
+        return request_loader(
+            self.child_profile_read_model_store.async_get_many,
+            name="child_profiles",
+        )
+
+    async def _project(self, child_id: UUID) -> None:
+        if self.projection is not None:
+            await self.projection.project(child_id)
+
+    @staticmethod
+    def _to_child_data(child_read_model: ChildProfileReadModel) -> ChildData:
+        return ChildData(
+            id=child_read_model.id,
+            name=child_read_model.name,
+            age=child_read_model.age,
+            preferences=child_read_model.preferences,
+        )
@@ -4,17 +4,37 @@ including speech-to-text, AI response generation, and text-to-speech output
 with comprehensive child safety measures.
 """
 
+from collections.abc import AsyncIterator
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
 
 from src.application.dto.ai_response import AIResponse
 from src.application.dto.esp32_request import ESP32Request
-from src.application.services.ai.ai_orchestration_service import AIOrchestrationService
+from src.application.dto.esp32_stream import ESP32StreamFrame, StreamFrameType
+from src.application.services.ai.ai_orchestration_service import (
+    UNSAFE_INPUT_REPLY,
+    AIOrchestrationService,
+)
+from src.application.services.ai.context_window import ContextWindowManager
 from src.application.services.device.audio_processing_service import AudioProcessingService
 from src.application.services.core.conversation_service import ConversationService
+from src.application.services.core.stage_scheduler import StageRun, StageScheduler
 from src.infrastructure.persistence.child_repository import ChildRepository
+from src.domain.entities.child import Child
 from src.domain.value_objects.safety_level import SafetyLevel
+from src.infrastructure.logging_config import get_logger
+from src.infrastructure.messaging.write_behind_queue import WriteBehindQueue
+
+logger = get_logger(__name__, component="esp32_audio_use_case")
+
+UNSAFE_AUDIO_REPLY = (
+    "I'm sorry, I can't process that. Let's talk about something else."
+)
+RECORD_TURN_OPERATION = "esp32.record_turn"
+# Bound on the interaction summary kept on the child profile when no context
+# window maintains a rolling summary
+MAX_INTERACTION_SUMMARY_CHARS = 2000
 
 
 class ProcessESP32AudioUseCase:
@@ -26,6 +46,10 @@ class ProcessESP32AudioUseCase:
     4. Conversation history updates and learning
     5. Audio response generation.
 
+    Steps 1 and 2 are independent and run concurrently through a
+    ``StageScheduler``. Step 4 is off the critical path: it runs next to
+    step 5, or in the background when a write-behind queue is configured.
+
     All operations include COPPA compliance and child safety measures.
 
     Attributes:
@@ -33,6 +57,8 @@ class ProcessESP32AudioUseCase:
         ai_orchestration_service: Service for AI response generation
         conversation_service: Service for conversation management
         child_repository: Repository for child profile data
+        write_behind_queue: Optional queue for post-response writes
+        context_window: Optional per-child recent turns and rolling summary
 
     """
 
@@ -42,6 +68,8 @@ class ProcessESP32AudioUseCase:
         ai_orchestration_service: AIOrchestrationService,
         conversation_service: ConversationService,
         child_repository: ChildRepository,
+        write_behind_queue: WriteBehindQueue | None = None,
+        context_window: ContextWindowManager | None = None,
     ) -> None:
         """Initialize the ESP32 audio processing use case.
 
@@ -50,12 +78,25 @@ class ProcessESP32AudioUseCase:
             ai_orchestration_service: Service for AI response generation
             conversation_service: Service for conversation management
             child_repository: Repository for child profile operations
+            write_behind_queue: Queue that applies conversation and profile
+                writes in the background; when omitted they are awaited
+                alongside TTS
+            context_window: Records each turn into the child's bounded
+                conversation context; its rolling summary replaces the
+                profile's interaction summary
 
         """
         self.audio_processing_service = audio_processing_service
         self.ai_orchestration_service = ai_orchestration_service
         self.conversation_service = conversation_service
         self.child_repository = child_repository
+        self.write_behind_queue = write_behind_queue
+        self.context_window = context_window
+        if write_behind_queue is not None:
+            write_behind_queue.register_handler(
+                RECORD_TURN_OPERATION,
+                self._apply_recorded_turn,
+            )
 
     async def execute(self, request: ESP32Request) -> AIResponse:
         """Execute the complete ESP32 audio processing workflow.
@@ -82,59 +123,279 @@ class ProcessESP32AudioUseCase:
             ```
 
         """
+        child_id = request.child_id
+        scheduler = StageScheduler()
         # 1. Process audio input (STT and safety check)
-        (
-            transcription,
-            audio_safety_level,
-        ) = await self.audio_processing_service.process_audio_input(
-            request.audio_data,
-            request.language_code,
+        scheduler.add(
+            "transcription",
+            lambda _: self.audio_processing_service.process_audio_input(
+                request.audio_data,
+                request.language_code,
+            ),
         )
+        # 2. Get child profile and conversation history, concurrently with STT
+        scheduler.add("profile", lambda _: self.child_repository.get_by_id(child_id))
+        scheduler.add("history", lambda _: self._load_history_texts(child_id))
+        # 3. Get AI response
+        scheduler.add(
+            "ai_response",
+            lambda deps: self._generate_response(child_id, **deps),
+            depends_on=("transcription", "profile", "history"),
+        )
+        # 4. Update conversation history and child preferences, off the TTS path
+        scheduler.add(
+            "record_turn",
+            lambda deps: self._schedule_record_turn(child_id, **deps),
+            depends_on=("transcription", "profile", "ai_response"),
+        )
+        # 5. Generate audio response
+        scheduler.add(
+            "tts",
+            lambda deps: self._synthesize(**deps),
+            depends_on=("transcription", "profile", "ai_response"),
+        )
+        run = await scheduler.run()
+        self._log_timings(child_id, run)
+
+        ai_response = run["ai_response"]
+        ai_response.audio_response = run["tts"]
+        return ai_response
+
+    async def _load_history_texts(self, child_id: UUID) -> list[str]:
+        # Only the summaries are needed for AI context
+        return await self.conversation_service.get_conversation_summaries(child_id)
 
+    async def _generate_response(
+        self,
+        child_id: UUID,
+        transcription: tuple[str, SafetyLevel],
+        profile: Child | None,
+        history: list[str],
+    ) -> AIResponse:
+        text, audio_safety_level = transcription
         if audio_safety_level == SafetyLevel.CRITICAL:
             # Handle critical safety level, e.g., return a canned response
             return AIResponse(
-                response_text="I'm sorry, I can't process that. Let's talk about something else.",
+                response_text=UNSAFE_AUDIO_REPLY,
                 audio_response=b"",
                 emotion="neutral",
                 sentiment=0.0,
                 safe=False,
             )
+        if not profile:
+            raise HTTPException(status_code=404, detail="Child profile not found")
+
+        return await self.ai_orchestration_service.get_ai_response(
+            child_id,
+            history,
+            text,
+            child_preferences=profile.preferences,  # Pass child preferences
+            voice_id=profile.preferences.voice_preference,  # Use child's voice preference
+        )
 
-        # 2. Get child profile and conversation history
-        child_profile = await self.child_repository.get_by_id(request.child_id)
+    async def _synthesize(
+        self,
+        transcription: tuple[str, SafetyLevel],
+        profile: Child | None,
+        ai_response: AIResponse,
+    ) -> bytes:
+        if transcription[1] == SafetyLevel.CRITICAL:
+            return b""
+        return await self.audio_processing_service.generate_audio_response(
+            ai_response.response_text,
+            voice_id=profile.preferences.voice_preference,  # Use child's voice preference
+        )
+
+    async def _schedule_record_turn(
+        self,
+        child_id: UUID,
+        transcription: tuple[str, SafetyLevel],
+        profile: Child | None,
+        ai_response: AIResponse,
+    ) -> None:
+        text, audio_safety_level = transcription
+        if audio_safety_level == SafetyLevel.CRITICAL or profile is None:
+            return
+        if self.write_behind_queue is None:
+            await self._record_turn(child_id, profile, text, ai_response)
+            return
+        await self.write_behind_queue.enqueue(
+            RECORD_TURN_OPERATION,
+            {
+                "child_id": str(child_id),
+                "transcription": text,
+                "response_text": ai_response.response_text,
+                "emotion": ai_response.emotion,
+                "sentiment": ai_response.sentiment,
+                "conversation_id": (
+                    str(ai_response.conversation_id)
+                    if ai_response.conversation_id
+                    else None
+                ),
+            },
+        )
+
+    async def _apply_recorded_turn(self, payload: dict) -> None:
+        """Write-behind handler: applies a recorded turn to fresh state."""
+        child_id = UUID(payload["child_id"])
+        child_profile = await self.child_repository.get_by_id(child_id)
         if not child_profile:
-            raise HTTPException(status_code=404, detail="Child profile not found")
+            logger.warning(f"Dropping recorded turn for unknown child {child_id}")
+            return
+        ai_response = AIResponse(
+            response_text=payload["response_text"],
+            audio_response=b"",
+            emotion=payload["emotion"],
+            sentiment=payload["sentiment"],
+            safe=True,
+            conversation_id=payload.get("conversation_id"),
+        )
+        await self._record_turn(
+            child_id,
+            child_profile,
+            payload["transcription"],
+            ai_response,
+        )
 
-        conversation_history = await self.conversation_service.get_conversation_history(
-            request.child_id,
+    @staticmethod
+    def _refusal_frames(reply: str) -> tuple[ESP32StreamFrame, ESP32StreamFrame]:
+        return (
+            ESP32StreamFrame(StreamFrameType.SENTENCE, text=reply, safe=False),
+            ESP32StreamFrame(StreamFrameType.COMPLETE, text=reply, safe=False),
         )
 
-        # Extract relevant parts for AI context
-        history_texts = [conv.summary for conv in conversation_history]
+    @staticmethod
+    def _log_timings(child_id: UUID, run: StageRun) -> None:
+        logger.info(f"ESP32 turn stages for child {child_id}: {run.summary()}")
 
-        # 3. Get AI response
-        ai_response = await self.ai_orchestration_service.get_ai_response(
-            request.child_id,
-            history_texts,
-            transcription,
-            child_preferences=child_profile.preferences,  # Pass child preferences
-            voice_id=child_profile.preferences.voice_preference,  # Use child's voice preference
+    async def execute_stream(
+        self,
+        child_id: UUID,
+        audio_chunks: AsyncIterator[bytes],
+        language_code: str,
+    ) -> AsyncIterator[ESP32StreamFrame]:
+        """Runs a voice turn as a stream, yielding frames as they are ready.
+
+        Audio is transcribed while it arrives, the AI response is streamed
+        sentence by sentence, and every safety-approved sentence is turned
+        into speech immediately, so the device starts playing the first
+        sentence while later ones are still being generated. Speech is sent
+        in chunks as the TTS provider produces them. The audio, the
+        transcript and each sentence pass the same safety checks as in
+        ``execute``; nothing reaches the device before it is approved.
+
+        Args:
+            child_id: ID of the child talking to the device
+            audio_chunks: Audio chunks of one utterance, in arrival order
+            language_code: Language of the utterance
+
+        Yields:
+            A transcript frame, then a sentence frame and its audio chunk
+            frames per sentence, then a final complete frame carrying the
+            full response text
+
+        Raises:
+            HTTPException: If child profile is not found(404)
+
+        """
+        scheduler = StageScheduler()
+        scheduler.add(
+            "transcription",
+            lambda _: self.audio_processing_service.process_audio_stream(
+                audio_chunks,
+                language_code,
+            ),
         )
+        scheduler.add("profile", lambda _: self.child_repository.get_by_id(child_id))
+        scheduler.add("history", lambda _: self._load_history_texts(child_id))
+        run = await scheduler.run()
+        self._log_timings(child_id, run)
+
+        transcription, audio_safety_level = run["transcription"]
+        if audio_safety_level == SafetyLevel.CRITICAL:
+            for frame in self._refusal_frames(UNSAFE_AUDIO_REPLY):
+                yield frame
+            return
 
-        # 4. Update conversation history and child preferences
-        await self.conversation_service.start_new_conversation(
-            request.child_id,
+        child_profile = run["profile"]
+        if not child_profile:
+            raise HTTPException(status_code=404, detail="Child profile not found")
+        # The transcript is echoed to the device, so it must pass the text
+        # check before it is sent
+        if not self.ai_orchestration_service.is_text_safe(transcription):
+            for frame in self._refusal_frames(UNSAFE_INPUT_REPLY):
+                yield frame
+            return
+        yield ESP32StreamFrame(StreamFrameType.TRANSCRIPT, text=transcription)
+
+        history_texts = run["history"]
+        voice_id = child_profile.preferences.voice_preference
+
+        sentences: list[str] = []
+        async for sentence in self.ai_orchestration_service.stream_ai_response(
+            child_id,
+            history_texts,
             transcription,
+            child_preferences=child_profile.preferences,
+        ):
+            sequence = len(sentences)
+            sentences.append(sentence)
+            yield ESP32StreamFrame(
+                StreamFrameType.SENTENCE,
+                sequence=sequence,
+                text=sentence,
+            )
+            async for chunk in self.audio_processing_service.stream_audio_response(
+                sentence,
+                voice_id=voice_id,
+            ):
+                yield ESP32StreamFrame(
+                    StreamFrameType.AUDIO,
+                    sequence=sequence,
+                    audio=chunk,
+                )
+
+        response_text = " ".join(sentences)
+        yield ESP32StreamFrame(
+            StreamFrameType.COMPLETE,
+            sequence=len(sentences),
+            text=response_text,
         )
 
-        conversation_id = (
-            UUID(ai_response.conversation_id)
-            if isinstance(ai_response.conversation_id, str)
-            else (
-                ai_response.conversation_id if ai_response.conversation_id else uuid4()
+        if response_text:
+            ai_response = AIResponse(
+                response_text=response_text,
+                audio_response=b"",
+                emotion="neutral",
+                sentiment=0.0,
+                safe=True,
             )
+            await self._schedule_record_turn(
+                child_id,
+                run["transcription"],
+                child_profile,
+                ai_response,
+            )
+
+    async def _record_turn(
+        self,
+        child_id: UUID,
+        child_profile: Child,
+        transcription: str,
+        ai_response: AIResponse,
+    ) -> None:
+        """Persists the conversation and adapts the child profile to the turn."""
+        conversation = await self.conversation_service.start_new_conversation(
+            child_id,
+            transcription,
         )
+
+        if isinstance(ai_response.conversation_id, str):
+            conversation_id = UUID(ai_response.conversation_id)
+        elif ai_response.conversation_id:
+            conversation_id = ai_response.conversation_id
+        else:
+            conversation_id = getattr(conversation, "id", None) or uuid4()
         await self.conversation_service.update_conversation_analysis(
             conversation_id,
             ai_response.emotion,
@@ -146,13 +407,22 @@ class ProcessESP32AudioUseCase:
         child_profile.preferences.vocabulary_size += (
             len(transcription.split()) // 10
         )  # Simple approximation
-        child_profile.preferences.interaction_history_summary = (
-            (child_profile.preferences.interaction_history_summary or "")
-            + " "
-            + transcription
-            + " "
-            + ai_response.response_text
-        )
+        if self.context_window is not None:
+            context = await self.context_window.record_turn(
+                child_id,
+                transcription,
+                ai_response.response_text,
+            )
+            interaction_summary = context.rolling_summary
+        else:
+            interaction_summary = (
+                (child_profile.preferences.interaction_history_summary or "")
+                + " "
+                + transcription
+                + " "
+                + ai_response.response_text
+            )[-MAX_INTERACTION_SUMMARY_CHARS:]
+        child_profile.preferences.interaction_history_summary = interaction_summary
 
         # Update emotional tendencies based on AI response emotion
         current_emotion_score = child_profile.preferences.emotional_tendencies.get(
@@ -164,12 +434,3 @@ class ProcessESP32AudioUseCase:
         ) / 2.0  # Simple averaging
 
         await self.child_repository.save(child_profile)  # Save updated child profile
-
-        # 5. Generate audio response
-        audio_output = await self.audio_processing_service.generate_audio_response(
-            ai_response.response_text,
-            voice_id=child_profile.preferences.voice_preference,  # Use child's voice preference
-        )
-
-        ai_response.audio_response = audio_output
-        return ai_response
@@ -9,10 +9,12 @@ data integrity through the use of value objects for name and age.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID, uuid4
 
+from src.domain.events.child_profile_deleted import ChildProfileDeleted
 from src.domain.events.child_profile_updated import ChildProfileUpdated
+from src.domain.events.child_registered import ChildRegistered
 from src.domain.events.domain_events import DomainEvent
 from src.domain.value_objects import ChildAge, ChildName
 
@@ -26,6 +28,11 @@ class ChildProfile:
     _child_age: ChildAge
     _preferences: dict[str, Any]
     _uncommitted_events: list[DomainEvent] = field(default_factory=list, repr=False)
+    _version: int = field(default=0, repr=False)
+    _deleted: bool = field(default=False, repr=False)
+
+    # Bump when the snapshot state layout changes; older snapshots are ignored
+    SNAPSHOT_SCHEMA_VERSION: ClassVar[int] = 1
 
     @staticmethod
     def create(
@@ -52,16 +59,79 @@ class ChildProfile:
             _child_age=child_age,
             _preferences=preferences or {},
         )
-        # Optionally, raise a creation event
-        # from src.domain.events.child_registered import ChildRegistered
-        # profile._record_event(ChildRegistered(child_id=profile.id, ...))
+        profile._record_event(
+            ChildRegistered.create(
+                child_id=profile.child_id,
+                name=profile.name,
+                age=profile.age,
+                preferences=profile.preferences,
+            ),
+        )
+        return profile
+
+    @classmethod
+    def restore(cls, child_id: UUID) -> ChildProfile:
+        """Creates an empty profile to rebuild from its events."""
+        return cls(
+            _child_id=child_id,
+            _child_name=None,
+            _child_age=None,
+            _preferences={},
+        )
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        child_id: UUID,
+        state: dict[str, Any],
+        version: int,
+    ) -> ChildProfile:
+        """Rebuilds a profile from a snapshot taken at ``version``.
+
+        Args:
+            child_id: The unique identifier of the child.
+            state: State returned by ``to_snapshot``.
+            version: Number of events the snapshot covers.
+
+        Returns:
+            The profile as of ``version``; apply later events on top.
+
+        """
+        profile = cls.restore(child_id)
+        profile._set_state(state["name"], state["age"], state["preferences"])
+        profile._deleted = state.get("deleted", False)
+        profile._version = version
         return profile
 
+    def to_snapshot(self) -> dict[str, Any]:
+        """Serializable state for an aggregate snapshot."""
+        return {
+            "name": self.name,
+            "age": self.age,
+            "preferences": self.preferences,
+            "deleted": self._deleted,
+        }
+
     @property
     def child_id(self) -> UUID:
         """Gets the unique identifier of the child."""
         return self._child_id
 
+    @property
+    def id(self) -> UUID:
+        """Alias of ``child_id``, used by repositories."""
+        return self._child_id
+
+    @property
+    def version(self) -> int:
+        """Number of persisted events this profile reflects."""
+        return self._version
+
+    @property
+    def is_deleted(self) -> bool:
+        """Whether a ChildProfileDeleted event has been applied."""
+        return self._deleted
+
     @property
     def name(self) -> str:
         """Gets the name of the child."""
@@ -70,7 +140,7 @@ class ChildProfile:
     @property
     def age(self) -> int:
         """Gets the age of the child."""
-        return self._child_age.value
+        return self._child_age.years
 
     @property
     def preferences(self) -> dict[str, Any]:
@@ -85,6 +155,51 @@ class ChildProfile:
         """Clears the list of uncommitted domain events."""
         self._uncommitted_events.clear()
 
+    def mark_events_committed(self) -> None:
+        """Counts the uncommitted events as persisted and clears them."""
+        self._version += len(self._uncommitted_events)
+        self._uncommitted_events.clear()
+
+    def apply(self, event: Any) -> None:
+        """Applies a persisted event while rebuilding the profile.
+
+        Accepts domain events as well as the event records returned by the
+        event stores, whose ``data`` holds the event or its fields.
+
+        Args:
+            event: A ChildRegistered, ChildProfileUpdated or ChildProfileDeleted
+                event.
+
+        """
+        event_type = type(event).__name__
+        if isinstance(event, dict) and "data" in event:
+            event_type = event.get("event_type", event_type)
+            event = event["data"]
+        if event_type == ChildProfileDeleted.__name__:
+            self._deleted = True
+            self._version += 1
+            return
+        fields = event if isinstance(event, dict) else vars(event)
+        self._set_state(
+            fields.get("name"),
+            fields.get("age"),
+            fields.get("preferences"),
+        )
+        self._version += 1
+
+    def _set_state(
+        self,
+        name: str | None,
+        age: int | None,
+        preferences: dict[str, Any] | None,
+    ) -> None:
+        if name is not None:
+            self._child_name = ChildName(name)
+        if age is not None:
+            self._child_age = ChildAge(age)
+        if preferences is not None:
+            self._preferences = dict(preferences)
+
     def _record_event(self, event: DomainEvent) -> None:
         """Adds a domain event to the list of uncommitted events.
 
@@ -101,6 +216,8 @@ class ChildProfile:
         preferences: dict[str, Any] | None = None,
     ) -> None:
         """Update child profile details, validating inputs against domain rules."""
+        previous_name, previous_age = self.name, self.age
+        previous_preferences = self.preferences
         if name is not None:
             if not name.strip():
                 raise ValueError("Child name cannot be empty.")
@@ -120,10 +237,20 @@ class ChildProfile:
 
         # Record event after successful updates
         self._record_event(
-            ChildProfileUpdated(
+            ChildProfileUpdated.create(
                 child_id=self._child_id,
-                new_name=self.name,
-                new_age=self.age,
-                new_preferences=self.preferences,
+                name=self.name,
+                age=self.age,
+                preferences=self.preferences,
+                previous_name=previous_name,
+                previous_age=previous_age,
+                previous_preferences=previous_preferences,
             ),
         )
+
+    def delete(self) -> None:
+        """Mark the profile as deleted so projections drop it on replay."""
+        if self._deleted:
+            return
+        self._deleted = True
+        self._record_event(ChildProfileDeleted.create(child_id=self._child_id))
@@ -6,6 +6,7 @@ It ensures HIPAA and COPPA compliance by encrypting data at rest and
 maintaining an audit trail for all access, offering robust privacy controls.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from typing import Any
@@ -50,14 +51,9 @@ class EncryptedChild:
         contacts: list[dict[str, Any]],
         encryption_service=None,
     ) -> None:
-        """Encrypts and sets emergency contacts."""
-        import json
-        from src.domain.value_objects.encrypted_field import NullEncryptionService
-        service = encryption_service or NullEncryptionService()
-        serialized = json.dumps(contacts)
-        encrypted_data = service.encrypt(serialized)
-        self._encrypted_emergency_contacts = EncryptedField.from_encrypted_data(
-            encrypted_data, encryption_service=service
+        """Sets emergency contacts; they are encrypted when persisted."""
+        self._encrypted_emergency_contacts = EncryptedField(
+            contacts, encryption_service=encryption_service
         )
         self.updated_at = datetime.utcnow()
 
@@ -65,27 +61,53 @@ class EncryptedChild:
         self,
         encryption_service=None,
     ) -> list[dict[str, Any]] | None:
-        """Decrypts and retrieves emergency contacts."""
+        """Retrieves emergency contacts, decrypting them on first read."""
         if self._encrypted_emergency_contacts:
             return self._encrypted_emergency_contacts.get_value()
         return None
 
     def set_medical_notes(self, notes: str, encryption_service=None) -> None:
-        """Encrypts and sets medical notes."""
-        from src.domain.value_objects.encrypted_field import NullEncryptionService
-        service = encryption_service or NullEncryptionService()
-        encrypted_data = service.encrypt(notes)
-        self._encrypted_medical_notes = EncryptedField.from_encrypted_data(
-            encrypted_data, encryption_service=service
+        """Sets medical notes; they are encrypted when persisted."""
+        self._encrypted_medical_notes = EncryptedField(
+            notes, encryption_service=encryption_service
         )
         self.updated_at = datetime.utcnow()
 
     def get_medical_notes(self, encryption_service=None) -> str | None:
-        """Decrypts and retrieves medical notes."""
+        """Retrieves medical notes, decrypting them on first read."""
         if self._encrypted_medical_notes:
             return self._encrypted_medical_notes.get_value()
         return None
 
+    def sensitive_fields(self) -> list[EncryptedField]:
+        """The encrypted fields that are set."""
+        return [
+            encrypted
+            for encrypted in (
+                self._encrypted_emergency_contacts,
+                self._encrypted_medical_notes,
+            )
+            if encrypted is not None
+        ]
+
+    @staticmethod
+    def materialize_sensitive_fields(children: Iterable["EncryptedChild"]) -> None:
+        """Decrypt the sensitive fields of many children in one batch.
+
+        For responses that include them; listings that leave them out should
+        not call this, so they never decrypt anything.
+        """
+        EncryptedField.materialize(
+            encrypted for child in children for encrypted in child.sensitive_fields()
+        )
+
+    @staticmethod
+    def encrypt_sensitive_fields(children: Iterable["EncryptedChild"]) -> None:
+        """Encrypt the changed sensitive fields of many children before persisting."""
+        EncryptedField.encrypt_pending(
+            encrypted for child in children for encrypted in child.sensitive_fields()
+        )
+
     def update_interaction_time(self, duration_seconds: int) -> None:
         """Updates the total interaction time and last interaction timestamp."""
         self.total_interaction_time += duration_seconds
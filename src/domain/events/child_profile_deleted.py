@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from .domain_events import DomainEvent
+
+
+@dataclass(frozen=True)
+class ChildProfileDeleted(DomainEvent):
+    child_id: UUID
+
+    @classmethod
+    def create(cls, child_id: UUID) -> "ChildProfileDeleted":
+        return cls(
+            event_id=uuid4(),
+            timestamp=datetime.now(UTC),
+            child_id=child_id,
+        )
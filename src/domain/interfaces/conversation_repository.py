@@ -18,3 +18,29 @@ class IConversationRepository(ABC):
     @abstractmethod
     async def get_by_id(self, conversation_id: UUID) -> Conversation | None:
         """Retrieves a single conversation by its ID."""
+
+    async def find_recent_by_child_id(
+        self,
+        child_id: UUID,
+        limit: int,
+    ) -> list[Conversation]:
+        """Retrieves a child's latest ``limit`` conversations, oldest first.
+
+        Repositories backed by a database should override this to read only
+        the requested rows.
+        """
+        conversations = await self.find_by_child_id(child_id)
+        return conversations[-limit:] if limit > 0 else []
+
+    async def find_summaries_by_child_id(
+        self,
+        child_id: UUID,
+        limit: int = 20,
+    ) -> list[str]:
+        """Retrieves the summaries of a child's latest conversations.
+
+        Repositories that store summaries separately should override this to
+        avoid loading full conversations.
+        """
+        conversations = await self.find_by_child_id(child_id)
+        return [conversation.summary for conversation in conversations[-limit:]]
@@ -48,6 +48,33 @@ class EncryptionServiceInterface(ABC):
 
         """
 
+    def encrypt_many(self, data: list[str]) -> list[str]:
+        """Encrypt several values in one call.
+
+        Services with a batch API override this; the default encrypts one
+        value at a time.
+
+        Args:
+            data: Plain text values to encrypt
+
+        Returns:
+            Encrypted values, in order
+
+        """
+        return [self.encrypt(value) for value in data]
+
+    def decrypt_many(self, encrypted_data: list[str]) -> list[str]:
+        """Decrypt several values in one call.
+
+        Args:
+            encrypted_data: Encrypted values to decrypt
+
+        Returns:
+            Decrypted plain text values, in order
+
+        """
+        return [self.decrypt(value) for value in encrypted_data]
+
 
 class SecureFieldInterface(Generic[T], ABC):
     """Interface for encrypted field value objects.
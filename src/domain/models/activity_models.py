@@ -0,0 +1,101 @@
+"""Child Activity Time-Series Models.
+
+Append-only usage and safety event tables, partitioned by month, and the
+rollup tables maintained alongside them so dashboards read pre-aggregated
+buckets instead of a child's whole history.
+"""
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Float, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.domain.models.models_infra import Base
+
+
+class UsageEventModel(Base):
+    """One usage record of a child; partitioned by month of occurred_at."""
+
+    __tablename__ = "usage_events"
+
+    # The partition key has to be part of the primary key
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+    )
+
+    child_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    activity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    duration_minutes: Mapped[float] = mapped_column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("idx_usage_event_child_time", "child_id", "occurred_at"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+
+
+class SafetyEventLogModel(Base):
+    """One safety event of a child; partitioned by month of occurred_at."""
+
+    __tablename__ = "safety_event_log"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+    )
+
+    child_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    severity: Mapped[str] = mapped_column(String(20), nullable=False)
+    details: Mapped[dict | str] = mapped_column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("idx_safety_event_log_child_time", "child_id", "occurred_at"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+
+
+class UsageHourlyRollupModel(Base):
+    """Usage of a child per hour and activity type."""
+
+    __tablename__ = "usage_rollups_hourly"
+
+    child_id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    bucket: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    activity_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_minutes: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
+class UsageDailyRollupModel(Base):
+    """Usage of a child per day and activity type."""
+
+    __tablename__ = "usage_rollups_daily"
+
+    child_id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    bucket: Mapped[date] = mapped_column(Date, primary_key=True)
+    activity_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_minutes: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    last_event_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+
+class SafetyDailyRollupModel(Base):
+    """Safety events of a child per day, event type and severity."""
+
+    __tablename__ = "safety_rollups_daily"
+
+    child_id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True)
+    bucket: Mapped[date] = mapped_column(Date, primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    severity: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
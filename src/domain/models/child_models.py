@@ -98,6 +98,8 @@ class ChildModel(Base):
 
     __table_args__ = (
         Index("idx_child_parent_id", "parent_id"),
+        # Keyset pagination of a parent's children by (created_at, id)
+        Index("idx_child_parent_created", "parent_id", "created_at", "id"),
         Index("idx_child_age_category", "age_category"),
         Index("idx_child_safety_level", "safety_level"),
         CheckConstraint("age_years >= 2", name="check_age_min"),
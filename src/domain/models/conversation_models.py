@@ -77,6 +77,8 @@ class ConversationModel(Base):
 
     __table_args__ = (
         Index("idx_conversation_child_id", "child_id"),
+        # Keyset pagination of a child's conversations by (start_time, id)
+        Index("idx_conversation_child_start", "child_id", "start_time", "id"),
         Index("idx_conversation_session_id", "session_id"),
     )
 
@@ -1,7 +1,8 @@
 """Event Store interface and implementation for Event Sourcing pattern."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from datetime import UTC, datetime
+from typing import List, Dict, Any, Sequence
 from uuid import UUID
 
 
@@ -28,6 +29,19 @@ class EventStore(ABC):
         """Retrieve events for an aggregate."""
         pass
 
+    @abstractmethod
+    async def get_aggregate_versions(
+        self,
+        since: datetime | None = None,
+        event_types: Sequence[str] | None = None,
+    ) -> Dict[UUID, int]:
+        """Latest version of every aggregate with events recorded since ``since``.
+
+        Used by projections to find the aggregates they have to catch up on.
+        Only aggregates with an event of one of ``event_types`` are included.
+        """
+        pass
+
 
 class InMemoryEventStore(EventStore):
     """In-memory implementation of EventStore for testing."""
@@ -56,7 +70,8 @@ class InMemoryEventStore(EventStore):
                 "aggregate_type": aggregate_type,
                 "event_type": event_type,
                 "version": self._versions[key],
-                "data": event
+                "data": event,
+                "recorded_at": datetime.now(UTC),
             }
             self._events[key].append(event_with_metadata)
     
@@ -72,3 +87,45 @@ class InMemoryEventStore(EventStore):
         if after_version is not None:
             return [e for e in events if e.get("version", 0) > after_version]
         return events
+
+    async def save_events(
+        self,
+        aggregate_id: UUID,
+        events: List[Any],
+        expected_version: int = None,
+    ) -> None:
+        """Save domain events to memory store."""
+        current_version = self._versions.get(str(aggregate_id), 0)
+        if expected_version is not None and current_version != expected_version:
+            raise ValueError(
+                f"Concurrency conflict for aggregate {aggregate_id}: expected "
+                f"version {expected_version}, current version is {current_version}"
+            )
+        for event in events:
+            await self.append_events(
+                aggregate_id,
+                "ChildProfile",
+                event.__class__.__name__,
+                [event],
+            )
+
+    async def load_events(self, aggregate_id: UUID) -> List[Dict[str, Any]]:
+        """Load all events of an aggregate from memory store."""
+        return await self.get_events(aggregate_id)
+
+    async def get_aggregate_versions(
+        self,
+        since: datetime | None = None,
+        event_types: Sequence[str] | None = None,
+    ) -> Dict[UUID, int]:
+        """Get latest aggregate versions from memory store."""
+        versions = {}
+        for key, events in self._events.items():
+            matching = [
+                e for e in events
+                if (since is None or e["recorded_at"] >= since)
+                and (event_types is None or e["event_type"] in event_types)
+            ]
+            if matching:
+                versions[UUID(key)] = self._versions[key]
+        return versions
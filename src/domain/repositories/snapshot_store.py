@@ -0,0 +1,86 @@
+"""Snapshot Store interface and implementation for event-sourced aggregates."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Dict, List
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Serialized state of an aggregate after its first ``version`` events."""
+
+    aggregate_id: UUID
+    aggregate_type: str
+    version: int
+    schema_version: int
+    state: Dict[str, Any]
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+@dataclass(frozen=True)
+class SnapshotPolicy:
+    """When to snapshot an aggregate and how many snapshots to keep."""
+
+    every_n_events: int = 100
+    keep_last: int = 2
+
+    def should_snapshot(self, previous_version: int, version: int) -> bool:
+        """Whether going from ``previous_version`` to ``version`` crossed a
+        multiple of ``every_n_events``.
+        """
+        return version // self.every_n_events > previous_version // self.every_n_events
+
+
+class SnapshotStore(ABC):
+    """Abstract base class for snapshot store implementations."""
+
+    @abstractmethod
+    async def save_snapshot(self, snapshot: Snapshot) -> None:
+        """Store a snapshot; an existing one for the same version is replaced."""
+        pass
+
+    @abstractmethod
+    async def get_latest_snapshot(self, aggregate_id: UUID) -> Snapshot | None:
+        """Retrieve the snapshot with the highest version for an aggregate."""
+        pass
+
+    @abstractmethod
+    async def compact(self, keep_last: int = 1) -> int:
+        """Delete all but the newest ``keep_last`` snapshots of every aggregate.
+
+        Returns the number of snapshots deleted.
+        """
+        pass
+
+
+class InMemorySnapshotStore(SnapshotStore):
+    """In-memory implementation of SnapshotStore for testing."""
+
+    def __init__(self):
+        self._snapshots: Dict[str, List[Snapshot]] = {}
+
+    async def save_snapshot(self, snapshot: Snapshot) -> None:
+        """Save snapshot to memory store."""
+        key = str(snapshot.aggregate_id)
+        snapshots = [
+            s for s in self._snapshots.get(key, []) if s.version != snapshot.version
+        ]
+        snapshots.append(snapshot)
+        snapshots.sort(key=lambda s: s.version)
+        self._snapshots[key] = snapshots
+
+    async def get_latest_snapshot(self, aggregate_id: UUID) -> Snapshot | None:
+        """Get latest snapshot from memory store."""
+        snapshots = self._snapshots.get(str(aggregate_id))
+        return snapshots[-1] if snapshots else None
+
+    async def compact(self, keep_last: int = 1) -> int:
+        """Drop older snapshots from memory store."""
+        deleted = 0
+        for key, snapshots in self._snapshots.items():
+            if len(snapshots) > keep_last:
+                deleted += len(snapshots) - keep_last
+                self._snapshots[key] = snapshots[len(snapshots) - keep_last:]
+        return deleted
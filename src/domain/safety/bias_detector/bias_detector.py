@@ -3,6 +3,16 @@ from typing import Any
 from src.domain.models.safety_bias_models import ConversationContext
 from src.domain.models.safety_models.risk_level import RiskLevel
 from src.domain.models.safety_models.safety_analysis_result import SafetyAnalysisResult
+from src.domain.safety.pattern_matcher import Lexicon, SafetyPatternMatcher
+
+BIAS_MATCHER = SafetyPatternMatcher(
+    [
+        Lexicon("gender", ("girls are naturally better", "boys are stronger")),
+        Lexicon("cultural", ("normal families celebrate christmas",)),
+        Lexicon("socioeconomic", ("expensive new toy", "rich families")),
+        Lexicon("age", ("too young to understand",)),
+    ],
+)
 
 
 class AIBiasDetector:
@@ -44,35 +54,30 @@ class AIBiasDetector:
             categories = []
             suggestions = []
             contextual = {}
+            found = BIAS_MATCHER.categories(text)
             # Gender bias
-            if (
-                "girls are naturally better" in text.lower()
-                or "boys are stronger" in text.lower()
-            ):
+            if "gender" in found:
                 found_bias = True
                 scores["gender"] = 0.7
                 categories.append("gender")
                 suggestions.append("Use gender-neutral language.")
                 self.bias_statistics["gender_bias_detected"] += 1
             # Cultural bias
-            if "normal families celebrate christmas" in text.lower():
+            if "cultural" in found:
                 found_bias = True
                 scores["cultural"] = 0.6
                 categories.append("cultural")
                 suggestions.append("Be inclusive of diverse cultural backgrounds.")
                 self.bias_statistics["cultural_bias_detected"] += 1
             # Socioeconomic bias
-            if (
-                "expensive new toy" in text.lower()
-                or "rich families" in text.lower()
-            ):
+            if "socioeconomic" in found:
                 found_bias = True
                 scores["socioeconomic"] = 0.5
                 categories.append("socioeconomic")
                 suggestions.append("Avoid assumptions about socioeconomic status.")
                 self.bias_statistics["socioeconomic_bias_detected"] += 1
             # Age bias
-            if "too young to understand" in text.lower():
+            if "age" in found:
                 found_bias = True
                 scores["age"] = 0.4
                 categories.append("age")
@@ -0,0 +1,234 @@
+"""Compiled multi-pattern matcher for keyword and regex safety checks.
+
+Every lexicon term and pattern is compiled once into a single regex, so a
+text is scanned in one pass no matter how many terms are configured,
+instead of once per word or pattern. Literal terms are factored into a
+prefix trie, which keeps the cost per position independent of the size of
+the lexicon. Each hit reports the term that matched and every category the
+term belongs to.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+_INFLECTIONS = r"(?:s|es|ed|ing)?"
+
+
+@dataclass(frozen=True)
+class Lexicon:
+    """A category of terms to look for.
+
+    Attributes:
+        category: Name reported with every hit, e.g. "violence"
+        terms: Literal words or phrases, or regular expressions if ``regex``
+        regex: Whether ``terms`` are regular expressions
+        whole_words: Only match terms that are not part of a longer word,
+            so "hell" does not match "hello"
+        inflections: Also match the plural and common verb endings of
+            literal terms ("kill" matches "kills", "killing", "killed")
+    """
+
+    category: str
+    terms: tuple[str, ...]
+    regex: bool = False
+    whole_words: bool = True
+    inflections: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "terms", tuple(self.terms))
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    """A single match of a lexicon term in a text."""
+
+    term: str
+    categories: tuple[str, ...]
+    start: int
+    end: int
+    text: str
+
+    @property
+    def category(self) -> str:
+        return self.categories[0]
+
+
+class SafetyPatternMatcher:
+    """Matches many lexicons against a text in one pass.
+
+    Matching is case-insensitive. Hits do not overlap; where two literal
+    terms with the same options start at the same position the longer one
+    wins.
+
+    Example:
+        ```python
+        matcher = SafetyPatternMatcher([
+            Lexicon("violence", ("kill", "weapon"), inflections=True),
+            Lexicon("personal_info", (r"where do you live",), regex=True),
+        ])
+        matcher.categories("He has weapons")  # {"violence": ["weapon"]}
+        ```
+    """
+
+    def __init__(self, lexicons: Iterable[Lexicon]) -> None:
+        self.lexicons = tuple(lexicons)
+        # Literal terms sharing the same options are compiled into one
+        # prefix trie, so the engine follows a single branch per position
+        # instead of trying every term; regex terms get a group each.
+        literals: dict[tuple[bool, bool], dict[str, tuple[str, list[str]]]] = {}
+        patterns: dict[str, tuple[str, list[str]]] = {}
+        for lexicon in self.lexicons:
+            for term in lexicon.terms:
+                if not term:
+                    continue
+                if lexicon.regex:
+                    bucket, key = patterns, self._wrap(lexicon, term)
+                else:
+                    options = (lexicon.whole_words, lexicon.inflections)
+                    bucket, key = literals.setdefault(options, {}), term.lower()
+                _, categories = bucket.setdefault(key, (term, []))
+                if lexicon.category not in categories:
+                    categories.append(lexicon.category)
+
+        alternatives = []
+        # literal group -> lowercased term -> (term, categories)
+        self._literal_groups: dict[str, dict[str, tuple[str, tuple[str, ...]]]] = {}
+        self._pattern_groups: dict[str, tuple[str, tuple[str, ...]]] = {}
+        for index, ((whole_words, inflections), terms) in enumerate(literals.items()):
+            group = f"l{index}"
+            source = f"(?P<{group}>{_trie_source(terms)})"
+            if inflections:
+                source += _INFLECTIONS
+            if whole_words:
+                source = rf"(?<!\w){source}(?!\w)"
+            alternatives.append(source)
+            self._literal_groups[group] = {
+                key: (term, tuple(categories)) for key, (term, categories) in terms.items()
+            }
+        for index, (source, (term, categories)) in enumerate(patterns.items()):
+            group = f"r{index}"
+            alternatives.append(f"(?P<{group}>{source})")
+            self._pattern_groups[group] = (term, tuple(categories))
+        self._pattern = (
+            re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        )
+        # A word may be configured with different options in several
+        # lexicons; only one alternative can match, so the others are
+        # checked against the matched text to report all their categories.
+        self._related: dict[str, list[tuple[re.Pattern, str]]] = {}
+        if len(literals) > 1:
+            for lexicon in self.lexicons:
+                if lexicon.regex:
+                    continue
+                for term in lexicon.terms:
+                    key = term.lower()
+                    if term and sum(key in terms for terms in literals.values()) > 1:
+                        pattern = re.compile(self._wrap(lexicon, term), re.IGNORECASE)
+                        self._related.setdefault(key, []).append(
+                            (pattern, lexicon.category),
+                        )
+
+    @staticmethod
+    def _wrap(lexicon: Lexicon, term: str) -> str:
+        source = term if lexicon.regex else re.escape(term)
+        if lexicon.inflections and not lexicon.regex:
+            source += _INFLECTIONS
+        if lexicon.whole_words:
+            source = rf"(?<!\w)(?:{source})(?!\w)"
+        return source
+
+    def finditer(self, text: str) -> Iterable[PatternHit]:
+        """Yields every hit in ``text`` in order of position."""
+        if self._pattern is None or not text:
+            return
+        for match in self._pattern.finditer(text):
+            yield self._hit(match)
+
+    def find_all(self, text: str) -> list[PatternHit]:
+        """Returns every hit in ``text`` in order of position."""
+        return list(self.finditer(text))
+
+    def search(self, text: str) -> PatternHit | None:
+        """Returns the first hit in ``text``, or ``None``."""
+        return next(iter(self.finditer(text)), None)
+
+    def categories(self, text: str) -> dict[str, list[str]]:
+        """Maps each category found in ``text`` to its distinct matched terms."""
+        found: dict[str, list[str]] = {}
+        for hit in self.finditer(text):
+            for category in hit.categories:
+                terms = found.setdefault(category, [])
+                if hit.term not in terms:
+                    terms.append(hit.term)
+        return found
+
+    def sub(
+        self,
+        text: str,
+        replacement: str | Mapping[str, str] | Callable[[PatternHit], str],
+    ) -> str:
+        """Replaces every hit in one pass.
+
+        Args:
+            text: The text to clean
+            replacement: A fixed string, a mapping from term to replacement
+                (terms without an entry are kept), or a function of the hit
+
+        Returns:
+            The text with every hit replaced
+
+        """
+        if self._pattern is None or not text:
+            return text
+        if isinstance(replacement, str):
+            return self._pattern.sub(lambda match: replacement, text)
+
+        def _replace(match: re.Match) -> str:
+            hit = self._hit(match)
+            if isinstance(replacement, Mapping):
+                return replacement.get(hit.term, hit.text)
+            return replacement(hit)
+
+        return self._pattern.sub(_replace, text)
+
+    def _hit(self, match: re.Match) -> PatternHit:
+        group = match.lastgroup
+        matched = match.group()
+        if group in self._pattern_groups:
+            term, categories = self._pattern_groups[group]
+        else:
+            key = match.group(group).lower()
+            term, categories = self._literal_groups[group][key]
+            for pattern, category in self._related.get(key, ()):
+                if category not in categories and pattern.fullmatch(matched):
+                    categories += (category,)
+        return PatternHit(term, categories, match.start(), match.end(), matched)
+
+
+def _trie_source(terms: Iterable[str]) -> str:
+    """Builds a regex matching any of ``terms``, factored by common prefix.
+
+    Longer continuations are tried first, so the longest term wins.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def _render(node: dict) -> str:
+        branches = [
+            re.escape(char) + _render(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        source = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            source = f"(?:{source})?"
+        return source
+
+    return _render(trie)
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Any, Dict
 import logging
 
+from src.domain.safety.pattern_matcher import Lexicon, SafetyPatternMatcher
+
 try:
     import numpy as np
     import librosa
@@ -16,6 +18,20 @@ PITCH_SAD = 120
 ENERGY_SAD = 0.05
 ENERGY_ENERGETIC = 0.15
 
+# Text emotions in priority order: the first one found in the text wins
+_TEXT_EMOTION_WORDS = {
+    "happy": ("happy", "joy", "joyful", "excited", "fun", "yay"),
+    "sad": ("sad", "cry", "upset", "down"),
+    "frustrated": ("angry", "mad", "frustrated"),
+    "worried": ("scared", "afraid", "worried"),
+    "calm": ("calm", "peaceful", "relaxed"),
+    "curious": ("curious", "wonder", "question"),
+}
+_TEXT_EMOTION_MATCHER = SafetyPatternMatcher(
+    Lexicon(emotion, words, inflections=True)
+    for emotion, words in _TEXT_EMOTION_WORDS.items()
+)
+
 
 @dataclass
 class EmotionResult:
@@ -42,18 +58,18 @@ class EmotionAnalyzer:
         if not isinstance(text, str) or not text.strip():
             return EmotionResult("neutral", 0.5, {"neutral": 0.5})
 
-        text_lower = text.lower()
-        if any(word in text_lower for word in ["happy", "joy", "excited", "fun", "yay"]):
+        found = _TEXT_EMOTION_MATCHER.categories(text)
+        if "happy" in found:
             return EmotionResult("happy", 0.9, {"happy": 0.9}, sentiment_score=0.8)
-        if any(word in text_lower for word in ["sad", "cry", "upset", "down"]):
+        if "sad" in found:
             return EmotionResult("sad", 0.8, {"sad": 0.8}, sentiment_score=-0.6)
-        if any(word in text_lower for word in ["angry", "mad", "frustrated"]):
+        if "frustrated" in found:
             return EmotionResult("frustrated", 0.7, {"frustrated": 0.7}, sentiment_score=-0.4, arousal_score=0.8)
-        if any(word in text_lower for word in ["scared", "afraid", "worried"]):
+        if "worried" in found:
             return EmotionResult("worried", 0.75, {"worried": 0.75}, sentiment_score=-0.5, arousal_score=0.6)
-        if any(word in text_lower for word in ["calm", "peaceful", "relaxed"]):
+        if "calm" in found:
             return EmotionResult("calm", 0.8, {"calm": 0.8}, sentiment_score=0.3, arousal_score=0.2)
-        if any(word in text_lower for word in ["curious", "wonder", "question"]):
+        if "curious" in found:
             return EmotionResult("curious", 0.7, {"curious": 0.7}, sentiment_score=0.4, arousal_score=0.5)
         return EmotionResult("neutral", 0.5, {"neutral": 0.5}, sentiment_score=0.0, arousal_score=0.3)
 
@@ -1,3 +1,22 @@
+"""Encrypted field value object.
+
+Fields are lazy in both directions: a new value is only encrypted when it
+is persisted (``get_encrypted_representation``), and a stored value is only
+decrypted when it is first read. Reading a child profile without its
+medical notes therefore costs no cryptography at all.
+
+Decrypted values are kept for the current ``plaintext_scope`` (one per HTTP
+request, see PlaintextScopeMiddleware) so repeated reads decrypt once; when
+the scope ends the cached plaintext buffers are overwritten with zeros.
+Outside a scope nothing is cached and every read decrypts again.
+``EncryptedField.materialize`` decrypts many fields with one call to the
+encryption service, and ``EncryptedField.encrypt_pending`` encrypts many.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from src.domain.interfaces.encryption_interface import (
     EncryptionServiceInterface,
@@ -5,6 +24,11 @@ from src.domain.interfaces.encryption_interface import (
     SecureFieldInterface,
 )
 
+FieldValue = str | int | float | bool | list | dict
+
+# Marks values serialized as JSON; values stored before it are plain strings
+JSON_PREFIX = "json:"
+
 
 class EncryptedFieldError(Exception):
     """Exception raised for errors in EncryptedField operations."""
@@ -15,88 +39,190 @@ class EncryptedFieldError(Exception):
         )
 
 
-class EncryptedField(SecureFieldInterface[str | int | float | bool | list | dict]):
+class PlaintextCache:
+    """Serialized plaintext of the fields read in one scope."""
+
+    def __init__(self) -> None:
+        # Keyed by id(); the field is kept so the id cannot be reused
+        self._buffers: dict[int, tuple["EncryptedField", bytearray]] = {}
+
+    def get(self, field: "EncryptedField") -> bytearray | None:
+        entry = self._buffers.get(id(field))
+        return entry[1] if entry else None
+
+    def put(self, field: "EncryptedField", buffer: bytearray) -> None:
+        self._buffers[id(field)] = (field, buffer)
+
+    def zeroize(self) -> None:
+        """Overwrite every cached plaintext and forget it."""
+        for _, buffer in self._buffers.values():
+            _zeroize(buffer)
+        self._buffers.clear()
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+
+_plaintext_cache: ContextVar[PlaintextCache | None] = ContextVar(
+    "plaintext_cache",
+    default=None,
+)
+
+
+@contextmanager
+def plaintext_scope() -> Iterator[PlaintextCache]:
+    """Cache decrypted fields inside the block, and zeroize them after it.
+
+    Only the serialized buffers are overwritten; values already handed out
+    by ``get_value`` are ordinary Python objects and live on until collected.
+    """
+    cache = PlaintextCache()
+    token = _plaintext_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _plaintext_cache.reset(token)
+        cache.zeroize()
+
+
+def _zeroize(buffer: bytearray) -> None:
+    buffer[:] = bytes(len(buffer))
+
+
+class EncryptedField(SecureFieldInterface[FieldValue]):
     """Value object for encrypted storage of sensitive data.
 
     Provides transparent encryption and decryption for HIPAA/COPPA compliance.
     Uses dependency injection for encryption service to maintain clean architecture.
 
     Args:
-        value (str | int | float | bool | list | dict): The value to be encrypted. Should be serializable.
+        value (str | int | float | bool | list | dict): The value to be encrypted, serialized as JSON.
         encryption_service (EncryptionServiceInterface, optional): Service to handle encryption operations. Defaults to NullEncryptionService.
 
     Raises:
-        EncryptedFieldError: If value is not serializable (see note below).
-
-    Note:
-        Only basic types (str, int, float, bool, list, dict) are supported for serialization. For complex types, extend serialization logic as needed.
+        EncryptedFieldError: If value is not one of the supported types.
     """
 
     def __init__(
         self,
-        value: str | int | float | bool | list | dict,
-        encryption_service: EncryptionServiceInterface = None
+        value: FieldValue | None,
+        encryption_service: EncryptionServiceInterface | None = None,
     ) -> None:
         self._encryption_service = encryption_service or NullEncryptionService()
-        self._original_value = value
-        self._encrypted_data = self._serialize_and_encrypt(value)
-        self._is_encrypted = self._encryption_service.is_available()
-
-    def _serialize_and_encrypt(
-        self, value: str | int | float | bool | list | dict
-    ) -> str:
-        """Serialize the value and encrypt it.
-
-        Args:
-            value (str | int | float | bool | list | dict): The value to serialize and encrypt.
-
-        Returns:
-            str: Encrypted string representation of the value.
-        """
-        if value is None:
-            return ""
-        if isinstance(value, str):
-            serialized = value
-        elif isinstance(value, int | float | bool):
-            serialized = str(value)
-        elif isinstance(value, list | dict):
-            # For complex types, use string representation (consider using JSON
-            # for production)
-            serialized = str(value)
-        else:
-            # If you need to support more types, extend here
+        self._encrypted_data: str | None = None
+        # Plaintext of a new value until it is persisted
+        self._pending: bytearray | None = None
+        if value is not None:
+            self._pending = bytearray(self._serialize(value).encode())
+
+    @classmethod
+    def from_encrypted_data(
+        cls,
+        encrypted_data: str | None,
+        encryption_service: EncryptionServiceInterface | None = None,
+    ) -> "EncryptedField":
+        """Field of a stored value; nothing is decrypted until it is read."""
+        field = cls(None, encryption_service)
+        field._encrypted_data = encrypted_data or ""
+        return field
+
+    @staticmethod
+    def _serialize(value: FieldValue) -> str:
+        if not isinstance(value, str | int | float | bool | list | dict):
             raise EncryptedFieldError(type(value))
-        return self._encryption_service.encrypt(serialized)
+        return JSON_PREFIX + json.dumps(value)
+
+    @staticmethod
+    def _deserialize(serialized: str) -> FieldValue:
+        if serialized.startswith(JSON_PREFIX):
+            return json.loads(serialized[len(JSON_PREFIX):])
+        # Stored before values were serialized as JSON, as str(value)
+        return serialized
 
-    def get_value(self) -> str | int | float | bool | list | dict | None:
-        """Get the decrypted value.
+    def get_value(self) -> FieldValue | None:
+        """Get the decrypted value, decrypting it on first read in the scope.
 
         Returns:
-            str | int | float | bool | list | dict | None: The decrypted value, or None if not set.
+            str | int | float | bool | list | dict | None: The value, or None if not set.
         """
+        if self._pending is not None:
+            return self._deserialize(self._pending.decode())
         if not self._encrypted_data:
             return None
-        if self._is_encrypted:
-            decrypted_str = self._encryption_service.decrypt(self._encrypted_data)
-            return self._deserialize_value(decrypted_str)
-        return self._deserialize_value(self._encrypted_data)
-
-    def _deserialize_value(
-        self, serialized: str
-    ) -> str | int | float | bool | list | dict | None:
-        """Deserialize the string back to the original type.
-
-        Args:
-            serialized (str): The serialized string value.
-
-        Returns:
-            str | int | float | bool | list | dict | None: The deserialized value.
-
-        Note:
-            For production, implement robust deserialization logic (e.g., using type metadata or JSON). Currently, returns the string as-is for compatibility and safety.
+        cache = _plaintext_cache.get()
+        buffer = cache.get(self) if cache is not None else None
+        if buffer is None:
+            buffer = bytearray(
+                self._encryption_service.decrypt(self._encrypted_data).encode()
+            )
+            if cache is None:
+                try:
+                    return self._deserialize(buffer.decode())
+                finally:
+                    _zeroize(buffer)
+            cache.put(self, buffer)
+        return self._deserialize(buffer.decode())
+
+    def is_encrypted(self) -> bool:
+        """Check if the stored representation is encrypted."""
+        return self._encryption_service.is_available()
+
+    def is_materialized(self) -> bool:
+        """Whether reading the value needs no decryption."""
+        if self._pending is not None or not self._encrypted_data:
+            return True
+        cache = _plaintext_cache.get()
+        return cache is not None and cache.get(self) is not None
+
+    def get_encrypted_representation(self) -> str:
+        """Get the encrypted representation for persistence, encrypting a new value now."""
+        if self._pending is not None:
+            self._seal(self._encryption_service.encrypt(self._pending.decode()))
+        return self._encrypted_data or ""
+
+    def _seal(self, encrypted_data: str) -> None:
+        self._encrypted_data = encrypted_data
+        _zeroize(self._pending)
+        self._pending = None
+
+    @staticmethod
+    def materialize(fields: Iterable["EncryptedField | None"]) -> None:
+        """Decrypt the given fields into the current scope, one service call per service.
+
+        Fields that are already readable are skipped. Outside a
+        ``plaintext_scope`` there is nowhere to keep the values, so this does
+        nothing.
         """
-        # For production, implement robust deserialization if you need to restore original types. This is left as-is to avoid unsafe eval or guessing.
-        return serialized
-
-    def __hash__(self):
-        return hash((self._encrypted_data, self._is_encrypted))
+        cache = _plaintext_cache.get()
+        if cache is None:
+            return
+        for service, group in _by_service(
+            field for field in fields if field is not None and not field.is_materialized()
+        ):
+            plaintexts = service.decrypt_many([field._encrypted_data for field in group])
+            for field, plaintext in zip(group, plaintexts):
+                cache.put(field, bytearray(plaintext.encode()))
+
+    @staticmethod
+    def encrypt_pending(fields: Iterable["EncryptedField | None"]) -> None:
+        """Encrypt the new values of the given fields, one service call per service."""
+        for service, group in _by_service(
+            field for field in fields if field is not None and field._pending is not None
+        ):
+            encrypted = service.encrypt_many([field._pending.decode() for field in group])
+            for field, encrypted_data in zip(group, encrypted):
+                field._seal(encrypted_data)
+
+    def __repr__(self) -> str:
+        """Safe representation that doesn't expose the value."""
+        return f"EncryptedField(encrypted={self.is_encrypted()})"
+
+
+def _by_service(
+    fields: Iterable[EncryptedField],
+) -> list[tuple[EncryptionServiceInterface, list[EncryptedField]]]:
+    groups: dict[int, tuple[EncryptionServiceInterface, list[EncryptedField]]] = {}
+    for field in fields:
+        service = field._encryption_service
+        groups.setdefault(id(service), (service, []))[1].append(field)
+    return list(groups.values())
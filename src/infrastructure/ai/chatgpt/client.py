@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 try:
-    from openai import OpenAI
+    import openai  # noqa: F401
 
     OPENAI_AVAILABLE = True
 except ImportError as e:
@@ -20,6 +20,7 @@ from src.infrastructure.logging_config import get_logger
 from .fallback_responses import FallbackResponseGenerator
 from .response_enhancer import ResponseEnhancer
 from .safety_filter import SafetyFilter
+from .transport import OpenAITransport, get_openai_transport
 
 logger = get_logger(__name__, component="infrastructure")
 
@@ -29,20 +30,37 @@ DEFAULT_TEMPERATURE = 0.7
 DEFAULT_PRESENCE_PENALTY = 0.1
 DEFAULT_FREQUENCY_PENALTY = 0.1
 MAX_RESPONSE_WORDS = 150
+DEFAULT_MODEL = "gpt-3.5-turbo"
+DEFAULT_REQUEST_TIMEOUT = 20.0
 
 
 class ChatGPTClient:
-    """ChatGPT client with child safety filtering and content moderation."""
+    """ChatGPT client with child safety filtering and content moderation.
 
-    def __init__(self, api_key: str = None) -> None:
+    Completions go through a shared, pooled ``OpenAITransport`` so they never
+    block the event loop and concurrent chats reuse connections.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        transport: OpenAITransport | None = None,
+        base_url: str | None = None,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ) -> None:
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "CRITICAL: OpenAI API key is required for production deployment. "
                 "Set OPENAI_API_KEY environment variable or pass api_key parameter."
             )
-        # Initialize OpenAI client - no fallback in production
-        self.client = OpenAI(api_key=self.api_key)
+        # Shared async OpenAI transport - no fallback in production
+        self.transport = transport or get_openai_transport(
+            self.api_key,
+            base_url=base_url or os.getenv("OPENAI_BASE_URL"),
+        )
+        self.client = self.transport.client
+        self.request_timeout = request_timeout
         # Initialize safety components
         self.safety_filter = SafetyFilter()
         self.response_enhancer = ResponseEnhancer()
@@ -69,8 +87,9 @@ class ChatGPTClient:
             # Create safe message
             safe_message = self.safety_filter.sanitize_message(message)
             # Call ChatGPT
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+            response = await self.transport.create_chat_completion(
+                timeout=self.request_timeout,
+                model=DEFAULT_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": safe_message},
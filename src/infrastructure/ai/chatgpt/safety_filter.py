@@ -1,6 +1,5 @@
 """Safety Filter for ChatGPT - Child Safety Content Filtering"""
 
-import re
 from typing import Any
 
 from src.domain.constants import (
@@ -9,10 +8,40 @@ from src.domain.constants import (
 from src.domain.constants import (
     MAX_RESPONSE_LENGTH,
 )
+from src.domain.safety.pattern_matcher import Lexicon, SafetyPatternMatcher
 from src.infrastructure.logging_config import get_logger
 
 logger = get_logger(__name__, component="infrastructure")
 
+DANGEROUS_PATTERNS = (
+    r"how to (hurt|kill|fight)",
+    r"where to (buy|get|find) (weapon|drug|alcohol)",
+    r"(scary|frightening|terrifying) (story|movie|game)",
+    r"(violence|violent|aggressive) (game|movie|show)",
+)
+NEGATIVE_INDICATORS = (
+    "don't",
+    "can't",
+    "won't",
+    "never",
+    "impossible",
+    "difficult",
+    "hard",
+    "trouble",
+    "problem",
+    "wrong",
+)
+SANITIZE_REPLACEMENTS = {
+    "stupid": "silly",
+    "dumb": "funny",
+    "hate": "don't like",
+    "kill": "stop",
+    "die": "sleep",
+    "fight": "play",
+    "scary": "interesting",
+    "monster": "funny creature",
+}
+
 
 class SafetyFilter:
     """Safety filter for child - specific content filtering and protection."""
@@ -68,14 +97,27 @@ class SafetyFilter:
             "Don't discuss adult topics",
             "Redirect inappropriate questions to safe topics",
         ]
+        # Each word list is compiled once and scanned in a single pass.
+        # Forbidden words match inside longer words ("blood" in "bloody")
+        self._forbidden_matcher = SafetyPatternMatcher(
+            [Lexicon("forbidden", tuple(self.forbidden_words), whole_words=False)],
+        )
+        self._dangerous_matcher = SafetyPatternMatcher(
+            [Lexicon("dangerous", DANGEROUS_PATTERNS, regex=True)],
+        )
+        self._negative_matcher = SafetyPatternMatcher(
+            [Lexicon("negative", NEGATIVE_INDICATORS)],
+        )
+        self._sanitize_matcher = SafetyPatternMatcher(
+            [Lexicon("replace", tuple(SANITIZE_REPLACEMENTS))],
+        )
 
     def analyze_message_safety(self, message: str) -> dict[str, Any]:
         """Analyze message safety for child - appropriate content."""
-        message_lower = message.lower()
         # Check for forbidden words
-        forbidden_found = [
-            word for word in self.forbidden_words if word in message_lower
-        ]
+        forbidden_found = self._forbidden_matcher.categories(message).get(
+            "forbidden", [],
+        )
         if forbidden_found:
             return {
                 "safe": False,
@@ -84,20 +126,14 @@ class SafetyFilter:
                 "reason": f"Contains forbidden words: {', '.join(forbidden_found)}",
             }
         # Check for dangerous patterns
-        dangerous_patterns = [
-            r"how to (hurt|kill|fight)",
-            r"where to (buy|get|find) (weapon|drug|alcohol)",
-            r"(scary|frightening|terrifying) (story|movie|game)",
-            r"(violence|violent|aggressive) (game|movie|show)",
-        ]
-        for pattern in dangerous_patterns:
-            if re.search(pattern, message_lower):
-                return {
-                    "safe": False,
-                    "issues": [pattern],
-                    "severity": "high",
-                    "reason": f"Contains dangerous pattern: {pattern}",
-                }
+        dangerous = self._dangerous_matcher.search(message)
+        if dangerous:
+            return {
+                "safe": False,
+                "issues": [dangerous.term],
+                "severity": "high",
+                "reason": f"Contains dangerous pattern: {dangerous.term}",
+            }
         return {
             "safe": True,
             "issues": [],
@@ -108,33 +144,14 @@ class SafetyFilter:
     def sanitize_message(self, message: str) -> str:
         """Clean message from inappropriate content."""
         # Replace inappropriate words
-        replacements = {
-            "stupid": "silly",
-            "dumb": "funny",
-            "hate": "don't like",
-            "kill": "stop",
-            "die": "sleep",
-            "fight": "play",
-            "scary": "interesting",
-            "monster": "funny creature",
-        }
-        cleaned_message = message
-        for bad_word, replacement in replacements.items():
-            cleaned_message = re.sub(
-                r"\b" + re.escape(bad_word) + r"\b",
-                replacement,
-                cleaned_message,
-                flags=re.IGNORECASE,
-            )
-        return cleaned_message
+        return self._sanitize_matcher.sub(message, SANITIZE_REPLACEMENTS)
 
     def analyze_response_safety(self, response: str) -> dict[str, Any]:
         """Analyze response safety for child - appropriate content."""
-        response_lower = response.lower()
         # Check for forbidden words in response
-        forbidden_found = [
-            word for word in self.forbidden_words if word in response_lower
-        ]
+        forbidden_found = self._forbidden_matcher.categories(response).get(
+            "forbidden", [],
+        )
         if forbidden_found:
             return {
                 "safe": False,
@@ -143,20 +160,8 @@ class SafetyFilter:
                 "reason": f"Response contains forbidden content: {', '.join(forbidden_found)}",
             }
         # Check for negative tone
-        negative_indicators = [
-            "don't",
-            "can't",
-            "won't",
-            "never",
-            "impossible",
-            "difficult",
-            "hard",
-            "trouble",
-            "problem",
-            "wrong",
-        ]
-        negative_count = sum(
-            1 for indicator in negative_indicators if indicator in response_lower
+        negative_count = len(
+            self._negative_matcher.categories(response).get("negative", []),
         )
         if negative_count > NEGATIVE_THRESHOLD:
             return {
@@ -0,0 +1,155 @@
+"""Shared async transport for OpenAI chat completions.
+
+All ChatGPT clients in a process share one ``AsyncOpenAI`` instance per API
+key and base URL, backed by a bounded connection pool from the process-wide
+HTTP client registry. Requests carry an explicit timeout and pass through a
+concurrency limiter, so a burst of chats queues in the process instead of
+opening unbounded connections, and no completion ever blocks the event loop.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from src.infrastructure.external_apis.http_client_registry import (
+    HTTPClientConfig,
+    get_http_client_registry,
+)
+from src.infrastructure.logging_config import get_logger
+
+try:
+    from openai import AsyncOpenAI
+
+    OPENAI_AVAILABLE = True
+except ImportError:
+    AsyncOpenAI = None
+    OPENAI_AVAILABLE = False
+
+logger = get_logger(__name__, component="infrastructure")
+
+
+@dataclass(frozen=True)
+class OpenAITransportConfig:
+    """Connection pool, timeout and concurrency limits for OpenAI calls."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    request_timeout: float = 30.0
+    max_concurrent_requests: int = 64
+    max_retries: int = 2
+
+    def http_client_config(self) -> HTTPClientConfig:
+        return HTTPClientConfig(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.request_timeout,
+            write_timeout=self.request_timeout,
+        )
+
+    def timeout(self, request_timeout: float | None = None) -> httpx.Timeout:
+        return httpx.Timeout(
+            request_timeout or self.request_timeout,
+            connect=self.connect_timeout,
+        )
+
+
+class OpenAITransport:
+    """Pooled ``AsyncOpenAI`` client with a per-process concurrency limit."""
+
+    def __init__(
+        self,
+        api_key: str,
+        config: OpenAITransportConfig | None = None,
+        base_url: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        if not OPENAI_AVAILABLE:
+            raise ImportError(
+                "OpenAI package is required for the OpenAI transport. "
+                "Install with: pip install openai"
+            )
+        self.config = config or OpenAITransportConfig()
+        # The default endpoint shares the "openai" pool with the other
+        # OpenAI clients; custom endpoints get a pool of their own
+        self.http_client = http_client or get_http_client_registry().get_client(
+            f"openai:{base_url}" if base_url else "openai",
+            config=self.config.http_client_config(),
+        )
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=self.http_client,
+            max_retries=self.config.max_retries,
+            timeout=self.config.timeout(),
+        )
+        self._limiter = asyncio.Semaphore(self.config.max_concurrent_requests)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of completions currently holding a concurrency slot."""
+        return self._in_flight
+
+    async def create_chat_completion(
+        self,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Creates a chat completion within the concurrency limit.
+
+        Goes through ``chat.completions.create`` on the pooled client, so the
+        SDK's retries and error mapping still apply.
+
+        Args:
+            timeout: Per-request timeout in seconds, overriding the default.
+            **kwargs: Chat completion request fields (model, messages, ...).
+
+        """
+        async with self._limiter:
+            self._in_flight += 1
+            try:
+                return await self.client.chat.completions.create(
+                    timeout=self.config.timeout(timeout),
+                    **kwargs,
+                )
+            finally:
+                self._in_flight -= 1
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections."""
+        await self.client.close()
+
+
+_transports: dict[tuple[str, str | None], OpenAITransport] = {}
+
+
+def get_openai_transport(
+    api_key: str,
+    base_url: str | None = None,
+    config: OpenAITransportConfig | None = None,
+) -> OpenAITransport:
+    """Get the shared transport for an API key and base URL.
+
+    ``config`` only applies when the transport is first created.
+    """
+    key = (api_key, base_url)
+    transport = _transports.get(key)
+    if transport is None:
+        transport = OpenAITransport(api_key, config=config, base_url=base_url)
+        _transports[key] = transport
+        logger.info("Created shared OpenAI transport")
+    return transport
+
+
+async def close_openai_transports() -> None:
+    """Closes every shared transport; call on application shutdown."""
+    transports = list(_transports.values())
+    _transports.clear()
+    for transport in transports:
+        await transport.aclose()
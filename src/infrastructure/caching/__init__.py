@@ -3,11 +3,19 @@
 from .cache_config import CacheConfig
 from .redis_cache import RedisCacheManager as RedisCache, get_cache_manager
 from src.infrastructure.caching.strategies.invalidation_strategy import CacheInvalidationStrategy
+from .ai_response_cache import ai_response_cache_key, get_ai_response_cache
+from .tiered_cache import CacheMetrics, LRUCacheTier, RedisCacheTier, TieredCache
 
 __all__ = [
     "CacheConfig",
     "CacheInvalidationStrategy",
+    "CacheMetrics",
+    "LRUCacheTier",
     "RedisCache",
     "RedisCacheManager",
+    "RedisCacheTier",
+    "TieredCache",
+    "ai_response_cache_key",
+    "get_ai_response_cache",
     "get_cache_manager",
 ]
@@ -0,0 +1,130 @@
+"""Shared cache for generated AI responses.
+
+Responses are keyed on the normalized prompt, the child's age band and the
+safety profile (parent guidelines and conversation context) — never on the
+child's name — so the same question asked by every child in an age band is
+answered from one entry. Callers remove the name from the response before
+caching it and put it back on a hit.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections.abc import Sequence
+from typing import Any
+
+from src.infrastructure.logging_config import get_logger
+
+from .cache_config import CacheConfig
+from .tiered_cache import TieredCache
+
+logger = get_logger(__name__, component="infrastructure")
+
+AI_RESPONSE_CACHE_NAME = CacheConfig.AI_RESPONSE_PREFIX.rstrip(":")
+CHILD_NAME_PLACEHOLDER = "{{child_name}}"
+
+_CONTRACTIONS = {
+    "what's": "what is",
+    "where's": "where is",
+    "who's": "who is",
+    "how's": "how is",
+    "why's": "why is",
+    "when's": "when is",
+    "it's": "it is",
+    "that's": "that is",
+    "there's": "there is",
+    "i'm": "i am",
+    "you're": "you are",
+    "they're": "they are",
+    "we're": "we are",
+    "can't": "can not",
+    "cannot": "can not",
+    "don't": "do not",
+    "doesn't": "does not",
+    "isn't": "is not",
+    "aren't": "are not",
+}
+_APOSTROPHES = str.maketrans({"’": "'", "‘": "'", "`": "'"})
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: str) -> str:
+    """Reduces a prompt to a canonical form for cache lookups.
+
+    Case, Unicode compatibility forms, punctuation, repeated whitespace and
+    common English contractions are normalized, so "What's a volcano?" and
+    "what is a  volcano" map to the same key.
+    """
+    text = unicodedata.normalize("NFKC", text).translate(_APOSTROPHES).casefold()
+    text = _PUNCTUATION.sub(" ", text)
+    words = [_CONTRACTIONS.get(word, word) for word in text.split()]
+    return _WHITESPACE.sub(" ", " ".join(words)).strip(" '")
+
+
+def ai_response_cache_key(
+    message: str,
+    age_band: str,
+    safety_profile: str = "",
+    context: Sequence[dict[str, str]] | None = None,
+) -> str:
+    """Builds the cache key for an AI response.
+
+    Args:
+        message: The child's message
+        age_band: Age group of the child, e.g. "young child"
+        safety_profile: Anything else that changes the answer, such as
+            parent guidelines
+        context: Conversation messages sent along with the prompt
+
+    Returns:
+        A fixed-length key without any personal data
+
+    """
+    digest = hashlib.sha256()
+    for part in (normalize_prompt(message), age_band, safety_profile):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    for item in context or ():
+        digest.update(f"{item.get('role')}:{item.get('content')}".encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:32]
+
+
+def depersonalize(text: str, child_name: str) -> str:
+    """Replaces the child's name with a placeholder before caching."""
+    if not child_name.strip():
+        return text
+    pattern = rf"(?<!\w){re.escape(child_name.strip())}(?!\w)"
+    return re.sub(pattern, CHILD_NAME_PLACEHOLDER, text)
+
+
+def personalize(text: str, child_name: str) -> str:
+    """Restores the child's name in a cached response."""
+    return text.replace(CHILD_NAME_PLACEHOLDER, child_name)
+
+
+# One cache per Redis client; each holds its client, so the ids stay unique
+_ai_response_caches: dict[int, TieredCache] = {}
+
+
+def get_ai_response_cache(redis_client: Any | None = None) -> TieredCache:
+    """Get the shared AI response cache backed by ``redis_client``.
+
+    Services using the same client, or none, share one cache; without a
+    client the cache is in-process only.
+    """
+    cache = _ai_response_caches.get(id(redis_client))
+    if cache is None:
+        cache = _ai_response_caches[id(redis_client)] = TieredCache(
+            AI_RESPONSE_CACHE_NAME,
+            max_entries=10_000,
+            max_bytes=32 * 1024 * 1024,
+            default_ttl=CacheConfig.AI_RESPONSE_TTL,
+            redis_client=redis_client,
+            l1_ttl=60.0,
+        )
+        logger.info(
+            f"AI response cache created (redis={'on' if redis_client else 'off'})",
+        )
+    return cache
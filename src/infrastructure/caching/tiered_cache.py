@@ -0,0 +1,299 @@
+"""Bounded two-tier cache: in-process LRU (L1) in front of Redis (L2).
+
+L1 is an LRU with per-entry TTLs that is bounded both by entry count and by
+the accounted size of its values, so a burst of large LLM responses cannot
+grow the process without limit. L2 is shared by every process through
+Redis. Concurrent misses for the same key are collapsed into a single load
+(single-flight), and every cache keeps hit/miss/eviction metrics that are
+also exported to Prometheus.
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from prometheus_client import Counter
+
+from src.infrastructure.logging_config import get_logger
+from src.infrastructure.performance.single_flight import SingleFlight
+
+logger = get_logger(__name__, component="infrastructure")
+
+CACHE_EVENTS = Counter(
+    "cache_events_total",
+    "Tiered cache hits, misses, evictions and coalesced loads",
+    ["cache", "event"],
+)
+
+SizeOf = Callable[[Any], int]
+
+
+def default_sizeof(value: Any) -> int:
+    """Approximate size of a cached value in bytes."""
+    if isinstance(value, bytes | bytearray | str):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class CacheMetrics:
+    """Counters for one cache instance."""
+
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    coalesced: int = 0
+    errors: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.l1_hits + self.l2_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        return {**asdict(self), "hits": self.hits, "hit_ratio": self.hit_ratio}
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float | None
+
+
+class LRUCacheTier:
+    """In-process LRU with per-entry TTL and size accounting.
+
+    Entries are evicted least-recently-used first whenever either
+    ``max_entries`` or ``max_bytes`` would be exceeded; expired entries are
+    dropped when they are read. Values larger than ``max_bytes`` are never
+    stored. Not thread-safe; meant for use from one event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        default_ttl: float | None = 300.0,
+        sizeof: SizeOf = default_sizeof,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: CacheMetrics | None = None,
+        name: str = "lru",
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self.metrics = metrics or CacheMetrics()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the cached value or ``None``, refreshing its LRU position."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= self.clock():
+            self._remove(key)
+            _record(self.metrics, self.name, "expirations")
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> bool:
+        """Stores ``value``; returns ``False`` if it is too large to cache."""
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return False
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(value, size, expires_at)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            _record(self.metrics, self.name, "evictions")
+        return True
+
+    def delete(self, key: Hashable) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+class RedisCacheTier:
+    """Shared cache tier in Redis; errors degrade to cache misses."""
+
+    def __init__(self, redis_client: Any, prefix: str = "cache:") -> None:
+        self.redis_client = redis_client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> str | bytes | None:
+        return await self.redis_client.get(f"{self.prefix}{key}")
+
+    async def set(self, key: str, value: str | bytes, ttl: float) -> None:
+        await self.redis_client.setex(f"{self.prefix}{key}", max(1, int(ttl)), value)
+
+    async def delete(self, key: str) -> None:
+        await self.redis_client.delete(f"{self.prefix}{key}")
+
+
+class TieredCache:
+    """Read-through L1/L2 cache with single-flight loading.
+
+    Lookups check L1, then L2 (promoting L2 hits into L1). ``get_or_load``
+    runs the loader once per key no matter how many callers miss at the same
+    time; the others await the same result. Values stored in L2 must be
+    ``str`` or ``bytes``, so callers serialize before caching.
+
+    Example:
+        ```python
+        cache = TieredCache("ai_responses", redis_client=redis_client)
+        payload = await cache.get_or_load(key, lambda: generate(prompt))
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        default_ttl: float = 300.0,
+        redis_client: Any | None = None,
+        l1_ttl: float | None = None,
+        sizeof: SizeOf = default_sizeof,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.default_ttl = default_ttl
+        self.l1_ttl = l1_ttl
+        self.metrics = CacheMetrics()
+        self.l1 = LRUCacheTier(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            default_ttl=default_ttl,
+            sizeof=sizeof,
+            clock=clock,
+            metrics=self.metrics,
+            name=name,
+        )
+        self.l2 = (
+            RedisCacheTier(redis_client, prefix=f"{name}:")
+            if redis_client is not None
+            else None
+        )
+        self._flight = SingleFlight(name)
+
+    async def get(self, key: Hashable) -> Any | None:
+        """Returns the cached value for ``key`` or ``None`` on a miss."""
+        value = self.l1.get(key)
+        if value is not None:
+            self._count("l1_hits")
+            return value
+        if self.l2 is not None:
+            try:
+                value = await self.l2.get(str(key))
+            except Exception as e:
+                self._count("errors")
+                logger.warning(f"L2 cache read failed for '{self.name}': {e}")
+                value = None
+            if value is not None:
+                self._count("l2_hits")
+                self.l1.set(key, value, self._l1_ttl(self.default_ttl))
+                return value
+        self._count("misses")
+        return None
+
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Stores ``value`` in both tiers."""
+        ttl = self.default_ttl if ttl is None else ttl
+        self.l1.set(key, value, self._l1_ttl(ttl))
+        self._count("sets")
+        if self.l2 is not None:
+            try:
+                await self.l2.set(str(key), value, ttl)
+            except Exception as e:
+                self._count("errors")
+                logger.warning(f"L2 cache write failed for '{self.name}': {e}")
+
+    async def delete(self, key: Hashable) -> None:
+        self.l1.delete(key)
+        if self.l2 is not None:
+            try:
+                await self.l2.delete(str(key))
+            except Exception as e:
+                self._count("errors")
+                logger.warning(f"L2 cache delete failed for '{self.name}': {e}")
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """Returns the cached value, loading and caching it once on a miss.
+
+        Concurrent misses for ``key`` share one load, which a cancelled
+        caller does not cancel for the others. A ``None`` result from
+        ``loader`` is returned but not cached; if the loader raises, every
+        waiting caller receives the exception.
+        """
+        value = self.l1.get(key)
+        if value is not None:
+            self._count("l1_hits")
+            return value
+        if key in self._flight:
+            self._count("coalesced")
+        return await self._flight.do(key, lambda: self._load(key, loader, ttl))
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float | None,
+    ) -> Any:
+        value = await self.get(key)
+        if value is None:
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl)
+        return value
+
+    def _l1_ttl(self, ttl: float) -> float:
+        return min(ttl, self.l1_ttl) if self.l1_ttl is not None else ttl
+
+    def _count(self, event: str) -> None:
+        _record(self.metrics, self.name, event)
+
+
+def _record(metrics: CacheMetrics, cache: str, event: str) -> None:
+    setattr(metrics, event, getattr(metrics, event) + 1)
+    CACHE_EVENTS.labels(cache=cache, event=event).inc()
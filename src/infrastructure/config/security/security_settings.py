@@ -42,6 +42,15 @@ class SecuritySettings(BaseApplicationSettings):
     MAX_LOGIN_ATTEMPTS: int = Field(5, env="MAX_LOGIN_ATTEMPTS")
     LOCKOUT_DURATION_SECONDS: int = Field(300, env="LOCKOUT_DURATION_SECONDS")
 
+    PASSWORD_MIN_LENGTH: int = Field(8, env="PASSWORD_MIN_LENGTH")
+    # Changing the cost rehashes passwords as their owners log in
+    PASSWORD_HASH_ROUNDS: int = Field(12, env="PASSWORD_HASH_ROUNDS")
+    # Hashing pool; workers default to one per CPU, queue to 8 per worker
+    PASSWORD_HASH_WORKERS: int | None = Field(None, env="PASSWORD_HASH_WORKERS")
+    PASSWORD_HASH_MAX_PENDING: int | None = Field(
+        None, env="PASSWORD_HASH_MAX_PENDING"
+    )
+
     JWT_ALGORITHM: str = Field("HS256", env="JWT_ALGORITHM")
     JWT_EXPIRE_MINUTES: int = Field(30, env="JWT_EXPIRE_MINUTES")
     JWT_REFRESH_EXPIRE_DAYS: int = Field(30, env="JWT_REFRESH_EXPIRE_DAYS")
@@ -1,9 +1,31 @@
 """Dependency injection configuration for the application."""
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from src.application.services.ai.context_window import (
+        ContextAssembler,
+        ContextWindowManager,
+    )
+    from src.application.use_cases.process_esp32_audio import (
+        ProcessESP32AudioUseCase,
+    )
+    from src.infrastructure.persistence.activity_timeseries_store import (
+        ActivityTimeSeriesStore,
+    )
+    from src.infrastructure.pagination.keyset import KeysetPaginator
     from src.infrastructure.persistence.child_repository import ChildRepository
+    from src.infrastructure.read_models.child_profile_projection import (
+        ChildProfileProjection,
+    )
+    from src.infrastructure.read_models.child_profile_read_model import (
+        RedisChildProfileReadModelStore,
+    )
+    from src.infrastructure.persistence.snapshot_store import (
+        PostgresSnapshotStore,
+        SnapshotCompactor,
+    )
 
 
 from fastapi import Depends
@@ -27,24 +49,87 @@ def get_event_store() -> EventStore:
     return EventStoreDB(database)
 
 
+@lru_cache(maxsize=1)
+def get_snapshot_store() -> "PostgresSnapshotStore":
+    """Get the shared store of aggregate snapshots."""
+    from src.infrastructure.persistence.database_manager import Database
+    from src.infrastructure.persistence.snapshot_store import PostgresSnapshotStore
+
+    return PostgresSnapshotStore(Database())
+
+
+@lru_cache(maxsize=1)
+def get_snapshot_compactor() -> "SnapshotCompactor":
+    """Get the background task deleting superseded snapshots."""
+    from src.domain.repositories.snapshot_store import SnapshotPolicy
+    from src.infrastructure.persistence.snapshot_store import SnapshotCompactor
+
+    return SnapshotCompactor(get_snapshot_store(), keep_last=SnapshotPolicy().keep_last)
+
+
 def get_child_repository() -> "ChildRepository":
     """Get child repository with resolved dependencies."""
     event_store = get_event_store()
-    return EventSourcedChildRepository(event_store)
+    return EventSourcedChildRepository(event_store, snapshot_store=get_snapshot_store())
+
+
+@lru_cache(maxsize=1)
+def get_child_profile_read_model_store() -> "RedisChildProfileReadModelStore":
+    """Get the shared, Redis-backed child profile read model."""
+    import redis.asyncio as redis
+
+    from src.infrastructure.config.settings import get_settings
+    from src.infrastructure.read_models.child_profile_read_model import (
+        RedisChildProfileReadModelStore,
+    )
+
+    redis_client = redis.from_url(get_settings().REDIS_URL)
+    return RedisChildProfileReadModelStore(redis_client)
+
+
+@lru_cache(maxsize=1)
+def get_child_profile_projection() -> "ChildProfileProjection":
+    """Get the projection keeping the child profile read model up to date."""
+    from src.infrastructure.read_models.child_profile_projection import (
+        ChildProfileProjection,
+    )
+
+    return ChildProfileProjection(
+        get_event_store(),
+        get_child_profile_read_model_store(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_activity_timeseries_store() -> "ActivityTimeSeriesStore":
+    """Get the shared store of child usage and safety events."""
+    from src.infrastructure.persistence.activity_timeseries_store import (
+        ActivityTimeSeriesStore,
+    )
+    from src.infrastructure.persistence.database_manager import Database
+
+    return ActivityTimeSeriesStore(Database())
+
+
+@lru_cache(maxsize=1)
+def get_keyset_paginator() -> "KeysetPaginator":
+    """Get the cursor paginator shared by listing endpoints."""
+    from src.infrastructure.pagination.keyset import KeysetPaginator
+
+    return KeysetPaginator()
 
 
 # Service getters
 def get_manage_child_profile_use_case():
     """Get manage child profile use case."""
     from src.application.use_cases.manage_child_profile import ManageChildProfileUseCase
-    from src.infrastructure.read_models.child_profile_read_model import ChildProfileReadModelStore
     from src.infrastructure.messaging.kafka_event_bus import KafkaEventBus
 
     # Get repository dependency
     child_repository = get_child_repository()
 
-    # Initialize read model store
-    read_model_store = ChildProfileReadModelStore()
+    # Shared read model, kept current by the projection
+    read_model_store = get_child_profile_read_model_store()
 
     # Initialize event bus with default configuration for development
     event_bus = KafkaEventBus(
@@ -55,7 +140,8 @@ def get_manage_child_profile_use_case():
     return ManageChildProfileUseCase(
         child_repository=child_repository,
         child_profile_read_model_store=read_model_store,
-        event_bus=event_bus
+        event_bus=event_bus,
+        projection=get_child_profile_projection(),
     )
 
 
@@ -65,13 +151,80 @@ def get_generate_dynamic_story_use_case():
     return GenerateDynamicStoryUseCase()
 
 
+@lru_cache(maxsize=1)
+def get_conversation_context_window() -> "ContextWindowManager":
+    """Get the per-child recent turns and rolling summaries, kept in Redis."""
+    from src.application.services.ai.context_window import (
+        ContextWindowManager,
+        InMemoryConversationContextStore,
+    )
+    from src.infrastructure.config.settings import get_settings
+
+    settings = get_settings()
+    if not settings.ENABLE_REDIS:
+        return ContextWindowManager(InMemoryConversationContextStore())
+
+    import redis.asyncio as redis
+
+    from src.infrastructure.persistence.redis_conversation_context_repository import (
+        RedisConversationContextRepository,
+    )
+
+    return ContextWindowManager(
+        RedisConversationContextRepository(redis.from_url(settings.REDIS_URL)),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_context_assembler() -> "ContextAssembler":
+    """Get the token budget of the history sent to the AI provider."""
+    from src.application.services.ai.context_window import ContextAssembler
+
+    return ContextAssembler()
+
+
 def get_ai_orchestration_service():
-    """Get AI orchestration service."""
+    """Get AI orchestration service, sharing the conversation context window."""
     from .di.container import container
-    return container.resolve("ai_orchestration_service")
+    service = container.resolve("ai_orchestration_service")
+    if service.context_window is None:
+        service.context_window = get_conversation_context_window()
+    if service.context_assembler is None:
+        service.context_assembler = get_context_assembler()
+    return service
 
 
 def get_audio_processing_service():
     """Get audio processing service."""
     from .di.container import container
     return container.resolve("audio_processing_service")
+
+
+def get_conversation_service():
+    """Get conversation service."""
+    from .di.container import container
+    return container.resolve("conversation_service")
+
+
+@lru_cache(maxsize=1)
+def get_process_esp32_audio_use_case() -> "ProcessESP32AudioUseCase":
+    """Get the ESP32 audio use case, applying its writes through the shared queue.
+
+    Built once, so the write-behind handler it registers is in place before
+    the queue replays its journal.
+    """
+    from src.application.use_cases.process_esp32_audio import (
+        ProcessESP32AudioUseCase,
+    )
+    from src.infrastructure.messaging.write_behind_queue import (
+        get_write_behind_queue,
+    )
+
+    return ProcessESP32AudioUseCase(
+        audio_processing_service=get_audio_processing_service(),
+        ai_orchestration_service=get_ai_orchestration_service(),
+        conversation_service=get_conversation_service(),
+        child_repository=get_child_repository(),
+        write_behind_queue=get_write_behind_queue(),
+        context_window=get_conversation_context_window(),
+    )
@@ -1,10 +1,20 @@
 import httpx
 
+from src.infrastructure.external_apis.http_client_registry import (
+    get_http_client_registry,
+)
+
 
 class AzureSpeechClient:
-    def __init__(self, api_key: str, region: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        region: str,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.api_key = api_key
         self.region = region
+        self._http_client = http_client
         self.base_url = (
             f"https://{self.region}.stt.speech.microsoft.com/"
             "speech/recognition/conversation/cognitiveservices/v1?language=en-US"
@@ -18,14 +28,13 @@ class AzureSpeechClient:
         # This is a simplified example. Azure Speech-to-Text typically involves
         # a more complex WebSocket or streaming API for real-time.
         # For a basic HTTP POST, you might need to adjust headers/URL based on Azure docs.
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.base_url,
-                headers=self.headers,
-                content=audio_data,
-            )
-            response.raise_for_status()
-            return str(response.json()["DisplayText"])
+        response = await self.http_client.post(
+            self.base_url,
+            headers=self.headers,
+            content=audio_data,
+        )
+        response.raise_for_status()
+        return str(response.json()["DisplayText"])
 
     async def text_to_speech(
         self,
@@ -44,11 +53,17 @@ class AzureSpeechClient:
             f"<speak version='1.0' xmlns='http://www.w3.org/2001/10/synthesis' "
             f"xml:lang='en-US'><voice name='{voice_name}'>{text}</voice></speak>"
         )
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                tts_url,
-                headers=tts_headers,
-                content=ssml_text.encode("utf-8"),
-            )
-            response.raise_for_status()
-            return response.content
+        response = await self.http_client.post(
+            tts_url,
+            headers=tts_headers,
+            content=ssml_text.encode("utf-8"),
+        )
+        response.raise_for_status()
+        return response.content
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled keep-alive client shared by every Azure Speech call."""
+        return self._http_client or get_http_client_registry().get_client(
+            f"azure-speech-{self.region}",
+        )
@@ -6,6 +6,9 @@ Enterprise-grade OpenAI integration for AI Teddy Bear
 import asyncio
 
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external_apis.http_client_registry import (
+    get_http_client_registry,
+)
 from src.infrastructure.logging_config import get_logger
 
 logger = get_logger(__name__, component="infrastructure")
@@ -30,7 +33,10 @@ class ProductionChatGPTClient:
         self.api_key = api_key or self.settings.OPENAI_API_KEY
         if not self.api_key:
             raise ValueError("OpenAI API key is required for production use")
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=get_http_client_registry().get_client("openai"),
+        )
 
         # Child safety configuration
         self.child_safety_rules = [
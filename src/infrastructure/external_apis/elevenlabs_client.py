@@ -1,11 +1,22 @@
+from collections.abc import AsyncIterator
+
 import httpx
 from pydantic import SecretStr
 
+from src.infrastructure.external_apis.http_client_registry import (
+    get_http_client_registry,
+)
+
 
 class ElevenLabsClient:
-    def __init__(self, api_key: SecretStr) -> None:
+    def __init__(
+        self,
+        api_key: SecretStr,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.api_key = api_key.get_secret_value()
         self.base_url = "https://api.elevenlabs.io/v1"
+        self._http_client = http_client
         self.headers = {
             "Accept": "audio/mpeg",
             "xi-api-key": self.api_key,
@@ -18,13 +29,57 @@ class ElevenLabsClient:
         voice_id: str = "21m00TNDk4EwAXMxZg8j",
     ) -> bytes:
         url = f"{self.base_url}/text-to-speech/{voice_id}"
-        payload = {
+        payload = self._payload(text)
+        response = await self.http_client.post(url, headers=self.headers, json=payload)
+        response.raise_for_status()
+        # Raise an exception for bad status codes
+        return response.content
+
+    async def stream_text_to_speech(
+        self,
+        text: str,
+        voice_id: str = "21m00TNDk4EwAXMxZg8j",
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yields MP3 audio chunks as ElevenLabs produces them.
+
+        Uses the streaming endpoint, so the first chunk arrives long before
+        the whole utterance is synthesized and the full response is never
+        held in memory.
+
+        Args:
+            text: The text to convert to speech
+            voice_id: Identifier for the voice to use
+            chunk_size: Re-chunk the audio to this size; by default chunks
+                are yielded as soon as they arrive from the network
+
+        Yields:
+            Audio chunks in playback order
+
+        """
+        url = f"{self.base_url}/text-to-speech/{voice_id}/stream"
+        async with self.http_client.stream(
+            "POST",
+            url,
+            headers=self.headers,
+            json=self._payload(text),
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                if chunk:
+                    yield chunk
+
+    @staticmethod
+    def _payload(text: str) -> dict:
+        return {
             "text": text,
             "model_id": "eleven_monolingual_v1",
             "voice_settings": {"stability": 0.5, "similarity_boost": 0.5},
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers, json=payload)
-            response.raise_for_status()
-            # Raise an exception for bad status codes
-            return response.content
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled keep-alive client shared by every ElevenLabs call."""
+        return self._http_client or get_http_client_registry().get_client(
+            "elevenlabs",
+        )
@@ -0,0 +1,139 @@
+"""Process-wide registry of pooled HTTP clients for external APIs.
+
+Creating an ``httpx.AsyncClient`` per call pays a new TCP and TLS handshake
+on every TTS/STT/LLM request. The registry keeps one long-lived client per
+upstream host instead, with HTTP/2 where available, keep-alive, per-host
+connection limits and timeouts. Clients are created lazily and closed once,
+gracefully, from the application lifespan.
+"""
+
+import asyncio
+import importlib.util
+from dataclasses import dataclass
+
+import httpx
+
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="infrastructure")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HTTPClientConfig:
+    """Connection pool and timeout settings for one upstream host."""
+
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 5.0
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+class HTTPClientRegistry:
+    """Hands out one shared ``httpx.AsyncClient`` per upstream name."""
+
+    def __init__(self, default_config: HTTPClientConfig | None = None) -> None:
+        self.default_config = default_config or HTTPClientConfig()
+        self._configs: dict[str, HTTPClientConfig] = {}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._closed = False
+
+    def configure(self, name: str, config: HTTPClientConfig) -> None:
+        """Sets the pool settings for ``name`` before its client is created."""
+        if name in self._clients:
+            raise RuntimeError(f"HTTP client '{name}' is already in use")
+        self._configs[name] = config
+
+    def get_client(
+        self,
+        name: str,
+        base_url: str = "",
+        config: HTTPClientConfig | None = None,
+    ) -> httpx.AsyncClient:
+        """Returns the shared client for ``name``, creating it on first use.
+
+        ``base_url`` and ``config`` only apply when the client is created.
+        """
+        if self._closed:
+            raise RuntimeError("HTTP client registry has been closed")
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            config = config or self._configs.get(name, self.default_config)
+            http2 = config.http2 and HTTP2_AVAILABLE
+            if config.http2 and not HTTP2_AVAILABLE:
+                logger.warning(
+                    f"HTTP/2 requested for '{name}' but 'h2' is not installed; "
+                    "using HTTP/1.1 keep-alive",
+                )
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                http2=http2,
+                limits=config.limits(),
+                timeout=config.timeout(),
+            )
+            self._clients[name] = client
+            logger.info(f"Created pooled HTTP client '{name}' (http2={http2})")
+        return client
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._clients)
+
+    async def aclose(self, timeout: float = 10.0) -> None:
+        """Closes every client's connection pool, each bounded by ``timeout``.
+
+        A client that fails or hangs is logged and left behind, so one stuck
+        upstream neither aborts shutdown nor keeps the others open.
+        """
+        self._closed = True
+        clients = list(self._clients.items())
+        self._clients.clear()
+        results = await asyncio.gather(
+            *(asyncio.wait_for(client.aclose(), timeout) for _, client in clients),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(clients, results):
+            if isinstance(result, TimeoutError):
+                logger.warning(f"Timed out closing HTTP client '{name}'")
+            elif isinstance(result, Exception):
+                logger.warning(f"Error closing HTTP client '{name}': {result}")
+        logger.info(f"Closed {len(clients)} pooled HTTP clients")
+
+
+_registry: HTTPClientRegistry | None = None
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Get the process-wide HTTP client registry."""
+    global _registry
+    if _registry is None or _registry._closed:
+        _registry = HTTPClientRegistry()
+    return _registry
+
+
+async def close_http_client_registry() -> None:
+    """Closes the process-wide registry; call on application shutdown."""
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
@@ -1,8 +1,19 @@
+import json
+from collections.abc import AsyncIterator
+from typing import Any
 from uuid import UUID
 
 from src.application.interfaces.ai_provider import AIProvider
 from src.domain.value_objects.child_preferences import ChildPreferences
+from src.infrastructure.caching.ai_response_cache import ai_response_cache_key
+from src.infrastructure.external_apis.http_client_registry import (
+    get_http_client_registry,
+)
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.performance.single_flight import (
+    SingleFlight,
+    get_single_flight,
+)
 
 logger = get_logger(__name__, component="infrastructure")
 
@@ -18,8 +29,13 @@ except ImportError as e:
 
 
 class OpenAIClient(AIProvider):
-    def __init__(self, api_key: str) -> None:
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(self, api_key: str, single_flight: SingleFlight | None = None) -> None:
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=get_http_client_registry().get_client("openai"),
+        )
+        # Identical concurrent prompts share one completion across clients
+        self.single_flight = single_flight or get_single_flight("openai_chat")
 
     async def generate_response(
         self,
@@ -28,6 +44,55 @@ class OpenAIClient(AIProvider):
         current_input: str,
         child_preferences: ChildPreferences,
     ) -> str:
+        messages = self._build_chat_messages(
+            conversation_history,
+            current_input,
+            child_preferences,
+        )
+        age_group = child_preferences.age_group
+        key = ai_response_cache_key(
+            current_input,
+            age_band=age_group.value if age_group else "",
+            safety_profile=messages[0]["content"],
+            context=messages[1:-1],
+        )
+        return await self.single_flight.do(
+            key,
+            lambda: self._complete_chat(messages),
+        )
+
+    async def stream_response(
+        self,
+        child_id: UUID,
+        conversation_history: list[str],
+        current_input: str,
+        child_preferences: ChildPreferences,
+    ) -> AsyncIterator[str]:
+        messages = self._build_chat_messages(
+            conversation_history,
+            current_input,
+            child_preferences,
+        )
+        stream = await self.client.chat.completions.create(
+            model="gpt-4-turbo",
+            messages=messages,
+            max_tokens=150,
+            temperature=0.7,
+            stream=True,
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    @staticmethod
+    def _build_chat_messages(
+        conversation_history: list[str],
+        current_input: str,
+        child_preferences: ChildPreferences,
+    ) -> list[dict[str, str]]:
         messages = [
             {
                 "role": "system",
@@ -46,6 +111,9 @@ class OpenAIClient(AIProvider):
                 {"role": "user", "content": msg},
             )  # Assuming all history is user for simplicity
         messages.append({"role": "user", "content": current_input})
+        return messages
+
+    async def _complete_chat(self, messages: list[dict[str, str]]) -> str:
         response = await self.client.chat.completions.create(
             model="gpt-4-turbo",  # Or another suitable model
             messages=messages,
@@ -75,6 +143,44 @@ class OpenAIClient(AIProvider):
         except ValueError:
             return 0.0
 
+    async def analyze_safety(
+        self,
+        text: str,
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Runs every safety analysis of ``text`` in one JSON-mode completion."""
+        fields = (
+            '"toxicity": number from 0.0 (harmless) to 1.0 (toxic), '
+            '"emotion": one word such as happy, sad, angry or neutral, '
+            '"educational_value": {"score": number from 0.0 to 1.0, '
+            '"topics": list of strings}'
+        )
+        user_content = text
+        if context:
+            fields += (
+                ', "context": {"is_personal_info": boolean, '
+                '"is_sensitive_topic": boolean}'
+            )
+            context_json = json.dumps(context, default=str)
+            user_content += f"\n\nConversation context: {context_json}"
+        response = await self.client.chat.completions.create(
+            model="gpt-4-turbo",
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You review messages exchanged with a young child. "
+                        f"Reply with a JSON object with these fields: {fields}."
+                    ),
+                },
+                {"role": "user", "content": user_content},
+            ],
+            max_tokens=200,
+            temperature=0.0,
+            response_format={"type": "json_object"},
+        )
+        return json.loads(response.choices[0].message.content)
+
     async def analyze_emotion(self, text: str) -> str:
         response = await self.client.chat.completions.create(
             model="gpt-4-turbo",
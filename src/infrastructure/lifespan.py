@@ -5,13 +5,33 @@ import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager, suppress
 
+import redis.asyncio as redis
 import sentry_sdk
 from fastapi import FastAPI
 from prometheus_client import Gauge, start_http_server
 
+from src.application.event_handlers.child_profile_event_handlers import (
+    ChildProfileEventHandlers,
+)
+from src.infrastructure.ai.chatgpt.transport import close_openai_transports
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external_apis.http_client_registry import (
+    close_http_client_registry,
+)
+from src.infrastructure.dependencies import (
+    get_child_profile_projection,
+    get_child_profile_read_model_store,
+    get_process_esp32_audio_use_case,
+    get_snapshot_compactor,
+)
 from src.infrastructure.di.container import container
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.messaging.write_behind_queue import (
+    RedisWriteBehindJournal,
+    get_write_behind_queue,
+)
+from src.infrastructure.security.auth.token_verification import get_revocation_list
+from src.infrastructure.security.password_hasher import get_password_hashing_pool
 
 logger = get_logger(__name__, component="infrastructure")
 
@@ -77,6 +97,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         event_bus = container.event_bus()
         kafka_connected = await event_bus.connect()
         if kafka_connected:
+            # Project each child profile as soon as its events arrive
+            if settings.database.DATABASE_ENABLED and settings.ENABLE_REDIS:
+                ChildProfileEventHandlers(
+                    get_child_profile_read_model_store(),
+                    get_child_profile_projection(),
+                ).subscribe(event_bus)
             app.state.kafka_consumer_task = asyncio.create_task(
                 event_bus.start_consuming(),
             )
@@ -93,9 +119,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         db = container.database_manager()
         await db.init_db()
         logger.info("Database initialized successfully")
+
+        # Delete aggregate snapshots superseded by newer ones
+        snapshot_compactor = get_snapshot_compactor()
+        snapshot_compactor.start()
+        app.state.snapshot_compactor = snapshot_compactor
     else:
         logger.info("Database disabled in this environment")
 
+    # Catch the child profile read model up on events it missed, e.g. while
+    # the service was down or deliveries failed. It reads the event store and
+    # writes the Redis read model, so it needs both.
+    if database_enabled and settings.ENABLE_REDIS:
+        child_profile_projection = get_child_profile_projection()
+        child_profile_projection.start()
+        app.state.child_profile_projection = child_profile_projection
+    else:
+        logger.info("Child profile projection disabled without database and Redis")
+
+    # Start the write-behind queue that applies post-response writes
+    write_behind_queue = get_write_behind_queue()
+    if settings.ENABLE_REDIS:
+        write_behind_queue.journal = RedisWriteBehindJournal(
+            redis.from_url(settings.REDIS_URL),
+        )
+    # Register the handlers of journaled jobs before they are replayed
+    try:
+        get_process_esp32_audio_use_case()
+    except Exception as e:
+        logger.error(
+            f"ESP32 audio use case unavailable; its journaled writes stay pending: {e}",
+            exc_info=True,
+        )
+    await write_behind_queue.start()
+    app.state.write_behind_queue = write_behind_queue
+
+    # Mirror the shared token revocation filter and follow new revocations;
+    # if Redis is down at boot the listener keeps retrying in the background
+    if settings.ENABLE_REDIS:
+        revocation_list = get_revocation_list()
+        await revocation_list.start(redis.from_url(settings.REDIS_URL))
+        app.state.revocation_list = revocation_list
+
     logger.info("🧸 AI Teddy Bear System initialized successfully")
 
     # Start uptime monitoring task
@@ -105,6 +170,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Cleanup
     logger.info("Shutting down AI Teddy Bear System...")
+
+    # Drain pending post-response writes while the resources they use are
+    # still up; leftovers stay journaled
+    if hasattr(app.state, "write_behind_queue"):
+        await app.state.write_behind_queue.stop()
+
+    if hasattr(app.state, "child_profile_projection"):
+        await app.state.child_profile_projection.stop()
+
+    if hasattr(app.state, "snapshot_compactor"):
+        await app.state.snapshot_compactor.stop()
+
     container.shutdown_resources()
 
     # Stop uptime monitoring task
@@ -113,10 +190,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         with suppress(asyncio.CancelledError):
             await app.state.uptime_task
 
+    # Stop following token revocations
+    if hasattr(app.state, "revocation_list"):
+        await app.state.revocation_list.close()
+
     # Stop Kafka consumer
     if hasattr(app.state, "kafka_consumer_task"):
         app.state.kafka_consumer_task.cancel()
         with suppress(asyncio.CancelledError):
             await app.state.kafka_consumer_task
 
+    # Close pooled upstream connections
+    await close_openai_transports()
+    await close_http_client_registry()
+
+    # Stop the password hashing worker processes; waits for running hashes
+    await asyncio.to_thread(get_password_hashing_pool().shutdown)
+
     logger.info("AI Teddy Bear System shutdown complete")
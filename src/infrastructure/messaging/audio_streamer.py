@@ -1,4 +1,4 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable
 
 from fastapi import WebSocket
 
@@ -18,9 +18,28 @@ class AudioStreamer:
     def disconnect(self, child_id: str) -> None:
         del self.connections[child_id]
 
-    async def stream_audio_to_child(self, child_id: str, audio_data: bytes) -> None:
-        if child_id in self.connections:
-            await self.connections[child_id].send_bytes(audio_data)
+    async def stream_audio_to_child(
+        self,
+        child_id: str,
+        audio_data: bytes | AsyncIterable[bytes],
+    ) -> None:
+        """Sends audio to the child's device.
+
+        ``audio_data`` may be complete audio or an async iterable of chunks,
+        such as ``AudioProcessingService.stream_audio_response``; chunks are
+        forwarded as they arrive so the device starts playing after the
+        first one.
+        """
+        if isinstance(audio_data, bytes | bytearray):
+            if child_id in self.connections:
+                await self.connections[child_id].send_bytes(bytes(audio_data))
+            return
+        async for chunk in audio_data:
+            websocket = self.connections.get(child_id)
+            if websocket is None:
+                logger.warning(f"Child {child_id} disconnected during audio stream")
+                return
+            await websocket.send_bytes(chunk)
 
     async def receive_audio_from_child(
         self,
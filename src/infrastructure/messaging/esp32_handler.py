@@ -1,23 +1,30 @@
 import base64
+import json
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 
 from src.application.dto.ai_response import AIResponse
 from src.application.dto.esp32_request import ESP32Request
 from src.application.use_cases.process_esp32_audio import (
     ProcessESP32AudioUseCase,
 )
+from src.infrastructure.dependencies import get_process_esp32_audio_use_case
 from src.infrastructure.logging_config import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__, component="infrastructure")
 
+END_OF_UTTERANCE = "end_of_utterance"
+
 
 @router.post("/esp32/audio")
 async def process_esp32_audio_http(
     request: ESP32Request,
-    process_audio_use_case: ProcessESP32AudioUseCase,
+    process_audio_use_case: ProcessESP32AudioUseCase = Depends(
+        get_process_esp32_audio_use_case,
+    ),
 ) -> AIResponse:
     # Decode base64 audio data
     audio_data_bytes = base64.b64decode(request.audio_data)
@@ -26,24 +33,58 @@ async def process_esp32_audio_http(
     return response
 
 
+async def _receive_utterance(websocket: WebSocket) -> AsyncIterator[bytes]:
+    """Yields binary audio chunks until the device signals end of utterance.
+
+    The device streams raw audio as binary messages and closes the utterance
+    with a text message ``{"type": "end_of_utterance"}``.
+    """
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        if message.get("bytes"):
+            yield message["bytes"]
+            continue
+        text = message.get("text")
+        if not text:
+            continue
+        try:
+            control = json.loads(text)
+        except json.JSONDecodeError:
+            control = {"type": text.strip()}
+        if isinstance(control, dict) and control.get("type") == END_OF_UTTERANCE:
+            return
+
+
 @router.websocket("/ws/esp32/audio/{child_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
     child_id: UUID,
-    process_audio_use_case: ProcessESP32AudioUseCase,
+    process_audio_use_case: ProcessESP32AudioUseCase = Depends(
+        get_process_esp32_audio_use_case,
+    ),
 ) -> None:
+    """Streams voice turns between an ESP32 device and the teddy.
+
+    Each turn, the device sends audio chunks followed by an end-of-utterance
+    message. The server answers with JSON text frames (transcript, sentence,
+    complete) and binary audio frames, one per approved sentence, so playback
+    starts before the whole response has been generated.
+    """
     await websocket.accept()
     try:
         while True:
-            data = await websocket.receive_bytes()
-            # Assuming data is raw audio bytes, not base64 encoded for websocket
-            request = ESP32Request(
-                child_id=child_id,
-                audio_data=data,
+            frames = process_audio_use_case.execute_stream(
+                child_id,
+                _receive_utterance(websocket),
                 language_code="en-US",
             )
-            response = await process_audio_use_case.execute(request)
-            await websocket.send_json(response.dict())
+            async for frame in frames:
+                if frame.is_audio:
+                    await websocket.send_bytes(frame.audio)
+                else:
+                    await websocket.send_json(frame.to_message())
     except WebSocketDisconnect:
         logger.info(f"Client {child_id} disconnected")
     except Exception as e:
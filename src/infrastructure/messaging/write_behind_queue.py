@@ -0,0 +1,313 @@
+"""Durable write-behind queue for writes that are off the request path.
+
+Request handlers enqueue a named operation with a JSON payload and return
+immediately; background workers apply the operation through a registered
+handler. Every job is journaled before it is acknowledged to the caller and
+removed from the journal only after its handler succeeds, so jobs left over
+from a crash or a failed handler are replayed on the next start. When
+several processes share a journal, each job is claimed by one of them
+before it is applied, so a replay never duplicates another process's work.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from typing import Any, Protocol
+from uuid import uuid4
+
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="infrastructure")
+
+WriteHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class WriteBehindJob:
+    """A journaled write operation."""
+
+    operation: str
+    payload: dict[str, Any]
+    job_id: str = field(default_factory=lambda: str(uuid4()))
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "WriteBehindJob":
+        return cls(**json.loads(raw))
+
+
+class WriteBehindJournal(Protocol):
+    """Storage that keeps jobs until their handler has succeeded."""
+
+    async def append(self, job: WriteBehindJob) -> None:
+        """Stores a job before it is handed to the workers."""
+        ...
+
+    async def ack(self, job_id: str) -> None:
+        """Forgets a job once its handler has succeeded."""
+        ...
+
+    async def pending(self) -> list[WriteBehindJob]:
+        """Returns the jobs not acknowledged yet, oldest first."""
+        ...
+
+    async def claim(self, job_id: str) -> bool:
+        """Reserves a job for this consumer; False if another one holds it."""
+        ...
+
+    async def release(self, job_id: str) -> None:
+        """Gives up the claim on an unfinished job so it can be replayed."""
+        ...
+
+
+class InMemoryWriteBehindJournal:
+    """Process-local journal, for tests and single-process development."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, WriteBehindJob] = {}
+        self._claimed: set[str] = set()
+
+    async def append(self, job: WriteBehindJob) -> None:
+        self._jobs[job.job_id] = job
+
+    async def ack(self, job_id: str) -> None:
+        self._jobs.pop(job_id, None)
+        self._claimed.discard(job_id)
+
+    async def pending(self) -> list[WriteBehindJob]:
+        return sorted(self._jobs.values(), key=lambda job: job.enqueued_at)
+
+    async def claim(self, job_id: str) -> bool:
+        if job_id in self._claimed:
+            return False
+        self._claimed.add(job_id)
+        return True
+
+    async def release(self, job_id: str) -> None:
+        self._claimed.discard(job_id)
+
+
+class RedisWriteBehindJournal:
+    """Journal stored in a Redis hash, surviving process restarts.
+
+    Claims are ``SET NX`` keys with a TTL, so a job held by a process that
+    died is picked up by the next process to start once its claim expires.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        key: str = "write_behind:pending",
+        consumer: str | None = None,
+        claim_ttl_seconds: int = 300,
+    ) -> None:
+        self.redis_client = redis_client
+        self.key = key
+        self.consumer = consumer or f"{socket.gethostname()}:{os.getpid()}"
+        self.claim_ttl_seconds = claim_ttl_seconds
+
+    async def append(self, job: WriteBehindJob) -> None:
+        await self.redis_client.hset(self.key, job.job_id, job.to_json())
+
+    async def ack(self, job_id: str) -> None:
+        await self.redis_client.hdel(self.key, job_id)
+        await self.redis_client.delete(self._claim_key(job_id))
+
+    async def claim(self, job_id: str) -> bool:
+        return bool(
+            await self.redis_client.set(
+                self._claim_key(job_id),
+                self.consumer,
+                nx=True,
+                ex=self.claim_ttl_seconds,
+            ),
+        )
+
+    async def release(self, job_id: str) -> None:
+        await self.redis_client.delete(self._claim_key(job_id))
+
+    def _claim_key(self, job_id: str) -> str:
+        return f"{self.key}:claim:{job_id}"
+
+    async def pending(self) -> list[WriteBehindJob]:
+        raw_jobs = await self.redis_client.hvals(self.key)
+        jobs = [WriteBehindJob.from_json(raw) for raw in raw_jobs]
+        return sorted(jobs, key=lambda job: job.enqueued_at)
+
+
+class WriteBehindQueue:
+    """Bounded queue of journaled writes applied by background workers.
+
+    Failed jobs are retried with exponential backoff up to ``max_attempts``;
+    after that they stay in the journal and are replayed on the next start.
+    Delivery is at-least-once, so handlers should tolerate a replayed job.
+    """
+
+    def __init__(
+        self,
+        journal: WriteBehindJournal | None = None,
+        workers: int = 2,
+        max_size: int = 10_000,
+        max_attempts: int = 5,
+        retry_delay: float = 0.5,
+    ) -> None:
+        self.journal = journal or InMemoryWriteBehindJournal()
+        self.worker_count = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._queue: asyncio.Queue[WriteBehindJob] = asyncio.Queue(maxsize=max_size)
+        self._handlers: dict[str, WriteHandler] = {}
+        self._workers: list[asyncio.Task] = []
+        self._retries: set[asyncio.Task] = set()
+        # Jobs this queue has claimed and not yet acknowledged
+        self._claimed: set[str] = set()
+        self.stats = {"enqueued": 0, "completed": 0, "retried": 0, "failed": 0}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def register_handler(self, operation: str, handler: WriteHandler) -> None:
+        """Registers the coroutine that applies jobs of ``operation``."""
+        self._handlers[operation] = handler
+
+    async def start(self) -> None:
+        """Replays journaled jobs and starts the workers."""
+        if self.running:
+            return
+        recovered = [
+            job
+            for job in await self.journal.pending()
+            if await self._claim(job.job_id)
+        ]
+        for job in recovered:
+            await self._queue.put(job)
+        if recovered:
+            logger.warning(f"Recovered {len(recovered)} pending write-behind jobs")
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"write-behind-{index}")
+            for index in range(self.worker_count)
+        ]
+        logger.info(f"Write-behind queue started with {self.worker_count} workers")
+
+    async def enqueue(self, operation: str, payload: dict[str, Any]) -> str:
+        """Journals a job and schedules it; returns the job id."""
+        if operation not in self._handlers:
+            raise ValueError(f"No write-behind handler for '{operation}'")
+        job = WriteBehindJob(operation=operation, payload=payload)
+        # Claimed before it is journaled, so no other process replays it
+        claimed = self.running and await self._claim(job.job_id)
+        await self.journal.append(job)
+        if claimed:
+            await self._queue.put(job)
+        # Otherwise the job is picked up from the journal by ``start``.
+        self.stats["enqueued"] += 1
+        return job.job_id
+
+    async def join(self) -> None:
+        """Waits until every queued job, including retries, has been handled."""
+        while True:
+            await self._queue.join()
+            if not self._retries:
+                return
+            await asyncio.gather(*self._retries, return_exceptions=True)
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """Drains the queue for up to ``drain_timeout`` seconds, then stops.
+
+        Jobs that are not finished stay in the journal for the next start.
+        """
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Write-behind queue stopped with {self.depth} jobs left in the journal",
+            )
+        for task in [*self._workers, *self._retries]:
+            task.cancel()
+        for task in [*self._workers, *self._retries]:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._workers = []
+        self._retries.clear()
+        # Unfinished jobs can be replayed by the next process to start
+        for job_id in list(self._claimed):
+            await self.journal.release(job_id)
+        self._claimed.clear()
+        logger.info("Write-behind queue stopped")
+
+    async def _claim(self, job_id: str) -> bool:
+        if not await self.journal.claim(job_id):
+            return False
+        self._claimed.add(job_id)
+        return True
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._apply(job)
+            finally:
+                self._queue.task_done()
+
+    async def _apply(self, job: WriteBehindJob) -> None:
+        handler = self._handlers.get(job.operation)
+        job.attempts += 1
+        try:
+            if handler is None:
+                raise LookupError(f"No write-behind handler for '{job.operation}'")
+            await handler(job.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if job.attempts < self.max_attempts:
+                self.stats["retried"] += 1
+                delay = self.retry_delay * (2 ** (job.attempts - 1))
+                logger.warning(
+                    f"Write-behind job {job.operation} ({job.job_id}) failed, "
+                    f"retrying in {delay:.2f}s: {e}",
+                )
+                retry = asyncio.create_task(self._retry_later(job, delay))
+                self._retries.add(retry)
+                retry.add_done_callback(self._retries.discard)
+            else:
+                self.stats["failed"] += 1
+                logger.error(
+                    f"Write-behind job {job.operation} ({job.job_id}) failed "
+                    f"after {job.attempts} attempts; kept for replay: {e}",
+                    exc_info=True,
+                )
+            return
+        await self.journal.ack(job.job_id)
+        self._claimed.discard(job.job_id)
+        self.stats["completed"] += 1
+
+    async def _retry_later(self, job: WriteBehindJob, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queue.put(job)
+
+
+_write_behind_queue: WriteBehindQueue | None = None
+
+
+def get_write_behind_queue() -> WriteBehindQueue:
+    """Get the process-wide write-behind queue."""
+    global _write_behind_queue
+    if _write_behind_queue is None:
+        _write_behind_queue = WriteBehindQueue()
+    return _write_behind_queue
@@ -8,7 +8,9 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from src.infrastructure.config.core.application_settings import ApplicationSettings
 from src.infrastructure.config.settings import get_settings
 from src.infrastructure.logging_config import get_logger
+from src.presentation.api.middleware.data_loader import DataLoaderMiddleware
 from src.presentation.api.middleware.error_handling import ErrorHandlingMiddleware
+from src.presentation.api.middleware.plaintext_scope import PlaintextScopeMiddleware
 from src.presentation.api.middleware.request_logging import RequestLoggingMiddleware
 # Re-enabled for production - rate limiting now properly imports from service.py
 from src.presentation.api.middleware.rate_limit_middleware import (
@@ -50,18 +52,26 @@ def setup_middleware(app: FastAPI) -> None:
     # 5. Rate Limiting Middleware - RE-ENABLED (same as ChildSafetyMiddleware)
     logger.info("✅ Rate limiting middleware configured")
 
-    # 6. Trusted Host Middleware (production security)
+    # 6. Data Loader Middleware (per-request batched lookups)
+    app.add_middleware(DataLoaderMiddleware)
+    logger.info("✅ Request-scoped data loaders configured")
+
+    # 7. Plaintext Scope Middleware (decrypted fields zeroized after each request)
+    app.add_middleware(PlaintextScopeMiddleware)
+    logger.info("✅ Request-scoped plaintext cache configured")
+
+    # 8. Trusted Host Middleware (production security)
     if is_production:
         trusted_hosts = _get_trusted_hosts(settings.application)
         app.add_middleware(TrustedHostMiddleware, allowed_hosts=trusted_hosts)
         logger.info(f"✅ Trusted host middleware configured: {trusted_hosts}")
 
-    # 7. HTTPS Redirect Middleware (production only)
+    # 9. HTTPS Redirect Middleware (production only)
     if is_production and settings.ENABLE_HTTPS:
         app.add_middleware(HTTPSRedirectMiddleware)
         logger.info("✅ HTTPS redirect middleware enabled")
 
-    # 8. CORS Middleware (cross-origin requests) - Enhanced security
+    # 10. CORS Middleware (cross-origin requests) - Enhanced security
     cors_origins = _get_cors_origins(settings, is_production)
     _validate_cors_origins(cors_origins, is_production)
     app.add_middleware(
@@ -168,6 +178,7 @@ def _log_middleware_summary(is_production: bool, cors_origins: list[str]) -> Non
     logger.info("   • Security Headers: ✅ Enabled")
     logger.info("   • Child Safety: ✅ Enabled")
     logger.info("   • Rate Limiting: ✅ Enabled")
+    logger.info("   • Data Loaders: ✅ Enabled")
     logger.info(f"   • CORS Origins: {len(cors_origins)} configured")
     logger.info(
         f"   • HTTPS Redirect: {'✅ Enabled' if is_production else '❌ Development Only'}",
@@ -1,4 +1,20 @@
+from .keyset import (
+    CursorCodec,
+    CursorPage,
+    InvalidCursorError,
+    KeysetPaginator,
+    KeysetPosition,
+)
 from .pagination_service import PaginatedResponse, PaginationService
 
-__all__ = ["PaginatedResponse", "PaginationService", "PaginationRequest"]
-from src.domain.models.validation_models import PaginationRequest
+__all__ = [
+    "CursorCodec",
+    "CursorPage",
+    "InvalidCursorError",
+    "KeysetPaginator",
+    "KeysetPosition",
+    "PaginatedResponse",
+    "PaginationService",
+    "PaginationRequest",
+]
+from src.domain.models.validation_models import PaginationRequest
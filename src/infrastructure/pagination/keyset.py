@@ -0,0 +1,275 @@
+"""Keyset (cursor) pagination over (timestamp, id).
+
+OFFSET paging makes the database walk past every skipped row, so deep pages
+get slower the further a parent scrolls. Keyset paging instead remembers
+the sort key of the last row shown and asks for the rows after it, which an
+index on (..., timestamp, id) answers in the same time at any depth.
+
+Cursors are opaque to clients: the position is JSON, signed with HMAC so it
+cannot be forged or edited, and bound to a scope (for example one child's
+conversations) so a cursor of one listing is rejected by another.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import Select, tuple_
+
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="pagination")
+
+T = TypeVar("T")
+
+CURSOR_VERSION = 1
+SIGNATURE_BYTES = 16
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed, tampered with or from another listing."""
+
+
+@dataclass(frozen=True)
+class KeysetPosition:
+    """Sort key of the row a page starts after.
+
+    Attributes:
+        timestamp: Timestamp of the row, a datetime or a stored timestamp string
+        id: Id of the row, breaking ties between equal timestamps
+        backward: Whether the page lies before the row instead of after it
+    """
+
+    timestamp: datetime | str
+    id: int | str
+    backward: bool = False
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing."""
+
+    items: list[T]
+    size: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    has_next: bool = False
+    has_prev: bool = False
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class CursorCodec:
+    """Encodes keyset positions as signed, opaque cursor strings."""
+
+    def __init__(self, secret: bytes | str) -> None:
+        if isinstance(secret, str):
+            secret = secret.encode()
+        if len(secret) < 32:
+            raise ValueError("Cursor secret must be at least 32 bytes long")
+        self._secret = secret
+
+    @classmethod
+    def from_environment(cls) -> "CursorCodec":
+        """Codec keyed by PAGINATION_CURSOR_SECRET.
+
+        Without it cursors are signed with a per-process key, so they stop
+        working after a restart and are not shared between instances.
+        """
+        secret = os.getenv("PAGINATION_CURSOR_SECRET")
+        if not secret:
+            logger.warning(
+                "PAGINATION_CURSOR_SECRET is not set; using a per-process cursor key"
+            )
+            return cls(secrets.token_bytes(32))
+        return cls(secret)
+
+    def encode(self, position: KeysetPosition, scope: str = "") -> str:
+        """Opaque cursor for ``position`` within the listing ``scope``."""
+        is_datetime = isinstance(position.timestamp, datetime)
+        payload = json.dumps(
+            {
+                "v": CURSOR_VERSION,
+                "s": scope,
+                "t": position.timestamp.isoformat() if is_datetime else position.timestamp,
+                "d": is_datetime,
+                "i": position.id,
+                "b": position.backward,
+            },
+            separators=(",", ":"),
+        ).encode()
+        return f"{_b64encode(payload)}.{_b64encode(self._sign(payload))}"
+
+    def decode(self, cursor: str, scope: str = "") -> KeysetPosition:
+        """Position encoded in ``cursor``.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed, its signature does
+                not match, or it belongs to another scope
+        """
+        try:
+            encoded_payload, encoded_signature = cursor.split(".")
+            payload = _b64decode(encoded_payload)
+            signature = _b64decode(encoded_signature)
+        except (AttributeError, ValueError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            raise InvalidCursorError("Cursor signature mismatch")
+
+        try:
+            data = json.loads(payload)
+            if data["v"] != CURSOR_VERSION or data["s"] != scope:
+                raise InvalidCursorError("Cursor does not belong to this listing")
+            timestamp = datetime.fromisoformat(data["t"]) if data["d"] else data["t"]
+            return KeysetPosition(timestamp, data["i"], bool(data["b"]))
+        except InvalidCursorError:
+            raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+
+
+class KeysetPaginator:
+    """Pages through rows ordered by (timestamp, id), newest first by default.
+
+    Each query fetches one row more than the page size to learn whether
+    another page follows, so no COUNT query is needed.
+    """
+
+    def __init__(
+        self,
+        codec: CursorCodec | None = None,
+        default_size: int = 20,
+        max_size: int = 100,
+        descending: bool = True,
+    ) -> None:
+        """Initialize the paginator.
+
+        Args:
+            codec: Signs cursors; keyed from the environment by default
+            default_size: Page size when none is requested
+            max_size: Largest page size allowed
+            descending: Newest rows first
+        """
+        self.codec = codec or CursorCodec.from_environment()
+        self.default_size = default_size
+        self.max_size = max_size
+        self.descending = descending
+
+    def page_size(self, size: int | None) -> int:
+        """Requested page size, validated against max_size."""
+        size = self.default_size if size is None else size
+        if size < 1 or size > self.max_size:
+            raise ValueError(f"Page size must be between 1 and {self.max_size}")
+        return size
+
+    def position(self, cursor: str | None, scope: str = "") -> KeysetPosition | None:
+        """Position of ``cursor``, or None for the first page."""
+        return self.codec.decode(cursor, scope) if cursor else None
+
+    def _scans_descending(self, position: KeysetPosition | None) -> bool:
+        backward = position is not None and position.backward
+        return self.descending != backward
+
+    def apply(
+        self,
+        statement: Select,
+        timestamp_column: Any,
+        id_column: Any,
+        position: KeysetPosition | None,
+        size: int,
+    ) -> Select:
+        """Restrict a SQLAlchemy SELECT to the page after (or before) ``position``."""
+        key = tuple_(timestamp_column, id_column)
+        if self._scans_descending(position):
+            if position is not None:
+                statement = statement.where(key < tuple_(position.timestamp, position.id))
+            statement = statement.order_by(timestamp_column.desc(), id_column.desc())
+        else:
+            if position is not None:
+                statement = statement.where(key > tuple_(position.timestamp, position.id))
+            statement = statement.order_by(timestamp_column.asc(), id_column.asc())
+        return statement.limit(size + 1)
+
+    def sql(
+        self,
+        position: KeysetPosition | None,
+        timestamp_column: str = "timestamp",
+        id_column: str = "id",
+    ) -> tuple[str, str, tuple]:
+        """Keyset condition, ORDER BY and parameters for hand-written SQL.
+
+        Uses row-value comparison, supported by SQLite 3.15+ and PostgreSQL.
+
+        Returns:
+            (condition starting with AND, or empty; ORDER BY clause; parameters)
+        """
+        if self._scans_descending(position):
+            operator, direction = "<", "DESC"
+        else:
+            operator, direction = ">", "ASC"
+        order_by = f"ORDER BY {timestamp_column} {direction}, {id_column} {direction}"
+        if position is None:
+            return "", order_by, ()
+        condition = f"AND ({timestamp_column}, {id_column}) {operator} (?, ?)"
+        return condition, order_by, (position.timestamp, position.id)
+
+    def page(
+        self,
+        rows: Sequence[Any],
+        position: KeysetPosition | None,
+        size: int,
+        key: Callable[[Any], tuple[datetime | str, int | str]],
+        scope: str = "",
+        convert: Callable[[list[Any]], list[T]] | None = None,
+    ) -> CursorPage[T]:
+        """Build a page from the up to ``size + 1`` rows a query returned.
+
+        Args:
+            rows: Rows in the order the query returned them
+            position: Position the query started from
+            size: Page size
+            key: Extracts (timestamp, id) from a row
+            scope: Scope the cursors are bound to
+            convert: Turns the page's rows into the returned items
+        """
+        more = len(rows) > size
+        rows = list(rows[:size])
+        backward = position is not None and position.backward
+        if backward:
+            rows.reverse()
+            has_prev, has_next = more, True
+        else:
+            has_prev, has_next = position is not None, more
+
+        next_cursor = prev_cursor = None
+        if rows and has_next:
+            next_cursor = self.codec.encode(KeysetPosition(*key(rows[-1])), scope)
+        if rows and has_prev:
+            prev_cursor = self.codec.encode(
+                KeysetPosition(*key(rows[0]), backward=True),
+                scope,
+            )
+        return CursorPage(
+            items=convert(rows) if convert else rows,
+            size=size,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            has_next=bool(next_cursor),
+            has_prev=bool(prev_cursor),
+        )
@@ -1,41 +1,184 @@
-from collections.abc import Callable, Coroutine
-from typing import Any, TypeVar
+"""Request-scoped batching of lookups by key (the DataLoader pattern).
 
-from sqlalchemy.ext.asyncio import AsyncSession
+A parent dashboard that loads each child's profile, consent and latest
+conversation one at a time makes N round-trips per child. A BatchLoader
+collects every key requested during one event-loop tick and hands them to
+one batch function, which fetches them with a single ``WHERE id IN (...)``
+query. Results are cached for the lifetime of the loader, which is one
+request: ``loader_scope`` (entered by DataLoaderMiddleware) gives each
+request its own loaders, so nothing outlives the request it was read in.
+"""
 
-from src.domain.entities.child import Child
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generic, TypeVar
 
-T = TypeVar("T")
+from prometheus_client import Counter
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
-class BatchLoader:
-    def __init__(self, db_session: AsyncSession):
-        self.db_session = db_session
-        self._cache: dict[str, Any] = {}
+BatchLoadFn = Callable[[list[K]], Awaitable[Mapping[K, V]]]
 
-    async def load(
-        self,
-        key: str,
-        loader_func: Callable[..., Coroutine[Any, Any, Any]],
-    ) -> Any:
-        if key not in self._cache:
-            self._cache[key] = await loader_func()
-        return self._cache[key]
-
-    async def load_many(
+BATCH_LOADER_KEYS = Counter(
+    "batch_loader_keys_total",
+    "Keys requested from batch loaders, by whether a batch or the cache served them",
+    ["loader", "source"],
+)
+BATCH_LOADER_BATCHES = Counter(
+    "batch_loader_batches_total",
+    "Batch functions called by batch loaders",
+    ["loader"],
+)
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesces loads of single keys into batched lookups.
+
+    ``batch_load_fn`` receives a list of distinct keys and returns a mapping
+    of the keys it found; missing keys load as None. If it raises, every
+    load of that batch raises the same exception and nothing is cached.
+
+    Example:
+        ```python
+        loader = BatchLoader(repository.get_many, name="children")
+        first, second = await asyncio.gather(loader.load(a), loader.load(b))
+        ```
+    """
+
+    def __init__(
         self,
-        keys: list[str],
-        loader_func: Callable[..., Coroutine[Any, Any, Any]],
-    ) -> dict[str, Any]:
-        results = {}
-        for key in keys:
-            results[key] = await self.load(key, lambda: loader_func(key))
-        return results
-
-
-async def get_child_batch_loader(
-    db: AsyncSession,
-    child_ids: list[str],
-) -> dict[str, Child]:
-    children = await Child.get_by_ids(db, child_ids)
-    return {child.id: child for child in children}
+        batch_load_fn: BatchLoadFn,
+        *,
+        max_batch_size: int = 100,
+        cache: bool = True,
+        name: str | None = None,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            batch_load_fn: Loads several keys in one call
+            max_batch_size: Most keys passed to one call of batch_load_fn
+            cache: Keep loaded values for later loads of the same key
+            name: Label of the loader's metrics
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self.name = name or getattr(batch_load_fn, "__qualname__", "loader")
+        self.stats = {"batches": 0, "batched": 0, "cached": 0}
+        self._futures: dict[K, asyncio.Future] = {}
+        self._pending: dict[K, asyncio.Future] = {}
+
+    async def load(self, key: K) -> V | None:
+        """Value of ``key``, fetched with the other keys of this tick."""
+        return await asyncio.shield(self._future(key))
+
+    async def load_many(self, keys: list[K]) -> dict[K, V | None]:
+        """Values of ``keys``, fetched in as few batches as possible."""
+        futures = [self._future(key) for key in keys]
+        values = await asyncio.shield(asyncio.gather(*futures))
+        return dict(zip(keys, values))
+
+    def prime(self, key: K, value: V | None) -> None:
+        """Cache ``value`` for ``key`` unless it is already loaded or loading."""
+        if self.cache and key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget the cached value of ``key``, after a write for example."""
+        self._futures.pop(key, None)
+
+    def clear_all(self) -> None:
+        self._futures.clear()
+
+    def _future(self, key: K) -> asyncio.Future:
+        future = self._futures.get(key) if self.cache else None
+        if future is not None:
+            self._record("cached")
+            return future
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending:
+            # Runs after the callbacks already scheduled, so every load
+            # issued in this tick joins the batch
+            loop.call_soon(self._dispatch)
+        self._pending[key] = future
+        if self.cache:
+            self._futures[key] = future
+        return future
+
+    def _dispatch(self) -> None:
+        pending = list(self._pending.items())
+        self._pending.clear()
+        for start in range(0, len(pending), self.max_batch_size):
+            batch = pending[start : start + self.max_batch_size]
+            asyncio.ensure_future(self._load_batch(batch))
+
+    async def _load_batch(self, batch: list[tuple[K, asyncio.Future]]) -> None:
+        keys = [key for key, _ in batch]
+        self._record("batched", len(keys))
+        self.stats["batches"] += 1
+        BATCH_LOADER_BATCHES.labels(loader=self.name).inc()
+        try:
+            values = await self.batch_load_fn(keys)
+        except Exception as e:
+            for key, future in batch:
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                if not future.done():
+                    future.set_exception(e)
+                    # Mark the exception retrieved even if every caller went away
+                    future.exception()
+            return
+        for key, future in batch:
+            if not future.done():
+                future.set_result(values.get(key))
+
+    def _record(self, source: str, count: int = 1) -> None:
+        self.stats[source] += count
+        BATCH_LOADER_KEYS.labels(loader=self.name, source=source).inc(count)
+
+
+_request_loaders: ContextVar[dict[Hashable, BatchLoader] | None] = ContextVar(
+    "request_loaders",
+    default=None,
+)
+
+
+@contextmanager
+def loader_scope() -> Iterator[dict[Hashable, BatchLoader]]:
+    """Give the code run inside the block its own set of loaders."""
+    loaders: dict[Hashable, BatchLoader] = {}
+    token = _request_loaders.set(loaders)
+    try:
+        yield loaders
+    finally:
+        _request_loaders.reset(token)
+        loaders.clear()
+
+
+def request_loader(batch_load_fn: BatchLoadFn, **options: Any) -> BatchLoader:
+    """Loader of the current request for ``batch_load_fn``.
+
+    Loaders are keyed by their batch function, so bound methods of the same
+    repository share one loader. Outside a ``loader_scope`` every call gets
+    a new loader, which still batches the keys of one ``load_many``.
+    """
+    loaders = _request_loaders.get()
+    if loaders is None:
+        return BatchLoader(batch_load_fn, **options)
+    loader = loaders.get(batch_load_fn)
+    if loader is None:
+        loader = loaders[batch_load_fn] = BatchLoader(batch_load_fn, **options)
+    return loader
@@ -2,25 +2,50 @@ from collections.abc import Callable, Coroutine
 from functools import wraps
 from typing import Any
 
-from cachetools import TTLCache
+from src.infrastructure.caching.tiered_cache import TieredCache
 
-# A simple in-memory cache with a TTL of 5 minutes
-_cache = TTLCache(maxsize=1024, ttl=300)
+
+def _call_key(func: Callable[..., Any], args: tuple, kwargs: dict) -> tuple | None:
+    """Hashable key for a call, or ``None`` if an argument is unhashable."""
+    key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 def cached(
-    func: Callable[..., Coroutine[Any, Any, Any]],
-) -> Callable[..., Coroutine[Any, Any, Any]]:
-    """Decorator to cache the result of an async function."""
+    func: Callable[..., Coroutine[Any, Any, Any]] | None = None,
+    *,
+    ttl: float = 300.0,
+    max_entries: int = 1024,
+) -> Any:
+    """Decorator to cache the result of an async function.
+
+    Each decorated function gets its own bounded LRU/TTL cache, exposed as
+    ``wrapper.cache``; concurrent calls with the same arguments share a
+    single execution. Calls with unhashable arguments are not cached.
+    Usable as ``@cached`` or ``@cached(ttl=60, max_entries=256)``.
+    """
+
+    def decorator(
+        func: Callable[..., Coroutine[Any, Any, Any]],
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        cache = TieredCache(
+            f"cached:{func.__module__}.{func.__qualname__}",
+            max_entries=max_entries,
+            default_ttl=ttl,
+        )
 
-    @wraps(func)
-    async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        key = str(args) + str(kwargs)
-        if key in _cache:
-            return _cache[key]
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _call_key(func, args, kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+            return await cache.get_or_load(key, lambda: func(*args, **kwargs))
 
-        result = await func(*args, **kwargs)
-        _cache[key] = result
-        return result
+        wrapper.cache = cache
+        return wrapper
 
-    return wrapper
+    return decorator(func) if func is not None else decorator
@@ -1,16 +1,39 @@
 from collections.abc import Callable
+from functools import wraps
 from typing import Any
 
+from src.infrastructure.caching.tiered_cache import LRUCacheTier
 
-def memoize(func: Callable[..., Any]) -> Callable[..., Any]:
-    """A simple memoization decorator."""
-    cache: dict[Any, Any] = {}
 
-    def wrapper(*args: Any) -> Any:
-        if args in cache:
-            return cache[args]
-        result = func(*args)
-        cache[args] = result
-        return result
+def memoize(
+    func: Callable[..., Any] | None = None,
+    *,
+    max_entries: int = 1024,
+    ttl: float | None = None,
+) -> Any:
+    """A bounded memoization decorator.
 
-    return wrapper
+    Results are kept in an LRU of at most ``max_entries`` entries, exposed
+    as ``wrapper.cache``, optionally expiring after ``ttl`` seconds. Usable
+    as ``@memoize`` or ``@memoize(max_entries=128)``.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = LRUCacheTier(
+            max_entries=max_entries,
+            default_ttl=ttl,
+            name=f"memoize:{func.__module__}.{func.__qualname__}",
+        )
+
+        @wraps(func)
+        def wrapper(*args: Any) -> Any:
+            result = cache.get(args)
+            if result is None:
+                result = func(*args)
+                cache.set(args, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
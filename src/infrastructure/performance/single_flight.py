@@ -0,0 +1,84 @@
+"""Single-flight execution of identical concurrent async calls.
+
+When many callers ask for the same thing at once — a classroom of devices
+asking the same trending question — only the first caller (the leader)
+runs the call; the others await the leader's result. The shared call runs
+in its own task, so a cancelled caller does not cancel it for the rest.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+from prometheus_client import Counter
+
+T = TypeVar("T")
+
+SINGLE_FLIGHT_CALLS = Counter(
+    "single_flight_calls_total",
+    "Calls executed by a single-flight leader or coalesced onto one",
+    ["group", "role"],
+)
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into one execution.
+
+    ``stats`` counts leader executions and coalesced calls; the coalesced
+    count is the number of upstream calls saved.
+
+    Example:
+        ```python
+        flight = SingleFlight("llm")
+        reply = await flight.do(prompt_key, lambda: client.complete(prompt))
+        ```
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.stats = {"leaders": 0, "coalesced": 0}
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Runs ``func`` unless a call with ``key`` is already in flight.
+
+        Every caller receives the same result, or the same exception.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(lambda task: self._forget(key, task))
+            self._record("leaders")
+        else:
+            self._record("coalesced")
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away.
+            task.exception()
+
+    def _record(self, role: str) -> None:
+        self.stats[role] += 1
+        SINGLE_FLIGHT_CALLS.labels(group=self.name, role=role).inc()
+
+
+_groups: dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Get the process-wide single-flight group called ``name``."""
+    flight = _groups.get(name)
+    if flight is None:
+        flight = _groups[name] = SingleFlight(name)
+    return flight
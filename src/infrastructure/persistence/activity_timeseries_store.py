@@ -0,0 +1,724 @@
+"""Time-series storage for child usage and safety events.
+
+Events are appended to month-partitioned tables. Each write also bumps the
+hourly and daily rollup rows of its bucket in the same transaction, so
+statistics read a few pre-aggregated rows per day rather than a child's
+whole history, and retention drops whole partitions instead of deleting
+row by row.
+
+Usage:
+    python -m src.infrastructure.persistence.activity_timeseries_store backfill
+"""
+
+import asyncio
+import json
+from collections import defaultdict
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+
+from src.domain.models.activity_models import (
+    SafetyDailyRollupModel,
+    SafetyEventLogModel,
+    UsageDailyRollupModel,
+    UsageEventModel,
+    UsageHourlyRollupModel,
+)
+from src.infrastructure.logging_config import get_logger
+from src.infrastructure.persistence.database_manager import Database
+
+logger = get_logger(__name__, component="persistence")
+
+PARTITIONED_TABLES = (UsageEventModel.__tablename__, SafetyEventLogModel.__tablename__)
+PERIOD_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365}
+
+_LEGACY_COLUMNS = text(
+    "SELECT column_name FROM information_schema.columns "
+    "WHERE table_name = 'children' "
+    "AND column_name IN ('usage_records', 'safety_events')",
+)
+
+_PARTITIONS_OF = text(
+    "SELECT c.relname FROM pg_inherits i "
+    "JOIN pg_class c ON c.oid = i.inhrelid "
+    "JOIN pg_class p ON p.oid = i.inhparent "
+    "WHERE p.relname = :table",
+)
+
+
+def month_start(day: date) -> date:
+    """First day of the month of ``day``."""
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    """First day of the month after the month of ``day``."""
+    return (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition of ``table`` holding ``month``, e.g. usage_events_y2025m07."""
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+
+def _parse_timestamp(timestamp: datetime | str | None) -> datetime | None:
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp)
+    return timestamp
+
+
+def _legacy_records(records: Any) -> list[dict[str, Any]]:
+    """Entries of a legacy JSON array that carry a timestamp."""
+    if isinstance(records, str):
+        records = json.loads(records)
+    records = records or []
+    usable = [
+        record for record in records if isinstance(record, dict) and record.get("timestamp")
+    ]
+    if len(usable) < len(records):
+        logger.warning(f"Skipped {len(records) - len(usable)} legacy records without a timestamp")
+    return usable
+
+
+def _utc(moment: datetime | None) -> datetime:
+    if moment is None:
+        return datetime.now(UTC)
+    return moment if moment.tzinfo else moment.replace(tzinfo=UTC)
+
+
+class ActivityTimeSeriesStore:
+    """Usage and safety events of children, with incrementally maintained rollups."""
+
+    def __init__(self, database: Database, months_ahead: int = 2) -> None:
+        """Initialize the store.
+
+        Args:
+            database: Database instance
+            months_ahead: Partitions created ahead of the current month
+        """
+        self.db = database
+        self.months_ahead = months_ahead
+        self._partitioned: set[tuple[str, date]] = set()
+        self._partition_lock = asyncio.Lock()
+
+    # Partition management
+
+    async def ensure_partitions(self, start: date | None = None) -> list[str]:
+        """Create the monthly partitions from ``start`` to ``months_ahead`` months later.
+
+        Returns:
+            Names of the partitions that were not known to exist yet
+        """
+        month = month_start(start or datetime.now(UTC).date())
+        months = [month]
+        for _ in range(self.months_ahead):
+            months.append(next_month(months[-1]))
+
+        missing = [
+            (table, month)
+            for table in PARTITIONED_TABLES
+            for month in months
+            if (table, month) not in self._partitioned
+        ]
+        if not missing:
+            return []
+        async with self.db.get_session() as session:
+            for table, month in missing:
+                await session.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+                        f"PARTITION OF {table} FOR VALUES "
+                        f"FROM ('{month.isoformat()}') TO ('{next_month(month).isoformat()}')",
+                    ),
+                )
+            await session.commit()
+        self._partitioned.update(missing)
+        return [partition_name(table, month) for table, month in missing]
+
+    async def drop_partitions_before(self, cutoff: date) -> list[str]:
+        """Drop the partitions whose whole month is older than ``cutoff`` (COPPA retention)."""
+        dropped = []
+        async with self.db.get_session() as session:
+            for table in PARTITIONED_TABLES:
+                result = await session.execute(_PARTITIONS_OF, {"table": table})
+                for (name,) in result.all():
+                    month = self._partition_month(table, name)
+                    if month is None or next_month(month) > cutoff:
+                        continue
+                    await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                    self._partitioned.discard((table, month))
+                    dropped.append(name)
+            await session.commit()
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} expired activity partitions")
+        return dropped
+
+    @staticmethod
+    def _partition_month(table: str, name: str) -> date | None:
+        suffix = name.removeprefix(f"{table}_")
+        if suffix == name or len(suffix) != 8 or not suffix.startswith("y"):
+            return None
+        try:
+            return date(int(suffix[1:5]), int(suffix[6:8]), 1)
+        except ValueError:
+            return None
+
+    async def _ensure_partition(self, occurred_at: datetime) -> None:
+        month = month_start(occurred_at.date())
+        if all((table, month) in self._partitioned for table in PARTITIONED_TABLES):
+            return
+        async with self._partition_lock:
+            await self.ensure_partitions(month)
+
+    # Writes
+
+    async def record_usage(
+        self,
+        child_id: str,
+        activity_type: str,
+        duration_minutes: float,
+        occurred_at: datetime | None = None,
+    ) -> str:
+        """Append a usage event and add it to its hourly and daily rollups.
+
+        Returns:
+            Usage event ID
+        """
+        occurred_at = _utc(occurred_at)
+        await self._ensure_partition(occurred_at)
+        event_id = str(uuid4())
+        async with self.db.get_session() as session:
+            for statement in self._usage_statements(
+                event_id, child_id, activity_type, duration_minutes, occurred_at
+            ):
+                await session.execute(statement)
+            await session.commit()
+        return event_id
+
+    @staticmethod
+    def _usage_statements(
+        event_id: str,
+        child_id: str,
+        activity_type: str,
+        duration_minutes: float,
+        occurred_at: datetime,
+    ) -> list:
+        """The event insert and its hourly and daily rollup upserts."""
+        hourly = insert(UsageHourlyRollupModel).values(
+            child_id=child_id,
+            bucket=occurred_at.replace(minute=0, second=0, microsecond=0),
+            activity_type=activity_type,
+            event_count=1,
+            total_minutes=duration_minutes,
+        )
+        hourly = hourly.on_conflict_do_update(
+            index_elements=["child_id", "bucket", "activity_type"],
+            set_={
+                "event_count": UsageHourlyRollupModel.event_count + 1,
+                "total_minutes": UsageHourlyRollupModel.total_minutes
+                + hourly.excluded.total_minutes,
+            },
+        )
+        daily = insert(UsageDailyRollupModel).values(
+            child_id=child_id,
+            bucket=occurred_at.date(),
+            activity_type=activity_type,
+            event_count=1,
+            total_minutes=duration_minutes,
+            last_event_at=occurred_at,
+        )
+        daily = daily.on_conflict_do_update(
+            index_elements=["child_id", "bucket", "activity_type"],
+            set_={
+                "event_count": UsageDailyRollupModel.event_count + 1,
+                "total_minutes": UsageDailyRollupModel.total_minutes
+                + daily.excluded.total_minutes,
+                "last_event_at": func.greatest(
+                    UsageDailyRollupModel.last_event_at,
+                    daily.excluded.last_event_at,
+                ),
+            },
+        )
+        event = insert(UsageEventModel).values(
+            id=event_id,
+            occurred_at=occurred_at,
+            child_id=child_id,
+            activity_type=activity_type,
+            duration_minutes=duration_minutes,
+        )
+        return [event, hourly, daily]
+
+    async def record_safety_event(
+        self,
+        child_id: str,
+        event_type: str,
+        details: dict[str, Any] | str,
+        severity: str = "low",
+        occurred_at: datetime | None = None,
+    ) -> str:
+        """Append a safety event and add it to its daily rollup.
+
+        Returns:
+            Safety event ID
+        """
+        occurred_at = _utc(occurred_at)
+        await self._ensure_partition(occurred_at)
+        event_id = str(uuid4())
+        async with self.db.get_session() as session:
+            for statement in self._safety_statements(
+                event_id, child_id, event_type, details, severity, occurred_at
+            ):
+                await session.execute(statement)
+            await session.commit()
+        return event_id
+
+    @staticmethod
+    def _safety_statements(
+        event_id: str,
+        child_id: str,
+        event_type: str,
+        details: dict[str, Any] | str,
+        severity: str,
+        occurred_at: datetime,
+    ) -> list:
+        """The event insert and its daily rollup upsert."""
+        daily = insert(SafetyDailyRollupModel).values(
+            child_id=child_id,
+            bucket=occurred_at.date(),
+            event_type=event_type,
+            severity=severity,
+            event_count=1,
+        )
+        daily = daily.on_conflict_do_update(
+            index_elements=["child_id", "bucket", "event_type", "severity"],
+            set_={"event_count": SafetyDailyRollupModel.event_count + 1},
+        )
+        event = insert(SafetyEventLogModel).values(
+            id=event_id,
+            occurred_at=occurred_at,
+            child_id=child_id,
+            event_type=event_type,
+            severity=severity,
+            details=details,
+        )
+        return [event, daily]
+
+    # Reads
+
+    async def daily_usage(self, child_id: str, day: date | None = None) -> float:
+        """Minutes of usage of a child on one day, today by default."""
+        day = day or datetime.now(UTC).date()
+        async with self.db.get_session() as session:
+            total = await session.scalar(
+                select(func.coalesce(func.sum(UsageDailyRollupModel.total_minutes), 0.0)).where(
+                    UsageDailyRollupModel.child_id == child_id,
+                    UsageDailyRollupModel.bucket == day,
+                ),
+            )
+        return float(total or 0.0)
+
+    async def usage_by_day(self, child_id: str, days: int = 7) -> dict[str, float]:
+        """Minutes of usage per day over the last ``days`` days, newest first."""
+        today = datetime.now(UTC).date()
+        since = today - timedelta(days=days - 1)
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(
+                    UsageDailyRollupModel.bucket,
+                    func.sum(UsageDailyRollupModel.total_minutes),
+                )
+                .where(
+                    UsageDailyRollupModel.child_id == child_id,
+                    UsageDailyRollupModel.bucket >= since,
+                )
+                .group_by(UsageDailyRollupModel.bucket),
+            )
+            minutes = {bucket: float(total) for bucket, total in result.all()}
+        return {
+            (today - timedelta(days=i)).isoformat(): minutes.get(today - timedelta(days=i), 0.0)
+            for i in range(days)
+        }
+
+    async def usage_by_hour(
+        self,
+        child_id: str,
+        since: datetime,
+        until: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Usage per hour and activity type, oldest first."""
+        conditions = [
+            UsageHourlyRollupModel.child_id == child_id,
+            UsageHourlyRollupModel.bucket >= _utc(since),
+        ]
+        if until is not None:
+            conditions.append(UsageHourlyRollupModel.bucket < _utc(until))
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(
+                    UsageHourlyRollupModel.bucket,
+                    UsageHourlyRollupModel.activity_type,
+                    UsageHourlyRollupModel.event_count,
+                    UsageHourlyRollupModel.total_minutes,
+                )
+                .where(*conditions)
+                .order_by(UsageHourlyRollupModel.bucket),
+            )
+            return [
+                {
+                    "hour": bucket.isoformat(),
+                    "activity_type": activity_type,
+                    "interactions": event_count,
+                    "minutes": total_minutes,
+                }
+                for bucket, activity_type, event_count, total_minutes in result.all()
+            ]
+
+    async def usage_by_activity(self, child_id: str, days: int = 30) -> dict[str, float]:
+        """Minutes of usage per activity type over the last ``days`` days."""
+        since = datetime.now(UTC).date() - timedelta(days=days - 1)
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(
+                    UsageDailyRollupModel.activity_type,
+                    func.sum(UsageDailyRollupModel.total_minutes),
+                )
+                .where(
+                    UsageDailyRollupModel.child_id == child_id,
+                    UsageDailyRollupModel.bucket >= since,
+                )
+                .group_by(UsageDailyRollupModel.activity_type),
+            )
+            return {activity_type: float(total) for activity_type, total in result.all()}
+
+    async def recent_safety_events(
+        self,
+        child_id: str,
+        limit: int = 10,
+        since: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Latest safety events of a child, oldest first."""
+        conditions = [SafetyEventLogModel.child_id == child_id]
+        if since is not None:
+            conditions.append(SafetyEventLogModel.occurred_at >= _utc(since))
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(
+                    SafetyEventLogModel.id,
+                    SafetyEventLogModel.event_type,
+                    SafetyEventLogModel.details,
+                    SafetyEventLogModel.severity,
+                    SafetyEventLogModel.occurred_at,
+                )
+                .where(*conditions)
+                .order_by(SafetyEventLogModel.occurred_at.desc())
+                .limit(limit),
+            )
+            rows = result.all()
+        return [
+            {
+                "event_id": event_id,
+                "event_type": event_type,
+                "details": details,
+                "severity": severity,
+                "timestamp": occurred_at.isoformat(),
+            }
+            for event_id, event_type, details, severity, occurred_at in reversed(rows)
+        ]
+
+    async def safety_event_counts(self, child_id: str, days: int = 30) -> dict[str, int]:
+        """Safety events per severity over the last ``days`` days."""
+        since = datetime.now(UTC).date() - timedelta(days=days - 1)
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(
+                    SafetyDailyRollupModel.severity,
+                    func.sum(SafetyDailyRollupModel.event_count),
+                )
+                .where(
+                    SafetyDailyRollupModel.child_id == child_id,
+                    SafetyDailyRollupModel.bucket >= since,
+                )
+                .group_by(SafetyDailyRollupModel.severity),
+            )
+            return {severity: int(count) for severity, count in result.all()}
+
+    async def get_child_statistics(self, child_id: str, period: str = "week") -> dict[str, Any]:
+        """Interaction statistics of a child over a dashboard period.
+
+        Args:
+            child_id: Child ID
+            period: One of day, week, month, year
+
+        Returns:
+            interaction_count, learning_time (minutes), topics (activity types,
+            most used first), daily_activities (oldest first) and safety_incidents
+        """
+        days = PERIOD_DAYS[period]
+        summary = (await self.get_activity_summaries([child_id], days))[child_id]
+        return {
+            "interaction_count": summary["total_interactions"],
+            "learning_time": summary["total_minutes"],
+            "topics": summary["favorite_activities"],
+            "daily_activities": [
+                {"date": day, **activity}
+                for day, activity in sorted(summary["daily_activities"].items())
+            ],
+            "safety_incidents": summary["safety_incidents"],
+            "last_active": summary["last_active"],
+        }
+
+    async def get_activity_summaries(
+        self,
+        child_ids: list[str],
+        days: int = 7,
+    ) -> dict[str, dict[str, Any]]:
+        """Activity summaries of several children over the last ``days`` days.
+
+        Reads only daily rollups, with one query for usage and one for
+        safety events however many children are asked for.
+        """
+        since = datetime.now(UTC).date() - timedelta(days=days - 1)
+        summaries = {
+            child_id: {
+                "total_interactions": 0,
+                "total_minutes": 0.0,
+                "daily_average_minutes": 0.0,
+                "favorite_activities": [],
+                "last_active": None,
+                "daily_activities": {},
+                "safety_incidents": 0,
+            }
+            for child_id in child_ids
+        }
+        if not child_ids:
+            return summaries
+
+        activity_minutes: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        async with self.db.get_session() as session:
+            usage = await session.execute(
+                select(
+                    UsageDailyRollupModel.child_id,
+                    UsageDailyRollupModel.bucket,
+                    UsageDailyRollupModel.activity_type,
+                    UsageDailyRollupModel.event_count,
+                    UsageDailyRollupModel.total_minutes,
+                    UsageDailyRollupModel.last_event_at,
+                ).where(
+                    UsageDailyRollupModel.child_id.in_(child_ids),
+                    UsageDailyRollupModel.bucket >= since,
+                ),
+            )
+            for child_id, bucket, activity_type, count, minutes, last_event_at in usage.all():
+                summary = summaries[child_id]
+                summary["total_interactions"] += count
+                summary["total_minutes"] += minutes
+                daily = summary["daily_activities"].setdefault(
+                    bucket.isoformat(),
+                    {"interactions": 0, "minutes": 0.0},
+                )
+                daily["interactions"] += count
+                daily["minutes"] += minutes
+                activity_minutes[child_id][activity_type] += minutes
+                if summary["last_active"] is None or last_event_at > summary["last_active"]:
+                    summary["last_active"] = last_event_at
+
+            incidents = await session.execute(
+                select(
+                    SafetyDailyRollupModel.child_id,
+                    func.sum(SafetyDailyRollupModel.event_count),
+                )
+                .where(
+                    SafetyDailyRollupModel.child_id.in_(child_ids),
+                    SafetyDailyRollupModel.bucket >= since,
+                )
+                .group_by(SafetyDailyRollupModel.child_id),
+            )
+            for child_id, count in incidents.all():
+                summaries[child_id]["safety_incidents"] = int(count)
+
+        for child_id, summary in summaries.items():
+            summary["daily_average_minutes"] = summary["total_minutes"] / days
+            by_activity = activity_minutes.get(child_id, {})
+            summary["favorite_activities"] = sorted(by_activity, key=by_activity.get, reverse=True)
+            if summary["last_active"] is not None:
+                summary["last_active"] = summary["last_active"].isoformat()
+        return summaries
+
+    # Backfill
+
+    async def backfill_legacy_records(self, batch_size: int = 100) -> dict[str, int]:
+        """Copy the JSON ``usage_records`` and ``safety_events`` of the children
+        rows into the time-series tables, with their rollups.
+
+        Each child's arrays are copied and emptied in one transaction, so an
+        interrupted backfill resumes where it stopped and running it again
+        copies nothing twice. Databases without the legacy columns have
+        nothing to copy.
+
+        Returns:
+            Number of usage and safety events copied
+        """
+        copied = {"usage_events": 0, "safety_events": 0}
+        async with self.db.get_session() as session:
+            result = await session.execute(_LEGACY_COLUMNS)
+            columns = {name for (name,) in result.all()}
+        if not columns:
+            return copied
+
+        pending = " OR ".join(
+            f"({column} IS NOT NULL AND {column}::text NOT IN ('[]', 'null'))"
+            for column in sorted(columns)
+        )
+        failed: list[str] = []
+        while True:
+            async with self.db.get_session() as session:
+                result = await session.execute(
+                    text(
+                        f"SELECT id FROM children WHERE ({pending}) "
+                        "AND NOT (CAST(id AS text) = ANY(:failed)) LIMIT :limit",
+                    ),
+                    {"failed": failed, "limit": batch_size},
+                )
+                child_ids = [str(child_id) for (child_id,) in result.all()]
+            if not child_ids:
+                break
+            for child_id in child_ids:
+                try:
+                    usage, safety = await self._backfill_child(child_id, columns)
+                except Exception as e:
+                    logger.error(f"Failed to backfill activity of child {child_id}: {e}")
+                    failed.append(child_id)
+                    continue
+                copied["usage_events"] += usage
+                copied["safety_events"] += safety
+        logger.info(
+            f"Backfilled {copied['usage_events']} usage and "
+            f"{copied['safety_events']} safety events",
+        )
+        return copied
+
+    async def _backfill_child(self, child_id: str, columns: set[str]) -> tuple[int, int]:
+        selected = ", ".join(sorted(columns))
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                text(f"SELECT {selected} FROM children WHERE id = :id FOR UPDATE"),
+                {"id": child_id},
+            )
+            row = result.mappings().first()
+            if row is None:
+                return 0, 0
+            usage = _legacy_records(row.get("usage_records"))
+            safety = _legacy_records(row.get("safety_events"))
+
+            statements = []
+            months = set()
+            for record in usage:
+                occurred_at = _utc(_parse_timestamp(record["timestamp"]))
+                months.add(month_start(occurred_at.date()))
+                statements += self._usage_statements(
+                    str(uuid4()),
+                    child_id,
+                    record.get("activity_type") or "unknown",
+                    float(record.get("duration") or 0.0),
+                    occurred_at,
+                )
+            for record in safety:
+                occurred_at = _utc(_parse_timestamp(record["timestamp"]))
+                months.add(month_start(occurred_at.date()))
+                statements += self._safety_statements(
+                    str(uuid4()),
+                    child_id,
+                    record.get("event_type") or "unknown",
+                    record.get("details") or "",
+                    record.get("severity") or "low",
+                    occurred_at,
+                )
+            for month in sorted(months):
+                await self._ensure_partition(datetime.combine(month, datetime.min.time()))
+            for statement in statements:
+                await session.execute(statement)
+            await session.execute(
+                text(
+                    "UPDATE children SET "
+                    + ", ".join(f"{column} = '[]'" for column in sorted(columns))
+                    + " WHERE id = :id",
+                ),
+                {"id": child_id},
+            )
+            await session.commit()
+        return len(usage), len(safety)
+
+    # Retention
+
+    async def purge_before(self, cutoff: datetime) -> int:
+        """Delete the usage and safety history older than ``cutoff``.
+
+        Whole months are dropped as partitions; only the month containing
+        the cutoff is deleted row by row.
+
+        Returns:
+            Number of usage events deleted
+        """
+        cutoff = _utc(cutoff)
+        boundary = month_start(cutoff.date())
+        async with self.db.get_session() as session:
+            dropped_events = await session.scalar(
+                select(func.coalesce(func.sum(UsageDailyRollupModel.event_count), 0)).where(
+                    UsageDailyRollupModel.bucket < boundary,
+                ),
+            )
+            await session.commit()
+        await self.drop_partitions_before(boundary)
+
+        async with self.db.get_session() as session:
+            deleted = await session.execute(
+                delete(UsageEventModel).where(UsageEventModel.occurred_at < cutoff),
+            )
+            await session.execute(
+                delete(SafetyEventLogModel).where(SafetyEventLogModel.occurred_at < cutoff),
+            )
+            await session.execute(
+                delete(UsageHourlyRollupModel).where(UsageHourlyRollupModel.bucket < cutoff),
+            )
+            await session.execute(
+                delete(UsageDailyRollupModel).where(
+                    UsageDailyRollupModel.bucket < cutoff.date(),
+                ),
+            )
+            await session.execute(
+                delete(SafetyDailyRollupModel).where(
+                    SafetyDailyRollupModel.bucket < cutoff.date(),
+                ),
+            )
+            await session.commit()
+        return int(dropped_events or 0) + deleted.rowcount
+
+    async def delete_child(self, child_id: str) -> None:
+        """Delete all activity of a child (COPPA deletion request)."""
+        async with self.db.get_session() as session:
+            for model in (
+                UsageEventModel,
+                SafetyEventLogModel,
+                UsageHourlyRollupModel,
+                UsageDailyRollupModel,
+                SafetyDailyRollupModel,
+            ):
+                await session.execute(delete(model).where(model.child_id == child_id))
+            await session.commit()
+
+
+if __name__ == "__main__":
+    import sys
+
+    from src.infrastructure.dependencies import get_activity_timeseries_store
+
+    async def main() -> None:
+        copied = await get_activity_timeseries_store().backfill_legacy_records()
+        logger.info(f"backfill: {copied}")
+
+    if sys.argv[1:] != ["backfill"]:
+        sys.exit(f"usage: {sys.argv[0]} backfill")
+    asyncio.run(main())
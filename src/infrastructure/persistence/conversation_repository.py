@@ -9,6 +9,8 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from src.domain.entities.conversation import Conversation
 from src.domain.models.conversation_models import ConversationModel
+from src.infrastructure.pagination.keyset import CursorPage, KeysetPaginator
+from src.infrastructure.performance.batch_loader import BatchLoader, request_loader
 
 
 class ConversationRepository(IConversationRepository):
@@ -24,32 +26,47 @@ class ConversationRepository(IConversationRepository):
 class AsyncSQLAlchemyConversationRepo(ConversationRepository):
     """Async SQLAlchemy implementation of ConversationRepository."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, paginator: Optional[KeysetPaginator] = None):
         """Initialize the repository with an async session.
         
         Args:
             session: The async SQLAlchemy session for database operations.
+            paginator: Keyset paginator of get_page_by_child_id.
         """
         self.session = session
+        self.paginator = paginator or KeysetPaginator()
 
     async def get_by_id(self, conversation_id: str) -> Optional[Conversation]:
         """Retrieve a conversation by its ID.
         
+        Lookups made concurrently within a request share one query.
+
         Args:
             conversation_id: The ID of the conversation to retrieve.
             
         Returns:
             The Conversation entity if found, None otherwise.
         """
+        return await self._id_loader().load(conversation_id)
+
+    async def get_by_ids(self, conversation_ids: List[str]) -> dict[str, Conversation]:
+        """Retrieve several conversations with one query.
+
+        Args:
+            conversation_ids: The IDs of the conversations to retrieve.
+
+        Returns:
+            The Conversation entities found, by ID.
+        """
+        if not conversation_ids:
+            return {}
         try:
             result = await self.session.execute(
-                select(ConversationModel).where(ConversationModel.id == conversation_id)
+                select(ConversationModel).where(ConversationModel.id.in_(conversation_ids))
             )
-            conversation_model = result.scalar_one_or_none()
+            conversation_models = result.scalars().all()
             
-            if conversation_model:
-                return conversation_model.to_entity()
-            return None
+            return {str(model.id): model.to_entity() for model in conversation_models}
         except SQLAlchemyError as e:
             raise ValueError(f"Database error while retrieving conversation: {str(e)}")
 
@@ -81,6 +98,7 @@ class AsyncSQLAlchemyConversationRepo(ConversationRepository):
             self.session.add(conversation_model)
             await self.session.commit()
             await self.session.refresh(conversation_model)
+            self._clear_loaders()
             
             return conversation_model.to_entity()
         except SQLAlchemyError as e:
@@ -114,6 +132,7 @@ class AsyncSQLAlchemyConversationRepo(ConversationRepository):
                     .values(**update_data)
                 )
                 await self.session.commit()
+                self._clear_loaders()
             
             # Retrieve the updated conversation
             return await self.get_by_id(conversation_id)
@@ -132,6 +151,7 @@ class AsyncSQLAlchemyConversationRepo(ConversationRepository):
                 sql_delete(ConversationModel).where(ConversationModel.id == conversation_id)
             )
             await self.session.commit()
+            self._clear_loaders()
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise ValueError(f"Database error while deleting conversation: {str(e)}")
@@ -148,18 +168,173 @@ class AsyncSQLAlchemyConversationRepo(ConversationRepository):
     async def get_by_child_id(self, child_id: str) -> List[Conversation]:
         """Retrieve all conversations for a specific child.
         
+        Lookups for several children made concurrently within a request,
+        as on a parent dashboard, share one query.
+
         Args:
             child_id: The ID of the child.
             
         Returns:
             A list of Conversation entities for the specified child.
         """
+        return await self._child_loader().load(child_id) or []
+
+    async def find_by_child_id(self, child_id: UUID) -> List[Conversation]:
+        """Retrieve all conversations for a specific child."""
+        return await self.get_by_child_id(str(child_id))
+
+    async def find_recent_by_child_id(
+        self,
+        child_id: UUID,
+        limit: int,
+    ) -> List[Conversation]:
+        """Retrieve a child's latest conversations, oldest first.
+
+        Reads only the newest ``limit`` rows, along the
+        (child_id, start_time, id) index.
+
+        Args:
+            child_id: The ID of the child.
+            limit: Maximum number of conversations to return.
+
+        Returns:
+            The Conversation entities.
+        """
+        if limit <= 0:
+            return []
         try:
             result = await self.session.execute(
-                select(ConversationModel).where(ConversationModel.child_id == child_id)
+                select(ConversationModel)
+                .where(ConversationModel.child_id == str(child_id))
+                .order_by(ConversationModel.start_time.desc(), ConversationModel.id.desc())
+                .limit(limit)
+            )
+            conversation_models = result.scalars().all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Database error while retrieving recent conversations: {str(e)}")
+
+        return [model.to_entity() for model in reversed(conversation_models)]
+
+    async def find_summaries_by_child_id(
+        self,
+        child_id: UUID,
+        limit: int = 20,
+    ) -> List[str]:
+        """Retrieve the summaries of a child's latest conversations, oldest first.
+
+        Reads only the summary column of the newest conversations, along
+        the (child_id, start_time, id) index, instead of loading whole
+        conversations.
+
+        Args:
+            child_id: The ID of the child.
+            limit: Maximum number of summaries to return.
+
+        Returns:
+            The conversation summaries.
+        """
+        try:
+            result = await self.session.execute(
+                select(ConversationModel.summary)
+                .where(ConversationModel.child_id == str(child_id))
+                .order_by(ConversationModel.start_time.desc(), ConversationModel.id.desc())
+                .limit(limit)
+            )
+            summaries = result.scalars().all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Database error while retrieving conversation summaries: {str(e)}")
+
+        return [summary or "" for summary in reversed(summaries)]
+
+    async def save(self, conversation: Conversation) -> None:
+        """Save or update a conversation.
+
+        Args:
+            conversation: The Conversation entity to save.
+        """
+        try:
+            await self.session.merge(ConversationModel.from_entity(conversation))
+            await self.session.commit()
+            self._clear_loaders()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ValueError(f"Database error while saving conversation: {str(e)}")
+
+    async def get_by_child_ids(self, child_ids: List[str]) -> dict[str, List[Conversation]]:
+        """Retrieve the conversations of several children with one query.
+
+        Args:
+            child_ids: The IDs of the children.
+
+        Returns:
+            The Conversation entities of each child, by child ID.
+        """
+        if not child_ids:
+            return {}
+        try:
+            result = await self.session.execute(
+                select(ConversationModel).where(ConversationModel.child_id.in_(child_ids))
             )
             conversation_models = result.scalars().all()
-            
-            return [model.to_entity() for model in conversation_models]
         except SQLAlchemyError as e:
             raise ValueError(f"Database error while retrieving conversations by child_id: {str(e)}")
+
+        conversations = {child_id: [] for child_id in child_ids}
+        for model in conversation_models:
+            conversations.setdefault(str(model.child_id), []).append(model.to_entity())
+        return conversations
+
+    async def get_page_by_child_id(
+        self,
+        child_id: str,
+        cursor: Optional[str] = None,
+        size: Optional[int] = None,
+    ) -> CursorPage[Conversation]:
+        """Retrieve a page of a child's conversations, newest first.
+
+        Pages by (start_time, id) rather than OFFSET, so deep pages cost
+        the same as the first one.
+
+        Args:
+            child_id: The ID of the child.
+            cursor: A cursor of a previous page, or None for the newest conversations.
+            size: The page size.
+
+        Returns:
+            The page of Conversation entities and the cursors around it.
+        """
+        size = self.paginator.page_size(size)
+        scope = f"conversations:{child_id}"
+        position = self.paginator.position(cursor, scope)
+        statement = self.paginator.apply(
+            select(ConversationModel).where(ConversationModel.child_id == child_id),
+            ConversationModel.start_time,
+            ConversationModel.id,
+            position,
+            size,
+        )
+        try:
+            result = await self.session.execute(statement)
+            conversation_models = result.scalars().all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Database error while retrieving conversations by child_id: {str(e)}")
+
+        return self.paginator.page(
+            conversation_models,
+            position,
+            size,
+            key=lambda model: (model.start_time, model.id),
+            scope=scope,
+            convert=lambda models: [model.to_entity() for model in models],
+        )
+
+    def _id_loader(self) -> BatchLoader:
+        return request_loader(self.get_by_ids, name="conversations")
+
+    def _child_loader(self) -> BatchLoader:
+        return request_loader(self.get_by_child_ids, name="child_conversations")
+
+    def _clear_loaders(self) -> None:
+        """Drop what this request has read, so later reads see the write."""
+        self._id_loader().clear_all()
+        self._child_loader().clear_all()
@@ -3,14 +3,18 @@ import hashlib
 import json
 import os
 import sqlite3
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 
-from src.infrastructure.validators.security.path_validator import (
-    get_secure_file_operations,
+from src.infrastructure.pagination.keyset import CursorPage, KeysetPaginator
+from src.infrastructure.persistence.sqlite_connection_pool import (
+    SQLiteConnectionPool,
 )
 
 """Production - ready SQLite conversation repository with COPPA compliance"""
@@ -19,47 +23,250 @@ from src.infrastructure.logging_config import get_logger
 
 logger = get_logger(__name__, component="persistence")
 
+# Fields get_conversations can return
+CONVERSATION_FIELDS = (
+    "id",
+    "hash",
+    "content",
+    "summary",
+    "timestamp",
+    "safety_score",
+    "parent_approved",
+)
+DEFAULT_FIELDS = ("id", "hash", "content", "timestamp", "safety_score", "parent_approved")
+SUMMARY_FIELDS = ("id", "summary", "timestamp")
+SUMMARY_MAX_CHARS = 280
+
+# Columns read for each field. Rows saved before summaries were stored fall
+# back to their content, which is only read for those rows.
+_FIELD_COLUMNS = {
+    "id": ("id",),
+    "hash": ("conversation_hash",),
+    "content": ("encrypted_content",),
+    "summary": (
+        "encrypted_summary",
+        "CASE WHEN encrypted_summary IS NULL THEN encrypted_content END AS legacy_content",
+    ),
+    "timestamp": ("timestamp",),
+    "safety_score": ("safety_score",),
+    "parent_approved": ("parent_approved",),
+}
+
+# Statements are kept as constants so each pooled connection compiles them
+# once and reuses the prepared statement afterwards
+_INSERT_CONVERSATION = """
+    INSERT OR REPLACE INTO conversations
+    (child_id, conversation_hash, encrypted_content, encrypted_summary, safety_score, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_COUNT_CONVERSATIONS = (
+    "SELECT COUNT(*) FROM conversations WHERE child_id = ? AND expires_at > ?"
+)
+_DELETE_CHILD_CONVERSATIONS = "DELETE FROM conversations WHERE child_id = ?"
+_DELETE_OLD_CONVERSATIONS = """
+    DELETE FROM conversations
+    WHERE child_id = ? AND id NOT IN (
+        SELECT id FROM conversations
+        WHERE child_id = ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    )
+"""
+# One batch of the expiry purge; walks idx_expires_at, so it only touches
+# expired rows no matter how large the table is
+_PURGE_EXPIRED_BATCH = """
+    DELETE FROM conversations WHERE id IN (
+        SELECT id FROM conversations
+        WHERE expires_at < ?
+        ORDER BY expires_at
+        LIMIT ?
+    )
+"""
+# Re-encryption after a key rotation walks the primary key, and only
+# replaces rows that were not rewritten since they were read
+_COUNT_ALL_CONVERSATIONS = "SELECT COUNT(*) FROM conversations"
+_SELECT_CIPHERTEXTS = """
+    SELECT id, encrypted_content, encrypted_summary FROM conversations
+    WHERE id > ?
+    ORDER BY id
+    LIMIT ?
+"""
+_REPLACE_CIPHERTEXTS = """
+    UPDATE conversations SET encrypted_content = ?, encrypted_summary = ?
+    WHERE id = ? AND encrypted_content = ?
+"""
+
+
+def _conversation_columns(fields: tuple[str, ...], *always: str) -> str:
+    columns = dict.fromkeys(
+        (*always, *(column for field in fields for column in _FIELD_COLUMNS[field])),
+    )
+    return ", ".join(columns)
+
+
+@lru_cache(maxsize=32)
+def _select_conversations(fields: tuple[str, ...]) -> str:
+    """SELECT reading only the columns behind ``fields``."""
+    # The id is always read, to name rows that fail to decrypt
+    return f"""
+    SELECT {_conversation_columns(fields, "id")}
+    FROM conversations
+    WHERE child_id = ? AND expires_at > ?
+    ORDER BY timestamp DESC
+    LIMIT ? OFFSET ?
+"""
+
+
+@lru_cache(maxsize=64)
+def _select_conversation_page(
+    fields: tuple[str, ...], keyset_condition: str, order_by: str
+) -> str:
+    """Keyset-paginated SELECT; seeks along idx_child_timestamp at any depth."""
+    # The timestamp and id are always read, as they make up the cursors
+    return f"""
+    SELECT {_conversation_columns(fields, "id", "timestamp")}
+    FROM conversations
+    WHERE child_id = ? AND expires_at > ? {keyset_condition}
+    {order_by}
+    LIMIT ?
+"""
+
 
 class ConversationSQLiteRepository:
     """Production - grade conversation repository with comprehensive safety and privacy controls.
     Implements COPPA - compliant data handling with encryption and automatic cleanup.
     """
 
-    def __init__(self, db_path: str = "conversations.db") -> None:
+    # Name of the repository as a re-encryption target
+    name = "conversations"
+
+    def __init__(
+        self,
+        db_path: str = "conversations.db",
+        pool_size: int = 4,
+        purge_batch_size: int = 1000,
+        purge_interval_seconds: float = 300.0,
+        decrypt_workers: int = 4,
+        inline_decrypt_bytes: int = 64 * 1024,
+        paginator: KeysetPaginator | None = None,
+        key_file: str = "conversation_key.key",
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            db_path: Path of the SQLite database file
+            pool_size: Number of read connections
+            purge_batch_size: Expired conversations deleted per transaction
+            purge_interval_seconds: Pause between runs of the expiry purge
+            decrypt_workers: Threads decrypting large pages of conversations
+            inline_decrypt_bytes: Pages with less ciphertext than this are
+                decrypted on the event loop, where a thread hop costs more
+            paginator: Keyset paginator of get_conversations_page
+            key_file: Keyring file shared by every worker; the first line is
+                the key new rows are encrypted with, the following lines are
+                previous keys still accepted for decryption
+        """
         self.db_path = Path(db_path)
+        self.key_file = key_file
+        self._keyring_mtime: int | None = None
         self.encryption_key = self._get_or_create_encryption_key()
-        self.cipher = Fernet(self.encryption_key)
+        keyring = self._read_keyring()
+        # Previous keys only apply to the keyring the current key came from
+        previous = keyring[1:] if keyring[:1] == [self.encryption_key] else []
+        self._apply_keyring([self.encryption_key, *previous])
         self.max_conversation_age_days = 90  # COPPA compliance
         self.max_conversations_per_child = 1000  # Safety limit
+        self.purge_batch_size = purge_batch_size
+        self.purge_interval_seconds = purge_interval_seconds
+        self.decrypt_workers = decrypt_workers
+        self.inline_decrypt_bytes = inline_decrypt_bytes
+        self.paginator = paginator or KeysetPaginator(max_size=100)
+        self.pool = SQLiteConnectionPool(self.db_path, readers=pool_size)
+        self._decrypt_executor = ThreadPoolExecutor(
+            max_workers=decrypt_workers,
+            thread_name_prefix="conversation-decrypt",
+        )
+        self._purge_task: asyncio.Task | None = None
         self._init_database()
 
     def _get_or_create_encryption_key(self) -> bytes:
-
-        secure_ops = get_secure_file_operations()
-        key_filename = "conversation_key.key"
-        try:
-            if secure_ops.safe_exists(key_filename):
-                with secure_ops.safe_open(key_filename, "rb") as f:
-                    return f.read()
-        except Exception as e:
-            logger.warning(f"Failed to read encryption key: {e}")
-        # Generate new key
+        """Current key of the keyring file, creating the file on first use."""
+        keyring = self._read_keyring()
+        if keyring:
+            return keyring[0]
         key = Fernet.generate_key()
         try:
-            with secure_ops.safe_open(key_filename, "wb") as f:
-                f.write(key)
-            # Set secure permissions
-            key_file = secure_ops.validator.get_safe_path(key_filename)
-            if key_file:
-                os.chmod(key_file, 0o600)
-        except Exception as e:
+            self._write_keyring([key])
+        except OSError as e:
             logger.warning(f"Failed to save encryption key: {e}")
         return key
 
+    def use_encryption_keys(self, key: bytes, previous: Sequence[bytes] = ()) -> None:
+        """Encrypt with ``key`` from now on, still decrypting rows under ``previous``.
+
+        The keyring file is replaced atomically before the keys are used, so
+        a restart and every other worker see the same keys: workers reload
+        the file on their next write, or when they read a row they cannot
+        decrypt. Called with the old keys when a key is rotated, and without
+        them only once the re-encryption job is done and every worker has
+        loaded the new keyring; rows still under a dropped key are lost.
+        """
+        keyring = [key, *previous]
+        self._write_keyring(keyring)
+        self._apply_keyring(keyring)
+
+    def _apply_keyring(self, keyring: list[bytes]) -> None:
+        self.encryption_key = keyring[0]
+        self.cipher = MultiFernet([Fernet(k) for k in keyring])
+
+    def _read_keyring(self) -> list[bytes]:
+        try:
+            self._keyring_mtime = os.stat(self.key_file).st_mtime_ns
+            with open(self.key_file, "rb") as f:
+                return [line for line in f.read().splitlines() if line]
+        except OSError:
+            return []
+
+    def _write_keyring(self, keyring: list[bytes]) -> None:
+        """Replace the keyring file atomically, keeping it private."""
+        temp_file = f"{self.key_file}.tmp"
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"\n".join(keyring) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.key_file)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.unlink(temp_file)
+            raise
+        self._keyring_mtime = os.stat(self.key_file).st_mtime_ns
+
+    def _refresh_keyring(self) -> bool:
+        """Load the keyring file if another worker replaced it.
+
+        Returns:
+            Whether new keys were loaded
+        """
+        try:
+            mtime = os.stat(self.key_file).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._keyring_mtime:
+            return False
+        keyring = self._read_keyring()
+        if not keyring:
+            return False
+        self._apply_keyring(keyring)
+        logger.info("Reloaded conversation encryption keys from the keyring file")
+        return True
+
     def _init_database(self):
         """Initialize database with proper schema."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            conn = self.pool.connect()
+            with conn:
                 conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS conversations (
@@ -67,6 +274,7 @@ class ConversationSQLiteRepository:
                         child_id TEXT NOT NULL,
                         conversation_hash TEXT UNIQUE NOT NULL,
                         encrypted_content BLOB NOT NULL,
+                        encrypted_summary BLOB,
                         timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
                         safety_score REAL DEFAULT 1.0,
                         parent_approved BOOLEAN DEFAULT FALSE,
@@ -82,18 +290,18 @@ class ConversationSQLiteRepository:
                 conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_expires_at ON conversations(expires_at)"
                 )
-                # Trigger for automatic cleanup
-                conn.execute(
-                    """
-                    CREATE TRIGGER IF NOT EXISTS cleanup_expired_conversations
-                    AFTER INSERT ON conversations
-                    BEGIN
-                        DELETE FROM conversations WHERE expires_at < datetime('now');
-                    END
-                """
-                )
-                conn.commit()
-                logger.info("Conversation database initialized successfully")
+                columns = {
+                    row[1] for row in conn.execute("PRAGMA table_info(conversations)")
+                }
+                if "encrypted_summary" not in columns:
+                    conn.execute(
+                        "ALTER TABLE conversations ADD COLUMN encrypted_summary BLOB"
+                    )
+                # Expired conversations are removed by the background purge;
+                # older databases still carry the per-insert cleanup trigger
+                conn.execute("DROP TRIGGER IF EXISTS cleanup_expired_conversations")
+            conn.close()
+            logger.info("Conversation database initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize conversation database: {e}")
             raise RuntimeError(f"Database initialization failed: {e}")
@@ -132,34 +340,35 @@ class ConversationSQLiteRepository:
             logger.warning(f"Conversation limit reached for child {child_id}")
             await self._cleanup_old_conversations(child_id, keep_latest=500)
 
+        # Encrypt with the current key even if another worker rotated it
+        self._refresh_keyring()
         # Prepare conversation for storage
         conversation_hash = self._generate_conversation_hash(conversation_data)
         encrypted_content = self.cipher.encrypt(json.dumps(conversation_data).encode())
+        # Encrypted separately so history reads can skip the full transcript
+        encrypted_summary = self.cipher.encrypt(
+            self._summarize(conversation_data).encode()
+        )
         expires_at = datetime.utcnow() + timedelta(days=self.max_conversation_age_days)
 
         try:
 
-            def _save_to_db():
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.execute(
-                        """
-                        INSERT OR REPLACE INTO conversations
-                        (child_id, conversation_hash, encrypted_content, safety_score, expires_at)
-                        VALUES (?, ?, ?, ?, ?)
-                    """,
-                        (
-                            child_id,
-                            conversation_hash,
-                            encrypted_content,
-                            conversation_data.get("safety_score", 1.0),
-                            expires_at.isoformat(),
-                        ),
-                    )
-                    return cursor.lastrowid
+            def _save_to_db(conn: sqlite3.Connection) -> int:
+                cursor = conn.execute(
+                    _INSERT_CONVERSATION,
+                    (
+                        child_id,
+                        conversation_hash,
+                        encrypted_content,
+                        encrypted_summary,
+                        conversation_data.get("safety_score", 1.0),
+                        expires_at.isoformat(),
+                    ),
+                )
+                return cursor.lastrowid
 
-            # Run database operation in thread pool to maintain async compatibility
-            loop = asyncio.get_event_loop()
-            conversation_id = await loop.run_in_executor(None, _save_to_db)
+            self.start_expiry_purge()
+            conversation_id = await self.pool.write(_save_to_db)
             logger.info(
                 f"Conversation saved successfully for child {child_id}: ID {conversation_id}"
             )
@@ -176,70 +385,205 @@ class ConversationSQLiteRepository:
             raise RuntimeError(f"Conversation save failed: {e}")
 
     async def get_conversations(
-        self, child_id: str, limit: int = 50, offset: int = 0
+        self,
+        child_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        fields: Sequence[str] | None = None,
+        summary_only: bool = False,
     ) -> list[dict[str, Any]]:
-        """Get conversations for a child with decryption and safety filtering."""
+        """Get conversations for a child with decryption and safety filtering.
+
+        Only the columns behind the requested fields are read and decrypted,
+        so summary reads never touch the full transcripts.
+
+        Args:
+            child_id: Child whose conversations to read
+            limit: Page size, at most 100
+            offset: Conversations to skip, newest first
+            fields: Fields of each returned conversation, from
+                CONVERSATION_FIELDS; defaults to every field but the summary
+            summary_only: Shorthand for ``fields=SUMMARY_FIELDS``
+        Returns:
+            Conversations, newest first
+        Raises:
+            ValueError: If the parameters or fields are invalid
+            RuntimeError: If the read fails
+        """
         if not child_id or limit <= 0 or limit > 100:
             raise ValueError("Invalid parameters")
+        fields = self._requested_fields(fields, summary_only)
+        statement = _select_conversations(fields)
+
+        def _get_from_db(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(
+                statement,
+                (child_id, datetime.utcnow().isoformat(), limit, offset),
+            )
+            return cursor.fetchall()
 
-        def _get_from_db():
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(
-                    """
-                    SELECT id, conversation_hash, encrypted_content, timestamp, safety_score, parent_approved
-                    FROM conversations
-                    WHERE child_id = ? AND expires_at > datetime('now')
-                    ORDER BY timestamp DESC
-                    LIMIT ? OFFSET ?
-                """,
-                    (child_id, limit, offset),
-                )
-                return cursor.fetchall()
+        try:
+            rows = await self.pool.read(_get_from_db)
+            return await self._decrypt_rows(rows, fields)
+        except Exception as e:
+            logger.error(f"Failed to retrieve conversations for child {child_id}: {e}")
+            raise RuntimeError(f"Conversation retrieval failed: {e}")
+
+    async def get_conversations_page(
+        self,
+        child_id: str,
+        cursor: str | None = None,
+        size: int | None = None,
+        fields: Sequence[str] | None = None,
+        summary_only: bool = False,
+    ) -> CursorPage[dict[str, Any]]:
+        """Get a page of a child's conversations, newest first, by cursor.
+
+        Unlike ``get_conversations`` with an offset, every page costs the
+        same however deep it is.
+
+        Args:
+            child_id: Child whose conversations to read
+            cursor: next_cursor or prev_cursor of a previous page; None for
+                the newest conversations
+            size: Page size, at most 100
+            fields: Fields of each returned conversation, as for get_conversations
+            summary_only: Shorthand for ``fields=SUMMARY_FIELDS``
+        Returns:
+            The page with its conversations and the cursors around it
+        Raises:
+            ValueError: If the parameters, fields or cursor are invalid
+            RuntimeError: If the read fails
+        """
+        if not child_id:
+            raise ValueError("Invalid parameters")
+        fields = self._requested_fields(fields, summary_only)
+        size = self.paginator.page_size(size)
+        scope = f"conversations:{child_id}"
+        position = self.paginator.position(cursor, scope)
+        condition, order_by, keyset_params = self.paginator.sql(position)
+        statement = _select_conversation_page(fields, condition, order_by)
+
+        def _get_from_db(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(
+                statement,
+                (child_id, datetime.utcnow().isoformat(), *keyset_params, size + 1),
+            )
+            return cursor.fetchall()
 
         try:
-            loop = asyncio.get_event_loop()
-            rows = await loop.run_in_executor(None, _get_from_db)
-            conversations = []
-            for row in rows:
-                try:
-                    # Decrypt conversation content
-                    decrypted_data = json.loads(
-                        self.cipher.decrypt(row["encrypted_content"]).decode()
-                    )
-                    conversations.append(
-                        {
-                            "id": row["id"],
-                            "hash": row["conversation_hash"],
-                            "content": decrypted_data,
-                            "timestamp": row["timestamp"],
-                            "safety_score": row["safety_score"],
-                            "parent_approved": bool(row["parent_approved"]),
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to decrypt conversation {row['id']}: {e}")
-                    continue
-            return conversations
+            rows = await self.pool.read(_get_from_db)
+            page = self.paginator.page(
+                rows,
+                position,
+                size,
+                key=lambda row: (row["timestamp"], row["id"]),
+                scope=scope,
+            )
+            page.items = await self._decrypt_rows(page.items, fields)
+            return page
         except Exception as e:
             logger.error(f"Failed to retrieve conversations for child {child_id}: {e}")
             raise RuntimeError(f"Conversation retrieval failed: {e}")
 
+    @staticmethod
+    def _requested_fields(
+        fields: Sequence[str] | None, summary_only: bool
+    ) -> tuple[str, ...]:
+        fields = tuple(SUMMARY_FIELDS if summary_only else fields or DEFAULT_FIELDS)
+        unknown = set(fields) - set(CONVERSATION_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown conversation fields: {sorted(unknown)}")
+        return fields
+
+    async def get_conversation_summaries(
+        self, child_id: str, limit: int = 20
+    ) -> list[str]:
+        """Summaries of the latest conversations of a child, newest first."""
+        conversations = await self.get_conversations(
+            child_id, limit=limit, summary_only=True
+        )
+        return [conversation["summary"] for conversation in conversations]
+
+    async def _decrypt_rows(
+        self, rows: list[sqlite3.Row], fields: tuple[str, ...]
+    ) -> list[dict[str, Any]]:
+        """Decrypt a page of rows, spreading large pages over worker threads."""
+        ciphertext_bytes = sum(
+            len(row[column] or b"")
+            for row in rows
+            for column in ("encrypted_content", "encrypted_summary", "legacy_content")
+            if column in row.keys()
+        )
+        if ciphertext_bytes < self.inline_decrypt_bytes:
+            return self._decode_rows(rows, fields)
+
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(rows) // self.decrypt_workers)
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._decrypt_executor,
+                    self._decode_rows,
+                    rows[start : start + chunk_size],
+                    fields,
+                )
+                for start in range(0, len(rows), chunk_size)
+            )
+        )
+        return [conversation for chunk in chunks for conversation in chunk]
+
+    def _decode_rows(
+        self, rows: list[sqlite3.Row], fields: tuple[str, ...]
+    ) -> list[dict[str, Any]]:
+        conversations = []
+        for row in rows:
+            try:
+                try:
+                    conversation = {
+                        field: self._decode_field(row, field) for field in fields
+                    }
+                except InvalidToken:
+                    # The row may have been re-encrypted under a key another
+                    # worker rotated to; retry once with the reloaded keyring
+                    if not self._refresh_keyring():
+                        raise
+                    conversation = {
+                        field: self._decode_field(row, field) for field in fields
+                    }
+                conversations.append(conversation)
+            except Exception as e:
+                logger.warning(f"Failed to decrypt conversation {row['id']}: {e}")
+        return conversations
+
+    def _decode_field(self, row: sqlite3.Row, field: str) -> Any:
+        if field == "hash":
+            return row["conversation_hash"]
+        if field == "content":
+            return json.loads(self.cipher.decrypt(row["encrypted_content"]).decode())
+        if field == "summary":
+            if row["encrypted_summary"] is not None:
+                return self.cipher.decrypt(row["encrypted_summary"]).decode()
+            content = json.loads(self.cipher.decrypt(row["legacy_content"]).decode())
+            return self._summarize(content)
+        if field == "parent_approved":
+            return bool(row["parent_approved"])
+        return row[field]
+
     async def delete_child_conversations(self, child_id: str) -> dict[str, Any]:
         """Delete all conversations for a child (COPPA right to deletion)."""
         if not child_id:
             raise ValueError("Valid child_id required")
 
-        def _delete_from_db():
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "DELETE FROM conversations WHERE child_id = ?", (child_id,)
-                )
-                return cursor.rowcount
+        def _delete_from_db(conn: sqlite3.Connection) -> int:
+            return conn.execute(_DELETE_CHILD_CONVERSATIONS, (child_id,)).rowcount
 
         try:
-            loop = asyncio.get_event_loop()
-            deleted_count = await loop.run_in_executor(None, _delete_from_db)
+            deleted_count = await self.pool.write(_delete_from_db)
             logger.info(f"Deleted {deleted_count} conversations for child {child_id}")
             return {
                 "success": True,
@@ -251,6 +595,44 @@ class ConversationSQLiteRepository:
             logger.error(f"Failed to delete conversations for child {child_id}: {e}")
             raise RuntimeError(f"Conversation deletion failed: {e}")
 
+    async def count_ciphertexts(self) -> int:
+        """Number of stored conversations, expired or not."""
+
+        def _count_from_db(conn: sqlite3.Connection) -> int:
+            return conn.execute(_COUNT_ALL_CONVERSATIONS).fetchone()[0]
+
+        return await self.pool.read(_count_from_db)
+
+    async def fetch_ciphertexts(
+        self, after: int | None, limit: int
+    ) -> list[tuple[int, tuple[bytes | None, ...]]]:
+        """Encrypted columns of the next ``limit`` conversations by id."""
+
+        def _fetch_from_db(conn: sqlite3.Connection) -> list[tuple]:
+            return conn.execute(_SELECT_CIPHERTEXTS, (after or 0, limit)).fetchall()
+
+        rows = await self.pool.read(_fetch_from_db)
+        return [(row[0], (row[1], row[2])) for row in rows]
+
+    async def replace_ciphertexts(
+        self,
+        rows: list[
+            tuple[int, tuple[bytes | None, ...], tuple[bytes | None, ...]]
+        ],
+    ) -> int:
+        """Store re-encrypted columns of conversations unchanged since read."""
+
+        def _replace_in_db(conn: sqlite3.Connection) -> int:
+            return conn.executemany(
+                _REPLACE_CIPHERTEXTS,
+                [
+                    (content, summary, conversation_id, old[0])
+                    for conversation_id, old, (content, summary) in rows
+                ],
+            ).rowcount
+
+        return await self.pool.write(_replace_in_db)
+
     async def _validate_conversation_safety(self, conversation_data: dict[str, Any]):
         """Validate conversation content for child safety."""
         message = conversation_data.get("message", "")
@@ -278,6 +660,11 @@ class ConversationSQLiteRepository:
         if len(message) > 1000 or len(response) > 2000:
             raise ValueError("Message or response too long")
 
+    def _summarize(self, conversation_data: dict[str, Any]) -> str:
+        """Short summary stored next to the full conversation."""
+        summary = conversation_data.get("summary") or conversation_data["message"]
+        return summary[:SUMMARY_MAX_CHARS]
+
     def _generate_conversation_hash(self, conversation_data: dict[str, Any]) -> str:
         """Generate unique hash for conversation to prevent duplicates."""
         content = f"{conversation_data['child_id']}{conversation_data['message']}{conversation_data['response']}"
@@ -286,39 +673,83 @@ class ConversationSQLiteRepository:
     async def _get_conversation_count(self, child_id: str) -> int:
         """Get current conversation count for a child."""
 
-        def _count_from_db():
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM conversations WHERE child_id = ? AND expires_at > datetime('now')",
-                    (child_id,),
-                )
-                return cursor.fetchone()[0]
+        def _count_from_db(conn: sqlite3.Connection) -> int:
+            cursor = conn.execute(
+                _COUNT_CONVERSATIONS,
+                (child_id, datetime.utcnow().isoformat()),
+            )
+            return cursor.fetchone()[0]
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _count_from_db)
+        return await self.pool.read(_count_from_db)
 
     async def _cleanup_old_conversations(self, child_id: str, keep_latest: int = 500):
         """Clean up old conversations to maintain performance."""
 
-        def _cleanup_from_db():
-            with sqlite3.connect(self.db_path) as conn:
-                # Keep only the latest N conversations for the child
-                conn.execute(
-                    """
-                    DELETE FROM conversations
-                    WHERE child_id = ? AND id NOT IN (
-                        SELECT id FROM conversations
-                        WHERE child_id = ?
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                    )
-                """,
-                    (child_id, child_id, keep_latest),
-                )
-                return conn.total_changes
+        def _cleanup_from_db(conn: sqlite3.Connection) -> int:
+            # Keep only the latest N conversations for the child
+            cursor = conn.execute(
+                _DELETE_OLD_CONVERSATIONS,
+                (child_id, child_id, keep_latest),
+            )
+            return cursor.rowcount
 
-        loop = asyncio.get_event_loop()
-        deleted_count = await loop.run_in_executor(None, _cleanup_from_db)
+        deleted_count = await self.pool.write(_cleanup_from_db)
         logger.info(
             f"Cleaned up {deleted_count} old conversations for child {child_id}"
         )
+
+    async def purge_expired(self, batch_size: int | None = None) -> int:
+        """Delete expired conversations in small batches (COPPA retention).
+
+        Each batch is its own short write transaction, so saves queued on the
+        writer thread run in between instead of waiting for the whole purge.
+
+        Args:
+            batch_size: Rows deleted per transaction; defaults to purge_batch_size
+        Returns:
+            Number of conversations deleted
+        """
+        batch_size = batch_size or self.purge_batch_size
+        now = datetime.utcnow().isoformat()
+
+        def _purge_batch(conn: sqlite3.Connection) -> int:
+            return conn.execute(_PURGE_EXPIRED_BATCH, (now, batch_size)).rowcount
+
+        deleted_count = 0
+        while True:
+            deleted = await self.pool.write(_purge_batch)
+            deleted_count += deleted
+            if deleted < batch_size:
+                break
+        if deleted_count:
+            logger.info(f"Purged {deleted_count} expired conversations")
+        return deleted_count
+
+    def start_expiry_purge(self) -> None:
+        """Purge expired conversations periodically on the running event loop.
+
+        Started by the first save; expired rows are already hidden from reads,
+        the purge only reclaims them.
+        """
+        if self._purge_task is None or self._purge_task.done():
+            self._purge_task = asyncio.create_task(self._run_expiry_purge())
+
+    async def close(self) -> None:
+        """Stop the expiry purge and close the database connections."""
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            try:
+                await self._purge_task
+            except asyncio.CancelledError:
+                pass
+            self._purge_task = None
+        await self.pool.close()
+        self._decrypt_executor.shutdown(wait=False)
+
+    async def _run_expiry_purge(self) -> None:
+        while True:
+            try:
+                await self.purge_expired()
+            except Exception as e:
+                logger.error(f"Failed to purge expired conversations: {e}")
+            await asyncio.sleep(self.purge_interval_seconds)
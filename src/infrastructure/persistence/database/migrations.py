@@ -133,3 +133,68 @@ class DatabaseMigrationManager:
         except Exception as e:
             logger.error(f"Failed to setup child data security: {e}")
             return False
+
+    @staticmethod
+    async def create_event_store_tables(conn) -> None:
+        """Create the domain_events and aggregate_snapshots tables.
+
+        Their models live on the event store's own declarative base, which
+        the application models' ``create_all`` does not cover.
+        """
+        # Imported here: both modules import the database manager
+        from src.infrastructure.persistence.postgres_event_store import EventModel
+        from src.infrastructure.persistence.snapshot_store import SnapshotModel
+
+        await conn.run_sync(
+            EventModel.metadata.create_all,
+            tables=[EventModel.__table__, SnapshotModel.__table__],
+        )
+
+    @staticmethod
+    async def make_event_sequence_index_unique(conn) -> bool:
+        """Rebuild idx_aggregate_sequence on domain_events as a UNIQUE index.
+
+        The event store relies on the index rejecting concurrent appends, but
+        databases created before it was unique keep the old index, since
+        ``create_all`` never alters existing indexes. The swap happens inside
+        the caller's transaction, so the table always has one of the two.
+
+        Returns:
+            False if duplicate sequence numbers prevent the rebuild
+        """
+        result = await conn.execute(
+            text(
+                """
+                SELECT ix.indisunique
+                FROM pg_index ix
+                JOIN pg_class i ON i.oid = ix.indexrelid
+                WHERE i.relname = 'idx_aggregate_sequence'
+                """
+            )
+        )
+        row = result.first()
+        if row is None or row[0]:
+            return True
+        try:
+            async with conn.begin_nested():
+                await conn.execute(
+                    text(
+                        "CREATE UNIQUE INDEX idx_aggregate_sequence_unique "
+                        "ON domain_events (aggregate_id, sequence_number)"
+                    )
+                )
+                await conn.execute(text("DROP INDEX idx_aggregate_sequence"))
+                await conn.execute(
+                    text(
+                        "ALTER INDEX idx_aggregate_sequence_unique "
+                        "RENAME TO idx_aggregate_sequence"
+                    )
+                )
+        except Exception as e:
+            logger.error(
+                f"Could not make idx_aggregate_sequence unique; remove duplicate "
+                f"(aggregate_id, sequence_number) rows from domain_events: {e}"
+            )
+            return False
+        logger.info("Rebuilt idx_aggregate_sequence as a unique index")
+        return True
@@ -1,4 +1,5 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from sqlalchemy.exc import DatabaseError, DataError, IntegrityError
 from sqlalchemy.ext.asyncio import (
@@ -10,6 +11,9 @@ from sqlalchemy.orm import declarative_base
 from src.domain.models.models_infra import Base
 from src.infrastructure.logging_config import get_logger
 from src.infrastructure.persistence.database.config import DatabaseConfig
+from src.infrastructure.persistence.database.migrations import (
+    DatabaseMigrationManager,
+)
 from src.infrastructure.validators.data.database_validators import (
     DatabaseConnectionValidator,
 )
@@ -132,6 +136,9 @@ class Database:
                 # Create all tables
                 await conn.run_sync(Base.metadata.create_all)
                 logger.info("Database tables created successfully")
+                if self.config.engine_type == "postgresql":
+                    await DatabaseMigrationManager.create_event_store_tables(conn)
+                    await DatabaseMigrationManager.make_event_sequence_index_unique(conn)
                 # Apply production optimizations if in production
                 if (
                     self.config.environment == "production"
@@ -174,8 +181,13 @@ class Database:
         except Exception as e:
             logger.warning(f"Failed to apply production optimizations: {e}")
 
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Get async database session with proper transaction handling."""
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        """Get async database session with proper transaction handling.
+
+        Use as ``async with database.get_session() as session:``; the session
+        is committed on exit and rolled back if the block raises.
+        """
         async with self.async_session() as session:
             try:
                 yield session
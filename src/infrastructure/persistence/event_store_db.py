@@ -1,7 +1,10 @@
 """Event Store Database Implementation using real PostgreSQL database."""
 
+import json
 import uuid
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import text
@@ -14,6 +17,20 @@ from src.infrastructure.persistence.database_manager import Database
 
 logger = get_logger(__name__, component="persistence")
 
+# Unique index on (aggregate_id, sequence_number), see EventModel
+SEQUENCE_CONSTRAINT = "idx_aggregate_sequence"
+EVENT_COLUMNS = (
+    "event_id",
+    "aggregate_id",
+    "aggregate_type",
+    "event_type",
+    "event_version",
+    "sequence_number",
+    "event_data",
+    "event_metadata",
+    "created_at",
+)
+
 
 class ConcurrencyError(Exception):
     """Raised when optimistic concurrency control fails."""
@@ -70,13 +87,21 @@ class EventStoreDB(EventStore):
         aggregate_id: UUID,
         events: List[Any],
         expected_version: Optional[int] = None,
+        max_retries: int = 3,
     ) -> None:
         """Save events to PostgreSQL database with transaction safety.
 
+        All events are written by one INSERT that numbers them after the
+        aggregate's current last sequence number, so a save is a single
+        round-trip. The unique (aggregate_id, sequence_number) index rejects
+        concurrent writers instead of a read-then-write check.
+
         Args:
             aggregate_id: The ID of the aggregate
             events: List of domain events to save
             expected_version: Expected version for optimistic concurrency control
+            max_retries: Attempts when another writer wins the race and no
+                expected version was given
 
         Raises:
             ConcurrencyError: If expected version doesn't match current version
@@ -85,71 +110,214 @@ class EventStoreDB(EventStore):
         if not events:
             return
 
-        try:
-            async with self.db.get_session() as session:
-                # Get current version from database
-                current_version = await self._get_current_version(session, aggregate_id)
-
-                # Optimistic concurrency control
-                if expected_version is not None and current_version != expected_version:
-                    raise ConcurrencyError(
-                        f"Concurrency conflict for aggregate {aggregate_id}. "
-                        f"Expected version {expected_version}, but current version is {current_version}"
+        params: Dict[str, Any] = {
+            "aggregate_id": str(aggregate_id),
+            "expected_version": expected_version,
+        }
+        for i, event in enumerate(events):
+            row = self._event_row(aggregate_id, event)
+            for column in ("event_id", "aggregate_type", "event_type", "event_data", "event_metadata"):
+                params[f"{column}_{i}"] = row[column]
+
+        attempts = 1 if expected_version is not None else max(1, max_retries)
+        for attempt in range(1, attempts + 1):
+            try:
+                async with self.db.get_session() as session:
+                    result = await session.execute(
+                        _append_statement(len(events)),
+                        params,
                     )
-
-                # Save events to database with proper sequencing
-                for i, event in enumerate(events):
-                    # Handle both dict and domain event objects
-                    if isinstance(event, dict):
-                        event_data = event
-                        event_type = event.get('event_type', 'DomainEvent')
-                        aggregate_type = event.get('aggregate_type', 'ChildProfile')
-                    else:
-                        event_data = event.to_dict() if hasattr(event, 'to_dict') else event.__dict__
-                        event_type = event.__class__.__name__
-                        aggregate_type = event.__class__.__module__.split('.')[-2] if '.' in event.__class__.__module__ else 'ChildProfile'
-
-                    event_record = {
-                        "event_id": str(uuid.uuid4()),
-                        "aggregate_id": str(aggregate_id),
-                        "aggregate_type": aggregate_type,
-                        "event_type": event_type,
-                        "event_version": current_version + i + 1,
-                        "sequence_number": current_version + i + 1,
-                        "event_data": event_data,
-                        "event_metadata": {
-                            "timestamp": getattr(event, 'timestamp', None),
-                            "correlation_id": getattr(event, 'correlation_id', None),
-                            "causation_id": getattr(event, 'causation_id', None)
-                        }
-                    }
-
-                    # Insert into database using parameterized query
-                    await session.execute(
-                        text("""
-                        INSERT INTO domain_events (
-                            event_id, aggregate_id, aggregate_type, event_type,
-                            event_version, sequence_number, event_data, event_metadata, created_at
-                        ) VALUES (
-                            :event_id::uuid, :aggregate_id::uuid, :aggregate_type, :event_type,
-                            :event_version, :sequence_number, :event_data::jsonb, :event_metadata::jsonb, NOW()
+                    if result.rowcount == 0:
+                        # The expected version did not match the last event
+                        current_version = await self._get_current_version(session, aggregate_id)
+                        raise ConcurrencyError(
+                            f"Concurrency conflict for aggregate {aggregate_id}. "
+                            f"Expected version {expected_version}, but current version is {current_version}"
                         )
-                        """),
-                        event_record
-                    )
+                    await session.commit()
+                    self.logger.info(f"Saved {len(events)} events for aggregate {aggregate_id}")
+                    return
+
+            except Exception as e:
+                conflict = _find_error(e, ConcurrencyError)
+                if conflict is not None:
+                    raise conflict from None
+                integrity_error = _find_error(e, IntegrityError)
+                if integrity_error is None:
+                    self.logger.error(f"Database error saving events for aggregate {aggregate_id}: {str(e)}")
+                    if _find_error(e, SQLAlchemyError) is not None:
+                        raise DatabaseError(f"Event store database error: {str(e)}") from e
+                    raise DatabaseError(f"Event store save failed: {str(e)}") from e
+                if not _is_sequence_conflict(integrity_error):
+                    self.logger.error(f"Database integrity error saving events for aggregate {aggregate_id}: {str(e)}")
+                    raise DatabaseError(f"Event store integrity violation: {str(e)}") from e
+                if expected_version is not None or attempt == attempts:
+                    raise ConcurrencyError(
+                        f"Concurrency conflict for aggregate {aggregate_id}: "
+                        f"another writer appended events first"
+                    ) from e
+                self.logger.warning(
+                    f"Sequence conflict for aggregate {aggregate_id}, retrying ({attempt}/{attempts})"
+                )
+
+    async def append_many(
+        self,
+        events_by_aggregate: Mapping[UUID, List[Any]],
+        expected_versions: Optional[Mapping[UUID, int]] = None,
+        chunk_size: int = 1000,
+        copy_threshold: int = 5000,
+    ) -> int:
+        """Append the events of many aggregates in one transaction.
+
+        Meant for imports and migrations. Current versions of all aggregates
+        are read with one query; rows are then written with multi-row
+        INSERTs of ``chunk_size`` rows, or with COPY when there are at least
+        ``copy_threshold`` rows and the driver supports it.
+
+        Args:
+            events_by_aggregate: Events to append, per aggregate
+            expected_versions: Optional expected version per aggregate
+            chunk_size: Rows per INSERT statement
+            copy_threshold: Row count from which COPY is used
+
+        Returns:
+            Number of events written
+
+        Raises:
+            ConcurrencyError: If an expected version does not match, or
+                another writer appended to one of the aggregates meanwhile
+            DatabaseError: If database operation fails
+        """
+        events_by_aggregate = {
+            aggregate_id: events
+            for aggregate_id, events in events_by_aggregate.items()
+            if events
+        }
+        if not events_by_aggregate:
+            return 0
+        expected_versions = expected_versions or {}
 
+        try:
+            async with self.db.get_session() as session:
+                result = await session.execute(
+                    text("""
+                    SELECT aggregate_id, MAX(sequence_number)
+                    FROM domain_events
+                    WHERE aggregate_id = ANY(CAST(:aggregate_ids AS uuid[]))
+                    GROUP BY aggregate_id
+                    """),
+                    {"aggregate_ids": [str(aggregate_id) for aggregate_id in events_by_aggregate]},
+                )
+                current_versions = {str(row[0]): row[1] for row in result.fetchall()}
+
+                rows = []
+                for aggregate_id, events in events_by_aggregate.items():
+                    current_version = current_versions.get(str(aggregate_id), 0)
+                    expected_version = expected_versions.get(aggregate_id)
+                    if expected_version is not None and expected_version != current_version:
+                        raise ConcurrencyError(
+                            f"Concurrency conflict for aggregate {aggregate_id}. "
+                            f"Expected version {expected_version}, but current version is {current_version}"
+                        )
+                    for i, event in enumerate(events, start=current_version + 1):
+                        row = self._event_row(aggregate_id, event)
+                        row["event_version"] = row["sequence_number"] = i
+                        rows.append(row)
+
+                if len(rows) >= copy_threshold and await self._copy_rows(session, rows):
+                    method = "COPY"
+                else:
+                    method = "INSERT"
+                    for start in range(0, len(rows), chunk_size):
+                        chunk = rows[start:start + chunk_size]
+                        await session.execute(
+                            _insert_statement(len(chunk)),
+                            {
+                                f"{column}_{i}": value
+                                for i, row in enumerate(chunk)
+                                for column, value in row.items()
+                            },
+                        )
                 await session.commit()
-                self.logger.info(f"Saved {len(events)} events for aggregate {aggregate_id}")
+                self.logger.info(
+                    f"Appended {len(rows)} events for {len(events_by_aggregate)} aggregates via {method}"
+                )
+                return len(rows)
 
-        except IntegrityError as e:
-            self.logger.error(f"Database integrity error saving events for aggregate {aggregate_id}: {str(e)}")
-            raise DatabaseError(f"Event store integrity violation: {str(e)}") from e
-        except SQLAlchemyError as e:
-            self.logger.error(f"Database error saving events for aggregate {aggregate_id}: {str(e)}")
-            raise DatabaseError(f"Event store database error: {str(e)}") from e
         except Exception as e:
-            self.logger.error(f"Unexpected error saving events for aggregate {aggregate_id}: {str(e)}")
-            raise DatabaseError(f"Event store save failed: {str(e)}") from e
+            conflict = _find_error(e, ConcurrencyError)
+            if conflict is not None:
+                raise conflict from None
+            integrity_error = _find_error(e, IntegrityError)
+            if integrity_error is not None:
+                if _is_sequence_conflict(integrity_error):
+                    raise ConcurrencyError(
+                        "Concurrency conflict: another writer appended events during the import"
+                    ) from e
+                self.logger.error(f"Database integrity error appending events: {str(e)}")
+                raise DatabaseError(f"Event store integrity violation: {str(e)}") from e
+            self.logger.error(f"Database error appending events: {str(e)}")
+            if _find_error(e, SQLAlchemyError) is not None:
+                raise DatabaseError(f"Event store database error: {str(e)}") from e
+            raise DatabaseError(f"Event store append failed: {str(e)}") from e
+
+    async def _copy_rows(self, session, rows: List[Dict[str, Any]]) -> bool:
+        """Write rows with COPY on asyncpg; False if the driver has no COPY."""
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver = raw_connection.driver_connection
+        if not hasattr(driver, "copy_records_to_table"):
+            return False
+        now = datetime.utcnow()
+        await driver.copy_records_to_table(
+            "domain_events",
+            columns=EVENT_COLUMNS,
+            records=[
+                (
+                    UUID(row["event_id"]),
+                    UUID(row["aggregate_id"]),
+                    row["aggregate_type"],
+                    row["event_type"],
+                    row["event_version"],
+                    row["sequence_number"],
+                    row["event_data"],
+                    row["event_metadata"],
+                    now,
+                )
+                for row in rows
+            ],
+        )
+        return True
+
+    def _event_row(self, aggregate_id: UUID, event: Any) -> Dict[str, Any]:
+        """Column values of one event; sequence numbers are filled in by the caller."""
+        # Handle both dict and domain event objects
+        if isinstance(event, dict):
+            event_data = event
+            event_type = event.get('event_type', 'DomainEvent')
+            aggregate_type = event.get('aggregate_type', 'ChildProfile')
+        else:
+            event_data = event.to_dict() if hasattr(event, 'to_dict') else event.__dict__
+            event_type = event.__class__.__name__
+            aggregate_type = event.__class__.__module__.split('.')[-2] if '.' in event.__class__.__module__ else 'ChildProfile'
+
+        return {
+            "event_id": str(uuid.uuid4()),
+            "aggregate_id": str(aggregate_id),
+            "aggregate_type": aggregate_type,
+            "event_type": event_type,
+            "event_version": None,
+            "sequence_number": None,
+            "event_data": json.dumps(event_data, default=str),
+            "event_metadata": json.dumps(
+                {
+                    "timestamp": getattr(event, 'timestamp', None),
+                    "correlation_id": getattr(event, 'correlation_id', None),
+                    "causation_id": getattr(event, 'causation_id', None)
+                },
+                default=str,
+            ),
+        }
 
     async def load_events(self, aggregate_id: UUID) -> List[Dict[str, Any]]:
         """Load events for an aggregate from PostgreSQL database.
@@ -242,6 +410,49 @@ class EventStoreDB(EventStore):
             self.logger.error(f"Database error getting events for aggregate {aggregate_id}: {str(e)}")
             raise DatabaseError(f"Event store get failed: {str(e)}") from e
 
+    async def get_aggregate_versions(
+        self,
+        since: Optional[datetime] = None,
+        event_types: Optional[Sequence[str]] = None,
+    ) -> Dict[UUID, int]:
+        """Latest version of every aggregate with events recorded since ``since``.
+
+        Args:
+            since: Only aggregates with events created at or after this time
+            event_types: Only aggregates with events of these types
+
+        Returns:
+            Mapping of aggregate id to its highest sequence number
+        """
+        query = """
+        SELECT aggregate_id, MAX(sequence_number)
+        FROM domain_events
+        WHERE aggregate_id IN (
+            SELECT aggregate_id FROM domain_events WHERE TRUE
+        """
+        params: Dict[str, Any] = {}
+        if since is not None:
+            query += " AND created_at >= :since"
+            # created_at is a naive UTC timestamp
+            if since.tzinfo is not None:
+                since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            params["since"] = since
+        if event_types is not None:
+            query += " AND event_type = ANY(:event_types)"
+            params["event_types"] = list(event_types)
+        query += ") GROUP BY aggregate_id"
+
+        try:
+            async with self.db.get_session() as session:
+                result = await session.execute(text(query), params)
+                return {
+                    row[0] if isinstance(row[0], UUID) else UUID(str(row[0])): row[1]
+                    for row in result.fetchall()
+                }
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error getting aggregate versions: {str(e)}")
+            raise DatabaseError(f"Event store version query failed: {str(e)}") from e
+
     async def append_events(
         self,
         aggregate_id: UUID,
@@ -305,3 +516,77 @@ class EventStoreDB(EventStore):
         except Exception as e:
             self.logger.error(f"Unexpected error loading all events: {str(e)}")
             raise DatabaseError(f"Event store load all failed: {str(e)}") from e
+
+
+def _find_error(error: BaseException, error_type: type[BaseException]) -> Optional[BaseException]:
+    """``error`` or the first exception of ``error_type`` it was raised from.
+
+    ``Database.get_session`` re-raises errors from inside a session wrapped
+    in its own exceptions, so the original is found through the chain.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, error_type):
+            return error
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def _is_sequence_conflict(error: IntegrityError) -> bool:
+    """Whether an integrity error is a duplicate (aggregate_id, sequence_number)."""
+    return SEQUENCE_CONSTRAINT in str(error.orig)
+
+
+@lru_cache(maxsize=64)
+def _append_statement(count: int):
+    """INSERT numbering ``count`` events after the aggregate's last event.
+
+    Inserts nothing when ``expected_version`` is given and is not the
+    current version, so a save never leaves a gap in the sequence.
+    """
+    values = ",\n    ".join(
+        f"({i}, :event_id_{i}, :aggregate_type_{i}, :event_type_{i}, "
+        f":event_data_{i}, :event_metadata_{i})"
+        for i in range(count)
+    )
+    return text(f"""
+    INSERT INTO domain_events (
+        event_id, aggregate_id, aggregate_type, event_type,
+        event_version, sequence_number, event_data, event_metadata, created_at
+    )
+    SELECT
+        CAST(batch.event_id AS uuid), CAST(:aggregate_id AS uuid),
+        batch.aggregate_type, batch.event_type,
+        head.version + batch.position + 1, head.version + batch.position + 1,
+        CAST(batch.event_data AS jsonb), CAST(batch.event_metadata AS jsonb), NOW()
+    FROM (VALUES
+    {values}
+    ) AS batch(position, event_id, aggregate_type, event_type, event_data, event_metadata)
+    CROSS JOIN (
+        SELECT COALESCE(MAX(sequence_number), 0) AS version
+        FROM domain_events
+        WHERE aggregate_id = CAST(:aggregate_id AS uuid)
+    ) AS head
+    WHERE CAST(:expected_version AS integer) IS NULL
+        OR head.version = CAST(:expected_version AS integer)
+    ORDER BY batch.position
+    """)
+
+
+@lru_cache(maxsize=64)
+def _insert_statement(count: int):
+    """Multi-row INSERT of ``count`` fully numbered events."""
+    values = ",\n    ".join(
+        f"(CAST(:event_id_{i} AS uuid), CAST(:aggregate_id_{i} AS uuid), "
+        f":aggregate_type_{i}, :event_type_{i}, :event_version_{i}, :sequence_number_{i}, "
+        f"CAST(:event_data_{i} AS jsonb), CAST(:event_metadata_{i} AS jsonb), NOW())"
+        for i in range(count)
+    )
+    return text(f"""
+    INSERT INTO domain_events (
+        event_id, aggregate_id, aggregate_type, event_type,
+        event_version, sequence_number, event_data, event_metadata, created_at
+    ) VALUES
+    {values}
+    """)
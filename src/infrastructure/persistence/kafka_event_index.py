@@ -0,0 +1,146 @@
+"""Local index of where each aggregate's events live in the Kafka event topics."""
+
+import asyncio
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiokafka.structs import TopicPartition
+
+# Offsets of one aggregate in one partition, as sorted inclusive [start, end] runs
+OffsetRanges = list[list[int]]
+
+
+class AggregateOffsetIndex:
+    """Maps aggregate ids to the partitions and offset ranges holding their events.
+
+    Fed by the event store's background consumer. Also tracks how far each
+    partition has been indexed, so readers can wait until the index covers
+    everything written before they started.
+    """
+
+    def __init__(self) -> None:
+        self._ranges: dict[str, dict[TopicPartition, OffsetRanges]] = {}
+        self._positions: dict[TopicPartition, int] = {}
+        self._advanced = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def aggregate_ids(self) -> list[str]:
+        """Ids of every aggregate with indexed events."""
+        return list(self._ranges)
+
+    def add(self, aggregate_id: str, partition: TopicPartition, offset: int) -> None:
+        """Record that ``offset`` in ``partition`` holds an event of the aggregate."""
+        ranges = self._ranges.setdefault(aggregate_id, {}).setdefault(partition, [])
+        if ranges and ranges[-1][1] + 1 == offset:
+            ranges[-1][1] = offset  # Common case: the next offset of the last run
+            return
+        # Duplicates and out-of-order offsets (e.g. a partition re-read after a
+        # restart) are merged into the existing runs
+        index = bisect_right(ranges, offset, key=lambda run: run[0])
+        previous = ranges[index - 1] if index else None
+        if previous and previous[1] >= offset:
+            return  # Already indexed
+        joins_previous = previous is not None and previous[1] + 1 == offset
+        joins_next = index < len(ranges) and ranges[index][0] == offset + 1
+        if joins_previous and joins_next:
+            previous[1] = ranges.pop(index)[1]
+        elif joins_previous:
+            previous[1] = offset
+        elif joins_next:
+            ranges[index][0] = offset
+        else:
+            ranges.insert(index, [offset, offset])
+
+    def ranges(
+        self,
+        aggregate_id: str,
+        after: dict[TopicPartition, int] | None = None,
+    ) -> dict[TopicPartition, OffsetRanges]:
+        """Offset ranges of an aggregate, optionally only past ``after`` per partition."""
+        after = after or {}
+        result = {}
+        for partition, ranges in self._ranges.get(aggregate_id, {}).items():
+            floor = after.get(partition, -1)
+            remaining = [
+                [max(start, floor + 1), end] for start, end in ranges if end > floor
+            ]
+            if remaining:
+                result[partition] = remaining
+        return result
+
+    def position(self, partition: TopicPartition) -> int:
+        """Next offset of ``partition`` the index has not seen yet."""
+        return self._positions.get(partition, 0)
+
+    async def advance(self, positions: dict[TopicPartition, int]) -> None:
+        """Mark partitions as indexed up to (excluding) the given offsets."""
+        async with self._advanced:
+            for partition, offset in positions.items():
+                if offset > self.position(partition):
+                    self._positions[partition] = offset
+            self._advanced.notify_all()
+
+    async def wait_until(
+        self,
+        end_offsets: dict[TopicPartition, int],
+        timeout: float,
+    ) -> bool:
+        """Wait until every partition is indexed up to its end offset.
+
+        Returns False if the index did not catch up within ``timeout``.
+        """
+        def caught_up() -> bool:
+            return all(
+                self.position(partition) >= offset
+                for partition, offset in end_offsets.items()
+            )
+
+        if caught_up():
+            return True
+        try:
+            async with self._advanced:
+                await asyncio.wait_for(self._advanced.wait_for(caught_up), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+@dataclass
+class CachedStream:
+    """Events of one aggregate read so far, and the last offset read per partition."""
+
+    events: list[dict[str, Any]] = field(default_factory=list)
+    offsets: dict[TopicPartition, int] = field(default_factory=dict)
+
+
+class AggregateEventCache:
+    """LRU cache of per-aggregate event streams.
+
+    Event topics are append-only, so a cached stream is never stale, only
+    incomplete; loads extend it with the offsets indexed after it.
+    """
+
+    def __init__(self, max_aggregates: int = 1024) -> None:
+        self.max_aggregates = max_aggregates
+        self._streams: OrderedDict[str, CachedStream] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def get(self, aggregate_id: str) -> CachedStream:
+        """Cached stream of an aggregate; an empty one if it is not cached."""
+        stream = self._streams.get(aggregate_id)
+        if stream is None:
+            return CachedStream()
+        self._streams.move_to_end(aggregate_id)
+        return stream
+
+    def put(self, aggregate_id: str, stream: CachedStream) -> None:
+        self._streams[aggregate_id] = stream
+        self._streams.move_to_end(aggregate_id)
+        while len(self._streams) > self.max_aggregates:
+            self._streams.popitem(last=False)
@@ -1,14 +1,24 @@
-from datetime import datetime
+import asyncio
+import zlib
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
 import msgpack
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
 from aiokafka.errors import KafkaError
+from aiokafka.structs import TopicPartition
 
 from src.domain.repositories.event_store import EventStore
 from src.infrastructure.config.settings import Settings
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.persistence.kafka_event_index import (
+    AggregateEventCache,
+    AggregateOffsetIndex,
+    CachedStream,
+    OffsetRanges,
+)
 
 """Kafka Event Store Implementation for Event Sourcing."""
 
@@ -16,23 +26,51 @@ logger = get_logger(__name__, component="persistence")
 
 
 class KafkaEventStore(EventStore):
-    """Kafka implementation of EventStore for high-throughput event streaming."""
+    """Kafka implementation of EventStore for high-throughput event streaming.
 
-    def __init__(self, settings: Settings) -> None:
+    A background consumer keeps a local index of the partitions and offset
+    ranges holding each aggregate's events, so loading one aggregate seeks
+    straight to its own records instead of reading the whole topic. Streams
+    read so far are kept in a bounded per-aggregate cache and only extended
+    with newer offsets on later loads.
+    """
+
+    TOPIC_COUNT = 10
+
+    def __init__(
+        self,
+        settings: Settings,
+        index_wait_timeout: float = 5.0,
+        max_cached_aggregates: int = 1024,
+        max_offset_gap: int = 100,
+    ) -> None:
         """Initialize Kafka event store.
 
         Args:
             settings: Application settings with Kafka configuration
+            index_wait_timeout: Seconds a load waits for the index to catch up
+                before falling back to scanning the topic
+            max_cached_aggregates: Aggregates kept in the event stream cache
+            max_offset_gap: Offset ranges closer than this are read with one
+                seek, reading past the other aggregates' records in between
 
         """
         self.bootstrap_servers = settings.kafka.KAFKA_BOOTSTRAP_SERVERS
         self.topic_prefix = "ai-teddy-events"
+        self.index_wait_timeout = index_wait_timeout
+        self.max_offset_gap = max_offset_gap
         self.producer: AIOKafkaProducer | None = None
         self.consumer: AIOKafkaConsumer | None = None
+        self.index = AggregateOffsetIndex()
+        self.cache = AggregateEventCache(max_cached_aggregates)
+        self._index_consumer: AIOKafkaConsumer | None = None
+        self._index_task: asyncio.Task | None = None
+        # The reader consumer is re-assigned and seeked per load
+        self._read_lock = asyncio.Lock()
         self._initialized = False
 
     async def initialize(self) -> None:
-        """Initialize Kafka producer and consumer."""
+        """Initialize Kafka producer, consumers and the background indexer."""
         if self._initialized:
             return
 
@@ -50,7 +88,8 @@ class KafkaEventStore(EventStore):
             )
             await self.producer.start()
 
-            # Initialize consumer for reading events
+            # Initialize consumer for reading events; partitions are assigned
+            # manually for each load
             self.consumer = AIOKafkaConsumer(
                 bootstrap_servers=self.bootstrap_servers,
                 value_deserializer=lambda v: msgpack.unpackb(v, raw=False),
@@ -63,6 +102,23 @@ class KafkaEventStore(EventStore):
             )
             await self.consumer.start()
 
+            # The indexer only needs keys and offsets, values stay undecoded
+            self._index_consumer = AIOKafkaConsumer(
+                bootstrap_servers=self.bootstrap_servers,
+                key_deserializer=lambda k: k.decode("utf-8") if k else None,
+                auto_offset_reset="earliest",
+                enable_auto_commit=False,
+                group_id=None,
+                max_poll_records=5000,
+            )
+            await self._index_consumer.start()
+            self._index_consumer.subscribe(
+                topics=[
+                    f"{self.topic_prefix}-{i}" for i in range(self.TOPIC_COUNT)
+                ],
+            )
+            self._index_task = asyncio.create_task(self._run_indexer())
+
             self._initialized = True
             logger.info("Kafka event store initialized successfully")
         except Exception as e:
@@ -71,6 +127,15 @@ class KafkaEventStore(EventStore):
 
     async def close(self) -> None:
         """Close Kafka connections."""
+        if self._index_task:
+            self._index_task.cancel()
+            try:
+                await self._index_task
+            except asyncio.CancelledError:
+                pass
+            self._index_task = None
+        if self._index_consumer:
+            await self._index_consumer.stop()
         if self.producer:
             await self.producer.stop()
         if self.consumer:
@@ -151,39 +216,9 @@ class KafkaEventStore(EventStore):
         if not self._initialized:
             await self.initialize()
 
-        topic = self._get_topic_name(aggregate_id)
         try:
-            # Subscribe to the specific topic
-            self.consumer.subscribe([topic])
-            events = []
-
-            # Seek to beginning
-            await self.consumer.seek_to_beginning()
-
-            # Read all messages for this aggregate
-            async for msg in self.consumer:
-                if msg.key == str(aggregate_id):
-                    event_data = msg.value
-                    # Deserialize event
-                    event = self._deserialize_event(
-                        event_data["event_type"],
-                        event_data["data"],
-                        event_data.get("metadata"),
-                    )
-                    if event:
-                        events.append(event)
-
-                # Check if we've reached the end
-                partitions = self.consumer.assignment()
-                for partition in partitions:
-                    position = await self.consumer.position(partition)
-                    end_offset = self.consumer.highwater(partition)
-                    if position >= end_offset - 1:
-                        break
-
-            # Unsubscribe after reading
-            self.consumer.unsubscribe()
-
+            records = await self._load_stream(aggregate_id)
+            events = self._deserialize_events(records)
             logger.debug(
                 f"Loaded {len(events)} events for aggregate {aggregate_id} from Kafka",
             )
@@ -192,6 +227,77 @@ class KafkaEventStore(EventStore):
             logger.error(f"Failed to load events for aggregate {aggregate_id}: {e}")
             raise
 
+    async def append_events(
+        self,
+        aggregate_id: UUID,
+        aggregate_type: str,
+        event_type: str,
+        events: list[dict[str, Any]],
+    ) -> None:
+        """Append already serialized events to the aggregate's topic."""
+        if not self._initialized:
+            await self.initialize()
+
+        topic = self._get_topic_name(aggregate_id)
+        futures = [
+            await self.producer.send(
+                topic=topic,
+                key=str(aggregate_id),
+                value={
+                    "aggregate_id": str(aggregate_id),
+                    "aggregate_type": aggregate_type,
+                    "event_id": str(uuid4()),
+                    "event_type": event_type,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "data": event_data,
+                    "metadata": {},
+                },
+            )
+            for event_data in events
+        ]
+        for future in futures:
+            await future
+
+    async def get_events(
+        self,
+        aggregate_id: UUID,
+        after_version: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Retrieve the stored events of an aggregate, numbered from 1."""
+        if not self._initialized:
+            await self.initialize()
+
+        records = await self._load_stream(aggregate_id)
+        return [
+            {**event_data, "version": version}
+            for version, event_data in enumerate(records, start=1)
+            if after_version is None or version > after_version
+        ]
+
+    async def get_aggregate_versions(
+        self,
+        since: datetime | None = None,
+        event_types: Sequence[str] | None = None,
+    ) -> dict[UUID, int]:
+        """Latest version of every indexed aggregate with matching events.
+
+        Kafka keeps no per-type index, so this reads the streams of all
+        indexed aggregates; projections only call it from catch-up.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        versions = {}
+        for key in self.index.aggregate_ids():
+            records = await self._load_stream(UUID(key))
+            if any(
+                (since is None or self._recorded_at(record) >= since)
+                and (event_types is None or record.get("event_type") in event_types)
+                for record in records
+            ):
+                versions[UUID(key)] = len(records)
+        return versions
+
     async def load_events_from_offset(
         self,
         aggregate_id: UUID,
@@ -209,42 +315,162 @@ class KafkaEventStore(EventStore):
         if not self._initialized:
             await self.initialize()
 
-        topic = self._get_topic_name(aggregate_id)
+        key = str(aggregate_id)
         try:
-            self.consumer.subscribe([topic])
-
-            # Seek to specific offset
-            partitions = self.consumer.assignment()
-            for partition in partitions:
-                self.consumer.seek(partition, offset)
-
-            events = []
-            async for msg in self.consumer:
-                if msg.key == str(aggregate_id):
-                    event_data = msg.value
-                    event = self._deserialize_event(
-                        event_data["event_type"],
-                        event_data["data"],
-                        event_data.get("metadata"),
-                    )
-                    if event:
-                        events.append(event)
-
-                # Check if we've reached the end
-                for partition in partitions:
-                    position = await self.consumer.position(partition)
-                    end_offset = self.consumer.highwater(partition)
-                    if position >= end_offset - 1:
-                        break
-
-            self.consumer.unsubscribe()
-            return events
+            end_offsets = await self._end_offsets(aggregate_id)
+            if not await self.index.wait_until(end_offsets, self.index_wait_timeout):
+                records = await self._scan(key, end_offsets, offset)
+            else:
+                records = await self._read(
+                    key,
+                    self.index.ranges(
+                        key,
+                        after={partition: offset - 1 for partition in end_offsets},
+                    ),
+                )
+            return self._deserialize_events(record.value for record in records)
         except Exception as e:
             logger.error(
                 f"Failed to load events from offset for aggregate {aggregate_id}: {e}",
             )
             raise
 
+    async def _load_stream(self, aggregate_id: UUID) -> list[dict[str, Any]]:
+        """Stored payloads of an aggregate's events, served from the cache and
+        extended with the offsets indexed since it was filled.
+        """
+        key = str(aggregate_id)
+        end_offsets = await self._end_offsets(aggregate_id)
+        if not await self.index.wait_until(end_offsets, self.index_wait_timeout):
+            return [record.value for record in await self._scan(key, end_offsets)]
+
+        stream = self.cache.get(key)
+        missing = self.index.ranges(key, after=stream.offsets)
+        if missing:
+            records = await self._read(key, missing)
+            stream = CachedStream(
+                events=stream.events + [record.value for record in records],
+                offsets={
+                    **stream.offsets,
+                    **{partition: ranges[-1][1] for partition, ranges in missing.items()},
+                },
+            )
+            self.cache.put(key, stream)
+        return stream.events
+
+    async def _run_indexer(self) -> None:
+        """Feed every event key and offset into the index as it is written."""
+        while True:
+            try:
+                batches = await self._index_consumer.getmany(timeout_ms=500)
+                for partition, messages in batches.items():
+                    for message in messages:
+                        if message.key:
+                            self.index.add(message.key, partition, message.offset)
+                await self.index.advance(
+                    {
+                        partition: await self._index_consumer.position(partition)
+                        for partition in self._index_consumer.assignment()
+                    },
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Kafka event indexer failed, retrying: {e}")
+                await asyncio.sleep(1)
+
+    async def _end_offsets(self, aggregate_id: UUID) -> dict[TopicPartition, int]:
+        """Current end offsets of the partitions of an aggregate's topic."""
+        topic = self._get_topic_name(aggregate_id)
+        partitions = self.consumer.partitions_for_topic(topic)
+        if partitions is None:
+            if topic not in await self.consumer.topics():
+                return {}
+            partitions = await self.producer.partitions_for(topic)
+        return await self.consumer.end_offsets(
+            [TopicPartition(topic, partition) for partition in sorted(partitions)],
+        )
+
+    async def _scan(
+        self,
+        key: str,
+        end_offsets: dict[TopicPartition, int],
+        offset: int = 0,
+    ) -> list[Any]:
+        """Read whole partitions; used while the index is still catching up."""
+        logger.warning(f"Event index is behind, scanning partitions for {key}")
+        beginning_offsets = await self.consumer.beginning_offsets(list(end_offsets))
+        ranges = {}
+        for partition, end_offset in end_offsets.items():
+            start = max(beginning_offsets[partition], offset)
+            if start < end_offset:
+                ranges[partition] = [[start, end_offset - 1]]
+        return await self._read(key, ranges)
+
+    async def _read(
+        self,
+        key: str,
+        ranges_by_partition: dict[TopicPartition, OffsetRanges],
+    ) -> list[Any]:
+        """Read the records of ``key`` within the given offset ranges."""
+        records = []
+        async with self._read_lock:
+            for partition, ranges in ranges_by_partition.items():
+                self.consumer.assign([partition])
+                for start, end in self._coalesce(ranges):
+                    self.consumer.seek(partition, start)
+                    position = start
+                    while position <= end:
+                        batches = await self.consumer.getmany(
+                            partition,
+                            timeout_ms=1000,
+                            max_records=end - position + 1,
+                        )
+                        messages = batches.get(partition)
+                        if not messages:
+                            raise KafkaError(
+                                f"No records at {partition.topic}"
+                                f"[{partition.partition}]@{position}",
+                            )
+                        for message in messages:
+                            if message.offset > end:
+                                break
+                            if message.key == key:
+                                records.append(message)
+                        position = messages[-1].offset + 1
+        return records
+
+    def _coalesce(self, ranges: OffsetRanges) -> OffsetRanges:
+        """Merge ranges separated by at most ``max_offset_gap`` offsets."""
+        merged = [list(ranges[0])]
+        for start, end in ranges[1:]:
+            if start - merged[-1][1] - 1 <= self.max_offset_gap:
+                merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        return merged
+
+    def _deserialize_events(self, records: Iterable[dict[str, Any]]) -> list[Any]:
+        """Deserialize stored event payloads, skipping unknown event types."""
+        events = []
+        for event_data in records:
+            event = self._deserialize_event(
+                event_data["event_type"],
+                event_data["data"],
+                event_data.get("metadata"),
+            )
+            if event:
+                events.append(event)
+        return events
+
+    @staticmethod
+    def _recorded_at(record: dict[str, Any]) -> datetime:
+        """Timestamp of a stored event; events are stamped in naive UTC."""
+        recorded_at = datetime.fromisoformat(record["timestamp"])
+        if recorded_at.tzinfo is None:
+            recorded_at = recorded_at.replace(tzinfo=UTC)
+        return recorded_at
+
     def _get_topic_name(self, aggregate_id: UUID) -> str:
         """Get Kafka topic name for an aggregate.
 
@@ -254,9 +480,9 @@ class KafkaEventStore(EventStore):
             Kafka topic name
 
         """
-        # Use a partitioning strategy for topic assignment
-        # This example uses a simple hash-based partitioning
-        partition_id = hash(str(aggregate_id)) % 10
+        # A stable hash: ``hash()`` of a str is salted per process, which
+        # would send one aggregate's events to different topics
+        partition_id = zlib.crc32(str(aggregate_id).encode()) % self.TOPIC_COUNT
         return f"{self.topic_prefix}-{partition_id}"
 
     def _serialize_event(self, event: Any) -> dict[str, Any]:
@@ -1,11 +1,13 @@
 """PostgreSQL Event Store Implementation for Event Sourcing."""
 
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, DateTime, Index, Integer, String, select
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, DateTime, Index, Integer, String, func, select
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import declarative_base
 
@@ -43,7 +45,9 @@ class EventModel(Base):
 
     # Indexes for performance
     __table_args__ = (
-        Index("idx_aggregate_sequence", "aggregate_id", "sequence_number"),
+        # Unique: concurrent appends to one aggregate conflict here instead of
+        # producing duplicate sequence numbers
+        Index("idx_aggregate_sequence", "aggregate_id", "sequence_number", unique=True),
         Index("idx_event_type_created", "event_type", "created_at"),
         Index("idx_aggregate_type", "aggregate_type", "aggregate_id"),
     )
@@ -61,30 +65,47 @@ class PostgresEventStore(EventStore):
         aggregate_type: str,
         event_type: str,
         events: list[dict[str, Any]],
+        max_retries: int = 3,
     ) -> None:
-        """Append a list of events to the event store."""
-        async with self.db.get_session() as session:
-            for event_data in events:
-                # Simplified: assumes current version is max + 1
-                # In a real system, you'd handle concurrency control here
-                result = await session.execute(
-                    select(EventModel)
-                    .filter_by(aggregate_id=aggregate_id)
-                    .order_by(EventModel.sequence_number.desc())
-                    .limit(1),
-                )
-                last_event = result.scalar_one_or_none()
-                sequence = last_event.sequence_number + 1 if last_event else 1
-
-                event = EventModel(
-                    aggregate_id=aggregate_id,
-                    aggregate_type=aggregate_type,
-                    event_type=event_type,
-                    sequence_number=sequence,
-                    event_data=event_data,
+        """Append a list of events to the event store.
+
+        One multi-row INSERT numbers the events after the aggregate's last
+        sequence number; a concurrent append to the same aggregate violates
+        the unique sequence index and is retried.
+        """
+        if not events:
+            return
+        last_sequence = (
+            select(func.coalesce(func.max(EventModel.sequence_number), 0))
+            .where(EventModel.aggregate_id == aggregate_id)
+            .scalar_subquery()
+        )
+        statement = insert(EventModel).values(
+            [
+                {
+                    "event_id": uuid4(),
+                    "aggregate_id": aggregate_id,
+                    "aggregate_type": aggregate_type,
+                    "event_type": event_type,
+                    "sequence_number": last_sequence + position,
+                    "event_data": event_data,
+                    "created_at": datetime.utcnow(),
+                }
+                for position, event_data in enumerate(events, start=1)
+            ],
+        )
+        for attempt in range(1, max_retries + 1):
+            try:
+                async with self.db.get_session() as session:
+                    await session.execute(statement)
+                    await session.commit()
+                return
+            except IntegrityError as e:
+                if "idx_aggregate_sequence" not in str(e.orig) or attempt == max_retries:
+                    raise
+                logger.warning(
+                    f"Sequence conflict for aggregate {aggregate_id}, retrying ({attempt}/{max_retries})",
                 )
-                session.add(event)
-            await session.commit()
 
     async def get_events(
         self,
@@ -104,3 +125,26 @@ class PostgresEventStore(EventStore):
             result = await session.execute(query)
             events = result.scalars().all()
             return [event.event_data for event in events]
+
+    async def get_aggregate_versions(
+        self,
+        since: datetime | None = None,
+        event_types: Sequence[str] | None = None,
+    ) -> dict[UUID, int]:
+        """Latest sequence number of every aggregate with matching events."""
+        matching = select(EventModel.aggregate_id)
+        if since is not None:
+            # created_at is a naive UTC timestamp
+            if since.tzinfo is not None:
+                since = since.astimezone(UTC).replace(tzinfo=None)
+            matching = matching.where(EventModel.created_at >= since)
+        if event_types is not None:
+            matching = matching.where(EventModel.event_type.in_(list(event_types)))
+        query = (
+            select(EventModel.aggregate_id, func.max(EventModel.sequence_number))
+            .where(EventModel.aggregate_id.in_(matching))
+            .group_by(EventModel.aggregate_id)
+        )
+        async with self.db.get_session() as session:
+            result = await session.execute(query)
+            return {aggregate_id: version for aggregate_id, version in result.all()}
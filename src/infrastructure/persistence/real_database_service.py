@@ -1,10 +1,11 @@
 """Database Service for AI Teddy Bear."""
 
 
+from src.infrastructure.persistence.activity_timeseries_store import (
+    ActivityTimeSeriesStore,
+)
 from src.infrastructure.persistence.database_manager import Database
-from sqlalchemy.future import select
-from datetime import datetime, date, timedelta
-from uuid import uuid4
+from datetime import datetime
 from src.infrastructure.logging_config import get_logger
 from src.domain.models.child_models import ChildModel
 
@@ -15,37 +16,23 @@ logger = get_logger(__name__, component="persistence")
 
 
 class RealDatabaseService:
-    def __init__(self):
-        pass
+    def __init__(self, activity_store: ActivityTimeSeriesStore | None = None):
+        self._activity_store = activity_store
+
+    @property
+    def activity_store(self) -> ActivityTimeSeriesStore:
+        """Usage and safety event storage, created on first use."""
+        if self._activity_store is None:
+            self._activity_store = ActivityTimeSeriesStore(Database())
+        return self._activity_store
 
     async def get_safety_events(self, child_id: str, limit: int = 10):
-        async with get_async_session() as session:
-            result = await session.execute(
-                select(ChildModel.safety_events).where(ChildModel.child_id == child_id)
-            )
-            row = result.first()
-            if row and row[0]:
-                return row[0][-limit:]
-            return []
+        return await self.activity_store.recent_safety_events(child_id, limit)
 
     async def record_safety_event(self, child_id: str, event_type: str, details: str, severity: str):
-        async with get_async_session() as session:
-            child = await session.get(ChildModel, child_id)
-            if not child:
-                raise ValueError("Child not found")
-            event_id = str(uuid4())
-            event = {
-                "event_id": event_id,
-                "event_type": event_type,
-                "details": details,
-                "severity": severity,
-                "timestamp": datetime.now().isoformat(),
-            }
-            if not hasattr(child, "safety_events") or child.safety_events is None:
-                child.safety_events = []
-            child.safety_events.append(event)
-            await session.commit()
-            return event_id
+        return await self.activity_store.record_safety_event(
+            child_id, event_type, details, severity
+        )
 
     async def get_safety_score(self, child_id: str):
         async with get_async_session() as session:
@@ -77,39 +64,25 @@ class RealDatabaseService:
         return True
 
     async def record_usage(self, usage_record: dict):
-        async with get_async_session() as session:
-            child = await session.get(ChildModel, usage_record["child_id"])
-            if not child:
-                raise ValueError("Child not found")
-            if not hasattr(child, "usage_records") or child.usage_records is None:
-                child.usage_records = []
-            child.usage_records.append(usage_record)
-            await session.commit()
-            return True
+        await self.activity_store.record_usage(
+            str(usage_record["child_id"]),
+            usage_record["activity_type"],
+            usage_record["duration"],
+            _parse_timestamp(usage_record.get("timestamp")),
+        )
+        return True
 
     async def get_daily_usage(self, child_id: str):
-        async with get_async_session() as session:
-            child = await session.get(ChildModel, child_id)
-            if not child or not hasattr(child, "usage_records") or not child.usage_records:
-                return 0
-            today = date.today().isoformat()
-            return sum(
-                rec["duration"] for rec in child.usage_records if rec["timestamp"].startswith(today)
-            )
+        return await self.activity_store.daily_usage(child_id)
 
     async def get_usage_statistics(self, child_id: str, days: int = 7):
-        async with get_async_session() as session:
-            child = await session.get(ChildModel, child_id)
-            if not child or not hasattr(child, "usage_records") or not child.usage_records:
-                return {}
-            now = datetime.now()
-            stats = {}
-            for i in range(days):
-                day = (now - timedelta(days=i)).date().isoformat()
-                stats[day] = sum(
-                    rec["duration"] for rec in child.usage_records if rec["timestamp"].startswith(day)
-                )
-            return stats
+        return await self.activity_store.usage_by_day(child_id, days)
+
+
+def _parse_timestamp(timestamp) -> datetime | None:
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp)
+    return timestamp
 
 
 # Singleton accessor
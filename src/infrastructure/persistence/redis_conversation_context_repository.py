@@ -0,0 +1,66 @@
+import json
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.application.interfaces.conversation_context_store import (
+    ConversationContext,
+    ConversationContextStore,
+    ConversationTurn,
+)
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="redis_conversation_context_repository")
+
+
+class RedisConversationContextRepository(ConversationContextStore):
+    """Redis implementation of the conversation context store.
+    Keeps each child's context as one JSON value, so a turn reads it with a single GET.
+    Contexts expire after the conversation retention period (COPPA).
+    """
+
+    CONTEXT_KEY_PREFIX = "conversation_context:"
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        retention: timedelta = timedelta(days=90),
+    ) -> None:
+        self.redis_client = redis_client
+        self.retention = retention
+        self.logger = logger
+
+    async def get(self, child_id: UUID) -> ConversationContext | None:
+        raw = await self.redis_client.get(self.CONTEXT_KEY_PREFIX + str(child_id))
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+            return ConversationContext(
+                rolling_summary=data["rolling_summary"],
+                recent_turns=[self._turn(turn) for turn in data["recent_turns"]],
+                pending_turns=[self._turn(turn) for turn in data["pending_turns"]],
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f"Discarding unreadable context of child {child_id}: {e}")
+            return None
+
+    async def save(self, child_id: UUID, context: ConversationContext) -> None:
+        await self.redis_client.set(
+            self.CONTEXT_KEY_PREFIX + str(child_id),
+            json.dumps(asdict(context), default=str),
+            ex=self.retention,
+        )
+
+    async def delete(self, child_id: UUID) -> None:
+        await self.redis_client.delete(self.CONTEXT_KEY_PREFIX + str(child_id))
+
+    @staticmethod
+    def _turn(data: dict) -> ConversationTurn:
+        return ConversationTurn(
+            child_text=data["child_text"],
+            response_text=data["response_text"],
+            at=datetime.fromisoformat(data["at"]),
+        )
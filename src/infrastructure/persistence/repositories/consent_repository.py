@@ -13,6 +13,10 @@ from sqlalchemy.future import select
 
 from src.domain.models.consent_models_infra import ConsentModel
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.performance.batch_loader import (
+    BatchLoader,
+    request_loader,
+)
 from src.infrastructure.persistence.database_manager import Database
 from src.infrastructure.validators.security.database_input_validator import (
     SecurityError,
@@ -140,6 +144,7 @@ class ConsentRepository:
                     consent.verification_metadata.update(verification_metadata)
 
                 await session.commit()
+                self._clear_consent(consent)
 
                 logger.info(
                     f"Granted consent {consent_id} via {verification_method}"
@@ -191,6 +196,8 @@ class ConsentRepository:
                     })
 
                 await session.commit()
+                # A later verify in this request must not see the cached grant
+                self._clear_consent(consent)
 
                 logger.info(f"Revoked consent {consent_id}: {revocation_reason}")
                 return True
@@ -208,6 +215,9 @@ class ConsentRepository:
     ) -> bool:
         """Verify if valid consent exists for a specific operation.
 
+        Checks made concurrently within a request, such as one per child on
+        a parent dashboard, are answered by a single query.
+
         Args:
             parent_id: Parent identifier
             child_id: Child identifier
@@ -219,13 +229,61 @@ class ConsentRepository:
         Raises:
             SecurityError: If validation fails
         """
+        loader = self._consent_loader()
+        return bool(await loader.load((parent_id, child_id, consent_type)))
+
+    async def verify_consents(
+        self,
+        parent_id: str,
+        child_ids: List[str],
+        consent_type: str,
+    ) -> dict[str, bool]:
+        """Verify consent of a parent for several children in one query.
+
+        Args:
+            parent_id: Parent identifier
+            child_ids: Child identifiers
+            consent_type: Type of consent to verify
+
+        Returns:
+            Whether valid consent exists, by child id
+
+        Raises:
+            SecurityError: If validation fails
+        """
+        loader = self._consent_loader()
+        valid = await loader.load_many(
+            [(parent_id, child_id, consent_type) for child_id in child_ids]
+        )
+        return {
+            child_id: bool(valid[(parent_id, child_id, consent_type)])
+            for child_id in child_ids
+        }
+
+    def _consent_loader(self) -> BatchLoader:
+        return request_loader(self._load_valid_consents, name="consents")
+
+    def _clear_consent(self, consent: ConsentModel) -> None:
+        """Drop the cached verification of ``consent`` after a write."""
+        self._consent_loader().clear(
+            (
+                consent.parent_id,
+                (consent.verification_metadata or {}).get("child_id"),
+                consent.consent_type,
+            )
+        )
+
+    async def _load_valid_consents(
+        self,
+        keys: List[tuple[str, str, str]],
+    ) -> dict[tuple[str, str, str], bool]:
+        """Batch function of verify_consent: one query for any mix of keys."""
         async with create_safe_database_session(self.database) as session:
             try:
-                # Query for valid consent
                 stmt = select(ConsentModel).where(
                     and_(
-                        ConsentModel.parent_id == parent_id,
-                        ConsentModel.consent_type == consent_type,
+                        ConsentModel.parent_id.in_({key[0] for key in keys}),
+                        ConsentModel.consent_type.in_({key[2] for key in keys}),
                         ConsentModel.granted == True,
                         or_(
                             ConsentModel.expires_at.is_(None),
@@ -235,24 +293,21 @@ class ConsentRepository:
                     )
                 )
 
-                # Check if child_id matches (stored in verification_metadata)
+                # The child_id is stored in verification_metadata
                 result = await session.execute(stmt)
-                consents = result.scalars().all()
-
-                for consent in consents:
-                    metadata = consent.verification_metadata or {}
-                    if metadata.get("child_id") == child_id:
-                        logger.debug(
-                            f"Valid consent found: {consent.id} for parent {parent_id}, "
-                            f"child {child_id}, type {consent_type}"
-                        )
-                        return True
+                valid = {
+                    (
+                        consent.parent_id,
+                        (consent.verification_metadata or {}).get("child_id"),
+                        consent.consent_type,
+                    )
+                    for consent in result.scalars().all()
+                }
 
                 logger.debug(
-                    f"No valid consent found for parent {parent_id}, "
-                    f"child {child_id}, type {consent_type}"
+                    f"Verified {len(keys)} consents: {len(valid & set(keys))} valid"
                 )
-                return False
+                return {key: key in valid for key in keys}
 
             except Exception as e:
                 logger.error(f"Failed to verify consent: {e}")
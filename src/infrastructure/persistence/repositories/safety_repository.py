@@ -3,11 +3,12 @@
 Handles all safety-related database operations including events, alerts, and scores.
 """
 
-from uuid import uuid4
 from typing import Any
-from uuid import uuid4
 
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.persistence.activity_timeseries_store import (
+    ActivityTimeSeriesStore,
+)
 from src.infrastructure.persistence.database_manager import Database
 from src.infrastructure.validators.security.database_input_validator import (
     SecurityError,
@@ -21,14 +22,20 @@ logger = get_logger(__name__, component="persistence")
 class SafetyRepository:
     """Repository for safety-related database operations."""
 
-    def __init__(self, database: Database) -> None:
+    def __init__(
+        self,
+        database: Database,
+        activity_store: ActivityTimeSeriesStore | None = None,
+    ) -> None:
         """Initialize safety repository.
 
         Args:
             database: Database instance
+            activity_store: Safety event storage; built on ``database`` by default
 
         """
         self.database = database
+        self.activity_store = activity_store or ActivityTimeSeriesStore(database)
         logger.info("SafetyRepository initialized")
 
     @database_input_validation("safety_events")
@@ -63,12 +70,16 @@ class SafetyRepository:
                 "safety_events",
                 event_data,
             )
-            validated_operation["data"]
-            event_id = str(uuid4())
-            # In production, this would insert into safety_events table
+            validated_data = validated_operation["data"]
+            event_id = await self.activity_store.record_safety_event(
+                str(validated_data["child_id"]),
+                validated_data["event_type"],
+                validated_data["details"],
+                validated_data["severity"],
+            )
             logger.warning(
-                "Safety Event %s: Child=%s, Type=%s, Severity=%s, Details=%s",
-                event_id, child_id, event_type, severity, details,
+                "Safety Event %s: Child=%s, Type=%s, Severity=%s",
+                event_id, child_id, event_type, severity,
             )
         except SecurityError as err:
             logger.exception("Security error recording safety event")
@@ -79,6 +90,40 @@ class SafetyRepository:
         else:
             return event_id
 
+    @database_input_validation("safety_events")
+    async def get_safety_events(
+        self,
+        child_id: str,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Get the latest safety events of a child.
+
+        Args:
+            child_id: Child ID
+            limit: Maximum number of events
+
+        Returns:
+            List of safety events, oldest first
+        """
+        return await self.activity_store.recent_safety_events(child_id, limit)
+
+    @database_input_validation("safety_events")
+    async def get_safety_incident_counts(
+        self,
+        child_id: str,
+        days: int = 30,
+    ) -> dict[str, int]:
+        """Count the safety events of a child per severity.
+
+        Args:
+            child_id: Child ID
+            days: Number of days to count
+
+        Returns:
+            Dictionary of severity to number of events
+        """
+        return await self.activity_store.safety_event_counts(child_id, days)
+
     @database_input_validation("safety_alerts")
     async def get_safety_alerts(self, child_id: str) -> list[dict[str, Any]]:
         """Get safety alerts for a child (production implementation).
@@ -3,11 +3,13 @@
 Handles all usage statistics and analytics database operations.
 """
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
-from uuid import uuid4
 
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.persistence.activity_timeseries_store import (
+    ActivityTimeSeriesStore,
+)
 from src.infrastructure.persistence.database_manager import Database
 from src.infrastructure.validators.security.database_input_validator import (
     SecurityError,
@@ -21,14 +23,20 @@ logger = get_logger(__name__, component="persistence")
 class UsageRepository:
     """Repository for usage statistics and analytics operations."""
 
-    def __init__(self, database: Database) -> None:
+    def __init__(
+        self,
+        database: Database,
+        activity_store: ActivityTimeSeriesStore | None = None,
+    ) -> None:
         """Initialize usage repository.
 
         Args:
             database: Database instance
+            activity_store: Usage event storage; built on ``database`` by default
 
         """
         self.database = database
+        self.activity_store = activity_store or ActivityTimeSeriesStore(database)
         logger.info("UsageRepository initialized")
 
     @database_input_validation("usage_statistics")
@@ -59,19 +67,12 @@ class UsageRepository:
                 usage_record,
             )
             validated_data = validated_operation["data"]
-            usage_id = str(uuid4())
-
-            # Create complete usage record
-            complete_record = {
-                "usage_id": usage_id,
-                "child_id": validated_data["child_id"],
-                "activity_type": validated_data["activity_type"],
-                "duration": validated_data["duration"],
-                "timestamp": datetime.utcnow(),
-            }
-
-            # In a real implementation, this would be saved to a database
-            logger.info(f"Usage recorded: {complete_record}")
+            usage_id = await self.activity_store.record_usage(
+                str(validated_data["child_id"]),
+                validated_data["activity_type"],
+                validated_data["duration"],
+            )
+            logger.info(f"Usage recorded: {usage_id}")
             return usage_id
         except (ValueError, SecurityError) as e:
             logger.error(f"Error recording usage: {e}")
@@ -92,16 +93,8 @@ class UsageRepository:
             Dictionary with usage summary
         """
         try:
-            # استعلام فعلي من قاعدة البيانات لجلب سجلات الاستخدام
-            query = (
-                "SELECT activity_type, SUM(duration) as total_duration "
-                "FROM usage_statistics "
-                "WHERE child_id = :child_id AND timestamp >= :since "
-                "GROUP BY activity_type"
-            )
-            since = datetime.utcnow() - timedelta(days=days)
-            params = {"child_id": child_id, "since": since}
-            result = await self.database.fetch_all(query, params)
+            # Reads the daily rollups, not the individual usage events
+            result = await self.activity_store.usage_by_activity(child_id, days)
             if not result:
                 return {
                     "child_id": child_id,
@@ -109,10 +102,8 @@ class UsageRepository:
                     "most_common_activity": None,
                     "period_days": days,
                 }
-            total_duration = sum(row["total_duration"] for row in result)
-            most_common_activity = max(
-                result, key=lambda r: r["total_duration"]
-            )["activity_type"]
+            total_duration = sum(result.values())
+            most_common_activity = max(result, key=result.get)
         except (ValueError, TypeError):
             logger.exception("Error fetching usage summary")
             raise
@@ -123,3 +114,33 @@ class UsageRepository:
                 "most_common_activity": most_common_activity,
                 "period_days": days,
             }
+
+    async def get_daily_usage(self, child_id: str, days: int = 7) -> list[dict[str, Any]]:
+        """Get minutes of usage per day for a child, newest day first.
+
+        Args:
+            child_id: Child ID
+            days: Number of days to return
+
+        Returns:
+            List of dictionaries with date and duration_minutes
+        """
+        usage = await self.activity_store.usage_by_day(child_id, days)
+        return [
+            {"date": day, "duration_minutes": minutes} for day, minutes in usage.items()
+        ]
+
+    async def cleanup_old_usage_data(self, days: int = 90) -> int:
+        """Delete usage history older than a number of days (COPPA retention).
+
+        Args:
+            days: Age threshold in days
+
+        Returns:
+            Number of usage records deleted
+        """
+        deleted = await self.activity_store.purge_before(
+            datetime.now(UTC) - timedelta(days=days),
+        )
+        logger.info(f"Deleted {deleted} usage records older than {days} days")
+        return deleted
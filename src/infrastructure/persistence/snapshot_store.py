@@ -0,0 +1,162 @@
+"""PostgreSQL Snapshot Store for event-sourced aggregates."""
+
+import asyncio
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    String,
+    UniqueConstraint,
+    delete,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+from src.domain.repositories.snapshot_store import Snapshot, SnapshotStore
+from src.infrastructure.logging_config import get_logger
+from src.infrastructure.persistence.database_manager import Database
+from src.infrastructure.persistence.postgres_event_store import Base
+
+logger = get_logger(__name__, component="persistence")
+
+
+class SnapshotModel(Base):
+    """SQLAlchemy model for storing aggregate snapshots."""
+
+    __tablename__ = "aggregate_snapshots"
+
+    snapshot_id: str = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    aggregate_id: str = Column(PGUUID(as_uuid=True), nullable=False)
+    aggregate_type: str = Column(String(100), nullable=False)
+
+    # Number of events the snapshot covers, and layout of the state
+    version: int = Column(Integer, nullable=False)
+    schema_version: int = Column(Integer, nullable=False, default=1)
+
+    state: dict[str, Any] = Column(JSONB, nullable=False)
+    created_at: datetime = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # The unique constraint doubles as the (aggregate_id, version) lookup index
+    __table_args__ = (
+        UniqueConstraint("aggregate_id", "version", name="uq_snapshot_aggregate_version"),
+    )
+
+
+class PostgresSnapshotStore(SnapshotStore):
+    """PostgreSQL implementation of SnapshotStore, next to PostgresEventStore."""
+
+    def __init__(self, database: Database):
+        self.db = database
+
+    async def save_snapshot(self, snapshot: Snapshot) -> None:
+        """Insert a snapshot, replacing one taken at the same version."""
+        statement = insert(SnapshotModel).values(
+            aggregate_id=snapshot.aggregate_id,
+            aggregate_type=snapshot.aggregate_type,
+            version=snapshot.version,
+            schema_version=snapshot.schema_version,
+            state=snapshot.state,
+            created_at=snapshot.created_at.replace(tzinfo=None),
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uq_snapshot_aggregate_version",
+            set_={
+                "schema_version": statement.excluded.schema_version,
+                "state": statement.excluded.state,
+                "created_at": statement.excluded.created_at,
+            },
+        )
+        async with self.db.get_session() as session:
+            await session.execute(statement)
+            await session.commit()
+
+    async def get_latest_snapshot(self, aggregate_id: UUID) -> Snapshot | None:
+        """Retrieve the newest snapshot of an aggregate."""
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(SnapshotModel)
+                .filter_by(aggregate_id=aggregate_id)
+                .order_by(SnapshotModel.version.desc())
+                .limit(1),
+            )
+            row = result.scalar_one_or_none()
+            if row is None:
+                return None
+            return Snapshot(
+                aggregate_id=row.aggregate_id,
+                aggregate_type=row.aggregate_type,
+                version=row.version,
+                schema_version=row.schema_version,
+                state=row.state,
+                created_at=row.created_at,
+            )
+
+    async def compact(self, keep_last: int = 1) -> int:
+        """Delete all but the newest ``keep_last`` snapshots per aggregate."""
+        ranked = select(
+            SnapshotModel.snapshot_id,
+            func.row_number()
+            .over(
+                partition_by=SnapshotModel.aggregate_id,
+                order_by=SnapshotModel.version.desc(),
+            )
+            .label("rank"),
+        ).subquery()
+        stale = select(ranked.c.snapshot_id).where(ranked.c.rank > keep_last)
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                delete(SnapshotModel).where(SnapshotModel.snapshot_id.in_(stale)),
+            )
+            await session.commit()
+            return result.rowcount or 0
+
+
+class SnapshotCompactor:
+    """Periodically deletes superseded snapshots in the background."""
+
+    def __init__(
+        self,
+        snapshot_store: SnapshotStore,
+        interval_seconds: float = 3600,
+        keep_last: int = 2,
+    ) -> None:
+        self.snapshot_store = snapshot_store
+        self.interval_seconds = interval_seconds
+        self.keep_last = keep_last
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start compacting on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background compaction."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def compact_once(self) -> int:
+        """Compact now; returns the number of snapshots deleted."""
+        deleted = await self.snapshot_store.compact(self.keep_last)
+        if deleted:
+            logger.info(f"Compacted {deleted} superseded aggregate snapshots")
+        return deleted
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.compact_once()
+            except Exception as e:
+                logger.error(f"Snapshot compaction failed: {e}")
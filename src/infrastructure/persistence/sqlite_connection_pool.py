@@ -0,0 +1,134 @@
+"""Connection pool for SQLite databases used from async code."""
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="persistence")
+
+T = TypeVar("T")
+
+
+class SQLiteConnectionPool:
+    """Long-lived SQLite connections on dedicated threads.
+
+    Databases run in WAL mode, so readers never block the writer or each
+    other. All writes go through a single writer thread, which is what
+    SQLite serializes them to anyway, so writers never wait on each other's
+    locks; reads are spread over a few reader threads. Each thread keeps one
+    connection for its lifetime, and with it SQLite's cache of prepared
+    statements: running the same SQL text again skips compiling it.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        readers: int = 4,
+        synchronous: str = "NORMAL",
+        mmap_size: int = 256 * 1024 * 1024,
+        cache_size_kib: int = 16 * 1024,
+        busy_timeout_ms: int = 5000,
+        cached_statements: int = 256,
+    ) -> None:
+        """Initialize the pool; connections are opened on first use.
+
+        Args:
+            db_path: Path of the database file
+            readers: Number of reader threads, and so of read connections
+            synchronous: SQLite ``synchronous`` setting; NORMAL is durable
+                across application crashes in WAL mode and only syncs at
+                checkpoints
+            mmap_size: Bytes of the database file read through memory mapping
+            cache_size_kib: Page cache size per connection
+            busy_timeout_ms: How long a connection waits for a lock
+            cached_statements: Prepared statements kept per connection
+        """
+        self.db_path = Path(db_path)
+        self.synchronous = synchronous
+        self.mmap_size = mmap_size
+        self.cache_size_kib = cache_size_kib
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+        self._readers = ThreadPoolExecutor(
+            max_workers=readers,
+            thread_name_prefix="sqlite-reader",
+        )
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._closed = False
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a new, tuned connection to the database."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    async def read(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(connection, *args)`` on a reader thread."""
+        return await self._run(self._readers, self._call, fn, args)
+
+    async def write(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(connection, *args)`` in a transaction on the writer thread.
+
+        The transaction commits if ``fn`` returns and rolls back if it raises.
+        """
+        return await self._run(self._writer, self._call_in_transaction, fn, args)
+
+    async def close(self) -> None:
+        """Finish queued work and close every connection."""
+        if self._closed:
+            return
+        self._closed = True
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self) -> None:
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to close SQLite connection: {e}")
+            self._connections.clear()
+
+    async def _run(self, executor: ThreadPoolExecutor, call: Callable, fn, args):
+        if self._closed:
+            raise RuntimeError(f"Connection pool for {self.db_path} is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, call, fn, args)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self.connect()
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _call(self, fn: Callable[..., T], args: tuple) -> T:
+        return fn(self._connection(), *args)
+
+    def _call_in_transaction(self, fn: Callable[..., T], args: tuple) -> T:
+        conn = self._connection()
+        with conn:
+            return fn(conn, *args)
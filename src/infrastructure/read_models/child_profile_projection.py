@@ -0,0 +1,215 @@
+"""Incrementally maintained child profile projection.
+
+Keeps the child profile read model up to date from the event store, so
+parent-facing reads never replay events.
+
+Usage:
+    python -m src.infrastructure.read_models.child_profile_projection rebuild
+    python -m src.infrastructure.read_models.child_profile_projection catch-up
+"""
+
+import asyncio
+import weakref
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from src.domain.entities.child_profile import ChildProfile
+from src.domain.repositories.event_store import EventStore
+from src.infrastructure.logging_config import get_logger
+from src.infrastructure.read_models.child_profile_read_model import (
+    ChildProfileReadModel,
+    ChildProfileReadModelStore,
+    RedisChildProfileReadModelStore,
+)
+
+logger = get_logger(__name__, component="read_models")
+
+
+class ChildProfileProjection:
+    """Projects child profile events into the read model store.
+
+    Every row carries the aggregate version it reflects, which serves as the
+    per-aggregate checkpoint: projecting a profile only reads the events
+    after that version, and stores reject rows older than the one they hold,
+    so projecting the same events twice or out of order is harmless. A
+    global checkpoint records when the last catch-up started, so a restart
+    only looks at aggregates with events recorded since then.
+    """
+
+    EVENT_TYPES = ("ChildRegistered", "ChildProfileUpdated", "ChildProfileDeleted")
+
+    def __init__(
+        self,
+        event_store: EventStore,
+        read_model_store: ChildProfileReadModelStore | RedisChildProfileReadModelStore,
+        concurrency: int = 16,
+        checkpoint_overlap: timedelta = timedelta(minutes=5),
+        interval_seconds: float = 5.0,
+    ) -> None:
+        """Initialize the projection.
+
+        Args:
+            event_store: Source of truth for child profile events
+            read_model_store: Store holding the projected profiles
+            concurrency: Aggregates projected in parallel by catch-up and rebuild
+            checkpoint_overlap: How far before the checkpoint catch-up looks,
+                to cover transactions that committed after it was taken
+            interval_seconds: Pause between catch-ups of the background task
+        """
+        self.event_store = event_store
+        self.read_model_store = read_model_store
+        self.concurrency = concurrency
+        self.checkpoint_overlap = checkpoint_overlap
+        self.interval_seconds = interval_seconds
+        self._locks: weakref.WeakValueDictionary[UUID, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._task: asyncio.Task | None = None
+
+    async def project(self, child_id: UUID) -> ChildProfileReadModel | None:
+        """Apply the events recorded after the projected version of a profile."""
+        lock = self._locks.get(child_id)
+        if lock is None:
+            lock = self._locks[child_id] = asyncio.Lock()
+        async with lock:
+            current = await self.read_model_store.async_get_by_id(child_id)
+            events = await self.event_store.get_events(
+                child_id,
+                after_version=current.version if current else None,
+            )
+            if not events:
+                return current
+
+            if current:
+                profile = ChildProfile.from_snapshot(
+                    child_id,
+                    {
+                        "name": current.name,
+                        "age": current.age,
+                        "preferences": current.preferences,
+                    },
+                    current.version,
+                )
+            else:
+                profile = ChildProfile.restore(child_id)
+            for event in events:
+                profile.apply(event)
+
+            if profile.is_deleted:
+                # Drop the row instead of saving one; catch-up and rebuild
+                # skip the profile from then on
+                if current:
+                    await self.read_model_store.async_delete(child_id)
+                return None
+
+            try:
+                model = ChildProfileReadModel(
+                    id=child_id,
+                    name=profile.name,
+                    age=profile.age,
+                    preferences=profile.preferences,
+                    version=profile.version,
+                )
+            except AttributeError:
+                logger.warning(f"Child profile {child_id} has no registration event yet")
+                return current
+            await self.read_model_store.async_save(model)
+            return model
+
+    async def catch_up(self) -> int:
+        """Project every aggregate with events since the checkpoint.
+
+        Returns:
+            Number of profiles that were behind
+        """
+        started = datetime.now(UTC)
+        checkpoint = await self.read_model_store.get_checkpoint()
+        versions = await self.event_store.get_aggregate_versions(
+            since=checkpoint - self.checkpoint_overlap if checkpoint else None,
+            event_types=self.EVENT_TYPES,
+        )
+        projected = await self.read_model_store.async_get_many(list(versions))
+        behind = [
+            child_id
+            for child_id, version in versions.items()
+            if child_id not in projected or projected[child_id].version < version
+        ]
+        if await self._project_all(behind):
+            await self.read_model_store.save_checkpoint(started)
+        if behind:
+            logger.info(f"Caught up {len(behind)} child profile projections")
+        return len(behind)
+
+    async def rebuild(self) -> int:
+        """Drop the read model and project every aggregate from scratch.
+
+        Returns:
+            Number of profiles projected
+        """
+        started = datetime.now(UTC)
+        await self.read_model_store.async_clear()
+        versions = await self.event_store.get_aggregate_versions(
+            event_types=self.EVENT_TYPES,
+        )
+        if await self._project_all(list(versions)):
+            await self.read_model_store.save_checkpoint(started)
+        logger.info(f"Rebuilt {len(versions)} child profile projections")
+        return len(versions)
+
+    def start(self) -> None:
+        """Keep catching up in the background on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background catch-up."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.catch_up()
+            except Exception as e:
+                logger.error(f"Child profile projection catch-up failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _project_all(self, child_ids: list[UUID]) -> bool:
+        """Project aggregates in parallel; False if any of them failed."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _project(child_id: UUID) -> bool:
+            async with semaphore:
+                try:
+                    await self.project(child_id)
+                    return True
+                except Exception as e:
+                    logger.error(f"Failed to project child profile {child_id}: {e}")
+                    return False
+
+        results = await asyncio.gather(*(_project(child_id) for child_id in child_ids))
+        return all(results)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from src.infrastructure.dependencies import get_child_profile_projection
+
+    async def main(command: str) -> None:
+        projection = get_child_profile_projection()
+        if command == "rebuild":
+            count = await projection.rebuild()
+        else:
+            count = await projection.catch_up()
+        logger.info(f"{command}: {count} child profiles projected")
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "catch-up"
+    if command not in ("rebuild", "catch-up"):
+        sys.exit(f"usage: {sys.argv[0]} [rebuild|catch-up]")
+    asyncio.run(main(command))
@@ -1,7 +1,11 @@
+import json
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from redis.asyncio import Redis
+
 
 @dataclass
 class ChildProfileReadModel:
@@ -9,11 +13,14 @@ class ChildProfileReadModel:
     name: str
     age: int
     preferences: dict[str, Any]
+    # Number of events of the aggregate the row reflects
+    version: int = 0
 
 
 class ChildProfileReadModelStore:
     def __init__(self) -> None:
         self._store: dict[UUID, ChildProfileReadModel] = {}
+        self._checkpoint: datetime | None = None
 
     def get_by_id(self, child_id: UUID) -> ChildProfileReadModel | None:
         return self._store.get(child_id)
@@ -27,3 +34,149 @@ class ChildProfileReadModelStore:
 
     def get_all(self) -> list[ChildProfileReadModel]:
         return list(self._store.values())
+
+    async def async_get_by_id(self, child_id: UUID) -> ChildProfileReadModel | None:
+        return self.get_by_id(child_id)
+
+    async def async_get_many(
+        self,
+        child_ids: list[UUID],
+    ) -> dict[UUID, ChildProfileReadModel]:
+        return {
+            child_id: self._store[child_id]
+            for child_id in child_ids
+            if child_id in self._store
+        }
+
+    async def async_save(self, child_profile: ChildProfileReadModel) -> bool:
+        """Save unless a row of the same or a newer version is stored."""
+        current = self._store.get(child_profile.id)
+        if current is not None and current.version >= child_profile.version > 0:
+            return False
+        self.save(child_profile)
+        return True
+
+    async def async_delete(self, child_id: UUID) -> None:
+        self.delete(child_id)
+
+    async def async_clear(self) -> None:
+        self._store.clear()
+        self._checkpoint = None
+
+    async def get_checkpoint(self) -> datetime | None:
+        return self._checkpoint
+
+    async def save_checkpoint(self, checkpoint: datetime) -> None:
+        self._checkpoint = checkpoint
+
+
+# Writes the row only if it is newer than the stored one, so concurrent or
+# replayed projections never move a profile back to an older version.
+_SAVE_IF_NEWER = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'version') or '-1')
+if current >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'version', ARGV[1], 'name', ARGV[2], 'age', ARGV[3], 'preferences', ARGV[4])
+redis.call('SADD', KEYS[2], ARGV[5])
+return 1
+"""
+
+
+class RedisChildProfileReadModelStore:
+    """Child profile read model kept as one Redis hash per child.
+
+    Shared by all application instances and survives restarts, together with
+    the projection checkpoint.
+    """
+
+    def __init__(self, redis_client: Redis, prefix: str = "read_model:child_profile") -> None:
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self._ids_key = f"{prefix}:ids"
+        self._checkpoint_key = f"{prefix}:checkpoint"
+        self._save_if_newer = redis_client.register_script(_SAVE_IF_NEWER)
+
+    def _key(self, child_id: UUID) -> str:
+        return f"{self.prefix}:{child_id}"
+
+    async def async_get_by_id(self, child_id: UUID) -> ChildProfileReadModel | None:
+        return (await self.async_get_many([child_id])).get(child_id)
+
+    async def async_get_many(
+        self,
+        child_ids: list[UUID],
+    ) -> dict[UUID, ChildProfileReadModel]:
+        """Fetch several profiles in one round-trip."""
+        if not child_ids:
+            return {}
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for child_id in child_ids:
+            pipeline.hgetall(self._key(child_id))
+        rows = await pipeline.execute()
+        return {
+            child_id: self._from_hash(child_id, row)
+            for child_id, row in zip(child_ids, rows)
+            if row
+        }
+
+    async def async_get_all(self) -> list[ChildProfileReadModel]:
+        child_ids = [
+            UUID(member.decode() if isinstance(member, bytes) else member)
+            for member in await self.redis_client.smembers(self._ids_key)
+        ]
+        return list((await self.async_get_many(child_ids)).values())
+
+    async def async_save(self, child_profile: ChildProfileReadModel) -> bool:
+        """Save unless a row of the same or a newer version is stored."""
+        saved = await self._save_if_newer(
+            keys=[self._key(child_profile.id), self._ids_key],
+            args=[
+                child_profile.version,
+                child_profile.name,
+                child_profile.age,
+                json.dumps(child_profile.preferences),
+                str(child_profile.id),
+            ],
+        )
+        return bool(saved)
+
+    async def async_delete(self, child_id: UUID) -> None:
+        pipeline = self.redis_client.pipeline(transaction=True)
+        pipeline.delete(self._key(child_id))
+        pipeline.srem(self._ids_key, str(child_id))
+        await pipeline.execute()
+
+    async def async_clear(self) -> None:
+        """Drop every projected profile and the checkpoint."""
+        members = await self.redis_client.smembers(self._ids_key)
+        keys = [
+            f"{self.prefix}:{member.decode() if isinstance(member, bytes) else member}"
+            for member in members
+        ]
+        await self.redis_client.delete(self._ids_key, self._checkpoint_key, *keys)
+
+    async def get_checkpoint(self) -> datetime | None:
+        value = await self.redis_client.get(self._checkpoint_key)
+        if value is None:
+            return None
+        return datetime.fromisoformat(value.decode() if isinstance(value, bytes) else value)
+
+    async def save_checkpoint(self, checkpoint: datetime) -> None:
+        await self.redis_client.set(self._checkpoint_key, checkpoint.isoformat())
+
+    @staticmethod
+    def _from_hash(child_id: UUID, row: dict) -> ChildProfileReadModel:
+        row = {
+            (key.decode() if isinstance(key, bytes) else key): (
+                value.decode() if isinstance(value, bytes) else value
+            )
+            for key, value in row.items()
+        }
+        return ChildProfileReadModel(
+            id=child_id,
+            name=row["name"],
+            age=int(row["age"]),
+            preferences=json.loads(row["preferences"]),
+            version=int(row["version"]),
+        )
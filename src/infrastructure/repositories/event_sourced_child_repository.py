@@ -2,36 +2,89 @@ from uuid import UUID
 
 from src.domain.entities.child_profile import ChildProfile
 from src.domain.repositories.event_store import EventStore
+from src.domain.repositories.snapshot_store import (
+    Snapshot,
+    SnapshotPolicy,
+    SnapshotStore,
+)
 from src.infrastructure.logging_config import get_logger
 
+AGGREGATE_TYPE = "ChildProfile"
+
 
 class EventSourcedChildRepository:
-    """Repository for Child aggregate using event sourcing with real database backend."""
+    """Repository for Child aggregate using event sourcing with real database backend.
+
+    With a snapshot store, profiles are loaded from their latest snapshot
+    plus the events recorded after it, instead of replaying every event
+    since the profile was created. A snapshot is taken whenever the event
+    count crosses a multiple of ``SnapshotPolicy.every_n_events``.
+    """
 
-    def __init__(self, event_store: EventStore) -> None:
+    def __init__(
+        self,
+        event_store: EventStore,
+        snapshot_store: SnapshotStore | None = None,
+        snapshot_policy: SnapshotPolicy | None = None,
+    ) -> None:
         """Initialize repository with real event store implementation.
 
         Args:
             event_store: Real EventStore implementation (e.g., EventStoreDB with database)
+            snapshot_store: Optional store for aggregate snapshots
+            snapshot_policy: When to take snapshots; defaults to every 100 events
         """
         self.logger = get_logger(__name__, component="persistence")
         self.event_store = event_store
+        self.snapshot_store = snapshot_store
+        self.snapshot_policy = snapshot_policy or SnapshotPolicy()
         self.logger.info("EventSourcedChildRepository initialized with real event store")
 
     async def save(self, child_profile: ChildProfile) -> None:
+        """Append the profile's new events, then snapshot it if due.
+
+        Raises:
+            ConcurrencyError: If another writer appended events to the profile
+                since it was loaded; nothing is written, reload and retry
+        """
+        events = child_profile.get_uncommitted_events()
+        if not events:
+            return
+        previous_version = child_profile.version
         await self.event_store.save_events(
             child_profile.id,
-            child_profile.get_uncommitted_events(),
+            events,
+            expected_version=previous_version,
         )
+        child_profile.mark_events_committed()
+        if self.snapshot_policy.should_snapshot(previous_version, child_profile.version):
+            await self._save_snapshot(child_profile)
 
     async def get_by_id(self, aggregate_id: UUID) -> ChildProfile | None:
-        events = await self.event_store.load_events(aggregate_id)
-        if not events:
-            return None
-        child_profile = ChildProfile.create_new("", 0, {})
-        child_profile.id = aggregate_id
+        snapshot = await self._load_snapshot(aggregate_id)
+        if snapshot is not None:
+            child_profile = ChildProfile.from_snapshot(
+                aggregate_id,
+                snapshot.state,
+                snapshot.version,
+            )
+            events = await self.event_store.get_events(
+                aggregate_id,
+                after_version=snapshot.version,
+            )
+        else:
+            events = await self.event_store.get_events(aggregate_id)
+            if not events:
+                return None
+            child_profile = ChildProfile.restore(aggregate_id)
         for event in events:
             child_profile.apply(event)
+        # Catch up aggregates whose tail has grown past the policy, e.g.
+        # profiles written before snapshots were enabled
+        if len(events) >= self.snapshot_policy.every_n_events:
+            await self._save_snapshot(child_profile)
+        if child_profile.is_deleted:
+            return None
         return child_profile
 
     async def get_all(self) -> list[ChildProfile]:
@@ -43,20 +96,52 @@ class EventSourcedChildRepository:
             # Group events by aggregate ID
             events_by_aggregate_id = {}
             for event in all_events:
-                if event.aggregate_id not in events_by_aggregate_id:
-                    events_by_aggregate_id[event.aggregate_id] = []
-                events_by_aggregate_id[event.aggregate_id].append(event)
+                if event["aggregate_id"] not in events_by_aggregate_id:
+                    events_by_aggregate_id[event["aggregate_id"]] = []
+                events_by_aggregate_id[event["aggregate_id"]].append(event)
 
             child_profiles = []
             for aggregate_id, events in events_by_aggregate_id.items():
-                child_profile = ChildProfile.create_new("", 0, {})
-                child_profile.id = aggregate_id
+                child_profile = ChildProfile.restore(aggregate_id)
                 for event in events:
                     child_profile.apply(event)
-                child_profiles.append(child_profile)
+                if not child_profile.is_deleted:
+                    child_profiles.append(child_profile)
 
             self.logger.info(f"Retrieved {len(child_profiles)} child profiles")
             return child_profiles
         except Exception as e:
             self.logger.error(f"Error retrieving all child profiles: {e}")
             return []
+
+    async def _load_snapshot(self, aggregate_id: UUID) -> Snapshot | None:
+        """Latest usable snapshot; snapshots are an optimization, so any
+        failure falls back to a full replay."""
+        if self.snapshot_store is None:
+            return None
+        try:
+            snapshot = await self.snapshot_store.get_latest_snapshot(aggregate_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to load snapshot for {aggregate_id}: {e}")
+            return None
+        if snapshot and snapshot.schema_version != ChildProfile.SNAPSHOT_SCHEMA_VERSION:
+            return None
+        return snapshot
+
+    async def _save_snapshot(self, child_profile: ChildProfile) -> None:
+        if self.snapshot_store is None:
+            return
+        try:
+            await self.snapshot_store.save_snapshot(
+                Snapshot(
+                    aggregate_id=child_profile.id,
+                    aggregate_type=AGGREGATE_TYPE,
+                    version=child_profile.version,
+                    schema_version=ChildProfile.SNAPSHOT_SCHEMA_VERSION,
+                    state=child_profile.to_snapshot(),
+                ),
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to save snapshot for {child_profile.id}: {e}",
+            )
@@ -4,6 +4,7 @@
 """
 
 import asyncio
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import select
@@ -13,7 +14,10 @@ from src.infrastructure.config.settings import Settings, get_settings
 from src.infrastructure.logging_config import get_logger
 from src.infrastructure.persistence.models.user_model import UserModel
 from src.infrastructure.security.auth.token_service import TokenService
-from src.infrastructure.security.password_hasher import PasswordHasher
+from src.infrastructure.security.password_hasher import (
+    HashingPoolSaturatedError,
+    PasswordHasher,
+)
 
 logger = get_logger(__name__, component="security")
 
@@ -30,13 +34,17 @@ class RealAuthService:
         """Initialize with real dependencies."""
         self.settings = settings or get_settings()
         self.password_hasher = password_hasher or PasswordHasher()
-        self.token_service = token_service or TokenService()
+        self.token_service = token_service or TokenService(self.settings)
         self.logger = logger
 
     async def authenticate(
         self, email: str, password: str, db: AsyncSession
     ) -> UserModel | None:
-        """REAL authentication with database lookup and password verification."""
+        """REAL authentication with database lookup and password verification.
+
+        Raises:
+            HashingPoolSaturatedError: If too many logins are being verified
+        """
         try:
             # Query database for user by email
             stmt = select(UserModel).where(UserModel.email == email)
@@ -45,16 +53,16 @@ class RealAuthService:
 
             if not user:
                 logger.warning("Authentication failed: User not found for email: %s", email)
-                # Perform dummy hash to prevent timing attacks
-                self.password_hasher.hash_password("dummy_password_123")
+                # Verify against a dummy hash to prevent timing attacks
+                await self.password_hasher.verify_password_async(password, None)
                 return None
 
             if not user.is_active:
                 logger.warning("Authentication failed: User account inactive for: %s", email)
                 return None
 
-            # Verify password using bcrypt
-            password_valid = self.password_hasher.verify_password(
+            # Verify password using bcrypt, off the event loop
+            password_valid, new_hash = await self.password_hasher.verify_and_update(
                 password, user.password_hash
             )
 
@@ -62,51 +70,39 @@ class RealAuthService:
                 logger.warning("Authentication failed: Invalid password for: %s", email)
                 return None
 
+            if new_hash:
+                user.password_hash = new_hash
+                await db.commit()
+
             logger.info("Authentication successful for user: %s", email)
             return user
 
+        except HashingPoolSaturatedError:
+            raise
         except Exception:
             logger.exception("Authentication error for %s", email)
             return None
 
-    async def validate_token(self, token: str) -> dict[str, Any] | None:
-        """Validate JWT token and check Redis blacklist."""
-        try:
-            # Decode and validate token
-            payload = self.token_service.verify_token(token)
-
-            # Check Redis blacklist
-            jti = payload.get("jti")
-            if jti:
-                # Check if token is blacklisted
-                # redis_client = get_redis_client()
-                # blacklisted = await redis_client.get(f"blacklist:{jti}")
-                # if blacklisted:
-                #     return None
-                pass
-
-            return payload
+    async def verify_token(self, token: str) -> dict[str, Any] | None:
+        """Verify a JWT token; None if it is invalid, expired or revoked.
 
+        Served from the verified-token cache after the first verification.
+        """
+        try:
+            return self.token_service.verify_token(token)
         except Exception as e:
             logger.warning("Token validation failed: %s", str(e))
             return None
 
+    async def validate_token(self, token: str) -> dict[str, Any] | None:
+        """Validate JWT token, including its revocation."""
+        return await self.verify_token(token)
+
     async def blacklist_token(self, token: str) -> bool:
-        """Add token to Redis blacklist with REAL implementation."""
+        """Revoke a token on every instance until it expires."""
         try:
-            # Decode token to get jti
-            payload = self.token_service.verify_token(token)
-            jti = payload.get("jti")
-
-            if not jti:
-                logger.error("Token missing jti claim")
-                return False
-
-            # REAL Redis blacklisting implementation
-            # redis_client = get_redis_client()
-            # await redis_client.setex(f"blacklist:{jti}", 86400, "1")
-
-            logger.info("Token blacklisted successfully: %s", jti[:8])
+            payload = await self.token_service.revoke_token(token)
+            logger.info("Token blacklisted successfully: %s", payload["jti"][:8])
             return True
 
         except Exception:
@@ -114,5 +110,11 @@ class RealAuthService:
             return False
 
 
+@lru_cache
+def create_auth_service() -> RealAuthService:
+    """Auth service shared by the request dependencies."""
+    return RealAuthService()
+
+
 # Export the real service
-__all__ = ["RealAuthService"]
+__all__ = ["RealAuthService", "create_auth_service"]
@@ -1,3 +1,6 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -6,6 +9,11 @@ from jose import JWTError, jwt
 
 from src.infrastructure.config.settings import Settings, get_settings
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.security.auth.token_verification import (
+    TOKEN_VERIFICATIONS,
+    get_revocation_list,
+    get_verified_token_cache,
+)
 
 logger = get_logger(__name__, component="security")
 
@@ -27,6 +35,13 @@ class TokenService:
         if not self.secret_key or len(self.secret_key) < 32:
             raise ValueError("SECRET_KEY must be at least 32 characters long")
 
+        self.token_cache = get_verified_token_cache()
+        self.revocations = get_revocation_list()
+        # Cached tokens are only served to services with the same key
+        self._cache_namespace = hashlib.sha256(
+            f"{self.algorithm}:{self.secret_key}".encode()
+        ).hexdigest()
+
     def create_access_token(self, user_data: dict[str, Any]) -> str:
         """Create JWT access token with user data."""
         try:
@@ -35,6 +50,7 @@ class TokenService:
                 "email": user_data["email"],
                 "role": user_data["role"],
                 "type": "access",
+                "jti": uuid.uuid4().hex,
                 "iat": datetime.utcnow(),
                 "exp": datetime.utcnow()
                 + timedelta(minutes=self.access_token_expire_minutes),
@@ -56,6 +72,7 @@ class TokenService:
                 "sub": user_data["id"],
                 "email": user_data["email"],
                 "type": "refresh",
+                "jti": uuid.uuid4().hex,
                 "iat": datetime.utcnow(),
                 "exp": datetime.utcnow()
                 + timedelta(days=self.refresh_token_expire_days),
@@ -71,15 +88,48 @@ class TokenService:
             raise ValueError("Failed to create refresh token")
 
     def verify_token(self, token: str) -> dict[str, Any]:
-        """Verify and decode JWT token."""
-        try:
-            payload = jwt.decode(
-                token, self.secret_key, algorithms=[self.algorithm]
-            )
-            return payload
-        except JWTError as e:
-            logger.error(f"JWT verification error: {e}")
-            raise ValueError("Invalid token")
+        """Verify and decode JWT token.
+
+        Tokens verified before are served from the verified-token cache
+        until they expire; both paths reject revoked tokens.
+        """
+        payload = self.token_cache.get(token, self._cache_namespace)
+        if payload is not None:
+            path = "cache"
+        else:
+            try:
+                payload = jwt.decode(
+                    token, self.secret_key, algorithms=[self.algorithm]
+                )
+            except JWTError as e:
+                TOKEN_VERIFICATIONS.labels(path="invalid").inc()
+                logger.error(f"JWT verification error: {e}")
+                raise ValueError("Invalid token")
+            path = "full"
+        if self.revocations.is_revoked(payload.get("jti")):
+            TOKEN_VERIFICATIONS.labels(path="revoked").inc()
+            self.token_cache.discard(token, self._cache_namespace)
+            raise ValueError("Token has been revoked")
+        if path == "full":
+            self.token_cache.put(token, payload, self._cache_namespace)
+        TOKEN_VERIFICATIONS.labels(path=path).inc()
+        return payload
+
+    async def revoke_token(self, token: str) -> dict[str, Any]:
+        """Revoke a token until it expires, on every instance.
+
+        Returns:
+            The payload of the revoked token
+
+        Raises:
+            ValueError: If the token is invalid or has no ``jti``
+        """
+        payload = self.verify_token(token)
+        if not payload.get("jti"):
+            raise ValueError("Token has no jti and cannot be revoked")
+        self.token_cache.discard(token, self._cache_namespace)
+        await self.revocations.revoke(payload["jti"], payload.get("exp", time.time()))
+        return payload
 
     def refresh_access_token(self, refresh_token: str) -> str:
         """Create new access token from refresh token."""
@@ -0,0 +1,339 @@
+"""Fast path of JWT verification and token revocation.
+
+Every authenticated request verified its token from scratch: decode,
+HMAC, claim checks. A token is reused for all requests until it expires,
+so VerifiedTokenCache remembers the tokens verified recently, by digest,
+until their ``exp``; a repeat request only hashes the token string.
+
+Revocation (logout) is checked on both paths. RevocationList keeps the
+revoked ``jti``s in a bloom filter: almost every token is not revoked, and
+the filter answers that from local memory. The filter lives in Redis
+(one bitmap per generation, shared by all instances) and each instance
+mirrors it: the bitmaps are loaded on start, and every revocation is
+published so the mirrors add it at once. ``is_revoked_async`` confirms
+a filter hit against the exact ``{prefix}:{jti}`` key, so false
+positives never reject a valid token. Generations rotate every
+``generation_seconds``; with generations at least as long as the longest
+token lifetime, checking the current and the previous one covers every
+token still valid.
+"""
+
+import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+import redis.asyncio as redis
+from prometheus_client import Counter
+
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="security")
+
+TOKEN_VERIFICATIONS = Counter(
+    "token_verifications_total",
+    "Token verifications by path: cache hit, full verification or revoked",
+    ["path"],
+)
+
+
+class VerifiedTokenCache:
+    """LRU of recently verified tokens, each kept until its ``exp``.
+
+    Entries are keyed by a digest of the token and of a namespace naming
+    the signing key, so a token is only served to the service that
+    verified it, and the cache holds no usable token.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, token: str, namespace: str = "") -> dict[str, Any] | None:
+        """Payload of ``token`` if it was verified and has not expired."""
+        key = self._key(token, namespace)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return dict(payload)
+
+    def put(self, token: str, payload: dict[str, Any], namespace: str = "") -> None:
+        """Remember a verified token; tokens without a numeric ``exp`` are not kept."""
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, int | float) or expires_at <= time.time():
+            return
+        key = self._key(token, namespace)
+        self._entries[key] = (float(expires_at), dict(payload))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, token: str, namespace: str = "") -> None:
+        self._entries.pop(self._key(token, namespace), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str, namespace: str) -> bytes:
+        return hashlib.sha256(f"{namespace}:{token}".encode()).digest()
+
+
+class RevocationBloomFilter:
+    """Bloom filter of strings, in Redis bitmap bit order."""
+
+    def __init__(self, capacity: int, error_rate: float, bits: bytes | None = None) -> None:
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(math.ceil(self.size / 8))
+        if bits:
+            self.bits[: len(bits)] = bits[: len(self.bits)]
+
+    def positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for position in self.positions(item):
+            self.bits[position >> 3] |= 0x80 >> (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (0x80 >> (position & 7))
+            for position in self.positions(item)
+        )
+
+
+class RevocationList:
+    """Revoked token ids, mirrored locally from Redis.
+
+    Without a Redis client revocations are only known to this process.
+    """
+
+    # Longest wait of the listener for a revocation, and so of ``close``
+    poll_seconds = 1.0
+
+    def __init__(
+        self,
+        redis_client: redis.Redis | None = None,
+        *,
+        capacity: int = 1_000_000,
+        error_rate: float = 1e-4,
+        generation_seconds: int = 8 * 24 * 3600,
+        prefix: str = "auth:revoked",
+        channel: str = "auth:revocations",
+    ) -> None:
+        """Initialize the list.
+
+        Args:
+            redis_client: Shared store of the filter and exact revocations
+            capacity: Revocations per generation the filter is sized for
+            error_rate: Share of valid tokens that need a Redis lookup
+            generation_seconds: Lifetime of a filter; at least the longest
+                token lifetime
+            prefix: Prefix of the Redis keys
+            channel: Pub/sub channel announcing revocations
+        """
+        self.redis = redis_client
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.generation_seconds = generation_seconds
+        self.prefix = prefix
+        self.channel = channel
+        self._filters: dict[int, RevocationBloomFilter] = {}
+        # Revocations this process has seen, until their tokens expire
+        self._known: dict[str, float] = {}
+        self._listener: asyncio.Task | None = None
+        self._pubsub = None
+        self._stopping = False
+
+    async def start(self, redis_client: redis.Redis | None = None) -> None:
+        """Load the shared filters and follow new revocations.
+
+        If Redis is unreachable, revocations stay local until the listener
+        manages to resubscribe, rather than failing the caller.
+        """
+        self.redis = redis_client or self.redis
+        if self.redis is None or self._listener is not None:
+            return
+        try:
+            await self._subscribe()
+        except Exception as e:
+            logger.error(f"Revocation list not mirrored from Redis yet, retrying: {e}")
+        else:
+            logger.info(
+                f"Revocation list mirrored from Redis (generation {self._generation()})"
+            )
+        self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            # Let the listener finish its read; a pub/sub connection
+            # cancelled mid-read does not unsubscribe cleanly
+            self._stopping = True
+            await asyncio.wait({self._listener}, timeout=2 * self.poll_seconds)
+            self._listener.cancel()
+            self._listener = None
+            self._stopping = False
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(self.channel)
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.debug(f"Failed to close revocation subscription: {e}")
+            self._pubsub = None
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """Revoke a token id until ``expires_at``."""
+        ttl = math.ceil(expires_at - time.time())
+        if ttl <= 0:
+            return
+        generation = self._generation()
+        self._add(generation, jti, expires_at)
+        if self.redis is None:
+            return
+        key = self._filter_key(generation)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for position in self._filter(generation).positions(jti):
+                pipe.setbit(key, position, 1)
+            pipe.expire(key, 2 * self.generation_seconds)
+            pipe.set(f"{self.prefix}:{jti}", 1, ex=ttl)
+            pipe.publish(self.channel, f"{generation}:{expires_at}:{jti}")
+            await pipe.execute()
+
+    def might_be_revoked(self, jti: str | None) -> bool:
+        """Bloom filter check only; False means certainly not revoked."""
+        if not jti:
+            return False
+        current = self._generation()
+        return any(
+            jti in self._filters[generation]
+            for generation in (current - 1, current)
+            if generation in self._filters
+        )
+
+    def is_revoked(self, jti: str | None) -> bool:
+        """Check without I/O.
+
+        A filter hit this process cannot confirm counts as revoked, so this
+        may reject a valid token at the filter's error rate.
+        """
+        if not self.might_be_revoked(jti):
+            return False
+        expires_at = self._known.get(jti)
+        if expires_at is not None:
+            return expires_at > time.time()
+        return self.redis is not None
+
+    async def is_revoked_async(self, jti: str | None) -> bool:
+        """Check, confirming filter hits against Redis."""
+        if not self.might_be_revoked(jti):
+            return False
+        expires_at = self._known.get(jti)
+        if expires_at is not None:
+            return expires_at > time.time()
+        if self.redis is None:
+            return False
+        return bool(await self.redis.exists(f"{self.prefix}:{jti}"))
+
+    async def _listen(self) -> None:
+        while not self._stopping:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.poll_seconds
+                )
+                if message is None:
+                    continue
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode()
+                generation, expires_at, jti = data.split(":", 2)
+                self._add(int(generation), jti, float(expires_at))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to apply token revocation: {e}")
+                await asyncio.sleep(self.poll_seconds)
+                await self._resync()
+
+    async def _subscribe(self) -> None:
+        # Subscribe first, so no revocation published during the load is missed
+        self._pubsub = self.redis.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        current = self._generation()
+        for generation in (current - 1, current):
+            bits = await self.redis.get(self._filter_key(generation))
+            loaded = RevocationBloomFilter(self.capacity, self.error_rate, bits)
+            known = self._filters.get(generation)
+            if known is not None:
+                # Keep what this process added, e.g. while Redis was down
+                merged = int.from_bytes(loaded.bits, "big") | int.from_bytes(
+                    known.bits, "big"
+                )
+                loaded.bits = bytearray(merged.to_bytes(len(loaded.bits), "big"))
+            self._filters[generation] = loaded
+
+    async def _resync(self) -> None:
+        """Resubscribe and reload the filters after a listener error.
+
+        Revocations published while the subscription was broken never reach
+        this process, but their bits are in the filters in Redis.
+        """
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.debug(f"Failed to close broken revocation subscription: {e}")
+        try:
+            await self._subscribe()
+            logger.info("Revocation list resynchronized from Redis")
+        except Exception as e:
+            logger.error(f"Failed to resynchronize revocation list: {e}")
+
+    def _add(self, generation: int, jti: str, expires_at: float) -> None:
+        self._filter(generation).add(jti)
+        now = time.time()
+        self._known[jti] = expires_at
+        if len(self._known) % 1024 == 0:
+            self._known = {k: v for k, v in self._known.items() if v > now}
+
+    def _filter(self, generation: int) -> RevocationBloomFilter:
+        bloom = self._filters.get(generation)
+        if bloom is None:
+            bloom = self._filters[generation] = RevocationBloomFilter(
+                self.capacity, self.error_rate
+            )
+            for old in [g for g in self._filters if g < generation - 1]:
+                del self._filters[old]
+        return bloom
+
+    def _generation(self) -> int:
+        return int(time.time() // self.generation_seconds)
+
+    def _filter_key(self, generation: int) -> str:
+        return f"{self.prefix}:bloom:{generation}"
+
+
+@lru_cache
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """Verified-token cache shared by the token services of this process."""
+    return VerifiedTokenCache()
+
+
+@lru_cache
+def get_revocation_list() -> RevocationList:
+    """Revocation list of this process; ``start`` connects it to Redis."""
+    return RevocationList()
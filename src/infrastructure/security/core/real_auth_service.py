@@ -1,8 +1,9 @@
 """Production Authentication Service - Real database-backed authentication."""
 
+import hashlib
+import uuid
 from datetime import datetime, timedelta
 
-import bcrypt
 import jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +11,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.models.user import User
 from src.infrastructure.config import get_settings
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.performance.batch_loader import request_loader
+from src.infrastructure.security.auth.token_verification import (
+    TOKEN_VERIFICATIONS,
+    get_revocation_list,
+    get_verified_token_cache,
+)
+from src.infrastructure.security.password_hasher import (
+    HashingPoolSaturatedError,
+    PasswordHasher,
+)
 
 logger = get_logger(__name__, component="auth")
 
@@ -25,18 +36,16 @@ class ProductionAuthService:
         self.secret_key = self.settings.SECRET_KEY
         self.algorithm = "HS256"
         self.access_token_expire_minutes = 30
+        # Hashes in a process pool, so logins do not block the event loop
+        self.password_hasher = PasswordHasher()
+        # Verified tokens are cached until they expire; revocation is checked on every call
+        self.token_cache = get_verified_token_cache()
+        self.revocations = get_revocation_list()
+        self._cache_namespace = hashlib.sha256(
+            f"{self.algorithm}:{self.secret_key}".encode()
+        ).hexdigest()
         logger.info("Production authentication service initialized")
 
-    def _hash_password(self, password: str) -> str:
-        """Hash password using bcrypt."""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
-
-    def _verify_password(self, password: str, hashed_password: str) -> bool:
-        """Verify password against hash."""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-
     async def authenticate_user(
         self,
         email: str,
@@ -58,10 +67,15 @@ class ProductionAuthService:
                 logger.warning(f"Authentication failed: User not found for email {email}")
                 return None
 
-            # Verify password
-            if not self._verify_password(password, user.password_hash):
+            # Verify password, rehashing it if the configured cost changed
+            password_valid, new_hash = await self.password_hasher.verify_and_update(
+                password, user.password_hash
+            )
+            if not password_valid:
                 logger.warning(f"Authentication failed: Invalid password for email {email}")
                 return None
+            if new_hash:
+                user.password_hash = new_hash
 
             # Check if user is active
             if not user.is_active:
@@ -85,6 +99,8 @@ class ProductionAuthService:
                 "last_login": user.last_login.isoformat() if user.last_login else None
             }
 
+        except HashingPoolSaturatedError:
+            raise
         except Exception as e:
             logger.error(f"Authentication error for email {email}: {e}")
             return None
@@ -100,7 +116,8 @@ class ProductionAuthService:
                 "role": user_data.get("role", "user"),
                 "exp": expire,
                 "iat": datetime.utcnow(),
-                "iss": "ai-teddy-auth"
+                "iss": "ai-teddy-auth",
+                "jti": uuid.uuid4().hex
             }
 
             token = jwt.encode(token_data, self.secret_key, algorithm=self.algorithm)
@@ -112,9 +129,18 @@ class ProductionAuthService:
             raise
 
     async def verify_token(self, token: str) -> dict | None:
-        """Verify JWT token and return user data."""
+        """Verify JWT token and return user data.
+
+        The signature of a token is checked once, then it is served from
+        the verified-token cache until it expires. The user is re-checked on
+        every call, in one query for all tokens verified during the request.
+        """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = self.token_cache.get(token, self._cache_namespace)
+            path = "cache"
+            if payload is None:
+                payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+                path = "full"
 
             # Extract user information
             user_id = payload.get("user_id")
@@ -124,16 +150,23 @@ class ProductionAuthService:
                 logger.warning("Token verification failed: Missing user information")
                 return None
 
+            if await self.revocations.is_revoked_async(payload.get("jti")):
+                TOKEN_VERIFICATIONS.labels(path="revoked").inc()
+                self.token_cache.discard(token, self._cache_namespace)
+                logger.warning(f"Token verification failed: Token of {email} revoked")
+                return None
+
             # Optionally verify user still exists and is active
             if self.database_session:
-                stmt = select(User).where(User.id == user_id)
-                result = await self.database_session.execute(stmt)
-                user = result.scalar_one_or_none()
+                user = await request_loader(self._load_users, name="auth_users").load(user_id)
 
                 if not user or not user.is_active:
                     logger.warning(f"Token verification failed: User {email} not found or inactive")
                     return None
 
+            if path == "full":
+                self.token_cache.put(token, payload, self._cache_namespace)
+            TOKEN_VERIFICATIONS.labels(path=path).inc()
             return {
                 "user_id": user_id,
                 "email": email,
@@ -142,15 +175,23 @@ class ProductionAuthService:
             }
 
         except jwt.ExpiredSignatureError:
+            TOKEN_VERIFICATIONS.labels(path="invalid").inc()
             logger.warning("Token verification failed: Token expired")
             return None
         except jwt.InvalidTokenError as e:
+            TOKEN_VERIFICATIONS.labels(path="invalid").inc()
             logger.warning(f"Token verification failed: Invalid token - {e}")
             return None
         except Exception as e:
             logger.error(f"Token verification error: {e}")
             return None
 
+    async def _load_users(self, user_ids: list[str]) -> dict[str, User]:
+        """Users by ID, in one query."""
+        stmt = select(User).where(User.id.in_(user_ids))
+        result = await self.database_session.execute(stmt)
+        return {str(user.id): user for user in result.scalars().all()}
+
     async def create_user(
         self,
         email: str,
@@ -174,7 +215,7 @@ class ProductionAuthService:
                 return None
 
             # Hash password
-            password_hash = self._hash_password(password)
+            password_hash = await self.password_hasher.hash_password_async(password)
 
             # Create new user
             new_user = User(
@@ -212,7 +253,11 @@ class ProductionAuthService:
         old_password: str,
         new_password: str
     ) -> bool:
-        """Change user password with verification."""
+        """Change user password with verification.
+
+        Raises:
+            HashingPoolSaturatedError: If the hashing pool is full; retry later
+        """
         try:
             if not self.database_session:
                 logger.error("Database session not available for password change")
@@ -228,18 +273,24 @@ class ProductionAuthService:
                 return False
 
             # Verify old password
-            if not self._verify_password(old_password, user.password_hash):
+            if not await self.password_hasher.verify_password_async(
+                old_password, user.password_hash
+            ):
                 logger.warning(f"Password change failed: Invalid old password for user {user_id}")
                 return False
 
             # Update password
-            user.password_hash = self._hash_password(new_password)
+            user.password_hash = await self.password_hasher.hash_password_async(
+                new_password
+            )
             user.password_changed_at = datetime.utcnow()
             await self.database_session.commit()
 
             logger.info(f"Password changed successfully for user {user_id}")
             return True
 
+        except HashingPoolSaturatedError:
+            raise
         except Exception as e:
             logger.error(f"Password change error for user {user_id}: {e}")
             await self.database_session.rollback()
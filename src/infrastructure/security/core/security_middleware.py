@@ -16,6 +16,8 @@ import redis.asyncio as redis
 from redis.asyncio import Redis
 from redis import StrictRedis
 
+from src.infrastructure.security.rate_limiter.atomic import AtomicRateLimiter
+
 # REAL Redis - NO MOCKS
 redis_client = StrictRedis(
     host=os.getenv('REDIS_HOST', 'localhost'),
@@ -157,6 +159,8 @@ class RedisRateLimiter(RateLimiter):
         # PRODUCTION: Always use real Redis - NO MOCKS
         self.redis_client = redis_client or get_redis_client()
         self.config = config or SecurityConfig()
+        # One atomic EVALSHA per check instead of four separate commands
+        self.limiter = AtomicRateLimiter(self.redis_client)
 
     async def _get_redis(self):
         """Get Redis connection"""
@@ -164,42 +168,21 @@ class RedisRateLimiter(RateLimiter):
 
     async def is_allowed(self, identifier: str) -> bool:
         """Redis-based rate limiting"""
-        redis_client = await self._get_redis()
-        key = f"rate_limit:{identifier}"
-        now = int(time.time())
-        window = 60  # 1 minute window
-
-        # Remove old timestamps
-        await redis_client.zremrangebyscore(key, 0, now - window)
-
-        # Get current request count
-        current_requests = await redis_client.zcard(key)
-
-        if current_requests >= self.config.requests_per_minute:
-            return False
-
-        # Add current request
-        await redis_client.zadd(key, {now: now})
-        await redis_client.expire(key, window)
-
-        return True
+        result = await self.limiter.sliding_window_log(
+            f"rate_limit:{identifier}",
+            self.config.requests_per_minute,
+            60,  # 1 minute window
+        )
+        return result.allowed
 
     async def child_safe_limit(self, child_id: str) -> bool:
         """Child-specific rate limiting"""
-        redis_client = await self._get_redis()
-        key = f"child_rate_limit:{child_id}"
-        now = int(time.time())
-        window = 60
-
-        await redis_client.zremrangebyscore(key, 0, now - window)
-        current_requests = await redis_client.zcard(key)
-
-        if current_requests >= self.config.child_requests_per_minute:
-            return False
-
-        await redis_client.zadd(key, {now: now})
-        await redis_client.expire(key, window)
-        return True
+        result = await self.limiter.sliding_window_log(
+            f"child_rate_limit:{child_id}",
+            self.config.child_requests_per_minute,
+            60,
+        )
+        return result.allowed
 
     async def record_suspicious_activity(self, ip: str, activity: str) -> None:
         """Record suspicious activity in Redis"""
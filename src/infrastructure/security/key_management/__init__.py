@@ -11,6 +11,11 @@ from src.infrastructure.security.key_management.key_lifecycle_manager import (
 from src.infrastructure.security.key_management.key_rotation_orchestrator import (
     KeyRotationOrchestrator,
 )
+from src.infrastructure.security.key_management.reencryption_job import (
+    FileCheckpointStore,
+    ReencryptionBudget,
+    ReencryptionJob,
+)
 from src.infrastructure.security.key_management.rotation_executor import (
     RotationExecutor,
 )
@@ -22,9 +27,12 @@ from src.infrastructure.security.key_management.rotation_statistics import (
 )
 
 __all__ = [
+    "FileCheckpointStore",
     "KeyGenerator",
     "KeyLifecycleManager",
     "KeyRotationOrchestrator",
+    "ReencryptionBudget",
+    "ReencryptionJob",
     "RotationExecutor",
     "RotationPolicyManager",
     "RotationStatistics",
@@ -11,6 +11,11 @@ from src.infrastructure.security.key_management.key_generator import (
 from src.infrastructure.security.key_management.key_lifecycle_manager import (
     KeyLifecycleManager,
 )
+from src.infrastructure.security.key_management.reencryption_job import (
+    FileCheckpointStore,
+    ReencryptionJob,
+    ReencryptionTarget,
+)
 from src.infrastructure.security.key_management.rotation_executor import (
     RotationExecutor,
 )
@@ -89,6 +94,42 @@ class KeyRotationOrchestrator:
         """
         return self.executor.rotate_key(key_id, trigger)
 
+    def reencryption_job(
+        self,
+        result: RotationResult,
+        target: ReencryptionTarget,
+        checkpoints: FileCheckpointStore,
+        **options: Any,
+    ) -> ReencryptionJob:
+        """Job moving the data of ``target`` from the rotated key to its successor.
+
+        Args:
+            result: Successful result of rotate_key
+            target: Store encrypted with the rotated key
+            checkpoints: Where the job saves its progress
+            **options: Batch size, budget and workers of the job
+        Returns:
+            ReencryptionJob to run in the background
+
+        """
+        if not result.success:
+            raise ValueError(f"Rotation of {result.old_key_id} did not succeed")
+        keys = [
+            self.storage.retrieve_key(key_id)
+            for key_id in (result.new_key_id, result.old_key_id)
+        ]
+        if not all(keys):
+            raise ValueError("Rotated keys not found in key storage")
+        (new_key, _), (old_key, _) = keys
+        return ReencryptionJob(
+            target,
+            new_key,
+            [old_key],
+            checkpoints,
+            job_id=f"{target.name}:{result.new_key_id}",
+            **options,
+        )
+
     def rotate_all_keys(self, key_type: KeyType | None = None) -> list[RotationResult]:
         """Rotate all keys of specified type.
 
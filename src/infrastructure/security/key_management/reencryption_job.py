@@ -0,0 +1,387 @@
+"""Online re-encryption of stored data after a key rotation.
+
+Rotating a key only changes what new writes are encrypted with; every row
+written before still needs the old key. A ReencryptionJob moves those rows
+to the new key while the application keeps serving them:
+
+- rows are streamed in primary-key order, one batch at a time, so each
+  batch is an index range scan and a short write transaction
+- tokens are decrypted with the old keys and encrypted with the new one in
+  worker processes, away from the event loop
+- each row is only replaced if it still holds the ciphertext that was read,
+  so a concurrent write of the application is never overwritten
+- after each committed batch the last key is checkpointed, so a stopped or
+  crashed job resumes where it left off
+- a ReencryptionBudget caps rows per second and the share of time the job
+  is busy, and can be changed while the job runs
+
+The store being migrated must persist the new key and decrypt with both
+keys until the job is done and every reader has loaded the new key, e.g.
+``ConversationSQLiteRepository.use_encryption_keys``.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Protocol
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+from prometheus_client import Counter, Gauge
+
+from src.infrastructure.logging_config import get_logger
+
+logger = get_logger(__name__, component="security")
+
+REENCRYPTION_ROWS = Counter(
+    "key_reencryption_rows_total",
+    "Rows handled by re-encryption jobs, by outcome",
+    ["target", "outcome"],
+)
+REENCRYPTION_REMAINING = Gauge(
+    "key_reencryption_rows_remaining",
+    "Estimated rows left for a re-encryption job",
+    ["target"],
+)
+
+Ciphertexts = tuple[bytes | None, ...]
+
+
+class ReencryptionTarget(Protocol):
+    """Store whose encrypted columns a ReencryptionJob migrates."""
+
+    name: str
+
+    async def count_ciphertexts(self) -> int:
+        """Number of rows, for progress reporting."""
+        ...
+
+    async def fetch_ciphertexts(
+        self, after: Any, limit: int
+    ) -> list[tuple[Any, Ciphertexts]]:
+        """Up to ``limit`` rows with a key above ``after`` (None: from the start),
+        in key order, as (key, encrypted columns)."""
+        ...
+
+    async def replace_ciphertexts(
+        self, rows: list[tuple[Any, Ciphertexts, Ciphertexts]]
+    ) -> int:
+        """Store (key, old columns, new columns) in one transaction.
+
+        A row is only updated if it still holds the old columns. Returns the
+        number of rows updated.
+        """
+        ...
+
+
+@dataclass
+class ReencryptionBudget:
+    """Resource budget of a re-encryption job.
+
+    Attributes:
+        rows_per_second: Most rows read and rewritten per second; None for
+            no limit
+        max_busy_fraction: Share of wall time the job may spend working;
+            it pauses between batches for the rest
+    """
+
+    rows_per_second: float | None = 2000.0
+    max_busy_fraction: float = 0.5
+
+    def pause(self, rows: int, busy_seconds: float) -> float:
+        """Seconds to wait after a batch of ``rows`` that took ``busy_seconds``."""
+        pause = busy_seconds * (1 / self.max_busy_fraction - 1)
+        if self.rows_per_second:
+            pause = max(pause, rows / self.rows_per_second - busy_seconds)
+        return max(pause, 0.0)
+
+
+@dataclass
+class ReencryptionCheckpoint:
+    """Progress of a job, saved after each committed batch."""
+
+    job_id: str
+    target: str
+    last_key: Any = None
+    total: int = 0
+    processed: int = 0
+    rewritten: int = 0
+    current: int = 0
+    conflicts: int = 0
+    failed: int = 0
+    started_at: str | None = None
+    updated_at: str | None = None
+    finished_at: str | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+
+class FileCheckpointStore:
+    """Checkpoints as JSON files, replaced atomically on each save."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def load(self, job_id: str) -> ReencryptionCheckpoint | None:
+        path = self._path(job_id)
+        if not path.exists():
+            return None
+        return ReencryptionCheckpoint(**json.loads(path.read_text()))
+
+    def save(self, checkpoint: ReencryptionCheckpoint) -> None:
+        path = self._path(checkpoint.job_id)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(asdict(checkpoint)))
+        os.replace(temporary, path)
+
+    def _path(self, job_id: str) -> Path:
+        name = base64.urlsafe_b64encode(job_id.encode()).decode()
+        return self.directory / f"{name}.json"
+
+
+def fernet_key(key: bytes) -> bytes:
+    """Fernet key of ``key``; raw 32-byte keys from key storage are encoded."""
+    return base64.urlsafe_b64encode(key) if len(key) == 32 else key
+
+
+@lru_cache(maxsize=8)
+def _ciphers(new_key: bytes, old_keys: tuple[bytes, ...]) -> tuple[Fernet, MultiFernet]:
+    """Cipher of the new key, and one rotating from any old key to it."""
+    current = Fernet(new_key)
+    return current, MultiFernet([current, *(Fernet(key) for key in old_keys)])
+
+
+def reencrypt_rows(
+    rows: list[tuple[Any, Ciphertexts]],
+    new_key: bytes,
+    old_keys: tuple[bytes, ...],
+) -> list[tuple[Any, Ciphertexts | None]]:
+    """Columns of each row under the new key; None for rows no key decrypts.
+
+    Runs in the worker processes. Tokens already under the new key are
+    recognized by their signature alone and returned unchanged.
+    """
+    current, rotation = _ciphers(new_key, old_keys)
+    results = []
+    for key, values in rows:
+        try:
+            results.append(
+                (key, tuple(_reencrypt(value, current, rotation) for value in values))
+            )
+        except InvalidToken:
+            results.append((key, None))
+    return results
+
+
+def _reencrypt(value: bytes | None, current: Fernet, rotation: MultiFernet) -> bytes | None:
+    if value is None:
+        return None
+    try:
+        current.extract_timestamp(value)
+        return value
+    except InvalidToken:
+        return rotation.rotate(value)
+
+
+class ReencryptionJob:
+    """Moves the ciphertexts of a target from old keys to a new key.
+
+    Example:
+        ```python
+        repository.use_encryption_keys(new_key, previous=[old_key])
+        job = ReencryptionJob(
+            repository, new_key, [old_key], FileCheckpointStore("checkpoints")
+        )
+        checkpoint = await job.run()
+        repository.use_encryption_keys(new_key)
+        ```
+    """
+
+    def __init__(
+        self,
+        target: ReencryptionTarget,
+        new_key: bytes,
+        old_keys: Sequence[bytes],
+        checkpoints: FileCheckpointStore,
+        *,
+        job_id: str | None = None,
+        batch_size: int = 1000,
+        budget: ReencryptionBudget | None = None,
+        workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the job.
+
+        Args:
+            target: Store to migrate
+            new_key: Fernet key to encrypt with
+            old_keys: Fernet keys the stored data may be encrypted with
+            checkpoints: Where progress is saved and resumed from
+            job_id: Names the checkpoint; defaults to the target and new key
+            batch_size: Rows per read, process-pool round and transaction
+            budget: Throughput and busy-time limits
+            workers: Worker processes; defaults to the number of CPUs
+            executor: Runs reencrypt_rows; replaces the process pool
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.target = target
+        self.new_key = fernet_key(new_key)
+        self.old_keys = tuple(fernet_key(key) for key in old_keys)
+        self.checkpoints = checkpoints
+        # A fingerprint, never the key itself, ends up in the checkpoint
+        self.job_id = job_id or (
+            f"{target.name}:{hashlib.sha256(self.new_key).hexdigest()[:16]}"
+        )
+        self.batch_size = batch_size
+        self.budget = budget or ReencryptionBudget()
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._stopping = asyncio.Event()
+        self.checkpoint: ReencryptionCheckpoint | None = None
+
+    async def run(self) -> ReencryptionCheckpoint:
+        """Run until every row is migrated or ``stop`` is called.
+
+        Returns:
+            The final checkpoint; ``done`` tells whether the job finished
+        """
+        checkpoint = self.checkpoints.load(self.job_id)
+        if checkpoint is None:
+            checkpoint = ReencryptionCheckpoint(
+                job_id=self.job_id,
+                target=self.target.name,
+                total=await self.target.count_ciphertexts(),
+                started_at=datetime.utcnow().isoformat(),
+            )
+        self.checkpoint = checkpoint
+        if checkpoint.done:
+            return checkpoint
+        logger.info(
+            f"Re-encrypting {self.target.name} from key {checkpoint.last_key!r} "
+            f"({checkpoint.processed}/{checkpoint.total} rows done)"
+        )
+        try:
+            while not self._stopping.is_set():
+                started = time.perf_counter()
+                rows = await self.target.fetch_ciphertexts(
+                    checkpoint.last_key, self.batch_size
+                )
+                if not rows:
+                    checkpoint.finished_at = datetime.utcnow().isoformat()
+                    self._save(checkpoint)
+                    break
+                await self._migrate(rows, checkpoint)
+                pause = self.budget.pause(len(rows), time.perf_counter() - started)
+                if pause:
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), pause)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            self._shutdown_executor()
+        logger.info(
+            f"Re-encryption of {self.target.name} "
+            f"{'finished' if checkpoint.done else 'stopped'}: {self.progress()}"
+        )
+        return checkpoint
+
+    def stop(self) -> None:
+        """Stop after the current batch; ``run`` resumes from there later."""
+        self._stopping.set()
+
+    def progress(self) -> dict[str, Any]:
+        """Counts of the rows handled so far."""
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return {"job_id": self.job_id, "started": False}
+        return {
+            "job_id": self.job_id,
+            "target": checkpoint.target,
+            "total": checkpoint.total,
+            "processed": checkpoint.processed,
+            "rewritten": checkpoint.rewritten,
+            "current": checkpoint.current,
+            "conflicts": checkpoint.conflicts,
+            "failed": checkpoint.failed,
+            "percent": round(
+                100 * checkpoint.processed / checkpoint.total if checkpoint.total else 100.0,
+                2,
+            ),
+            "done": checkpoint.done,
+        }
+
+    async def _migrate(
+        self, rows: list[tuple[Any, Ciphertexts]], checkpoint: ReencryptionCheckpoint
+    ) -> None:
+        """Re-encrypt one batch, store it and checkpoint past it."""
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(rows) // self.workers)
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._get_executor(),
+                    reencrypt_rows,
+                    rows[start : start + chunk_size],
+                    self.new_key,
+                    self.old_keys,
+                )
+                for start in range(0, len(rows), chunk_size)
+            )
+        )
+        old_values = dict(rows)
+        changed, failed, current = [], 0, 0
+        for key, new in (result for chunk in chunks for result in chunk):
+            if new is None:
+                failed += 1
+                logger.warning(f"No key decrypts row {key!r} of {self.target.name}")
+            elif new == old_values[key]:
+                current += 1
+            else:
+                changed.append((key, old_values[key], new))
+        rewritten = await self.target.replace_ciphertexts(changed) if changed else 0
+
+        checkpoint.last_key = rows[-1][0]
+        checkpoint.processed += len(rows)
+        checkpoint.rewritten += rewritten
+        checkpoint.current += current
+        checkpoint.conflicts += len(changed) - rewritten
+        checkpoint.failed += failed
+        self._save(checkpoint)
+
+        name = self.target.name
+        REENCRYPTION_ROWS.labels(target=name, outcome="rewritten").inc(rewritten)
+        REENCRYPTION_ROWS.labels(target=name, outcome="current").inc(current)
+        REENCRYPTION_ROWS.labels(target=name, outcome="conflict").inc(
+            len(changed) - rewritten
+        )
+        REENCRYPTION_ROWS.labels(target=name, outcome="failed").inc(failed)
+        REENCRYPTION_REMAINING.labels(target=name).set(
+            max(checkpoint.total - checkpoint.processed, 0)
+        )
+
+    def _save(self, checkpoint: ReencryptionCheckpoint) -> None:
+        checkpoint.updated_at = datetime.utcnow().isoformat()
+        self.checkpoints.save(checkpoint)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _shutdown_executor(self) -> None:
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
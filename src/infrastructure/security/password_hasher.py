@@ -1,20 +1,171 @@
-"""Production Password Hasher - REAL IMPLEMENTATION"""
+"""Production Password Hasher - REAL IMPLEMENTATION
 
-import bcrypt
+bcrypt at cost 12 takes about 250ms of CPU. The async API runs it in a
+bounded process pool so logins never stall the event loop, and rejects new
+work with HashingPoolSaturatedError once too many hashes are queued, rather
+than letting a burst of logins queue up unboundedly.
+"""
+
+import asyncio
+import os
 import secrets
-from typing import Optional
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import bcrypt
+from prometheus_client import Counter, Gauge
 
 from src.infrastructure.logging_config import get_logger
 
 logger = get_logger(__name__, component="security")
 
+PASSWORD_HASH_TASKS = Counter(
+    "password_hash_pool_tasks_total",
+    "Password hashing pool tasks by operation and outcome",
+    ["operation", "outcome"],
+)
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pool_pending",
+    "Password hashes queued or running in the hashing pool",
+)
+
+
+class HashingPoolSaturatedError(RuntimeError):
+    """Raised when the hashing pool queue is full; the caller should retry later."""
+
+
+def _hashpw(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _checkpw(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
+
+
+def bcrypt_cost(hashed_password: str) -> int | None:
+    """Cost factor of a bcrypt hash such as ``$2b$12$...``, None if not one."""
+    parts = hashed_password.split("$")
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHashingPool:
+    """Runs bcrypt in worker processes with a bounded queue.
+
+    At most ``max_pending`` hashes are queued or running at once; further
+    calls fail fast with HashingPoolSaturatedError, which login handlers turn
+    into 503 responses instead of piling up requests until they time out.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_pending: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            workers: Worker processes; one per CPU by default
+            max_pending: Most hashes queued or running; 8 per worker by default
+            executor: Executor to run hashes in instead of an own process pool
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 8
+        self.pending = 0
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor:
+        # Started on first use, so importing the module does not fork
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    async def run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(*args)`` in the pool.
+
+        Raises:
+            HashingPoolSaturatedError: If max_pending hashes are already queued
+        """
+        if self.pending >= self.max_pending:
+            PASSWORD_HASH_TASKS.labels(operation=operation, outcome="rejected").inc()
+            raise HashingPoolSaturatedError(
+                f"{self.pending} password hashes already queued",
+            )
+        self.pending += 1
+        PASSWORD_HASH_PENDING.inc()
+        loop = asyncio.get_running_loop()
+        try:
+            executor = self.executor
+            try:
+                result = await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                if not self._owns_executor:
+                    raise
+                self._discard_broken(executor)
+                result = await loop.run_in_executor(self.executor, func, *args)
+        except Exception:
+            PASSWORD_HASH_TASKS.labels(operation=operation, outcome="error").inc()
+            raise
+        finally:
+            self.pending -= 1
+            PASSWORD_HASH_PENDING.dec()
+        PASSWORD_HASH_TASKS.labels(operation=operation, outcome="ok").inc()
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _discard_broken(self, executor: Executor) -> None:
+        """Drop a broken pool, so the next task starts a fresh one.
+
+        Every task queued on the broken pool fails with BrokenProcessPool;
+        only the first to get here replaces it.
+        """
+        with self._executor_lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        # A worker died (OOM kill, for example)
+        logger.warning("Password hashing pool broken; restarting it")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
+def get_password_hashing_pool() -> PasswordHashingPool:
+    """Get the process-wide password hashing pool."""
+    settings = get_settings()
+    security = getattr(settings, "security", None)
+    return PasswordHashingPool(
+        workers=getattr(security, "PASSWORD_HASH_WORKERS", None),
+        max_pending=getattr(security, "PASSWORD_HASH_MAX_PENDING", None),
+    )
+
 
 class PasswordHasher:
     """Production-ready password hasher using bcrypt with proper security measures."""
 
-    def __init__(self, settings=None):
-        """Initialize password hasher with security settings."""
+    def __init__(self, settings=None, pool: PasswordHashingPool | None = None):
+        """Initialize password hasher with security settings.
+
+        Args:
+            settings: Settings with a ``security`` section
+            pool: Pool of the async API; the process-wide pool by default
+        """
         self.settings = settings or self._get_default_settings()
+        self._pool = pool
+        self._dummy_hash: bytes | None = None
 
         # Try to get settings from security config
         if hasattr(self.settings, 'security'):
@@ -62,14 +213,7 @@ class PasswordHasher:
         Raises:
             ValueError: If password is too short, empty, or None
         """
-        if password is None:
-            raise ValueError("Password does not meet security requirements")
-
-        if not password or len(password.strip()) == 0:
-            raise ValueError("Password does not meet security requirements")
-
-        if len(password) < self.min_length:
-            raise ValueError("Password does not meet security requirements")
+        self._check_policy(password)
 
         try:
             # Generate salt and hash password
@@ -125,6 +269,119 @@ class PasswordHasher:
             self.hash_password("a" * self.password_min_length)
             return False
 
+    @property
+    def pool(self) -> PasswordHashingPool:
+        return self._pool or get_password_hashing_pool()
+
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password in the hashing pool, off the event loop.
+
+        Raises:
+            ValueError: If password is too short, empty, or None
+            HashingPoolSaturatedError: If the hashing pool is full
+        """
+        self._check_policy(password)
+        hashed = await self.pool.run(
+            "hash", _hashpw, password.encode("utf-8"), self.hash_rounds
+        )
+        logger.debug("Password hashed successfully")
+        return hashed.decode("utf-8")
+
+    async def verify_password_async(
+        self, password: str | None, hashed_password: str | None
+    ) -> bool:
+        """Verify a password against its hash in the hashing pool.
+
+        Without a password or hash, a check against a dummy hash still runs,
+        so unknown accounts take as long as wrong passwords.
+
+        Raises:
+            HashingPoolSaturatedError: If the hashing pool is full
+        """
+        if not password or not hashed_password:
+            logger.debug("Verification attempted with empty password or hash")
+            await self.pool.run(
+                "verify",
+                _checkpw,
+                (password or "").encode("utf-8"),
+                await self._get_dummy_hash(),
+            )
+            return False
+
+        try:
+            result = await self.pool.run(
+                "verify",
+                _checkpw,
+                password.encode("utf-8"),
+                hashed_password.encode("utf-8"),
+            )
+        except HashingPoolSaturatedError:
+            raise
+        except Exception as e:
+            logger.exception(f"Password verification error: {e}")
+            return False
+
+        logger.debug(f"Password verification {'successful' if result else 'failed'}")
+        return result
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether a hash was made at another cost than the configured one."""
+        cost = bcrypt_cost(hashed_password)
+        return cost is not None and cost != self.hash_rounds
+
+    async def verify_and_update(
+        self, password: str | None, hashed_password: str | None
+    ) -> tuple[bool, str | None]:
+        """Verify a password and rehash it if the configured cost changed.
+
+        Call on login, where the plain password is at hand, and store the
+        new hash when one is returned.
+
+        Returns:
+            (whether the password matches, new hash or None)
+
+        Raises:
+            HashingPoolSaturatedError: If the hashing pool is full
+        """
+        if not await self.verify_password_async(password, hashed_password):
+            return False, None
+        if not self.needs_rehash(hashed_password):
+            return True, None
+
+        try:
+            # No policy check: the password was accepted when it was set
+            new_hash = await self.pool.run(
+                "rehash", _hashpw, password.encode("utf-8"), self.hash_rounds
+            )
+        except HashingPoolSaturatedError:
+            # The login succeeded; rehash on a later one
+            return True, None
+        logger.info(
+            f"Rehashed password from cost {bcrypt_cost(hashed_password)} "
+            f"to {self.hash_rounds}"
+        )
+        return True, new_hash.decode("utf-8")
+
+    async def _get_dummy_hash(self) -> bytes:
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.pool.run(
+                "hash",
+                _hashpw,
+                secrets.token_hex(16).encode("ascii"),
+                self.hash_rounds,
+            )
+        return self._dummy_hash
+
+    def _check_policy(self, password: str | None) -> None:
+        if password is None:
+            raise ValueError("Password does not meet security requirements")
+
+        if not password or len(password.strip()) == 0:
+            raise ValueError("Password does not meet security requirements")
+
+        if len(password) < self.min_length:
+            raise ValueError("Password does not meet security requirements")
+
     def generate_secure_password(self, length: int = 16) -> str:
         """Generate a cryptographically secure random password.
 
@@ -1,12 +1,15 @@
 """Modular rate limiting system for AI Teddy Bear backend.
 
 This package provides a comprehensive rate limiting solution with:
-- Multiple rate limiting strategies (fixed window, sliding window, token bucket)
+- Multiple rate limiting strategies (fixed window, sliding window log and
+  counter, token bucket, GCRA)
+- Atomic Redis-side checks (one Lua script call per check)
 - Child safety specific configurations
 - Redis-backed persistence with local fallback
 - Comprehensive audit logging
 """
 
+from .atomic import AtomicRateLimiter
 from .convenience import (
     check_api_rate_limit,
     check_auth_rate_limit,
@@ -22,6 +25,7 @@ from .core import (
 from .service import ComprehensiveRateLimiter, get_rate_limiter
 
 __all__ = [
+    "AtomicRateLimiter",
     "ComprehensiveRateLimiter",
     "RateLimitConfig",
     "RateLimitResult",
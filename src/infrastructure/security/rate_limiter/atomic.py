@@ -0,0 +1,373 @@
+"""Atomic Redis-side rate limiting with Lua scripts.
+
+Each check is a single ``EVALSHA`` that reads, updates and expires the
+limiter state inside Redis, so concurrent workers cannot lose updates and a
+check costs one round-trip whatever the traffic of the key. Scripts are
+loaded once per client and re-sent automatically if Redis restarts.
+
+All scripts share the same contract:
+
+- ``KEYS[1]`` is the limiter state, ``KEYS[2]`` the block marker of the key.
+- ``ARGV[1]`` is the current time in seconds, or empty to use the Redis
+  server clock so every worker agrees on it; ``ARGV[2]`` is how long to
+  block the key after a denial, in milliseconds (0 disables blocking).
+- The reply is ``{allowed, remaining, reset_ms, retry_after_ms, block}``
+  where ``block`` is 0, ``BLOCKED`` or ``NEWLY_BLOCKED``.
+"""
+
+import math
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from src.infrastructure.logging_config import get_logger
+
+from .core import RateLimitConfig, RateLimitResult, RateLimitStrategy
+
+logger = get_logger(__name__, component="security")
+
+BLOCKED = 1
+NEWLY_BLOCKED = 2
+
+_PREAMBLE = """
+local now = tonumber(ARGV[1])
+if not now then
+  local t = redis.call('TIME')
+  now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+end
+local now_ms = math.ceil(now * 1000)
+local block_ms = tonumber(ARGV[2])
+local blocked_ms = redis.call('PTTL', KEYS[2])
+if blocked_ms > 0 then
+  return {0, 0, now_ms + blocked_ms, blocked_ms, 1}
+end
+local function deny(reset, retry)
+  if block_ms > 0 then
+    redis.call('SET', KEYS[2], '1', 'PX', block_ms)
+    return {0, 0, now_ms + block_ms, block_ms, 2}
+  end
+  return {0, 0, math.ceil(reset * 1000), math.ceil(retry * 1000), 0}
+end
+local function allow(remaining, reset)
+  return {1, math.floor(remaining), math.ceil(reset * 1000), 0, 0}
+end
+"""
+
+# ARGV[3] limit, ARGV[4] window seconds, ARGV[5] unique member
+_SLIDING_WINDOW_LOG = """
+local limit = tonumber(ARGV[3])
+local window = tonumber(ARGV[4])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count >= limit then
+  local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+  local reset = tonumber(oldest[2]) + window
+  return deny(reset, reset - now)
+end
+redis.call('ZADD', KEYS[1], now, ARGV[5])
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+return allow(limit - count - 1, now + window)
+"""
+
+# ARGV[3] limit, ARGV[4] window seconds
+_SLIDING_WINDOW_COUNTER = """
+local limit = tonumber(ARGV[3])
+local window = tonumber(ARGV[4])
+local index = math.floor(now / window)
+local state = redis.call('HMGET', KEYS[1], 'window', 'current', 'previous')
+local current = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+local last = tonumber(state[1]) or index
+if last ~= index then
+  if last == index - 1 then previous = current else previous = 0 end
+  current = 0
+end
+local window_start = index * window
+local weight = 1 - (now - window_start) / window
+local estimate = previous * weight + current
+local reset = window_start + window
+local allowed = estimate + 1 <= limit
+if allowed then current = current + 1 end
+redis.call('HSET', KEYS[1], 'window', index, 'current', current, 'previous', previous)
+redis.call('PEXPIRE', KEYS[1], math.ceil(2 * window * 1000))
+if not allowed then
+  local retry = reset - now
+  local room = limit - current - 1
+  if previous > 0 and room >= 0 then
+    retry = math.min(retry, (weight - room / previous) * window)
+  end
+  return deny(reset, retry)
+end
+return allow(limit - estimate - 1, reset)
+"""
+
+# ARGV[3] capacity, ARGV[4] refill rate in tokens per second
+_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[3])
+local rate = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'timestamp')
+local tokens = tonumber(state[1]) or capacity
+local timestamp = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - timestamp) * rate)
+local allowed = tokens >= 1
+if allowed then tokens = tokens - 1 end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'timestamp', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+if not allowed then
+  local retry = (1 - tokens) / rate
+  return deny(now + retry, retry)
+end
+return allow(tokens, now + (capacity - tokens) / rate)
+"""
+
+# ARGV[3] limit, ARGV[4] period seconds, ARGV[5] burst
+_GCRA = """
+local limit = tonumber(ARGV[3])
+local period = tonumber(ARGV[4])
+local burst = tonumber(ARGV[5])
+local interval = period / limit
+local tolerance = interval * burst
+local tat = math.max(tonumber(redis.call('GET', KEYS[1])) or now, now)
+local new_tat = tat + interval
+local allow_at = new_tat - tolerance
+if allow_at > now then
+  return deny(allow_at, allow_at - now)
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return allow((now - allow_at) / interval, new_tat)
+"""
+
+# ARGV[3] limit, ARGV[4] window seconds; windows are aligned to the epoch
+_FIXED_WINDOW = """
+local limit = tonumber(ARGV[3])
+local window = tonumber(ARGV[4])
+local index = math.floor(now / window)
+local reset = (index + 1) * window
+local state = redis.call('HMGET', KEYS[1], 'window', 'count')
+local count = tonumber(state[2]) or 0
+if tonumber(state[1]) ~= index then count = 0 end
+if count >= limit then
+  return deny(reset, reset - now)
+end
+count = count + 1
+redis.call('HSET', KEYS[1], 'window', index, 'count', count)
+redis.call('PEXPIRE', KEYS[1], math.ceil((reset - now) * 1000))
+return allow(limit - count, reset)
+"""
+
+# ARGV[3] window seconds, ARGV[4] denials allowed in it, ARGV[5] unique member;
+# KEYS[1] is a log of recent denials rather than limiter state
+_DENIALS = """
+local window = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+redis.call('ZADD', KEYS[1], now, ARGV[5])
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+if redis.call('ZCARD', KEYS[1]) > tonumber(ARGV[4]) then
+  redis.call('DEL', KEYS[1])
+  return deny(now, 0)
+end
+return {0, 0, now_ms, 0, 0}
+"""
+
+SCRIPTS: dict[RateLimitStrategy, str] = {
+    RateLimitStrategy.SLIDING_WINDOW: _PREAMBLE + _SLIDING_WINDOW_LOG,
+    RateLimitStrategy.SLIDING_WINDOW_COUNTER: _PREAMBLE + _SLIDING_WINDOW_COUNTER,
+    RateLimitStrategy.TOKEN_BUCKET: _PREAMBLE + _TOKEN_BUCKET,
+    RateLimitStrategy.GCRA: _PREAMBLE + _GCRA,
+    RateLimitStrategy.FIXED_WINDOW: _PREAMBLE + _FIXED_WINDOW,
+}
+# The leaky bucket as a meter is the GCRA
+SCRIPTS[RateLimitStrategy.LEAKY_BUCKET] = SCRIPTS[RateLimitStrategy.GCRA]
+
+
+class AtomicRateLimiter:
+    """Runs rate limit checks as atomic Lua scripts in Redis.
+
+    Example:
+        ```python
+        limiter = AtomicRateLimiter(redis_client)
+        result = await limiter.check("child:123", config)
+        allowed = await limiter.sliding_window_log("rate_limit:1.2.3.4", 60, 60)
+        ```
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        prefix: str = "rate_limit",
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """Initializes the limiter.
+
+        Args:
+            redis_client: An async Redis client
+            prefix: Prefix of the keys used by ``check``
+            clock: Source of the current time; defaults to the Redis server
+                clock, which every worker shares
+
+        """
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self.clock = clock
+        self._scripts = {
+            strategy: redis_client.register_script(source)
+            for strategy, source in SCRIPTS.items()
+        }
+        self._denials = redis_client.register_script(_PREAMBLE + _DENIALS)
+
+    async def check(self, key: str, config: RateLimitConfig) -> RateLimitResult:
+        """Checks and counts one request for ``key`` under ``config``.
+
+        Child-safe configurations block the key for
+        ``config.block_duration_seconds`` after a denial.
+        """
+        strategy = config.strategy
+        block_ms = config.block_duration_seconds * 1000 if config.child_safe_mode else 0
+        limit = config.max_requests or config.requests_per_minute
+        window = config.window_seconds or 60
+        if strategy == RateLimitStrategy.TOKEN_BUCKET:
+            args = [config.burst_capacity or limit, config.refill_rate or limit / window]
+        elif strategy in (RateLimitStrategy.GCRA, RateLimitStrategy.LEAKY_BUCKET):
+            args = [limit, window, config.burst_capacity or limit]
+        elif strategy == RateLimitStrategy.SLIDING_WINDOW:
+            args = [limit, window, uuid.uuid4().hex]
+        else:
+            args = [limit, window]
+        return await self._run(
+            strategy,
+            f"{self.prefix}:{strategy.value}:{key}",
+            f"{self.prefix}:blocked:{key}",
+            block_ms,
+            args,
+        )
+
+    async def record_denial(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: float,
+        block_seconds: float,
+    ) -> bool:
+        """Counts a denial of ``key`` and blocks it after too many.
+
+        Once more than ``limit`` denials fall within ``window_seconds``, the
+        key is blocked for ``block_seconds``, like a child-safe denial.
+
+        Returns:
+            Whether the key is blocked
+
+        """
+        now = self.clock() if self.clock else ""
+        reply = await self._denials(
+            keys=[f"{self.prefix}:denials:{key}", f"{self.prefix}:blocked:{key}"],
+            args=[
+                now,
+                int(block_seconds * 1000),
+                window_seconds,
+                limit,
+                uuid.uuid4().hex,
+            ],
+        )
+        return int(reply[4]) != 0
+
+    async def sliding_window_log(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: float,
+        block_key: str | None = None,
+        block_seconds: float = 0,
+    ) -> RateLimitResult:
+        """Exact sliding window over a log of request timestamps."""
+        return await self._run(
+            RateLimitStrategy.SLIDING_WINDOW,
+            key,
+            block_key or f"{key}:blocked",
+            block_seconds * 1000,
+            [limit, window_seconds, uuid.uuid4().hex],
+        )
+
+    async def sliding_window_counter(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: float,
+        block_key: str | None = None,
+        block_seconds: float = 0,
+    ) -> RateLimitResult:
+        """Approximate sliding window from two fixed-window counters.
+
+        Uses constant memory per key, unlike the log.
+        """
+        return await self._run(
+            RateLimitStrategy.SLIDING_WINDOW_COUNTER,
+            key,
+            block_key or f"{key}:blocked",
+            block_seconds * 1000,
+            [limit, window_seconds],
+        )
+
+    async def token_bucket(
+        self,
+        key: str,
+        capacity: float,
+        refill_rate: float,
+        block_key: str | None = None,
+        block_seconds: float = 0,
+    ) -> RateLimitResult:
+        """Token bucket holding up to ``capacity`` tokens; new keys start full."""
+        return await self._run(
+            RateLimitStrategy.TOKEN_BUCKET,
+            key,
+            block_key or f"{key}:blocked",
+            block_seconds * 1000,
+            [capacity, refill_rate],
+        )
+
+    async def gcra(
+        self,
+        key: str,
+        limit: int,
+        period_seconds: float,
+        burst: int,
+        block_key: str | None = None,
+        block_seconds: float = 0,
+    ) -> RateLimitResult:
+        """Generic cell rate algorithm: ``limit`` per period, ``burst`` at once.
+
+        Keeps a single timestamp per key.
+        """
+        return await self._run(
+            RateLimitStrategy.GCRA,
+            key,
+            block_key or f"{key}:blocked",
+            block_seconds * 1000,
+            [limit, period_seconds, burst],
+        )
+
+    async def _run(
+        self,
+        strategy: RateLimitStrategy,
+        key: str,
+        block_key: str,
+        block_ms: float,
+        args: list[Any],
+    ) -> RateLimitResult:
+        now = self.clock() if self.clock else ""
+        reply = await self._scripts[strategy](
+            keys=[key, block_key],
+            args=[now, int(block_ms), *args],
+        )
+        allowed, remaining, reset_ms, retry_ms, block = (int(value) for value in reply)
+        result = RateLimitResult(
+            allowed=bool(allowed),
+            remaining=max(0, remaining),
+            reset_time=math.ceil(reset_ms / 1000),
+        )
+        if not result.allowed:
+            result.retry_after = max(1, math.ceil(retry_ms / 1000))
+            if block == BLOCKED:
+                result.blocked_reason = "blocked"
+            elif block == NEWLY_BLOCKED:
+                result.blocked_reason = "blocked_due_to_suspicious_activity"
+        return result
@@ -13,6 +13,11 @@ logger = get_logger(__name__, component="security")
 class ChildSafetyHandler:
     """Handler for child safety related rate limiting features."""
 
+    # More than SUSPICIOUS_FACTOR times the limit in denials within
+    # SUSPICIOUS_WINDOW_SECONDS blocks the key
+    SUSPICIOUS_WINDOW_SECONDS = 300
+    SUSPICIOUS_FACTOR = 3
+
     def __init__(self):
         self.audit_integration = get_audit_integration()
 
@@ -51,10 +56,10 @@ class ChildSafetyHandler:
         # Block if there have been too many recent denials
         import time
 
-        recent_time = time.time() - 300  # Last 5 minutes
+        recent_time = time.time() - self.SUSPICIOUS_WINDOW_SECONDS
         recent_requests = len([r for r in state.requests if r > recent_time])
         # Block if more than 3 rate limit denials in the last 5 minutes
-        if recent_requests > config.max_requests * 3:
+        if recent_requests > config.max_requests * self.SUSPICIOUS_FACTOR:
             logger.warning(
                 f"Suspicious activity detected for key {state.key}, blocking.",
             )
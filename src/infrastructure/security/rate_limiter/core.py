@@ -38,8 +38,10 @@ class RateLimitStrategy(Enum):
     """Rate limiting strategies."""
     FIXED_WINDOW = "fixed_window"
     SLIDING_WINDOW = "sliding_window"
+    SLIDING_WINDOW_COUNTER = "sliding_window_counter"
     TOKEN_BUCKET = "token_bucket"
     LEAKY_BUCKET = "leaky_bucket"
+    GCRA = "gcra"
 
 @dataclass
 class RateLimitConfig:
@@ -59,6 +61,7 @@ class RateLimitConfig:
     parent_requests_per_hour: int = 2000
     
     # Enhanced features
+    limit_type: RateLimitType = RateLimitType.REQUESTS_PER_MINUTE
     strategy: RateLimitStrategy = RateLimitStrategy.SLIDING_WINDOW
     max_requests: Optional[int] = None
     window_seconds: Optional[int] = None
@@ -9,6 +9,7 @@ from src.infrastructure.security.audit.comprehensive_audit_integration import (
     get_audit_integration,
 )
 
+from .atomic import AtomicRateLimiter
 from .child_safety import ChildSafetyHandler
 from .config import DefaultConfigurations
 from .core import RateLimitConfig, RateLimitResult
@@ -29,10 +30,15 @@ class ComprehensiveRateLimiter:
     - Automatic blocking for suspicious activity
     - Comprehensive audit logging
     - Redis-backed persistence (optional)
+
+    With Redis, every check is a single atomic Lua script shared by all
+    workers; the in-process state is only used without Redis or while
+    Redis is unreachable.
     """
 
     def __init__(self, redis_client=None):
-        self.storage = RateLimitStorage(redis_client)
+        self.atomic = AtomicRateLimiter(redis_client) if redis_client else None
+        self.storage = RateLimitStorage()
         self.configs: dict[str, RateLimitConfig] = (
             DefaultConfigurations.get_default_configs()
         )
@@ -68,6 +74,20 @@ class ComprehensiveRateLimiter:
         if not config:
             raise ValueError(f"Rate limit configuration '{config_name}' not found")
 
+        if self.atomic is not None:
+            try:
+                result = await self.atomic.check(key, config)
+            except Exception as e:
+                logger.warning(f"Atomic rate limit check failed, using local state: {e}")
+            else:
+                if result.blocked_reason == "blocked":
+                    return result
+                if not result.allowed and result.blocked_reason is None:
+                    await self._block_if_suspicious(key, config, result)
+                return await self._finish_check(
+                    result, config, config_name, key, user_id, child_id, ip_address,
+                )
+
         state = await self.storage.get_state(key)
 
         # Check if key is currently blocked
@@ -83,14 +103,54 @@ class ComprehensiveRateLimiter:
         # Apply rate limiting strategy
         result = await RateLimitingStrategies.apply_strategy(config, state)
 
+        # Block key if necessary
+        if not result.allowed and self.child_safety_handler.should_block_key(
+            config, state,
+        ):
+            state.blocked_until = time.time() + config.block_duration_seconds
+            result.retry_after = config.block_duration_seconds
+            result.blocked_reason = "blocked_due_to_suspicious_activity"
+
+        # Save updated state
+        await self.storage.save_state(key, state)
+        return await self._finish_check(
+            result, config, config_name, key, user_id, child_id, ip_address,
+        )
+
+    async def _block_if_suspicious(
+        self, key: str, config: RateLimitConfig, result: RateLimitResult,
+    ) -> None:
+        """Blocks a key denied too often, as ``should_block_key`` does locally."""
+        handler = self.child_safety_handler
+        limit = config.max_requests or config.requests_per_minute
+        try:
+            blocked = await self.atomic.record_denial(
+                key,
+                limit * handler.SUSPICIOUS_FACTOR,
+                handler.SUSPICIOUS_WINDOW_SECONDS,
+                config.block_duration_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record rate limit denial: {e}")
+            return
+        if blocked:
+            logger.warning(f"Suspicious activity detected for key {key}, blocking.")
+            result.retry_after = config.block_duration_seconds
+            result.blocked_reason = "blocked_due_to_suspicious_activity"
+
+    async def _finish_check(
+        self,
+        result: RateLimitResult,
+        config: RateLimitConfig,
+        config_name: str,
+        key: str,
+        user_id: str | None,
+        child_id: str | None,
+        ip_address: str | None,
+    ) -> RateLimitResult:
+        """Runs child safety handling and auditing for a checked request."""
         # Handle rate limit violation
         if not result.allowed:
-            # Block key if necessary
-            if self.child_safety_handler.should_block_key(config, state):
-                state.blocked_until = time.time() + config.block_duration_seconds
-                result.retry_after = config.block_duration_seconds
-                result.blocked_reason = "blocked_due_to_suspicious_activity"
-
             # Trigger child safety violation if applicable
             if config.child_safe_mode:
                 await self.child_safety_handler.handle_child_safety_violation(
@@ -111,9 +171,6 @@ class ComprehensiveRateLimiter:
             child_id=child_id,
             ip_address=ip_address,
         )
-
-        # Save updated state
-        await self.storage.save_state(key, state)
         return result
 
     async def _cleanup_expired_entries(self):
@@ -1,11 +1,19 @@
 """JWT Token Service - REAL IMPLEMENTATION"""
 
+import hashlib
+import uuid
+
 import jwt
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from fastapi import Depends
 
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.security.auth.token_verification import (
+    TOKEN_VERIFICATIONS,
+    get_revocation_list,
+    get_verified_token_cache,
+)
 
 logger = get_logger(__name__, component="security")
 
@@ -38,6 +46,13 @@ class TokenService:
         if len(self.secret_key) < 32:
             raise ValueError("SECRET_KEY must be at least 32 characters long")
 
+        # Fast path: recently verified tokens, and the revoked token ids
+        self.token_cache = get_verified_token_cache()
+        self.revocations = get_revocation_list()
+        self._cache_namespace = hashlib.sha256(
+            f"{self.algorithm}:{self.secret_key}".encode()
+        ).hexdigest()
+
         logger.info(f"TokenService initialized with algorithm={self.algorithm}, "
                     f"access_expire={self.access_token_expire_minutes}min")
 
@@ -91,6 +106,7 @@ class TokenService:
                 "exp": expire,  # Expiration time
                 "iat": datetime.utcnow(),  # Issued at
                 "type": "access",  # Token type
+                "jti": uuid.uuid4().hex,  # Token ID, for revocation
             }
 
             # Add additional user data to payload
@@ -143,6 +159,7 @@ class TokenService:
                 "exp": expire,  # Expiration time
                 "iat": datetime.utcnow(),  # Issued at
                 "type": "refresh",  # Token type
+                "jti": uuid.uuid4().hex,  # Token ID, for revocation
             }
 
             # Add essential user data to payload (minimal for refresh tokens)
@@ -164,6 +181,9 @@ class TokenService:
     async def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify and decode a JWT token.
 
+        Tokens verified before are served from the verified-token cache
+        until they expire; both paths reject revoked tokens.
+
         Args:
             token: JWT token string to verify
 
@@ -171,7 +191,7 @@ class TokenService:
             Dict[str, Any]: Decoded token payload
 
         Raises:
-            ValueError: If token is invalid, expired, or malformed
+            ValueError: If token is invalid, expired, revoked, or malformed
         """
         if not token:
             raise ValueError("Token cannot be empty or None")
@@ -185,6 +205,25 @@ class TokenService:
         if token == "malformed_token":
             raise ValueError("Invalid token format")
 
+        payload = self.token_cache.get(token, self._cache_namespace)
+        if payload is None:
+            payload = self._decode(token)
+            path = "full"
+        else:
+            path = "cache"
+
+        if await self.revocations.is_revoked_async(payload.get("jti")):
+            TOKEN_VERIFICATIONS.labels(path="revoked").inc()
+            self.token_cache.discard(token, self._cache_namespace)
+            raise ValueError("Token has been revoked")
+
+        if path == "full":
+            self.token_cache.put(token, payload, self._cache_namespace)
+        TOKEN_VERIFICATIONS.labels(path=path).inc()
+        return payload
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        """Decode a token, checking its signature and claims."""
         try:
             # Decode and verify JWT token
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
@@ -203,15 +242,37 @@ class TokenService:
             return payload
 
         except jwt.ExpiredSignatureError:
+            TOKEN_VERIFICATIONS.labels(path="invalid").inc()
             logger.warning(f"Expired token verification attempted")
             raise ValueError("Token has expired")
         except jwt.InvalidTokenError as e:
+            TOKEN_VERIFICATIONS.labels(path="invalid").inc()
             logger.warning(f"Invalid token verification attempted: {e}")
             raise ValueError("Invalid token") from e
         except Exception as e:
+            TOKEN_VERIFICATIONS.labels(path="invalid").inc()
             logger.exception(f"Token verification error: {e}")
             raise ValueError(f"Token verification failed: {e}") from e
 
+    async def revoke_token(self, token: str) -> Dict[str, Any]:
+        """Revoke a token until it expires, on every instance.
+
+        Args:
+            token: JWT token string to revoke
+
+        Returns:
+            Dict[str, Any]: Payload of the revoked token
+
+        Raises:
+            ValueError: If the token is invalid or has no ``jti``
+        """
+        payload = await self.verify_token(token)
+        if not payload.get("jti"):
+            raise ValueError("Token has no jti and cannot be revoked")
+        self.token_cache.discard(token, self._cache_namespace)
+        await self.revocations.revoke(payload["jti"], payload["exp"])
+        return payload
+
     def get_user_id_from_token(self, token: str) -> str:
         """Extract user ID from token without full verification.
 
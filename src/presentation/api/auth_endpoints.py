@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.infrastructure.persistence.database_manager import Database
 from src.infrastructure.di.fastapi_dependencies import get_database
 from src.infrastructure.security.auth.real_auth_service import RealAuthService
+from src.infrastructure.security.password_hasher import HashingPoolSaturatedError
 from src.infrastructure.logging_config import get_logger
 
 logger = get_logger(__name__, component="api")
@@ -19,7 +20,7 @@ async def get_db_session(
     database: Database = Depends(get_database)
 ) -> AsyncGenerator[AsyncSession, None]:
     """Database session dependency for FastAPI endpoints."""
-    async for session in database.get_session():
+    async with database.get_session() as session:
         yield session
 
 
@@ -47,7 +48,15 @@ async def login_endpoint(
             )
 
         # Authenticate user
-        user = await auth_service.authenticate(email, password, db)
+        try:
+            user = await auth_service.authenticate(email, password, db)
+        except HashingPoolSaturatedError:
+            logger.warning("Login rejected: password hashing pool saturated")
+            raise HTTPException(
+                status_code=503,
+                detail="Too many login attempts in progress, please retry",
+                headers={"Retry-After": "1"},
+            ) from None
         if not user:
             raise HTTPException(
                 status_code=401,
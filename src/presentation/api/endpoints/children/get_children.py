@@ -3,14 +3,31 @@ Handles retrieving children list for parents with proper access control.
 """
 
 from typing import Any
+from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
+from sqlalchemy import select
 
 from src.application.use_cases.manage_child_profile import ManageChildProfileUseCase
 from src.domain.entities.user import User
+from src.domain.models.child_models import ChildModel
+from src.infrastructure.dependencies import (
+    get_activity_timeseries_store,
+    get_keyset_paginator,
+)
 from src.infrastructure.di.container import container
+from src.infrastructure.di.fastapi_dependencies import get_database
 from src.infrastructure.logging_config import get_logger
+from src.infrastructure.pagination import (
+    CursorPage,
+    InvalidCursorError,
+    KeysetPaginator,
+)
+from src.infrastructure.persistence.activity_timeseries_store import (
+    ActivityTimeSeriesStore,
+)
+from src.infrastructure.persistence.database_manager import Database
 
 from .models import ChildResponse
 
@@ -58,6 +75,80 @@ async def get_children_endpoint(
         )
 
 
+@inject
+async def get_children_page_endpoint(
+    cursor: str | None = Query(
+        None,
+        description="next_cursor or prev_cursor of the previous page",
+    ),
+    size: int = Query(20, ge=1, le=50, description="Page size"),
+    current_user: User = Depends(container.auth_service.get_current_user),
+    manage_child_profile_use_case: ManageChildProfileUseCase = Depends(
+        Provide[container.manage_child_profile_use_case],
+    ),
+    database: Database = Depends(get_database),
+    paginator: KeysetPaginator = Depends(get_keyset_paginator),
+) -> CursorPage[ChildResponse]:
+    """الحصول على أطفال الوالد صفحةً صفحة، الأحدث أولاً، باستخدام cursor."""
+    try:
+        if current_user.role not in ["parent", "guardian"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only parents and guardians can access children profiles",
+            )
+
+        scope = f"children:{current_user.id}"
+        try:
+            position = paginator.position(cursor, scope)
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid cursor: {e!s}",
+            )
+
+        # Only the keys are paged in SQL; profiles come from the read model
+        statement = paginator.apply(
+            select(ChildModel.created_at, ChildModel.id).where(
+                ChildModel.parent_id == str(current_user.id),
+            ),
+            ChildModel.created_at,
+            ChildModel.id,
+            position,
+            size,
+        )
+        async with database.get_session() as session:
+            rows = (await session.execute(statement)).all()
+        page = paginator.page(rows, position, size, key=tuple, scope=scope)
+
+        profiles = {
+            profile.id: profile
+            for profile in await manage_child_profile_use_case.list_child_profiles(
+                [UUID(row.id) for row in page.items],
+            )
+        }
+        page.items = [
+            ChildResponse(
+                child_id=profile.id,
+                name=profile.name,
+                age=profile.age,
+                preferences=profile.preferences,
+                created_at=row.created_at,
+                updated_at=profile.last_interaction or row.created_at,
+            )
+            for row in page.items
+            if (profile := profiles.get(UUID(row.id)))
+        ]
+        return page
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving children page: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve children profiles. Please try again.",
+        )
+
+
 @inject
 async def get_children_summary(
     current_user: User = Depends(container.auth_service.get_current_user),
@@ -255,6 +346,7 @@ async def get_children_activity_summary(
     manage_child_profile_use_case: ManageChildProfileUseCase = Depends(
         Provide[container.manage_child_profile_use_case],
     ),
+    activity_store: ActivityTimeSeriesStore = Depends(get_activity_timeseries_store),
 ) -> dict[str, Any]:
     """الحصول على ملخص نشاط الأطفال للأيام الماضية."""
     try:
@@ -285,21 +377,14 @@ async def get_children_activity_summary(
         safety_incidents = 0
         day_activity_counter = {}
 
+        # Daily rollups of all children in two queries, whatever their history
+        activities = await activity_store.get_activity_summaries(
+            [str(child.id) for child in children],
+            days,
+        )
+
         for child in children:
-            # استرجاع بيانات النشاط الفعلية من use case أو repository
-            activity = await manage_child_profile_use_case.get_child_activity_summary(
-                child_id=child.id,
-                days=days,
-            )
-            # مثال: activity = {
-            #   "total_interactions": int,
-            #   "daily_average_minutes": float,
-            #   "favorite_activities": list,
-            #   "safety_score": float,
-            #   "last_active": str (ISO),
-            #   "activity_by_day": {"2025-07-20": 5, ...}
-            #   "safety_incidents": int
-            # }
+            activity = activities[str(child.id)]
             children_activity.append({
                 "child_id": child.id,
                 "child_name": child.name,
@@ -313,8 +398,10 @@ async def get_children_activity_summary(
             total_minutes += activity.get("daily_average_minutes", 0)
             safety_incidents += activity.get("safety_incidents", 0)
             # حساب اليوم الأكثر نشاطاً
-            for day, count in activity.get("activity_by_day", {}).items():
-                day_activity_counter[day] = day_activity_counter.get(day, 0) + count
+            for day, daily in activity["daily_activities"].items():
+                day_activity_counter[day] = (
+                    day_activity_counter.get(day, 0) + daily["interactions"]
+                )
 
         if day_activity_counter:
             most_active_day = max(day_activity_counter, key=day_activity_counter.get)
@@ -8,11 +8,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from .create_child import create_child_endpoint
-from .get_children import get_children_endpoint
+from .get_children import get_children_endpoint, get_children_page_endpoint
 from .models import ChildResponse
 from src.infrastructure.persistence.database_manager import Database
 from src.domain.models.child_models import ChildModel
 from src.infrastructure.di.fastapi_dependencies import get_database
+from src.infrastructure.pagination import CursorPage
 
 
 def setup_children_routes(router: APIRouter) -> None:
@@ -38,6 +39,16 @@ def setup_children_routes(router: APIRouter) -> None:
         description="Retrieve all children profiles for the authenticated parent",
     )
 
+    # Get children by cursor endpoint
+    router.add_api_route(
+        "/page",
+        get_children_page_endpoint,
+        methods=["GET"],
+        response_model=CursorPage[ChildResponse],
+        summary="Get Children Profiles Page",
+        description="Retrieve the authenticated parent's children one cursor page at a time",
+    )
+
     # Update child endpoint
     router.add_api_route(
         "/{child_id}",
@@ -149,7 +160,7 @@ async def get_db_session(
     database: Database = Depends(get_database)
 ) -> AsyncGenerator[AsyncSession, None]:
     """Database session dependency for FastAPI endpoints."""
-    async for session in database.get_session():
+    async with database.get_session() as session:
         yield session
 
 
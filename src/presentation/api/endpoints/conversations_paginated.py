@@ -2,41 +2,59 @@
 Provides paginated access to child conversations with COPPA compliance.
 """
 
-from fastapi import APIRouter, HTTPException, Query, status
-from datetime import datetime, timedelta
 from typing import Any
 
 from src.infrastructure.logging_config import get_logger
 from src.infrastructure.pagination import (
+    CursorPage,
+    InvalidCursorError,
     PaginatedResponse,
     PaginationRequest,
     PaginationService,
-    SortOrder,
 )
-from src.domain.services.conversation_service import ConversationService
-from src.infrastructure.persistence.repositories.conversation_repository import ConversationRepository
+from src.infrastructure.persistence.conversation_sqlite_repository import (
+    ConversationSQLiteRepository,
+)
 
 logger = get_logger(__name__, component="api")
 
+# Import FastAPI dependencies
+try:
+    from fastapi import APIRouter, HTTPException, Query, status
+
+    FASTAPI_AVAILABLE = True
+except ImportError:
+    logger.critical("FastAPI is required for the paginated conversations API. Please install fastapi.")
+    raise ImportError("FastAPI is not installed. The paginated conversations API cannot run without FastAPI.")
+
 
 class ConversationPaginationService:
     """Service for paginated conversation operations."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        conversation_repository: ConversationSQLiteRepository | None = None,
+    ) -> None:
         """Initialize conversation pagination service."""
         self.pagination_service = PaginationService()
-        self.conversation_service = ConversationService(
-            repository=ConversationRepository()
-        )
+        self._conversation_repository = conversation_repository
         logger.info("Conversation pagination service initialized")
 
+    @property
+    def conversation_repository(self) -> ConversationSQLiteRepository:
+        """Conversation storage, opened on first use."""
+        if self._conversation_repository is None:
+            self._conversation_repository = ConversationSQLiteRepository()
+        return self._conversation_repository
+
     async def get_child_conversations(
         self,
         child_id: str,
-        pagination_request: PaginationRequest,
+        cursor: str | None = None,
+        size: int = 20,
         parent_id: str | None = None,
-    ) -> PaginatedResponse[dict[str, Any]]:
-        """Get paginated conversations for a child."""
+    ) -> CursorPage[dict[str, Any]]:
+        """Get a page of a child's conversations, newest first, by cursor."""
         try:
             # Validate parent-child relationship for COPPA compliance
             if parent_id and not await self._validate_parent_access(
@@ -48,16 +66,15 @@ class ConversationPaginationService:
                     detail="Parent does not have access to this child's conversations",
                 )
 
-            # Create child-safe pagination
-            safe_pagination = self.pagination_service.create_child_safe_pagination(
-                pagination_request,
+            return await self.conversation_repository.get_conversations_page(
+                child_id,
+                cursor=cursor,
+                size=size,
             )
-
-            # جلب المحادثات من repository الفعلي
-            logger.error(f"Conversations repository not implemented yet for child {child_id}")
+        except InvalidCursorError as e:
             raise HTTPException(
-                status_code=status.HTTP_501_NOT_IMPLEMENTED,
-                detail="Conversations repository not implemented yet"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid cursor: {e!s}",
             )
         except HTTPException:
             raise
@@ -135,38 +152,27 @@ router = APIRouter(prefix="/api/v1/conversations", tags=["Conversations Paginate
 
 if FASTAPI_AVAILABLE:
 
-    @router.get("/child/{child_id}")
+    @router.get("/child/{child_id}", response_model=CursorPage[dict[str, Any]])
     async def get_child_conversations_paginated(
         child_id: str,
-        page: int = Query(1, ge=1, description="Page number"),
+        cursor: str | None = Query(
+            None,
+            description="next_cursor or prev_cursor of the previous page",
+        ),
         size: int = Query(20, ge=1, le=50, description="Page size"),
-        sort_by: str | None = Query(None, description="Sort field"),
-        sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
-        search: str | None = Query(None, description="Search term"),
         parent_id: str | None = Query(
             None,
             description="Parent ID for COPPA validation",
         ),
     ):
-        """Get paginated conversations for a child."""
-        # Create pagination request
-        pagination_request = PaginationRequest(
-            page=page,
-            size=size,
-            sort_by=sort_by,
-            sort_order=SortOrder(sort_order),
-            search=search,
-        )
-
-        # Get paginated conversations
-        result = await conversation_pagination_service.get_child_conversations(
+        """Get a child's conversations, newest first, one cursor page at a time."""
+        return await conversation_pagination_service.get_child_conversations(
             child_id=child_id,
-            pagination_request=pagination_request,
+            cursor=cursor,
+            size=size,
             parent_id=parent_id,
         )
 
-        return result.to_dict()
-
     @router.get("/child/{child_id}/history")
     async def get_conversation_history_paginated(
         child_id: str,
@@ -187,7 +193,7 @@ if FASTAPI_AVAILABLE:
             page=page,
             size=size,
             sort_by=sort_by,
-            sort_order=SortOrder(sort_order),
+            sort_order=sort_order,
         )
 
         # Get conversation history
@@ -219,7 +225,7 @@ if FASTAPI_AVAILABLE:
             page=page,
             size=size,
             sort_by=sort_by,
-            sort_order=SortOrder(sort_order),
+            sort_order=sort_order,
             search=search_term,
         )
 
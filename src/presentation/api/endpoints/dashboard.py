@@ -18,11 +18,15 @@ from src.application.services.device.audio_processing_service import (
 )
 from src.infrastructure.caching.redis_cache import RedisCacheManager as RedisCache
 from src.infrastructure.dependencies import (
+    get_activity_timeseries_store,
     get_ai_orchestration_service,
     get_audio_processing_service,
 )
 from src.infrastructure.di.container import container
 from src.infrastructure.logging import get_standard_logger
+from src.infrastructure.persistence.activity_timeseries_store import (
+    ActivityTimeSeriesStore,
+)
 from src.infrastructure.persistence.database_manager import Database
 from src.presentation.api.error_handlers import (
     AITeddyErrorHandler,
@@ -98,7 +102,7 @@ async def get_child_stats(
     child_id: str,
     period: str = "week",  # week, month, year
     current_user: User = Depends(get_authenticated_user),
-    database: Database = Depends(container.database),
+    activity_store: ActivityTimeSeriesStore = Depends(get_activity_timeseries_store),
 ) -> dict[str, Any]:
     """Get child interaction statistics with COPPA compliance.
 
@@ -124,8 +128,8 @@ async def get_child_stats(
             },
         )
 
-        # Real query for child statistics
-        child_stats = await database.get_child_statistics(child_id, period)
+        # Reads the daily usage rollups of the period only
+        child_stats = await activity_store.get_child_statistics(child_id, period)
 
         if not child_stats:
             raise AITeddyErrorHandler.handle_not_found_error(
@@ -1,4 +1,6 @@
+from .data_loader import DataLoaderMiddleware
 from .error_handling import ErrorHandlingMiddleware
+from .plaintext_scope import PlaintextScopeMiddleware
 from .rate_limit_middleware import RateLimitMiddleware as ChildSafetyMiddleware
 from .request_logging import RequestLoggingMiddleware
 
@@ -7,7 +9,9 @@ from .request_logging import RequestLoggingMiddleware
 
 __all__ = [
     "ChildSafetyMiddleware",  # Re-enabled for production
+    "DataLoaderMiddleware",
     "ErrorHandlingMiddleware",
+    "PlaintextScopeMiddleware",
     "RateLimitMiddleware",  # Re-enabled for production (alias)
     "RequestLoggingMiddleware"
 ]
@@ -0,0 +1,23 @@
+"""Per-request batch loaders.
+
+Every HTTP request runs inside its own ``loader_scope``, so repositories
+batch the lookups made while handling it and cache them until it ends.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.performance.batch_loader import loader_scope
+
+
+class DataLoaderMiddleware:
+    """Pure ASGI middleware; the endpoint runs in the same context as the scope."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with loader_scope():
+            await self.app(scope, receive, send)
@@ -0,0 +1,24 @@
+"""Per-request plaintext of encrypted fields.
+
+Every HTTP request runs inside its own ``plaintext_scope``: an encrypted
+field read several times while handling it is decrypted once, and the
+decrypted buffers are zeroized when the response has been sent.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.domain.value_objects.encrypted_field import plaintext_scope
+
+
+class PlaintextScopeMiddleware:
+    """Pure ASGI middleware; the endpoint runs in the same context as the scope."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with plaintext_scope():
+            await self.app(scope, receive, send)
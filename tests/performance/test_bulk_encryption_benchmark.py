@@ -0,0 +1,53 @@
+"""Benchmark: encrypting a child's export field by field vs with encrypt_many.
+
+Each ``encrypt`` builds a cipher, decrypts its output again and writes an
+audit record; ``encrypt_many`` reuses the cipher, verifies a sample and
+audits the batch once.
+"""
+
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.security.encryption.robust_encryption_service import (
+    EncryptionConfig,
+    RobustEncryptionService,
+)
+
+FIELDS = 20_000
+
+
+@pytest.mark.performance
+async def test_encrypt_many_throughput():
+    service = RobustEncryptionService(EncryptionConfig(key_iterations=1000))
+    service.audit_integration.log_security_event = AsyncMock()
+    values = [f"conversation message {i}: I like dinosaurs" for i in range(FIELDS)]
+
+    started = time.perf_counter()
+    for value in values:
+        await service.encrypt(value)
+    single = time.perf_counter() - started
+    single_audits = service.audit_integration.log_security_event.await_count
+
+    service.audit_integration.log_security_event.reset_mock()
+    started = time.perf_counter()
+    batch = await service.encrypt_many(values)
+    batched = time.perf_counter() - started
+
+    started = time.perf_counter()
+    envelope = await service.encrypt_many(values, child_id="child-1")
+    enveloped = time.perf_counter() - started
+    decrypted = await service.decrypt_many(
+        [result.data for result in envelope], child_id="child-1"
+    )
+
+    print(
+        f"\n{FIELDS} fields: encrypt {FIELDS / single:,.0f}/s "
+        f"({single_audits} audit records); encrypt_many {FIELDS / batched:,.0f}/s, "
+        f"envelope {FIELDS / enveloped:,.0f}/s "
+        f"({service.audit_integration.log_security_event.await_count} audit records)",
+    )
+    assert all(result.success for result in batch)
+    assert [result.data for result in decrypted] == values
+    assert batched * 2 < single
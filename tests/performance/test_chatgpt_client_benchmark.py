@@ -0,0 +1,100 @@
+"""Benchmark: event-loop lag of ChatGPTClient under concurrent chats.
+
+Runs 200 concurrent chats against a local mock OpenAI server and samples
+the event-loop lag while they are in flight. With the pooled async
+transport the loop keeps ticking; the old synchronous ``OpenAI`` call
+blocked it for the full round-trip of every completion.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+from openai import OpenAI
+
+from src.infrastructure.ai.chatgpt.client import ChatGPTClient
+from src.infrastructure.ai.chatgpt.transport import (
+    OpenAITransport,
+    OpenAITransportConfig,
+)
+from tests.utils.loop_lag import EventLoopLagProbe
+from tests.utils.mock_openai_server import MockOpenAIServer
+
+CONCURRENT_CHATS = 200
+SERVER_LATENCY = 0.05
+MAX_P99_LAG_MS = 50.0
+IDLE_SECONDS = 0.5
+
+
+def _usable_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@pytest.fixture
+def mock_server():
+    with MockOpenAIServer(latency=SERVER_LATENCY) as server:
+        yield server
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(
+    _usable_cpus() < 2,
+    reason="the mock server thread competes with the event loop for one CPU",
+)
+async def test_event_loop_lag_stays_flat_under_concurrent_chats(mock_server):
+    transport = OpenAITransport(
+        "sk-test",
+        config=OpenAITransportConfig(max_concurrent_requests=32, max_retries=0),
+        base_url=mock_server.base_url,
+    )
+    client = ChatGPTClient(api_key="sk-test", transport=transport)
+
+    # The lag bound is relative to the idle loop on this machine
+    async with EventLoopLagProbe() as idle:
+        await asyncio.sleep(IDLE_SECONDS)
+
+    async with EventLoopLagProbe() as probe:
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(
+                client.generate_child_safe_response("Tell me about cats", 6)
+                for _ in range(CONCURRENT_CHATS)
+            ),
+        )
+        elapsed = time.perf_counter() - started
+    await transport.aclose()
+
+    assert all(response["source"] == "chatgpt" for response in responses)
+    assert mock_server.requests == CONCURRENT_CHATS
+    print(
+        f"\nasync transport: {CONCURRENT_CHATS} chats in {elapsed:.2f}s, "
+        f"loop lag p99={probe.percentile_ms(99):.1f}ms max={probe.max_ms:.1f}ms "
+        f"(idle p99={idle.percentile_ms(99):.1f}ms)",
+    )
+    assert probe.percentile_ms(99) < max(idle.percentile_ms(99) * 10, MAX_P99_LAG_MS)
+    # Concurrency is bounded by the limiter, not serialized.
+    assert elapsed < CONCURRENT_CHATS * SERVER_LATENCY / 4
+
+
+@pytest.mark.performance
+async def test_blocking_client_baseline_stalls_the_loop(mock_server):
+    """Reference measurement of the previous synchronous call path."""
+    sync_client = OpenAI(api_key="sk-test", base_url=mock_server.base_url, max_retries=0)
+
+    async def _blocking_chat() -> None:
+        await asyncio.sleep(0)
+        sync_client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Tell me about cats"}],
+        )
+
+    async with EventLoopLagProbe() as probe:
+        await asyncio.sleep(probe.interval * 2)
+        await asyncio.gather(*(_blocking_chat() for _ in range(10)))
+    sync_client.close()
+
+    print(f"\nblocking client: loop lag max={probe.max_ms:.1f}ms")
+    assert probe.max_ms >= SERVER_LATENCY * 1000 * 0.8
@@ -0,0 +1,107 @@
+"""Benchmark: conversation writes into a SQLite table of 1M rows.
+
+Compares the previous storage path (a new connection per write, rollback
+journal, cleanup trigger on every insert) with the pooled WAL connections
+of ConversationSQLiteRepository.
+"""
+
+import asyncio
+import os
+import shutil
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.infrastructure.persistence.conversation_sqlite_repository import (
+    _INSERT_CONVERSATION,
+    ConversationSQLiteRepository,
+)
+
+ROWS = 1_000_000
+WRITES = 2_000
+CONCURRENCY = 32
+
+
+def _row(i: int, expires_at: str) -> tuple:
+    return (f"child-{i % 10_000:06d}", f"{i:016x}", os.urandom(200), None, 1.0, expires_at)
+
+
+def _fill(db_path) -> None:
+    expires_at = (datetime.utcnow() + timedelta(days=90)).isoformat()
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            _INSERT_CONVERSATION,
+            (_row(i, expires_at) for i in range(ROWS)),
+        )
+
+
+def _legacy_write(db_path, params: tuple) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(_INSERT_CONVERSATION, params)
+
+
+async def _write_time(write, concurrency: int = 1) -> float:
+    expires_at = (datetime.utcnow() + timedelta(days=90)).isoformat()
+    rows = iter([_row(ROWS + i, expires_at) for i in range(WRITES)])
+
+    async def _writer():
+        for params in rows:
+            await write(params)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_writer() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+@pytest.mark.performance
+async def test_pooled_writes_vs_connection_per_write(tmp_path, monkeypatch):
+    key = Fernet.generate_key()
+    monkeypatch.setattr(
+        ConversationSQLiteRepository,
+        "_get_or_create_encryption_key",
+        lambda self: key,
+    )
+    pooled_path = tmp_path / "pooled.db"
+    legacy_path = tmp_path / "legacy.db"
+    await ConversationSQLiteRepository(str(pooled_path)).close()
+    _fill(pooled_path)
+    shutil.copy(pooled_path, legacy_path)
+    with sqlite3.connect(legacy_path) as conn:
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.execute(
+            """
+            CREATE TRIGGER cleanup_expired_conversations
+            AFTER INSERT ON conversations
+            BEGIN
+                DELETE FROM conversations WHERE expires_at < datetime('now');
+            END
+            """,
+        )
+
+    loop = asyncio.get_running_loop()
+    legacy = await _write_time(
+        lambda params: loop.run_in_executor(None, _legacy_write, legacy_path, params),
+    )
+
+    repository = ConversationSQLiteRepository(str(pooled_path))
+
+    def _insert(conn, params):
+        conn.execute(_INSERT_CONVERSATION, params)
+
+    pooled = await _write_time(lambda params: repository.pool.write(_insert, params))
+    concurrent = await _write_time(
+        lambda params: repository.pool.write(_insert, params),
+        concurrency=CONCURRENCY,
+    )
+    await repository.close()
+
+    print(
+        f"\n{WRITES:,} writes into {ROWS:,} rows: "
+        f"connection per write {WRITES / legacy:,.0f}/s, "
+        f"pooled WAL {WRITES / pooled:,.0f}/s ({legacy / pooled:.1f}x), "
+        f"pooled WAL with {CONCURRENCY} writers {WRITES / concurrent:,.0f}/s",
+    )
+    assert pooled * 2 < legacy
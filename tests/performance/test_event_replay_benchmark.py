@@ -0,0 +1,58 @@
+"""Benchmark: loading a child profile with a long event history.
+
+Compares a full replay of every event with loading from the latest snapshot
+plus the events recorded after it.
+"""
+
+import time
+
+import pytest
+
+from src.domain.entities.child_profile import ChildProfile
+from src.domain.repositories.event_store import InMemoryEventStore
+from src.domain.repositories.snapshot_store import (
+    InMemorySnapshotStore,
+    SnapshotPolicy,
+)
+from src.infrastructure.repositories.event_sourced_child_repository import (
+    EventSourcedChildRepository,
+)
+
+EVENTS = 10_000
+LOADS = 20
+
+
+async def _load_time(repository, aggregate_id) -> float:
+    started = time.perf_counter()
+    for _ in range(LOADS):
+        profile = await repository.get_by_id(aggregate_id)
+    elapsed = (time.perf_counter() - started) / LOADS
+    assert profile.version == EVENTS
+    return elapsed
+
+
+@pytest.mark.performance
+async def test_snapshot_load_vs_full_replay():
+    event_store = InMemoryEventStore()
+    snapshot_store = InMemorySnapshotStore()
+    policy = SnapshotPolicy(every_n_events=100)
+    writer = EventSourcedChildRepository(event_store, snapshot_store, policy)
+
+    profile = ChildProfile.create("Sam", 7, {})
+    await writer.save(profile)
+    for i in range(EVENTS - 1):
+        profile.update_profile(preferences={"story": i})
+        await writer.save(profile)
+
+    full_replay = await _load_time(
+        EventSourcedChildRepository(event_store),
+        profile.id,
+    )
+    from_snapshot = await _load_time(writer, profile.id)
+
+    print(
+        f"\n{EVENTS:,} events: full replay {full_replay * 1000:.2f} ms/load, "
+        f"snapshot + tail {from_snapshot * 1000:.2f} ms/load "
+        f"({full_replay / from_snapshot:.0f}x)",
+    )
+    assert from_snapshot * 10 < full_replay
@@ -0,0 +1,65 @@
+"""Benchmark: loading one aggregate from a busy Kafka event topic.
+
+Compares an indexed load with scanning the aggregate's partition, which is
+what every load did before the index, on the in-process broker stand-in.
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.persistence.kafka_event_store import KafkaEventStore
+from tests.utils.local_kafka_broker import LocalKafkaBroker
+
+MODULE = "src.infrastructure.persistence.kafka_event_store"
+AGGREGATES = 5_000
+EVENTS_EACH = 10
+LOADS = 50
+
+
+@pytest.mark.performance
+async def test_indexed_load_vs_partition_scan():
+    broker = LocalKafkaBroker(partitions=3)
+    with patch(f"{MODULE}.AIOKafkaProducer", broker.producer), patch(
+        f"{MODULE}.AIOKafkaConsumer",
+        broker.consumer,
+    ):
+        store = KafkaEventStore(
+            SimpleNamespace(kafka=SimpleNamespace(KAFKA_BOOTSTRAP_SERVERS="local")),
+        )
+        await store.initialize()
+
+    ids = [uuid4() for _ in range(AGGREGATES)]
+    for i in range(EVENTS_EACH):
+        for child_id in ids:
+            await store.append_events(child_id, "ChildProfile", "Noted", [{"i": i}])
+    targets = ids[:LOADS]
+
+    store.consumer.fetched = 0
+    started = time.perf_counter()
+    for child_id in targets:
+        end_offsets = await store._end_offsets(child_id)
+        records = await store._scan(str(child_id), end_offsets)
+        assert len(records) == EVENTS_EACH
+    scan_elapsed = (time.perf_counter() - started) / LOADS
+    scan_fetched = store.consumer.fetched / LOADS
+
+    store.consumer.fetched = 0
+    started = time.perf_counter()
+    for child_id in targets:
+        assert len(await store.get_events(child_id)) == EVENTS_EACH
+    indexed_elapsed = (time.perf_counter() - started) / LOADS
+    indexed_fetched = store.consumer.fetched / LOADS
+
+    await store.close()
+    print(
+        f"\n{AGGREGATES * EVENTS_EACH:,} events: partition scan "
+        f"{scan_elapsed * 1000:.2f} ms/load ({scan_fetched:,.0f} records read), "
+        f"indexed {indexed_elapsed * 1000:.2f} ms/load "
+        f"({indexed_fetched:,.0f} records read)",
+    )
+    assert indexed_fetched < scan_fetched / 10
+    assert indexed_elapsed < scan_elapsed
@@ -0,0 +1,127 @@
+"""Benchmark: deep pages of one child's conversations, OFFSET vs keyset.
+
+An OFFSET query walks past every skipped row, so its latency grows with the
+page depth; a keyset cursor seeks along idx_child_timestamp instead and
+costs the same on the first and the last page.
+"""
+
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.infrastructure.pagination.keyset import KeysetPosition
+from src.infrastructure.persistence.conversation_sqlite_repository import (
+    ConversationSQLiteRepository,
+)
+
+ROWS = 200_000
+PAGE_SIZE = 20
+DEPTHS = (0, 1_000, 50_000, 190_000)
+REPEATS = 20
+CHILD_ID = "child-000001"
+FIELDS = ("id", "timestamp")
+
+_INSERT_WITH_TIMESTAMP = """
+    INSERT INTO conversations
+    (child_id, conversation_hash, encrypted_content, safety_score, timestamp, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _fill(db_path) -> None:
+    started = datetime(2024, 1, 1)
+    expires_at = (datetime.utcnow() + timedelta(days=90)).isoformat()
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            _INSERT_WITH_TIMESTAMP,
+            (
+                (
+                    CHILD_ID,
+                    f"{i:016x}",
+                    os.urandom(200),
+                    1.0,
+                    (started + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S"),
+                    expires_at,
+                )
+                for i in range(ROWS)
+            ),
+        )
+
+
+def _row_at(db_path, depth: int) -> tuple[str, int]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT timestamp, id FROM conversations WHERE child_id = ? "
+            "ORDER BY timestamp DESC, id DESC LIMIT 1 OFFSET ?",
+            (CHILD_ID, depth - 1),
+        ).fetchone()
+
+
+async def _latency(read) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        await read()
+    return (time.perf_counter() - started) / REPEATS
+
+
+@pytest.mark.performance
+async def test_deep_pages_offset_vs_keyset(tmp_path, monkeypatch):
+    key = Fernet.generate_key()
+    monkeypatch.setattr(
+        ConversationSQLiteRepository,
+        "_get_or_create_encryption_key",
+        lambda self: key,
+    )
+    db_path = tmp_path / "conversations.db"
+    await ConversationSQLiteRepository(str(db_path)).close()
+    _fill(db_path)
+    repository = ConversationSQLiteRepository(str(db_path))
+    scope = f"conversations:{CHILD_ID}"
+
+    results = []
+    for depth in DEPTHS:
+        cursor = None
+        if depth:
+            timestamp, row_id = _row_at(db_path, depth)
+            cursor = repository.paginator.codec.encode(
+                KeysetPosition(timestamp, row_id),
+                scope,
+            )
+
+        offset_page = await repository.get_conversations(
+            CHILD_ID, limit=PAGE_SIZE, offset=depth, fields=FIELDS
+        )
+        keyset_page = await repository.get_conversations_page(
+            CHILD_ID, cursor=cursor, size=PAGE_SIZE, fields=FIELDS
+        )
+        assert [row["id"] for row in keyset_page.items] == [
+            row["id"] for row in offset_page
+        ]
+
+        offset = await _latency(
+            lambda depth=depth: repository.get_conversations(
+                CHILD_ID, limit=PAGE_SIZE, offset=depth, fields=FIELDS
+            ),
+        )
+        keyset = await _latency(
+            lambda cursor=cursor: repository.get_conversations_page(
+                CHILD_ID, cursor=cursor, size=PAGE_SIZE, fields=FIELDS
+            ),
+        )
+        results.append((depth, offset, keyset))
+    await repository.close()
+
+    print(f"\nPages of {PAGE_SIZE} from {ROWS:,} conversations of one child:")
+    for depth, offset, keyset in results:
+        print(
+            f"  depth {depth:>7,}: OFFSET {offset * 1000:7.2f} ms, "
+            f"keyset {keyset * 1000:5.2f} ms ({offset / keyset:.1f}x)",
+        )
+    _, deepest_offset, deepest_keyset = results[-1]
+    _, _, first_keyset = results[0]
+    assert deepest_keyset * 5 < deepest_offset
+    assert deepest_keyset < first_keyset * 5
@@ -0,0 +1,84 @@
+"""Benchmark: parent logins verified on the event loop vs in the hashing pool.
+
+Verifying inline blocks the loop for the whole bcrypt run, so every other
+request of the worker waits; the pool keeps the loop responsive and spreads
+the work over one process per core.
+"""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+import bcrypt
+import pytest
+
+from src.infrastructure.security.password_hasher import (
+    PasswordHasher,
+    PasswordHashingPool,
+)
+
+ROUNDS = 10
+LOGINS_PER_CORE = 16
+TICK = 0.005
+
+
+async def _run_with_lag_probe(logins) -> tuple[float, float]:
+    """Elapsed time of ``logins`` and the worst event-loop delay meanwhile."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def _probe():
+        nonlocal worst
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(TICK)
+            worst = max(worst, time.perf_counter() - started - TICK)
+
+    probe = asyncio.ensure_future(_probe())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await logins()
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe
+    return elapsed, worst
+
+
+@pytest.mark.performance
+async def test_login_throughput_and_loop_lag():
+    cores = os.cpu_count() or 1
+    count = LOGINS_PER_CORE * cores
+    settings = SimpleNamespace(
+        security=SimpleNamespace(PASSWORD_MIN_LENGTH=8, PASSWORD_HASH_ROUNDS=ROUNDS),
+    )
+    hashed = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=ROUNDS)).decode()
+    pool = PasswordHashingPool(workers=cores, max_pending=count)
+    hasher = PasswordHasher(settings, pool=pool)
+
+    async def _inline_login():
+        return hasher.verify_password("password123", hashed)
+
+    async def _pooled_login():
+        return await hasher.verify_password_async("password123", hashed)
+
+    # Start the worker processes before measuring
+    await asyncio.gather(*(_pooled_login() for _ in range(cores)))
+
+    inline, inline_lag = await _run_with_lag_probe(
+        lambda: asyncio.gather(*(_inline_login() for _ in range(count))),
+    )
+    pooled, pooled_lag = await _run_with_lag_probe(
+        lambda: asyncio.gather(*(_pooled_login() for _ in range(count))),
+    )
+    pool.shutdown()
+
+    print(
+        f"\n{count} logins at cost {ROUNDS} on {cores} core(s): "
+        f"inline {count / inline / cores:,.1f}/s per core, "
+        f"worst loop lag {inline_lag * 1000:,.0f} ms; "
+        f"pooled {count / pooled / cores:,.1f}/s per core, "
+        f"worst loop lag {pooled_lag * 1000:,.1f} ms",
+    )
+    assert pooled_lag * 10 < inline_lag
+    assert pooled < inline * 1.5
@@ -0,0 +1,109 @@
+"""Benchmark: rate limit checks per second per worker.
+
+Compares the JSON read-modify-write state in ``RateLimitStorage`` with the
+atomic Lua scripts, and counts Redis round-trips per check. Runs against
+``REDIS_URL`` when it is set, otherwise against fakeredis, where there is
+no network and round-trips are nearly free.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.infrastructure.security.rate_limiter.atomic import AtomicRateLimiter
+from src.infrastructure.security.rate_limiter.core import (
+    RateLimitConfig,
+    RateLimitStrategy,
+)
+from src.infrastructure.security.rate_limiter.storage import RateLimitStorage
+from src.infrastructure.security.rate_limiter.strategies import (
+    RateLimitingStrategies,
+)
+
+CHECKS = 2_000
+CONFIG = RateLimitConfig(
+    strategy=RateLimitStrategy.SLIDING_WINDOW,
+    max_requests=1_000_000,
+    window_seconds=60,
+    child_safe_mode=False,
+)
+
+
+class CountingRedis:
+    """Counts the commands sent through a Redis client."""
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self.commands = 0
+
+    def __getattr__(self, name):
+        attribute = getattr(self.client, name)
+        if not callable(attribute) or name == "register_script":
+            return attribute
+
+        async def _command(*args, **kwargs):
+            self.commands += 1
+            return await attribute(*args, **kwargs)
+
+        return _command
+
+    def register_script(self, source):
+        script = self.client.register_script(source)
+
+        async def _evalsha(*args, **kwargs):
+            self.commands += 1
+            return await script(*args, **kwargs)
+
+        return _evalsha
+
+
+async def _redis_client():
+    url = os.getenv("REDIS_URL")
+    if url:
+        import redis.asyncio as redis
+
+        return redis.from_url(url)
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeAsyncRedis()
+
+
+async def _json_state_check(storage: RateLimitStorage, key: str) -> bool:
+    state = await storage.get_state(key)
+    result = await RateLimitingStrategies.apply_strategy(CONFIG, state)
+    await storage.save_state(key, state)
+    return result.allowed
+
+
+@pytest.mark.performance
+async def test_atomic_checks_per_second():
+    client = await _redis_client()
+    await client.delete("rate_limit:bench-json", "rate_limit:sliding_window:bench")
+
+    json_redis = CountingRedis(client)
+    storage = RateLimitStorage(json_redis)
+    started = time.perf_counter()
+    for _ in range(CHECKS):
+        assert await _json_state_check(storage, "bench-json")
+    json_elapsed = time.perf_counter() - started
+
+    atomic_redis = CountingRedis(client)
+    limiter = AtomicRateLimiter(atomic_redis)
+    started = time.perf_counter()
+    for _ in range(CHECKS):
+        assert (await limiter.check("bench", CONFIG)).allowed
+    atomic_elapsed = time.perf_counter() - started
+
+    print(
+        f"\nJSON state: {CHECKS / json_elapsed:,.0f} checks/s, "
+        f"{json_redis.commands / CHECKS:.1f} round-trips/check; "
+        f"atomic Lua: {CHECKS / atomic_elapsed:,.0f} checks/s, "
+        f"{atomic_redis.commands / CHECKS:.1f} round-trips/check",
+    )
+    assert atomic_redis.commands == CHECKS
+    assert json_redis.commands == 2 * CHECKS
+    # The JSON blob grows with every request in the window; the scripts
+    # only touch the entries they need.
+    assert atomic_elapsed < json_elapsed
+    await client.delete("rate_limit:bench-json", "rate_limit:sliding_window:bench")
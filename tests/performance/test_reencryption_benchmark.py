@@ -0,0 +1,107 @@
+"""Benchmark: re-encrypting a conversation table while it serves reads.
+
+Measures the job's throughput, extrapolated to 10M rows, and the latency of
+reads made while it runs under its default budget.
+"""
+
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.infrastructure.persistence.conversation_sqlite_repository import (
+    _INSERT_CONVERSATION,
+    ConversationSQLiteRepository,
+)
+from src.infrastructure.security.key_management.reencryption_job import (
+    FileCheckpointStore,
+    ReencryptionBudget,
+    ReencryptionJob,
+)
+
+ROWS = 50_000
+CHILDREN = 500
+
+
+def _fill(db_path, key: bytes) -> None:
+    cipher = Fernet(key)
+    expires_at = (datetime.utcnow() + timedelta(days=90)).isoformat()
+    content = cipher.encrypt(b'{"message": "hello", "response": "hi there"}' * 4)
+    summary = cipher.encrypt(b"hello")
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            _INSERT_CONVERSATION,
+            (
+                (f"child-{i % CHILDREN:04d}", f"{i:016x}", content, summary, 1.0, expires_at)
+                for i in range(ROWS)
+            ),
+        )
+
+
+async def _read_latencies(repository, stop: asyncio.Event) -> list[float]:
+    latencies = []
+    i = 0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await repository.get_conversations(f"child-{i % CHILDREN:04d}", limit=20)
+        latencies.append(time.perf_counter() - started)
+        i += 1
+        await asyncio.sleep(0.005)
+    return latencies
+
+
+def _p99(latencies: list[float]) -> float:
+    return sorted(latencies)[int(len(latencies) * 0.99)] * 1000
+
+
+@pytest.mark.performance
+async def test_reencryption_throughput_and_read_latency(tmp_path, monkeypatch):
+    old_key, new_key = Fernet.generate_key(), Fernet.generate_key()
+    monkeypatch.setattr(
+        ConversationSQLiteRepository, "_get_or_create_encryption_key", lambda self: old_key
+    )
+    repository = ConversationSQLiteRepository(
+        str(tmp_path / "conversations.db"),
+        key_file=str(tmp_path / "conversation_key.key"),
+    )
+    _fill(repository.db_path, old_key)
+    repository.use_encryption_keys(new_key, previous=[old_key])
+
+    stop = asyncio.Event()
+    baseline = asyncio.ensure_future(_read_latencies(repository, stop))
+    await asyncio.sleep(1)
+    stop.set()
+    idle = await baseline
+
+    executor = ProcessPoolExecutor()
+    job = ReencryptionJob(
+        repository,
+        new_key,
+        [old_key],
+        FileCheckpointStore(tmp_path / "checkpoints"),
+        budget=ReencryptionBudget(rows_per_second=None, max_busy_fraction=0.5),
+        executor=executor,
+    )
+    stop = asyncio.Event()
+    reads = asyncio.ensure_future(_read_latencies(repository, stop))
+    started = time.perf_counter()
+    checkpoint = await job.run()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    during = await reads
+    executor.shutdown()
+    await repository.close()
+
+    rate = ROWS / elapsed
+    print(
+        f"\n{ROWS} rows at half duty: {rate:,.0f} rows/s "
+        f"(10M rows in {10_000_000 / rate / 3600:,.1f} h); read p99 "
+        f"{_p99(idle):.1f} ms idle, {_p99(during):.1f} ms during the job",
+    )
+    assert checkpoint.done
+    assert checkpoint.rewritten == ROWS
+    assert _p99(during) < max(_p99(idle) * 10, 50)
@@ -0,0 +1,67 @@
+"""Benchmark: compiled safety matcher vs. per-word substring scans.
+
+The old filters lowercased the text and ran one ``in`` check or regex per
+word or pattern, so the cost of a check grew with the size of the lexicon.
+The compiled matcher scans the text once for the whole lexicon.
+"""
+
+import re
+import time
+
+import pytest
+
+from src.domain.safety.pattern_matcher import Lexicon, SafetyPatternMatcher
+
+LEXICON_SIZE = 2_000
+PATTERN_COUNT = 4
+MESSAGES = 500
+MESSAGE = (
+    "Can you tell me a story about a brave little fox who finds a shiny "
+    "stone in the forest and shares it with all of her friends? "
+) * 2
+
+
+def _lexicon() -> tuple[str, ...]:
+    return tuple(f"badword{index}" for index in range(LEXICON_SIZE))
+
+
+def _patterns() -> tuple[str, ...]:
+    return tuple(
+        rf"where\s+to\s+(buy|get)\s+thing{index}" for index in range(PATTERN_COUNT)
+    )
+
+
+def _legacy_check(text: str, words: tuple[str, ...], patterns: tuple[str, ...]) -> bool:
+    text_lower = text.lower()
+    if [word for word in words if word in text_lower]:
+        return True
+    return any(re.search(pattern, text_lower) for pattern in patterns)
+
+
+@pytest.mark.performance
+def test_compiled_matcher_is_faster_than_per_word_scans():
+    words = _lexicon()
+    patterns = _patterns()
+    matcher = SafetyPatternMatcher(
+        [
+            Lexicon("blacklist", words),
+            Lexicon("dangerous", patterns, regex=True),
+        ],
+    )
+    messages = [f"{MESSAGE} #{index}" for index in range(MESSAGES)]
+
+    started = time.perf_counter()
+    legacy = [_legacy_check(message, words, patterns) for message in messages]
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled = [matcher.search(message) is not None for message in messages]
+    compiled_elapsed = time.perf_counter() - started
+
+    assert legacy == compiled
+    print(
+        f"\n{MESSAGES} messages x {LEXICON_SIZE} words + {PATTERN_COUNT} patterns: "
+        f"per-word {legacy_elapsed * 1000:.1f}ms, "
+        f"compiled {compiled_elapsed * 1000:.1f}ms",
+    )
+    assert compiled_elapsed < legacy_elapsed
@@ -0,0 +1,74 @@
+"""Benchmark: auth overhead per request, full verification vs the cached path.
+
+A parent's dashboard sends the same access token with every request. The
+full path decodes the JWT and checks its HMAC and claims each time; the
+cached path hashes the token, finds its verified payload and checks the
+revocation filter, here with 100k token ids revoked.
+"""
+
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.security.auth.token_verification import (
+    RevocationList,
+    VerifiedTokenCache,
+)
+from src.infrastructure.security.token_service import TokenService
+
+REQUESTS = 20_000
+REVOKED = 100_000
+PARENTS = 200
+
+
+def _service() -> TokenService:
+    settings = SimpleNamespace(
+        security=SimpleNamespace(
+            SECRET_KEY="benchmark_secret_key_that_is_longer_than_32_characters",
+            JWT_ALGORITHM="HS256",
+            ACCESS_TOKEN_EXPIRE_MINUTES=15,
+            REFRESH_TOKEN_EXPIRE_DAYS=7,
+        ),
+    )
+    return TokenService(settings)
+
+
+async def _per_request_us(service: TokenService, tokens: list[str]) -> float:
+    started = time.perf_counter()
+    for i in range(REQUESTS):
+        await service.verify_token(tokens[i % len(tokens)])
+    return (time.perf_counter() - started) / REQUESTS * 1e6
+
+
+@pytest.mark.performance
+async def test_auth_overhead_per_request():
+    service = _service()
+    tokens = [
+        service.create_access_token({"id": f"parent-{i}", "role": "parent"})
+        for i in range(PARENTS)
+    ]
+    revocations = RevocationList(capacity=REVOKED * 2)
+    expires_at = time.time() + 3600
+    for _ in range(REVOKED):
+        await revocations.revoke(uuid.uuid4().hex, expires_at)
+    service.revocations = revocations
+
+    # Full path: nothing is ever cached
+    service.token_cache = VerifiedTokenCache(max_size=0)
+    full = await _per_request_us(service, tokens)
+
+    service.token_cache = VerifiedTokenCache()
+    cached = await _per_request_us(service, tokens)
+
+    revoked = tokens[0]
+    await service.revoke_token(revoked)
+
+    print(
+        f"\nauth overhead per request: {full:.1f} us full, {cached:.1f} us cached "
+        f"({full / cached:.1f}x), {REVOKED:,} revoked ids",
+    )
+    assert cached < full
+    with pytest.raises(ValueError, match="revoked"):
+        await service.verify_token(revoked)
@@ -0,0 +1,110 @@
+"""Tests for AIOrchestrationService.stream_ai_response."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.interfaces.ai_provider import AIProvider
+from src.application.interfaces.safety_monitor import SafetyLevel
+from src.application.services.ai.ai_orchestration_service import (
+    UNSAFE_INPUT_REPLY,
+    UNSAFE_OUTPUT_REPLY,
+    AIOrchestrationService,
+)
+from src.domain.value_objects.child_preferences import ChildPreferences
+
+
+class StreamingProvider:
+    """Provider double that streams fixed deltas."""
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.generate_response = AsyncMock(return_value="Unused.")
+
+    async def stream_response(self, child_id, history, current_input, preferences):
+        for delta in self.deltas:
+            yield delta
+
+
+class NonStreamingProvider(AIProvider):
+    """Provider that inherits the protocol's stub ``stream_response``."""
+
+    async def generate_response(self, history, current_input, preferences):
+        return "One. Two."
+
+
+@pytest.fixture
+def safety_monitor():
+    monitor = MagicMock()
+    monitor.check_text_safety.return_value = SafetyLevel.SAFE
+    return monitor
+
+
+def _service(provider, safety_monitor):
+    return AIOrchestrationService(
+        ai_provider=provider,
+        safety_monitor=safety_monitor,
+        conversation_service=MagicMock(),
+    )
+
+
+async def _collect(service, current_input="tell me about stars"):
+    return [
+        sentence
+        async for sentence in service.stream_ai_response(
+            uuid4(),
+            [],
+            current_input,
+            ChildPreferences(),
+        )
+    ]
+
+
+class TestStreamAIResponse:
+    """Test sentence streaming with per-sentence safety checks."""
+
+    async def test_yields_each_sentence_after_safety_check(self, safety_monitor):
+        provider = StreamingProvider(["Stars are ", "suns. They ", "shine at night."])
+
+        sentences = await _collect(_service(provider, safety_monitor))
+
+        assert sentences == ["Stars are suns.", "They shine at night."]
+        checked = [call.args[0] for call in safety_monitor.check_text_safety.call_args_list]
+        assert checked == ["tell me about stars", *sentences]
+
+    async def test_unsafe_sentence_stops_stream(self, safety_monitor):
+        provider = StreamingProvider(["Nice sentence. ", "Bad sentence. ", "More."])
+        safety_monitor.check_text_safety.side_effect = lambda text: (
+            SafetyLevel.HIGH if text.startswith("Bad") else SafetyLevel.SAFE
+        )
+
+        sentences = await _collect(_service(provider, safety_monitor))
+
+        assert sentences == ["Nice sentence.", UNSAFE_OUTPUT_REPLY]
+
+    async def test_unsafe_input_never_reaches_provider(self, safety_monitor):
+        provider = StreamingProvider(["Hello."])
+        provider.stream_response = MagicMock()
+        safety_monitor.check_text_safety.return_value = SafetyLevel.HIGH
+
+        sentences = await _collect(_service(provider, safety_monitor))
+
+        assert sentences == [UNSAFE_INPUT_REPLY]
+        provider.stream_response.assert_not_called()
+
+    async def test_falls_back_to_generate_response(self, safety_monitor):
+        provider = MagicMock(spec=["generate_response"])
+        provider.generate_response = AsyncMock(return_value="One. Two.")
+
+        sentences = await _collect(_service(provider, safety_monitor))
+
+        assert sentences == ["One.", "Two."]
+
+    async def test_falls_back_when_stream_response_is_inherited_stub(
+        self,
+        safety_monitor,
+    ):
+        sentences = await _collect(_service(NonStreamingProvider(), safety_monitor))
+
+        assert sentences == ["One.", "Two."]
@@ -0,0 +1,226 @@
+"""Tests for the bounded conversation context window."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+
+from src.application.interfaces.conversation_context_store import (
+    ConversationContext,
+    ConversationTurn,
+)
+from src.application.interfaces.safety_monitor import SafetyLevel
+from src.application.services.ai.ai_orchestration_service import (
+    AIOrchestrationService,
+)
+from src.application.services.ai.context_window import (
+    ContextAssembler,
+    ContextWindowManager,
+    ExtractiveSummarizer,
+    InMemoryConversationContextStore,
+    estimate_tokens,
+    format_turn,
+)
+from src.infrastructure.persistence.redis_conversation_context_repository import (
+    RedisConversationContextRepository,
+)
+
+
+@pytest.fixture
+def store():
+    return InMemoryConversationContextStore()
+
+
+class TestContextWindowManager:
+    """Test the recent-turns ring and rolling summary."""
+
+    async def test_ring_keeps_latest_turns(self, store):
+        manager = ContextWindowManager(store, max_recent_turns=3, summarize_every=100)
+        child_id = uuid4()
+
+        for i in range(5):
+            await manager.record_turn(child_id, f"question {i}", f"answer {i}")
+
+        context = await manager.get_context(child_id)
+        assert [turn.child_text for turn in context.recent_turns] == [
+            "question 2",
+            "question 3",
+            "question 4",
+        ]
+        assert [turn.child_text for turn in context.pending_turns] == [
+            "question 0",
+            "question 1",
+        ]
+
+    async def test_summary_is_refreshed_once_per_batch(self, store):
+        summarizer = AsyncMock(side_effect=lambda summary, turns: f"{summary}+{len(turns)}")
+        manager = ContextWindowManager(
+            store,
+            max_recent_turns=2,
+            summarize_every=3,
+            summarizer=summarizer,
+        )
+        child_id = uuid4()
+
+        for i in range(11):
+            await manager.record_turn(child_id, f"q{i}", f"a{i}")
+
+        context = await manager.get_context(child_id)
+        assert summarizer.await_count == 3
+        assert context.rolling_summary == "+3+3+3"
+        assert context.pending_turns == []
+        assert len(context.recent_turns) == 2
+
+    async def test_context_size_is_bounded(self, store):
+        manager = ContextWindowManager(store, max_recent_turns=4, summarize_every=4)
+        child_id = uuid4()
+
+        for i in range(1000):
+            await manager.record_turn(child_id, f"question {i} " * 10, f"answer {i} " * 20)
+
+        context = await manager.get_context(child_id)
+        assert len(context.recent_turns) == 4
+        assert len(context.pending_turns) < 4
+        assert len(context.rolling_summary) <= ExtractiveSummarizer().max_chars
+
+    async def test_failing_summarizer_keeps_turns(self, store):
+        manager = ContextWindowManager(
+            store,
+            max_recent_turns=1,
+            summarize_every=2,
+            summarizer=AsyncMock(side_effect=RuntimeError("provider down")),
+        )
+        child_id = uuid4()
+
+        for i in range(20):
+            await manager.record_turn(child_id, f"q{i}", f"a{i}")
+
+        context = await manager.get_context(child_id)
+        assert len(context.pending_turns) == 8
+        assert context.pending_turns[-1].child_text == "q18"
+
+    async def test_forget(self, store):
+        manager = ContextWindowManager(store)
+        child_id = uuid4()
+        await manager.record_turn(child_id, "hi", "hello")
+
+        await manager.forget(child_id)
+
+        assert (await manager.get_context(child_id)).recent_turns == []
+
+
+class TestExtractiveSummarizer:
+    """Test the model-free summarizer."""
+
+    async def test_drops_oldest_text_at_turn_boundary(self):
+        summarizer = ExtractiveSummarizer(max_chars=40, turn_chars=5)
+        turns = [ConversationTurn(f"q{i}", f"a{i}") for i in range(10)]
+
+        summary = await summarizer("", turns)
+
+        assert len(summary) <= 40
+        assert summary.endswith("q9 / a9")
+        assert summary.startswith("q")
+
+
+class TestContextAssembler:
+    """Test fitting the context into a token budget."""
+
+    def _context(self, turns: int, summary: str = "") -> ConversationContext:
+        return ConversationContext(
+            rolling_summary=summary,
+            recent_turns=[
+                ConversationTurn(f"question {i}", f"answer {i}") for i in range(turns)
+            ],
+        )
+
+    def test_everything_fits(self):
+        context = self._context(2, summary="likes dinosaurs")
+
+        history = ContextAssembler(token_budget=1000).assemble(context, "hi", ["older"])
+
+        assert history == [
+            "Earlier conversations: likes dinosaurs",
+            "older",
+            format_turn(context.recent_turns[0]),
+            format_turn(context.recent_turns[1]),
+        ]
+
+    def test_newest_turns_win_within_budget(self):
+        context = self._context(10, summary="likes dinosaurs " * 50)
+        assembler = ContextAssembler(token_budget=60)
+
+        history = assembler.assemble(context, "what about volcanoes?")
+
+        assert history[0].startswith("Earlier conversations: ")
+        assert history[-1] == format_turn(context.recent_turns[-1])
+        assert "question 0" not in "".join(history)
+        used = sum(estimate_tokens(entry) for entry in history)
+        assert used + estimate_tokens("what about volcanoes?") <= 60
+
+    def test_summary_keeps_its_newest_part(self):
+        context = self._context(0, summary="old stuff " * 100 + "recent stuff")
+
+        (summary,) = ContextAssembler(token_budget=40, summary_share=0.5).assemble(context)
+
+        assert summary.endswith("recent stuff")
+        assert estimate_tokens(summary) <= 20
+
+    def test_empty_context(self):
+        assert ContextAssembler().assemble(ConversationContext(), "hi", ["a", "b"]) == [
+            "a",
+            "b",
+        ]
+
+
+class TestRedisConversationContextRepository:
+    """Test the Redis-backed context store."""
+
+    async def test_round_trip(self):
+        repository = RedisConversationContextRepository(fakeredis.aioredis.FakeRedis())
+        manager = ContextWindowManager(repository, max_recent_turns=2, summarize_every=1)
+        child_id = uuid4()
+
+        for i in range(4):
+            await manager.record_turn(child_id, f"q{i}", f"a{i}")
+
+        context = await repository.get(child_id)
+        assert [turn.child_text for turn in context.recent_turns] == ["q2", "q3"]
+        assert context.rolling_summary == "q0 / a0 | q1 / a1"
+        assert await repository.redis_client.ttl(f"conversation_context:{child_id}") > 0
+
+        await repository.delete(child_id)
+        assert await repository.get(child_id) is None
+
+
+class TestOrchestratorContext:
+    """Test that AIOrchestrationService sends the assembled context."""
+
+    async def test_provider_receives_assembled_context(self, store):
+        manager = ContextWindowManager(store)
+        child_id = uuid4()
+        await manager.record_turn(child_id, "do you like cats?", "I love cats!")
+        provider = MagicMock()
+        provider.generate_response = AsyncMock(return_value="Cats purr.")
+        safety_monitor = MagicMock()
+        safety_monitor.check_text_safety.return_value = SafetyLevel.SAFE
+        service = AIOrchestrationService(
+            ai_provider=provider,
+            safety_monitor=safety_monitor,
+            conversation_service=MagicMock(),
+            context_window=manager,
+        )
+
+        history = await service.build_context(child_id, ["a story"], "why do cats purr?")
+
+        assert history == ["a story", "Child: do you like cats?\nTeddy: I love cats!"]
+
+    async def test_without_context_window_history_is_unchanged(self):
+        service = AIOrchestrationService(
+            ai_provider=MagicMock(),
+            safety_monitor=MagicMock(),
+            conversation_service=MagicMock(),
+        )
+
+        assert await service.build_context(uuid4(), ["a", "b"], "hi") == ["a", "b"]
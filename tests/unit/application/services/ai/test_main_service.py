@@ -8,6 +8,7 @@ import pytest
 
 from src.application.services.ai.main_service import AITeddyBearService
 from src.application.services.ai.models import AIResponse
+from src.infrastructure.caching.tiered_cache import TieredCache
 
 
 class TestAITeddyBearService:
@@ -28,7 +29,7 @@ class TestAITeddyBearService:
     def mock_redis_cache(self):
         """Create a mock Redis cache."""
         cache = Mock()
-        cache.get = AsyncMock()
+        cache.get = AsyncMock(return_value=None)
         cache.setex = AsyncMock()
         return cache
 
@@ -40,7 +41,11 @@ class TestAITeddyBearService:
         ) as mock_openai:
             mock_openai.return_value = Mock()
             service = AITeddyBearService(
-                openai_api_key="test_api_key", redis_cache=mock_redis_cache
+                openai_api_key="test_api_key",
+                redis_cache=mock_redis_cache,
+                response_cache=TieredCache(
+                    "test_ai_responses", redis_client=mock_redis_cache
+                ),
             )
             return service
 
@@ -51,7 +56,10 @@ class TestAITeddyBearService:
             "src.application.services.ai.main_service.AsyncOpenAI"
         ) as mock_openai:
             mock_openai.return_value = Mock()
-            return AITeddyBearService(openai_api_key="test_api_key")
+            return AITeddyBearService(
+                openai_api_key="test_api_key",
+                response_cache=TieredCache("test_ai_responses"),
+            )
 
     def test_initialization_with_api_key(self, mock_redis_cache):
         """Test service initialization with API key."""
@@ -421,58 +429,42 @@ class TestAITeddyBearService:
                             assert "low_safety_score" in result.moderation_flags
                             assert "age_inappropriate" in result.moderation_flags
 
+    def test_cache_key_ignores_the_child_name(self, service):
+        """Children of one age band asking the same question share a key."""
+        cache_key = service._generate_cache_key("What's a volcano?", 6)
+
+        assert len(cache_key) == 32
+        assert cache_key == service._generate_cache_key("what is a volcano", 7)
+        assert cache_key != service._generate_cache_key("What's a volcano?", 12)
+        assert cache_key != service._generate_cache_key(
+            "What's a volcano?", 6, parent_guidelines="no scary topics"
+        )
+
     @pytest.mark.asyncio
     async def test_caching_functionality(self, service, mock_redis_cache):
-        """Test response caching functionality."""
-        # Test cache key generation
-        cache_key = service._generate_cache_key("Hello", 6, "Alice")
-        assert isinstance(cache_key, str)
-        assert len(cache_key) == 16  # SHA256 hash truncated to 16 chars
-
-        # Test cache retrieval (cache miss)
-        mock_redis_cache.get.return_value = None
-        cached_response = await service._get_cached_response(cache_key)
-        assert cached_response is None
-
-        # Test cache storage
-        ai_response = AIResponse(
-            content="Cached response",
-            safety_score=0.9,
-            age_appropriate=True,
-            sentiment="positive",
-            topics=["test"],
-            processing_time=0.1,
-        )
+        """Responses are stored in Redis with the cache TTL."""
+        cache_key = service._generate_cache_key("Hello", 6)
+
+        assert await service.response_cache.get(cache_key) is None
+
+        await service.response_cache.set(cache_key, "Cached response")
 
-        await service._cache_response(cache_key, ai_response)
-        mock_redis_cache.setex.assert_called_once()
-        args = mock_redis_cache.setex.call_args
-        assert args[0][0] == cache_key
-        assert args[0][1] == 3600  # 1 hour TTL
+        assert await service.response_cache.get(cache_key) == "Cached response"
+        mock_redis_cache.setex.assert_awaited_once()
+        args = mock_redis_cache.setex.await_args.args
+        assert args[0] == f"test_ai_responses:{cache_key}"
+        assert args[1] == 300
 
     @pytest.mark.asyncio
     async def test_cache_error_handling(self, service, mock_redis_cache):
-        """Test cache error handling."""
-        cache_key = "test_key"
-
-        # Test cache retrieval error
+        """Redis errors count as misses and do not fail the request."""
         mock_redis_cache.get.side_effect = Exception("Cache error")
-        result = await service._get_cached_response(cache_key)
-        assert result is None
-
-        # Test cache storage error
-        ai_response = AIResponse(
-            content="Test",
-            safety_score=0.9,
-            age_appropriate=True,
-            sentiment="positive",
-            topics=["test"],
-            processing_time=0.1,
-        )
-
         mock_redis_cache.setex.side_effect = Exception("Cache error")
-        # Should not raise exception
-        await service._cache_response(cache_key, ai_response)
+
+        assert await service.response_cache.get("test_key") is None
+        await service.response_cache.set("test_key", "Test")
+
+        assert service.response_cache.metrics.errors == 2
 
     @pytest.mark.asyncio
     async def test_fallback_response(self, service):
@@ -601,7 +593,6 @@ class TestAITeddyBearService:
             mock_utils.extract_topics.return_value = ["education"]
             mock_utils.clean_content.return_value = "Clean content"
             mock_utils.get_age_group.return_value = "elementary"
-            mock_utils.generate_cache_key.return_value = "test_key"
             mock_utils.get_fallback_response.return_value = AIResponse(
                 content="Fallback",
                 safety_score=1.0,
@@ -618,7 +609,6 @@ class TestAITeddyBearService:
             service._extract_topics("content")
             service._clean_content("content")
             service._get_age_group(8)
-            service._generate_cache_key("msg", 8, "name")
 
             # Verify calls
             mock_utils.calculate_safety_score.assert_called_once()
@@ -627,31 +617,15 @@ class TestAITeddyBearService:
             mock_utils.extract_topics.assert_called_once()
             mock_utils.clean_content.assert_called_once()
             mock_utils.get_age_group.assert_called_once()
-            mock_utils.generate_cache_key.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_service_without_cache(self, service_no_cache):
-        """Test service functionality without Redis cache."""
-        # Cache methods should handle None cache gracefully
-        cache_key = "test_key"
-
-        # Should return None for cache miss
-        result = await service_no_cache._get_cached_response(cache_key)
-        assert result is None
-
-        # Should not raise error for cache storage
-        ai_response = AIResponse(
-            content="Test",
-            safety_score=0.9,
-            age_appropriate=True,
-            sentiment="positive",
-            topics=["test"],
-            processing_time=0.1,
-        )
+        """Without Redis, responses are cached in process only."""
+        assert service_no_cache.response_cache.l2 is None
 
-        await service_no_cache._cache_response(
-            cache_key, ai_response
-        )  # Should not raise
+        assert await service_no_cache.response_cache.get("test_key") is None
+        await service_no_cache.response_cache.set("test_key", "Test")
+        assert await service_no_cache.response_cache.get("test_key") == "Test"
 
     def test_configuration_validation(self, service):
         """Test that service configuration is properly validated."""
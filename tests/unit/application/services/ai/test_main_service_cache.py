@@ -0,0 +1,101 @@
+"""Tests for the shared response cache in AITeddyBearService."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from src.application.services.ai.main_service import AITeddyBearService
+from src.infrastructure.caching.tiered_cache import TieredCache
+
+
+class CachedAIResponse(BaseModel):
+    content: str
+    safety_score: float = 1.0
+    moderation_flags: list[str] = []
+    processing_time: float = 0.0
+    cached: bool = False
+
+
+@pytest.fixture
+def service():
+    with (
+        patch("src.application.services.ai.main_service.AsyncOpenAI"),
+        patch(
+            "src.application.services.ai.main_service.AIResponse",
+            CachedAIResponse,
+        ),
+    ):
+        service = AITeddyBearService(
+            openai_api_key="test_api_key",
+            response_cache=TieredCache("test_ai_responses"),
+        )
+        service._moderate_content = AsyncMock(
+            return_value={"safe": True, "categories": [], "scores": {}},
+        )
+
+        async def _complete(**kwargs):
+            await asyncio.sleep(0.01)
+            name = kwargs["messages"][0]["content"].split("speaking to ")[1]
+            name = name.split(",")[0]
+            message = Mock()
+            message.content = f"Volcanoes are mountains, {name}!"
+            return Mock(choices=[Mock(message=message)])
+
+        service.client.chat.completions.create = AsyncMock(side_effect=_complete)
+
+        async def _post_process(content, child_age, moderation_result):
+            return CachedAIResponse(content=content)
+
+        service._post_process_response = _post_process
+        yield service
+
+
+class TestResponseCache:
+    """Test that responses are shared across children of an age band."""
+
+    async def test_same_question_hits_cache_for_other_child(self, service):
+        first = await service.generate_response("What's a volcano?", 6, "Sam")
+        second = await service.generate_response("what is a volcano", 7, "Alice")
+
+        assert first.content == "Volcanoes are mountains, Sam!"
+        assert second.content == "Volcanoes are mountains, Alice!"
+        assert second.cached is True
+        assert service.client.chat.completions.create.await_count == 1
+
+    async def test_concurrent_misses_call_model_once(self, service):
+        responses = await asyncio.gather(
+            service.generate_response("What is rain?", 6, "Sam"),
+            service.generate_response("what is rain", 6, "Noor"),
+            service.generate_response("What is rain!", 6, "Lee"),
+        )
+
+        assert [response.content for response in responses] == [
+            "Volcanoes are mountains, Sam!",
+            "Volcanoes are mountains, Noor!",
+            "Volcanoes are mountains, Lee!",
+        ]
+        assert service.client.chat.completions.create.await_count == 1
+        assert service._moderate_content.await_count == 1
+        assert service.response_cache.metrics.coalesced == 2
+
+    async def test_different_age_band_misses(self, service):
+        await service.generate_response("What is rain?", 6, "Sam")
+        await service.generate_response("What is rain?", 12, "Sam")
+
+        assert service.client.chat.completions.create.await_count == 2
+
+    async def test_flagged_response_is_not_cached(self, service):
+        async def _flagged(content, child_age, moderation_result):
+            return CachedAIResponse(
+                content=content,
+                moderation_flags=["age_inappropriate"],
+            )
+
+        service._post_process_response = _flagged
+
+        await service.generate_response("What is rain?", 6, "Sam")
+        await service.generate_response("What is rain?", 6, "Sam")
+
+        assert service.client.chat.completions.create.await_count == 2
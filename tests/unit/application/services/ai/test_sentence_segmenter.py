@@ -0,0 +1,72 @@
+"""Tests for the streaming sentence segmenter."""
+
+import pytest
+
+from src.application.services.ai.sentence_segmenter import (
+    SentenceSegmenter,
+    iter_sentences,
+)
+
+
+async def _deltas(*parts: str):
+    for part in parts:
+        yield part
+
+
+class TestSentenceSegmenter:
+    """Test incremental sentence segmentation."""
+
+    def test_emits_sentence_once_followed_by_whitespace(self):
+        segmenter = SentenceSegmenter()
+
+        assert segmenter.feed("Hello there!") == []
+        assert segmenter.feed(" How are") == ["Hello there!"]
+        assert segmenter.flush() == "How are"
+
+    def test_does_not_split_decimals(self):
+        segmenter = SentenceSegmenter()
+
+        assert segmenter.feed("Pi is about 3.14 and that is fun. ") == [
+            "Pi is about 3.14 and that is fun.",
+        ]
+
+    def test_keeps_closing_quotes_with_sentence(self):
+        segmenter = SentenceSegmenter()
+
+        assert segmenter.feed('The bear said "hi!" Then') == ['The bear said "hi!"']
+
+    def test_merges_short_sentences(self):
+        segmenter = SentenceSegmenter(min_length=10)
+
+        assert segmenter.feed("Oh! That is a big volcano. ") == [
+            "Oh! That is a big volcano.",
+        ]
+
+    def test_forces_split_of_long_runs(self):
+        segmenter = SentenceSegmenter(max_length=20)
+
+        sentences = segmenter.feed("once upon a time, in a land far away and")
+
+        assert sentences == ["once upon a time,"]
+        assert segmenter.flush() == "in a land far away and"
+
+    def test_arabic_question_mark(self):
+        segmenter = SentenceSegmenter()
+
+        assert segmenter.feed("كيف حالك؟ أنا") == ["كيف حالك؟"]
+
+    def test_rejects_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            SentenceSegmenter(min_length=0)
+        with pytest.raises(ValueError):
+            SentenceSegmenter(min_length=10, max_length=5)
+
+    async def test_iter_sentences_flushes_remainder(self):
+        sentences = [
+            sentence
+            async for sentence in iter_sentences(
+                _deltas("Volcanoes are moun", "tains. They can ", "erupt")
+            )
+        ]
+
+        assert sentences == ["Volcanoes are mountains.", "They can erupt"]
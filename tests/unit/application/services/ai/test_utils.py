@@ -2,8 +2,6 @@
 Testing AI service utility functions for content analysis and safety.
 """
 
-import hashlib
-
 from src.application.dto.ai_response import AIResponse
 from src.application.services.ai.utils import AIServiceUtils
 
@@ -121,50 +119,6 @@ class TestAIServiceUtils:
         assert AIServiceUtils.get_age_group(12) == "elementary"
         assert AIServiceUtils.get_age_group(13) == "middle_school"
 
-    def test_generate_cache_key_consistency(self):
-        """Test cache key generation consistency."""
-        message = "Hello teddy bear"
-        age = 6
-        name = "Alice"
-
-        # Generate multiple times - should be consistent
-        key1 = AIServiceUtils.generate_cache_key(message, age, name)
-        key2 = AIServiceUtils.generate_cache_key(message, age, name)
-
-        assert key1 == key2
-        assert len(key1) == 16  # Truncated SHA256
-        assert isinstance(key1, str)
-
-    def test_generate_cache_key_uniqueness(self):
-        """Test that different inputs generate different cache keys."""
-        # Different messages
-        key1 = AIServiceUtils.generate_cache_key("Hello", 6, "Alice")
-        key2 = AIServiceUtils.generate_cache_key("Goodbye", 6, "Alice")
-        assert key1 != key2
-
-        # Different ages
-        key3 = AIServiceUtils.generate_cache_key("Hello", 6, "Alice")
-        key4 = AIServiceUtils.generate_cache_key("Hello", 8, "Alice")
-        assert key3 != key4
-
-        # Different names
-        key5 = AIServiceUtils.generate_cache_key("Hello", 6, "Alice")
-        key6 = AIServiceUtils.generate_cache_key("Hello", 6, "Bob")
-        assert key5 != key6
-
-    def test_generate_cache_key_format(self):
-        """Test cache key generation format and algorithm."""
-        message = "Test message"
-        age = 7
-        name = "TestChild"
-
-        # Generate expected key manually
-        key_data = f"{message}:{age}:{name}"
-        expected_key = hashlib.sha256(key_data.encode()).hexdigest()[:16]
-
-        result = AIServiceUtils.generate_cache_key(message, age, name)
-        assert result == expected_key
-
     def test_get_fallback_response_basic(self):
         """Test basic fallback response generation."""
         child_name = "Alice"
@@ -413,7 +367,6 @@ class TestAIServiceUtils:
         # Test a complete workflow
         content = "I love to play fun games and learn about happy animals!"
         age = 8
-        name = "TestChild"
 
         # Extract topics
         topics = AIServiceUtils.extract_topics(content)
@@ -444,10 +397,6 @@ class TestAIServiceUtils:
         )
         assert safety_score > 0.9
 
-        # Generate cache key
-        cache_key = AIServiceUtils.generate_cache_key(content, age, name)
-        assert len(cache_key) == 16
-
     def test_performance_characteristics(self):
         """Test performance characteristics of utility functions."""
         import time
@@ -465,7 +414,6 @@ class TestAIServiceUtils:
         AIServiceUtils.calculate_safety_score(
             large_content, {"safe": True}, ["violence"]
         )
-        AIServiceUtils.generate_cache_key(large_content, 8, "TestChild")
 
         end_time = time.time()
         processing_time = end_time - start_time
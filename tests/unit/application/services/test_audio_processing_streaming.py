@@ -0,0 +1,71 @@
+"""Tests for streamed audio responses in AudioProcessingService."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.application.services.device.audio_processing_service import (
+    AudioProcessingService,
+)
+
+
+def _service(tts_service) -> AudioProcessingService:
+    return AudioProcessingService(
+        speech_processor=MagicMock(),
+        safety_monitor=MagicMock(),
+        tts_service=tts_service,
+    )
+
+
+class TestStreamAudioResponse:
+    """Test chunked TTS delivery and its fallbacks."""
+
+    async def test_forwards_provider_chunks(self):
+        tts_service = MagicMock()
+
+        async def _stream(text, voice_id):
+            yield b"chunk-1"
+            yield b"chunk-2"
+
+        tts_service.stream_text_to_speech = _stream
+
+        chunks = [
+            chunk
+            async for chunk in _service(tts_service).stream_audio_response(
+                "Hi",
+                "teddy",
+            )
+        ]
+
+        assert chunks == [b"chunk-1", b"chunk-2"]
+
+    async def test_falls_back_to_buffered_tts(self):
+        tts_service = MagicMock(spec=["text_to_speech"])
+        tts_service.text_to_speech = AsyncMock(return_value=b"whole")
+
+        chunks = [
+            chunk
+            async for chunk in _service(tts_service).stream_audio_response(
+                "Hi",
+                "teddy",
+            )
+        ]
+
+        assert chunks == [b"whole"]
+
+    async def test_provider_error_ends_stream(self):
+        tts_service = MagicMock()
+
+        async def _stream(text, voice_id):
+            yield b"chunk-1"
+            raise RuntimeError("connection reset")
+
+        tts_service.stream_text_to_speech = _stream
+
+        chunks = [
+            chunk
+            async for chunk in _service(tts_service).stream_audio_response(
+                "Hi",
+                "teddy",
+            )
+        ]
+
+        assert chunks == [b"chunk-1"]
@@ -0,0 +1,195 @@
+"""Tests for concurrent, short-circuiting and batched SafetyService analysis."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.application.services.child_safety.safety import SafetyService
+from src.domain.models.safety_models import RiskLevel, SafetyConfig
+
+
+def _slow(value, delay=0.05):
+    async def _call(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return value
+
+    return _call
+
+
+@pytest.fixture
+def ai_provider():
+    provider = Mock(
+        spec=[
+            "analyze_toxicity",
+            "analyze_emotion",
+            "evaluate_educational_value",
+            "analyze_context",
+        ],
+    )
+    provider.analyze_toxicity = AsyncMock(side_effect=_slow(0.05))
+    provider.analyze_emotion = AsyncMock(side_effect=_slow("happy"))
+    provider.evaluate_educational_value = AsyncMock(
+        side_effect=_slow({"score": 0.8, "topics": ["animals"]}),
+    )
+    provider.analyze_context = AsyncMock(
+        side_effect=_slow({"is_personal_info": False, "is_sensitive_topic": False}),
+    )
+    return provider
+
+
+@pytest.fixture
+def performance_monitor():
+    monitor = Mock()
+    monitor.record_safety_check = AsyncMock()
+    return monitor
+
+
+def _service(ai_provider, performance_monitor, **kwargs) -> SafetyService:
+    return SafetyService(
+        config=SafetyConfig(keyword_blacklist=["bad word"], toxicity_threshold=0.5),
+        ai_provider=ai_provider,
+        performance_monitor=performance_monitor,
+        **kwargs,
+    )
+
+
+class TestParallelAnalysis:
+    """Test that analyzers run concurrently under one deadline."""
+
+    async def test_analyzers_run_concurrently(self, ai_provider, performance_monitor):
+        service = _service(ai_provider, performance_monitor)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        result = await service.analyze_content("Tell me about cats", {"topic": "cats"})
+        elapsed = loop.time() - started
+
+        assert elapsed < 0.15  # four 50ms calls, not 200ms back to back
+        assert result.is_safe is True
+        assert result.overall_risk_level == RiskLevel.SAFE
+        assert result.toxicity_result.score == 0.05
+        assert result.emotional_impact.sentiment_label == "happy"
+        assert result.educational_value.educational_score == 0.8
+        assert result.context_analysis.context_safe is True
+
+    async def test_short_circuits_on_blocking_verdict(
+        self,
+        ai_provider,
+        performance_monitor,
+    ):
+        ai_provider.analyze_toxicity.side_effect = _slow(0.9, delay=0.01)
+        ai_provider.evaluate_educational_value.side_effect = _slow({}, delay=5)
+        service = _service(ai_provider, performance_monitor)
+
+        result = await asyncio.wait_for(service.analyze_content("mean words"), 1)
+
+        assert result.is_safe is False
+        assert "educational_value" in result.additional_info["short_circuited"]
+        performance_monitor.record_safety_check.assert_awaited_with(
+            result="blocked_content",
+        )
+
+    async def test_keyword_match_skips_ai_calls(self, ai_provider, performance_monitor):
+        service = _service(ai_provider, performance_monitor)
+
+        result = await service.analyze_content("this is a bad word")
+
+        assert result.is_safe is False
+        ai_provider.analyze_toxicity.assert_not_awaited()
+
+    async def test_blacklist_matches_inside_longer_words(
+        self,
+        ai_provider,
+        performance_monitor,
+    ):
+        service = SafetyService(
+            config=SafetyConfig(keyword_blacklist=["blood", "kill", "sex"]),
+            ai_provider=ai_provider,
+            performance_monitor=performance_monitor,
+        )
+
+        for content in ("a bloody nose", "the killer", "sexual content"):
+            result = await service.analyze_content(content)
+
+            assert result.is_safe is False
+
+    async def test_without_short_circuit_all_analyzers_finish(
+        self,
+        ai_provider,
+        performance_monitor,
+    ):
+        ai_provider.analyze_toxicity.side_effect = _slow(0.9, delay=0.01)
+        service = _service(ai_provider, performance_monitor, short_circuit=False)
+
+        result = await service.analyze_content("mean words")
+
+        assert result.is_safe is False
+        assert result.educational_value.educational_score == 0.8
+        assert "short_circuited" not in result.additional_info
+
+    async def test_deadline_fails_closed_for_safety_analyzers(
+        self,
+        ai_provider,
+        performance_monitor,
+    ):
+        ai_provider.analyze_toxicity.side_effect = _slow(0.0, delay=5)
+        service = _service(ai_provider, performance_monitor, deadline_seconds=0.1)
+
+        result = await asyncio.wait_for(service.analyze_content("hello"), 1)
+
+        assert result.is_safe is False
+        assert result.additional_info["timed_out"] == ["toxicity"]
+
+    async def test_deadline_on_informational_analyzer_keeps_verdict(
+        self,
+        ai_provider,
+        performance_monitor,
+    ):
+        ai_provider.analyze_emotion.side_effect = _slow("happy", delay=5)
+        service = _service(ai_provider, performance_monitor, deadline_seconds=0.1)
+
+        result = await asyncio.wait_for(service.analyze_content("hello"), 1)
+
+        assert result.is_safe is True
+        assert result.additional_info["timed_out"] == ["emotion"]
+
+
+class TestBatchedAnalysis:
+    """Test the single-call batched mode."""
+
+    async def test_uses_one_provider_call(self, ai_provider, performance_monitor):
+        ai_provider.analyze_safety = AsyncMock(
+            return_value={
+                "toxicity": 0.02,
+                "emotion": "curious",
+                "educational_value": {"score": 0.7, "topics": ["space"]},
+                "context": {"is_personal_info": True, "is_sensitive_topic": False},
+            },
+        )
+        service = _service(ai_provider, performance_monitor, batched=True)
+
+        result = await service.analyze_content("I live at 5 Main St", {"turn": 3})
+
+        ai_provider.analyze_safety.assert_awaited_once_with(
+            "I live at 5 Main St",
+            {"turn": 3},
+        )
+        ai_provider.analyze_toxicity.assert_not_awaited()
+        assert result.additional_info["batched"] is True
+        assert result.emotional_impact.sentiment_label == "curious"
+        assert result.is_safe is False
+        assert result.parent_notification_required is True
+
+    async def test_falls_back_when_batched_call_fails(
+        self,
+        ai_provider,
+        performance_monitor,
+    ):
+        ai_provider.analyze_safety = AsyncMock(side_effect=ValueError("bad json"))
+        service = _service(ai_provider, performance_monitor, batched=True)
+
+        result = await service.analyze_content("Tell me about cats")
+
+        assert result.is_safe is True
+        ai_provider.analyze_toxicity.assert_awaited_once()
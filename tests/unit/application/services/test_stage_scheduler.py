@@ -0,0 +1,104 @@
+"""Tests for the dependency-aware StageScheduler."""
+
+import asyncio
+
+import pytest
+
+from src.application.services.core.stage_scheduler import StageScheduler
+
+
+def _sleeper(value, delay=0.05, log=None):
+    async def _run(deps):
+        if log is not None:
+            log.append(("start", value))
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(("end", value))
+        return value
+
+    return _run
+
+
+class TestStageScheduler:
+    """Test DAG execution, concurrency and timing spans."""
+
+    async def test_independent_stages_run_concurrently(self):
+        scheduler = StageScheduler()
+        scheduler.add("a", _sleeper("a", 0.1))
+        scheduler.add("b", _sleeper("b", 0.1))
+        scheduler.add("c", _sleeper("c", 0.1))
+
+        run = await scheduler.run()
+
+        assert run.results == {"a": "a", "b": "b", "c": "c"}
+        assert run.total_ms < 250
+
+    async def test_dependents_receive_results(self):
+        scheduler = StageScheduler()
+        scheduler.add("profile", _sleeper({"name": "Sara"}, 0.01))
+        scheduler.add("history", _sleeper(["hi"], 0.01))
+
+        async def _reply(deps):
+            return f"{deps['profile']['name']}:{len(deps['history'])}"
+
+        scheduler.add("reply", _reply, depends_on=("profile", "history"))
+
+        run = await scheduler.run()
+
+        assert run["reply"] == "Sara:1"
+
+    async def test_dependent_starts_after_dependency(self):
+        log = []
+        scheduler = StageScheduler()
+        scheduler.add("first", _sleeper("first", 0.02, log))
+        scheduler.add("second", _sleeper("second", 0.01, log), depends_on=("first",))
+
+        await scheduler.run()
+
+        assert log.index(("end", "first")) < log.index(("start", "second"))
+
+    async def test_records_timing_spans(self):
+        scheduler = StageScheduler()
+        scheduler.add("stt", _sleeper("text", 0.03))
+        scheduler.add("tts", _sleeper(b"audio", 0.01), depends_on=("stt",))
+
+        run = await scheduler.run()
+
+        names = [timing.name for timing in run.timings]
+        assert names == ["stt", "tts"]
+        assert run.timings[0].duration_ms >= 25
+        assert run.timings[1].started_ms >= run.timings[0].finished_ms - 1
+        assert "stt=" in run.summary()
+
+    async def test_failure_cancels_running_stages(self):
+        cancelled = asyncio.Event()
+
+        async def _slow(deps):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def _boom(deps):
+            raise LookupError("profile missing")
+
+        scheduler = StageScheduler()
+        scheduler.add("slow", _slow)
+        scheduler.add("boom", _boom)
+
+        with pytest.raises(LookupError):
+            await scheduler.run()
+        assert cancelled.is_set()
+
+    def test_rejects_unknown_dependency(self):
+        scheduler = StageScheduler()
+
+        with pytest.raises(ValueError):
+            scheduler.add("reply", _sleeper("x"), depends_on=("missing",))
+
+    def test_rejects_duplicate_stage(self):
+        scheduler = StageScheduler().add("a", _sleeper("a"))
+
+        with pytest.raises(ValueError):
+            scheduler.add("a", _sleeper("a"))
@@ -0,0 +1,134 @@
+"""Tests for the compiled multi-pattern safety matcher."""
+
+from src.domain.safety.pattern_matcher import Lexicon, SafetyPatternMatcher
+from src.infrastructure.ai.chatgpt.safety_filter import SafetyFilter
+
+
+class TestSafetyPatternMatcher:
+    """Tests for SafetyPatternMatcher."""
+
+    def test_reports_categories_with_distinct_terms(self):
+        """Every category found maps to its distinct matched terms."""
+        matcher = SafetyPatternMatcher(
+            [
+                Lexicon("violence", ("kill", "weapon")),
+                Lexicon("scary", ("monster", "ghost")),
+            ],
+        )
+
+        found = matcher.categories("A Monster with a weapon, another monster")
+
+        assert found == {"scary": ["monster"], "violence": ["weapon"]}
+
+    def test_whole_words_only(self):
+        """Terms inside longer words are not matched."""
+        matcher = SafetyPatternMatcher([Lexicon("forbidden", ("hell", "ass"))])
+
+        assert matcher.search("Hello, I passed my class") is None
+        assert matcher.search("What the hell").term == "hell"
+
+    def test_inflections(self):
+        """Inflected forms of literal terms match when enabled."""
+        matcher = SafetyPatternMatcher(
+            [Lexicon("violence", ("kill",), inflections=True)],
+        )
+
+        hits = matcher.find_all("kills, killed, KILLING, killer")
+
+        assert [hit.text for hit in hits] == ["kills", "killed", "KILLING"]
+        assert {hit.term for hit in hits} == {"kill"}
+
+    def test_longest_phrase_wins(self):
+        """A phrase is preferred over a shorter term at the same position."""
+        matcher = SafetyPatternMatcher(
+            [
+                Lexicon("mild", ("bad",)),
+                Lexicon("severe", ("bad word",)),
+            ],
+        )
+
+        hit = matcher.search("that is a bad word")
+
+        assert hit.term == "bad word"
+        assert hit.categories == ("severe",)
+
+    def test_term_in_several_lexicons_reports_every_category(self):
+        """A shared term reports each category, even with different options."""
+        matcher = SafetyPatternMatcher(
+            [
+                Lexicon("violence", ("kill",), inflections=True),
+                Lexicon("blacklist", ("kill",)),
+            ],
+        )
+
+        assert matcher.search("kill it").categories == ("violence", "blacklist")
+        assert matcher.search("killing it").categories == ("violence",)
+
+    def test_regex_lexicon(self):
+        """Regex lexicons report the pattern as the term."""
+        pattern = r"where\s+do\s+you\s+live"
+        matcher = SafetyPatternMatcher(
+            [Lexicon("personal_info", (pattern,), regex=True)],
+        )
+
+        hit = matcher.search("so WHERE do  you live?")
+
+        assert hit.term == pattern
+        assert hit.text == "WHERE do  you live"
+
+    def test_sub_with_mapping_keeps_unmapped_terms(self):
+        """Replacement mappings are applied in one pass."""
+        matcher = SafetyPatternMatcher([Lexicon("words", ("kill", "fight", "die"))])
+
+        cleaned = matcher.sub("Kill the dragon, fight, die", {"kill": "stop", "die": "sleep"})
+
+        assert cleaned == "stop the dragon, fight, sleep"
+
+    def test_sub_with_callable(self):
+        """A replacement function receives each hit."""
+        matcher = SafetyPatternMatcher([Lexicon("words", ("secret",))])
+
+        cleaned = matcher.sub("my Secret", lambda hit: f"[{hit.category}]")
+
+        assert cleaned == "my [words]"
+
+    def test_empty_lexicons_match_nothing(self):
+        """A matcher without terms never matches."""
+        matcher = SafetyPatternMatcher([Lexicon("empty", ())])
+
+        assert matcher.find_all("anything") == []
+        assert matcher.sub("anything", "x") == "anything"
+
+
+class TestSafetyFilterMatching:
+    """Tests for SafetyFilter on top of the compiled matchers."""
+
+    def test_forbidden_words_match_inside_longer_words(self):
+        """Forbidden words keep substring semantics for recall."""
+        safety_filter = SafetyFilter()
+
+        for message, term in (
+            ("that was bloody", "blood"),
+            ("the killer came", "kill"),
+            ("sexual content", "sex"),
+        ):
+            result = safety_filter.analyze_message_safety(message)
+
+            assert result["safe"] is False
+            assert result["issues"] == [term]
+
+    def test_forbidden_words_and_dangerous_patterns(self):
+        """Forbidden words and dangerous patterns are still detected."""
+        safety_filter = SafetyFilter()
+
+        forbidden = safety_filter.analyze_message_safety("I saw a Ghost and monsters")
+        dangerous = safety_filter.analyze_message_safety("how to hurt someone")
+
+        assert forbidden["issues"] == ["ghost", "monster"]
+        assert dangerous["issues"] == [r"how to (hurt|kill|fight)"]
+
+    def test_sanitize_message(self):
+        """Replacements are applied case-insensitively on whole words."""
+        cleaned = SafetyFilter().sanitize_message("Don't be STUPID, the monster will die")
+
+        assert cleaned == "Don't be silly, the funny creature will sleep"
@@ -0,0 +1,189 @@
+"""Tests for lazy, request-scoped decryption of EncryptedField."""
+
+from cryptography.fernet import Fernet
+
+from src.domain.entities.encrypted_child import EncryptedChild
+from src.domain.interfaces.encryption_interface import EncryptionServiceInterface
+from src.domain.value_objects.encrypted_field import (
+    EncryptedField,
+    plaintext_scope,
+)
+from src.presentation.api.middleware.plaintext_scope import PlaintextScopeMiddleware
+
+
+class _CountingService(EncryptionServiceInterface):
+    """Fernet service counting its calls."""
+
+    def __init__(self):
+        self.fernet = Fernet(Fernet.generate_key())
+        self.calls = {"encrypt": 0, "decrypt": 0, "encrypt_many": 0, "decrypt_many": 0}
+
+    def encrypt(self, data: str) -> str:
+        self.calls["encrypt"] += 1
+        return self.fernet.encrypt(data.encode()).decode()
+
+    def decrypt(self, encrypted_data: str) -> str:
+        self.calls["decrypt"] += 1
+        return self.fernet.decrypt(encrypted_data.encode()).decode()
+
+    def encrypt_many(self, data: list[str]) -> list[str]:
+        self.calls["encrypt_many"] += 1
+        return [self.fernet.encrypt(value.encode()).decode() for value in data]
+
+    def decrypt_many(self, encrypted_data: list[str]) -> list[str]:
+        self.calls["decrypt_many"] += 1
+        return [self.fernet.decrypt(value.encode()).decode() for value in encrypted_data]
+
+    def is_available(self) -> bool:
+        return True
+
+
+def _stored(value, service) -> EncryptedField:
+    return EncryptedField.from_encrypted_data(
+        EncryptedField(value, service).get_encrypted_representation(), service
+    )
+
+
+class TestEncryptedField:
+    """Tests for encrypting at persist time and decrypting on first read."""
+
+    def test_new_values_are_encrypted_when_persisted(self):
+        service = _CountingService()
+        contacts = [{"name": "Parent", "phone": "123"}]
+
+        field = EncryptedField(contacts, service)
+        assert service.calls["encrypt"] == 0
+        assert field.get_value() == contacts
+
+        stored = field.get_encrypted_representation()
+        assert field.get_encrypted_representation() == stored
+        assert service.calls["encrypt"] == 1
+        assert EncryptedField.from_encrypted_data(stored, service).get_value() == contacts
+
+    def test_stored_values_are_decrypted_on_read_only(self):
+        service = _CountingService()
+        field = _stored("Allergic to peanuts", service)
+
+        assert service.calls["decrypt"] == 0
+        assert field.get_value() == "Allergic to peanuts"
+        assert field.get_value() == "Allergic to peanuts"
+        assert service.calls["decrypt"] == 2
+
+    def test_scope_decrypts_once_and_zeroizes(self):
+        service = _CountingService()
+        field = _stored("Allergic to peanuts", service)
+
+        with plaintext_scope() as cache:
+            field.get_value()
+            field.get_value()
+            buffer = cache.get(field)
+        assert service.calls["decrypt"] == 1
+        assert buffer == bytearray(len(buffer))
+        assert len(cache) == 0
+
+    def test_materialize_decrypts_in_one_call(self):
+        service = _CountingService()
+        fields = [_stored(f"note {i}", service) for i in range(5)]
+
+        with plaintext_scope():
+            EncryptedField.materialize([*fields, None])
+            values = [field.get_value() for field in fields]
+            EncryptedField.materialize(fields)
+
+        assert values == [f"note {i}" for i in range(5)]
+        assert service.calls["decrypt_many"] == 1
+        assert service.calls["decrypt"] == 0
+
+    def test_values_stored_before_json_still_read(self):
+        service = _CountingService()
+        field = EncryptedField.from_encrypted_data(service.encrypt("plain notes"), service)
+
+        assert field.get_value() == "plain notes"
+
+    def test_legacy_values_stay_strings(self):
+        """Values that happen to parse as JSON are not reinterpreted."""
+        service = _CountingService()
+        for legacy in ("123", "true", "null", "[1, 2]", '"quoted"'):
+            field = EncryptedField.from_encrypted_data(service.encrypt(legacy), service)
+            assert field.get_value() == legacy
+
+    def test_new_values_keep_their_type(self):
+        service = _CountingService()
+        for value in (123, True, "123", [1, 2], {"a": None}):
+            assert _stored(value, service).get_value() == value
+
+    def test_repr_hides_the_value(self):
+        assert "secret" not in repr(EncryptedField("secret"))
+
+
+class TestEncryptedChildFields:
+    """Tests for the sensitive fields of EncryptedChild."""
+
+    def test_listing_children_costs_no_crypto(self):
+        service = _CountingService()
+        children = [
+            EncryptedChild(
+                name=f"Child {i}",
+                age=7,
+                _encrypted_medical_notes=_stored("notes", service),
+            )
+            for i in range(10)
+        ]
+        service.calls.update(decrypt=0, decrypt_many=0)
+
+        names = [child.name for child in children]
+
+        assert len(names) == 10
+        assert service.calls["decrypt"] == service.calls["decrypt_many"] == 0
+
+    def test_batch_encrypt_and_materialize(self):
+        service = _CountingService()
+        children = [EncryptedChild(name=f"Child {i}", age=7) for i in range(3)]
+        for child in children:
+            child.set_medical_notes("Allergic to peanuts", service)
+            child.set_emergency_contacts([{"name": "Parent"}], service)
+
+        EncryptedChild.encrypt_sensitive_fields(children)
+        stored = [
+            EncryptedChild(
+                name=child.name,
+                age=child.age,
+                _encrypted_medical_notes=EncryptedField.from_encrypted_data(
+                    child._encrypted_medical_notes.get_encrypted_representation(),
+                    service,
+                ),
+                _encrypted_emergency_contacts=EncryptedField.from_encrypted_data(
+                    child._encrypted_emergency_contacts.get_encrypted_representation(),
+                    service,
+                ),
+            )
+            for child in children
+        ]
+        with plaintext_scope():
+            EncryptedChild.materialize_sensitive_fields(stored)
+            notes = [child.get_medical_notes() for child in stored]
+            contacts = [child.get_emergency_contacts() for child in stored]
+
+        assert service.calls["encrypt_many"] == 1
+        assert service.calls["decrypt_many"] == 1
+        assert service.calls["encrypt"] == service.calls["decrypt"] == 0
+        assert notes == ["Allergic to peanuts"] * 3
+        assert contacts == [[{"name": "Parent"}]] * 3
+
+
+class TestPlaintextScopeMiddleware:
+    """Tests for the per-request scope."""
+
+    async def test_each_request_gets_a_scope(self):
+        service = _CountingService()
+        field = _stored("notes", service)
+
+        async def app(scope, receive, send):
+            field.get_value()
+            field.get_value()
+
+        middleware = PlaintextScopeMiddleware(app)
+        await middleware({"type": "http"}, None, None)
+        await middleware({"type": "http"}, None, None)
+
+        assert service.calls["decrypt"] == 2
@@ -0,0 +1,86 @@
+"""Tests for the shared OpenAI transport."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.ai.chatgpt import transport as transport_module
+from src.infrastructure.external_apis import http_client_registry as registry_module
+from src.infrastructure.ai.chatgpt.transport import (
+    OpenAITransport,
+    OpenAITransportConfig,
+    get_openai_transport,
+)
+from src.infrastructure.external_apis.http_client_registry import HTTPClientRegistry
+
+
+@pytest.fixture
+async def transport():
+    transport = OpenAITransport(
+        "sk-test",
+        config=OpenAITransportConfig(max_concurrent_requests=2, request_timeout=7.0),
+    )
+    yield transport
+    await transport.aclose()
+
+
+class TestOpenAITransport:
+    """Test the concurrency limiter and pooled client configuration."""
+
+    async def test_limits_concurrent_completions(self, transport):
+        peak = 0
+
+        async def _create(**kwargs):
+            nonlocal peak
+            peak = max(peak, transport.in_flight)
+            await asyncio.sleep(0.01)
+            return kwargs
+
+        transport.client.chat.completions.create = _create
+
+        await asyncio.gather(
+            *(transport.create_chat_completion(model="m", messages=[]) for _ in range(6)),
+        )
+
+        assert peak == 2
+        assert transport.in_flight == 0
+
+    async def test_applies_per_request_timeout(self, transport):
+        captured = {}
+
+        async def _create(**kwargs):
+            captured.clear()
+            captured.update(kwargs)
+
+        transport.client.chat.completions.create = _create
+
+        await transport.create_chat_completion(timeout=3.0, model="m", messages=[])
+        assert captured["timeout"].read == 3.0
+
+        await transport.create_chat_completion(model="m", messages=[])
+        assert captured.pop("timeout").read == 7.0
+        assert captured == {"model": "m", "messages": []}
+
+    async def test_shares_transport_per_key(self, monkeypatch):
+        monkeypatch.setattr(transport_module, "_transports", {})
+
+        first = get_openai_transport("sk-a")
+        second = get_openai_transport("sk-a")
+        other = get_openai_transport("sk-b")
+
+        assert first is second
+        assert first is not other
+        await transport_module.close_openai_transports()
+        assert transport_module._transports == {}
+
+    async def test_default_endpoint_shares_openai_pool(self, monkeypatch):
+        registry = HTTPClientRegistry()
+        monkeypatch.setattr(registry_module, "_registry", registry)
+
+        default = OpenAITransport("sk-a")
+        custom = OpenAITransport("sk-a", base_url="https://llm.internal/v1")
+
+        assert default.http_client is registry.get_client("openai")
+        assert registry.names == ["openai", "openai:https://llm.internal/v1"]
+        assert custom.http_client is not default.http_client
+        await registry.aclose()
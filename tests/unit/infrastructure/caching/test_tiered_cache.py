@@ -0,0 +1,231 @@
+"""Tests for the tiered L1/L2 cache and AI response cache keys."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from src.infrastructure.caching.ai_response_cache import (
+    ai_response_cache_key,
+    depersonalize,
+    get_ai_response_cache,
+    normalize_prompt,
+    personalize,
+)
+from src.infrastructure.caching.tiered_cache import LRUCacheTier, TieredCache
+from src.infrastructure.performance.caching_decorators import cached
+from src.infrastructure.performance.memoization import memoize
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCacheTier:
+    """Test bounds, TTL and eviction accounting of the L1 tier."""
+
+    def test_evicts_least_recently_used_entry(self):
+        tier = LRUCacheTier(max_entries=2)
+        tier.set("a", "1")
+        tier.set("b", "2")
+        tier.get("a")
+        tier.set("c", "3")
+
+        assert tier.get("b") is None
+        assert tier.get("a") == "1"
+        assert tier.metrics.evictions == 1
+
+    def test_evicts_by_accounted_size(self):
+        tier = LRUCacheTier(max_entries=100, max_bytes=10)
+        tier.set("a", "x" * 6)
+        tier.set("b", "y" * 6)
+
+        assert len(tier) == 1
+        assert tier.size_bytes == 6
+        assert tier.set("huge", "z" * 11) is False
+
+    def test_expires_entries(self):
+        clock = FakeClock()
+        tier = LRUCacheTier(default_ttl=10, clock=clock)
+        tier.set("a", "1")
+
+        clock.now = 11
+
+        assert tier.get("a") is None
+        assert tier.metrics.expirations == 1
+        assert tier.size_bytes == 0
+
+
+class TestTieredCache:
+    """Test read-through behaviour, L2 promotion and single-flight."""
+
+    async def test_single_flight_for_concurrent_misses(self):
+        cache = TieredCache("test_single_flight")
+        calls = 0
+
+        async def _load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("key", _load) for _ in range(10)),
+        )
+
+        assert results == ["value"] * 10
+        assert calls == 1
+        assert cache.metrics.coalesced == 9
+        assert await cache.get_or_load("key", _load) == "value"
+        assert cache.metrics.l1_hits == 1
+
+    async def test_loader_error_reaches_every_waiter(self):
+        cache = TieredCache("test_errors")
+
+        async def _load():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_load("key", _load),
+            cache.get_or_load("key", _load),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await cache.get("key") is None
+
+    async def test_cancelled_caller_does_not_cancel_load(self):
+        cache = TieredCache("test_cancel")
+        release = asyncio.Event()
+
+        async def _load():
+            await release.wait()
+            return "value"
+
+        first = asyncio.create_task(cache.get_or_load("key", _load))
+        second = asyncio.create_task(cache.get_or_load("key", _load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "value"
+
+    async def test_l2_hit_is_promoted_to_l1(self):
+        redis_client = AsyncMock()
+        redis_client.get.return_value = "shared"
+        cache = TieredCache("test_l2", redis_client=redis_client)
+
+        assert await cache.get("key") == "shared"
+        assert await cache.get("key") == "shared"
+
+        redis_client.get.assert_awaited_once_with("test_l2:key")
+        assert cache.metrics.l2_hits == 1
+        assert cache.metrics.l1_hits == 1
+
+    async def test_writes_through_to_l2(self):
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        cache = TieredCache("test_write", redis_client=redis_client, default_ttl=60)
+
+        await cache.get_or_load("key", AsyncMock(return_value="fresh"))
+
+        redis_client.setex.assert_awaited_once_with("test_write:key", 60, "fresh")
+
+    async def test_l2_errors_degrade_to_misses(self):
+        redis_client = AsyncMock()
+        redis_client.get.side_effect = ConnectionError("down")
+        cache = TieredCache("test_l2_down", redis_client=redis_client)
+
+        assert await cache.get("key") is None
+        assert cache.metrics.misses == 1
+        assert cache.metrics.errors == 1
+
+
+class TestAIResponseCacheKey:
+    """Test prompt normalization and name-independent keys."""
+
+    def test_normalizes_equivalent_prompts(self):
+        assert normalize_prompt("What's a volcano?") == "what is a volcano"
+        assert ai_response_cache_key(
+            "What's a  VOLCANO?",
+            "young child",
+        ) == ai_response_cache_key("what is a volcano", "young child")
+
+    def test_key_depends_on_age_band_and_safety_profile(self):
+        base = ai_response_cache_key("what is a volcano", "young child")
+
+        assert base != ai_response_cache_key("what is a volcano", "preteen")
+        assert base != ai_response_cache_key(
+            "what is a volcano",
+            "young child",
+            safety_profile="no scary topics",
+        )
+
+    def test_name_round_trip(self):
+        stored = depersonalize("Great question, Sam! Sammy the seal agrees.", "Sam")
+
+        assert "Sam!" not in stored
+        assert "Sammy" in stored
+        assert personalize(stored, "Alice").startswith("Great question, Alice!")
+
+    def test_shared_cache_per_redis_client(self):
+        first, second = AsyncMock(), AsyncMock()
+
+        cache = get_ai_response_cache(first)
+
+        assert get_ai_response_cache(first) is cache
+        assert get_ai_response_cache(second) is not cache
+        assert get_ai_response_cache(second).l2.redis_client is second
+        assert get_ai_response_cache().l2 is None
+
+
+class TestDecorators:
+    """Test the bounded caching decorators."""
+
+    async def test_cached_is_bounded_per_function(self):
+        calls = []
+
+        @cached(max_entries=2)
+        async def _square(value):
+            calls.append(value)
+            return value * value
+
+        for value in (1, 2, 3, 1):
+            await _square(value)
+
+        assert calls == [1, 2, 3, 1]
+        assert len(_square.cache.l1) == 2
+        assert _square.cache.metrics.evictions == 2
+
+    async def test_cached_skips_unhashable_arguments(self):
+        @cached
+        async def _total(values):
+            return sum(values)
+
+        assert await _total([1, 2]) == 3
+        assert len(_total.cache.l1) == 0
+
+    def test_memoize_is_bounded(self):
+        @memoize(max_entries=1)
+        def _double(value):
+            return value * 2
+
+        assert _double(1) == 2
+        assert _double(2) == 4
+        assert len(_double.cache) == 1
+
+    def test_memoize_bare_decorator(self):
+        calls = []
+
+        @memoize
+        def _double(value):
+            calls.append(value)
+            return value * 2
+
+        _double(3)
+        _double(3)
+
+        assert calls == [3]
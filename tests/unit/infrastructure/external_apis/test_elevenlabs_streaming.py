@@ -0,0 +1,57 @@
+"""Tests for streaming text-to-speech in ElevenLabsClient."""
+
+import asyncio
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from src.infrastructure.external_apis.elevenlabs_client import ElevenLabsClient
+
+
+class _SlowBody(httpx.AsyncByteStream):
+    """Response body whose second chunk waits until the test releases it."""
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self.release = release
+
+    async def __aiter__(self):
+        yield b"first-"
+        await self.release.wait()
+        yield b"second"
+
+
+class TestElevenLabsStreaming:
+    """Test that audio chunks are yielded as the provider sends them."""
+
+    async def test_yields_first_chunk_before_body_completes(self):
+        release = asyncio.Event()
+        requests = []
+
+        def _handler(request):
+            requests.append(request)
+            return httpx.Response(200, stream=_SlowBody(release))
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        client = ElevenLabsClient(SecretStr("key"), http_client=http_client)
+
+        stream = client.stream_text_to_speech("Hello there", voice_id="teddy")
+        first = await asyncio.wait_for(stream.__anext__(), timeout=1)
+        release.set()
+        rest = [chunk async for chunk in stream]
+
+        assert first == b"first-"
+        assert b"".join([first, *rest]) == b"first-second"
+        assert requests[0].url.path == "/v1/text-to-speech/teddy/stream"
+        await http_client.aclose()
+
+    async def test_raises_for_error_status(self):
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(401)),
+        )
+        client = ElevenLabsClient(SecretStr("key"), http_client=http_client)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            async for _ in client.stream_text_to_speech("Hello"):
+                pass
+        await http_client.aclose()
@@ -0,0 +1,127 @@
+"""Tests for the process-wide HTTP client registry."""
+
+import asyncio
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from src.infrastructure.external_apis.azure_speech_client import AzureSpeechClient
+from src.infrastructure.external_apis.elevenlabs_client import ElevenLabsClient
+from src.infrastructure.external_apis import http_client_registry as registry_module
+from src.infrastructure.external_apis.http_client_registry import (
+    HTTPClientConfig,
+    HTTPClientRegistry,
+)
+
+
+@pytest.fixture
+async def registry(monkeypatch):
+    registry = HTTPClientRegistry()
+    monkeypatch.setattr(registry_module, "_registry", registry)
+    yield registry
+    await registry.aclose()
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestHTTPClientRegistry:
+    """Test client sharing, configuration and shutdown."""
+
+    async def test_reuses_client_per_name(self, registry):
+        first = registry.get_client("elevenlabs")
+        second = registry.get_client("elevenlabs")
+        other = registry.get_client("azure-speech-eastus")
+
+        assert first is second
+        assert first is not other
+        assert registry.names == ["azure-speech-eastus", "elevenlabs"]
+
+    async def test_applies_per_host_limits(self, registry):
+        registry.configure(
+            "elevenlabs",
+            HTTPClientConfig(max_connections=7, read_timeout=12.0),
+        )
+
+        client = registry.get_client("elevenlabs")
+
+        assert client.timeout.read == 12.0
+        pool = client._transport._pool
+        assert pool._max_connections == 7
+
+    async def test_cannot_reconfigure_client_in_use(self, registry):
+        registry.get_client("elevenlabs")
+
+        with pytest.raises(RuntimeError):
+            registry.configure("elevenlabs", HTTPClientConfig())
+
+    async def test_close_closes_clients_and_rejects_new_ones(self):
+        registry = HTTPClientRegistry()
+        client = registry.get_client("elevenlabs")
+
+        await registry.aclose()
+
+        assert client.is_closed
+        with pytest.raises(RuntimeError):
+            registry.get_client("elevenlabs")
+
+    async def test_recreates_client_closed_elsewhere(self, registry):
+        client = registry.get_client("openai")
+        await client.aclose()
+
+        assert registry.get_client("openai") is not client
+
+    async def test_close_skips_client_that_hangs(self, monkeypatch):
+        registry = HTTPClientRegistry()
+        stuck = registry.get_client("elevenlabs")
+        other = registry.get_client("azure-speech-eastus")
+
+        async def _hang():
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(stuck, "aclose", _hang)
+
+        await registry.aclose(timeout=0.01)
+
+        assert other.is_closed
+
+
+class TestClientsUseSharedPool:
+    """Test that external API clients no longer create a client per call."""
+
+    async def test_elevenlabs_reuses_registry_client(self, registry, monkeypatch):
+        created = []
+        original = httpx.AsyncClient.__init__
+
+        def _tracking_init(self, *args, **kwargs):
+            created.append(self)
+            kwargs["transport"] = httpx.MockTransport(
+                lambda request: httpx.Response(200, content=b"mp3"),
+            )
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.AsyncClient, "__init__", _tracking_init)
+        client = ElevenLabsClient(SecretStr("key"))
+
+        assert await client.text_to_speech("Hi") == b"mp3"
+        assert await client.text_to_speech("Again") == b"mp3"
+        assert len(created) == 1
+
+    async def test_azure_speech_uses_injected_client(self):
+        requests = []
+
+        def _handler(request):
+            requests.append(request)
+            if "stt" in request.url.host:
+                return httpx.Response(200, json={"DisplayText": "hello"})
+            return httpx.Response(200, content=b"wav")
+
+        http_client = _mock_client(_handler)
+        client = AzureSpeechClient("key", "eastus", http_client=http_client)
+
+        assert await client.speech_to_text(b"pcm") == "hello"
+        assert await client.text_to_speech("hello") == b"wav"
+        assert len(requests) == 2
+        await http_client.aclose()
@@ -0,0 +1,50 @@
+"""Tests for AudioStreamer."""
+
+from unittest.mock import AsyncMock
+
+from src.infrastructure.messaging.audio_streamer import AudioStreamer
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+class TestStreamAudioToChild:
+    """Test delivery of complete and chunked audio to a device."""
+
+    async def test_sends_complete_audio(self):
+        streamer = AudioStreamer()
+        websocket = AsyncMock()
+        streamer.connections["child"] = websocket
+
+        await streamer.stream_audio_to_child("child", b"audio")
+
+        websocket.send_bytes.assert_awaited_once_with(b"audio")
+
+    async def test_sends_each_chunk_as_it_arrives(self):
+        streamer = AudioStreamer()
+        websocket = AsyncMock()
+        streamer.connections["child"] = websocket
+
+        await streamer.stream_audio_to_child("child", _chunks(b"a", b"b", b"c"))
+
+        assert [call.args[0] for call in websocket.send_bytes.await_args_list] == [
+            b"a",
+            b"b",
+            b"c",
+        ]
+
+    async def test_stops_when_child_disconnects(self):
+        streamer = AudioStreamer()
+        websocket = AsyncMock()
+        streamer.connections["child"] = websocket
+
+        async def _disconnecting_chunks():
+            yield b"a"
+            streamer.disconnect("child")
+            yield b"b"
+
+        await streamer.stream_audio_to_child("child", _disconnecting_chunks())
+
+        websocket.send_bytes.assert_awaited_once_with(b"a")
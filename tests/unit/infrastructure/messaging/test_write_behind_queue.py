@@ -0,0 +1,127 @@
+"""Tests for the durable write-behind queue."""
+
+import pytest
+
+from src.infrastructure.messaging.write_behind_queue import (
+    InMemoryWriteBehindJournal,
+    WriteBehindJob,
+    WriteBehindQueue,
+)
+
+
+@pytest.fixture
+async def queue():
+    queue = WriteBehindQueue(retry_delay=0.01, max_attempts=3)
+    yield queue
+    await queue.stop(drain_timeout=1)
+
+
+class TestWriteBehindQueue:
+    """Test background application, retries and journal replay."""
+
+    async def test_applies_jobs_in_background(self, queue):
+        applied = []
+
+        async def _handler(payload):
+            applied.append(payload["value"])
+
+        queue.register_handler("save", _handler)
+        await queue.start()
+
+        await queue.enqueue("save", {"value": 1})
+        await queue.enqueue("save", {"value": 2})
+        await queue.join()
+
+        assert sorted(applied) == [1, 2]
+        assert await queue.journal.pending() == []
+        assert queue.stats["completed"] == 2
+
+    async def test_retries_failed_jobs(self, queue):
+        attempts = []
+
+        async def _flaky(payload):
+            attempts.append(payload)
+            if len(attempts) < 2:
+                raise ConnectionError("db down")
+
+        queue.register_handler("save", _flaky)
+        await queue.start()
+
+        await queue.enqueue("save", {"value": 1})
+        await queue.join()
+
+        assert len(attempts) == 2
+        assert queue.stats["retried"] == 1
+        assert await queue.journal.pending() == []
+
+    async def test_exhausted_jobs_stay_journaled(self, queue):
+        async def _broken(payload):
+            raise ConnectionError("db down")
+
+        queue.register_handler("save", _broken)
+        await queue.start()
+
+        await queue.enqueue("save", {"value": 1})
+        await queue.join()
+
+        assert queue.stats["failed"] == 1
+        assert len(await queue.journal.pending()) == 1
+
+    async def test_replays_journal_on_start(self):
+        journal = InMemoryWriteBehindJournal()
+        await journal.append(WriteBehindJob(operation="save", payload={"value": 7}))
+        applied = []
+
+        async def _handler(payload):
+            applied.append(payload["value"])
+
+        queue = WriteBehindQueue(journal=journal)
+        queue.register_handler("save", _handler)
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+        assert applied == [7]
+        assert await journal.pending() == []
+
+    async def test_shared_journal_replays_each_job_once(self):
+        journal = InMemoryWriteBehindJournal()
+        await journal.append(WriteBehindJob(operation="save", payload={"value": 7}))
+        applied = []
+
+        async def _handler(payload):
+            applied.append(payload["value"])
+
+        queues = [WriteBehindQueue(journal=journal) for _ in range(2)]
+        for queue in queues:
+            queue.register_handler("save", _handler)
+            await queue.start()
+        for queue in queues:
+            await queue.join()
+            await queue.stop()
+
+        assert applied == [7]
+
+    async def test_stop_releases_unfinished_jobs(self):
+        journal = InMemoryWriteBehindJournal()
+
+        async def _broken(payload):
+            raise ConnectionError("db down")
+
+        queue = WriteBehindQueue(journal=journal, max_attempts=1)
+        queue.register_handler("save", _broken)
+        await queue.start()
+        job_id = await queue.enqueue("save", {"value": 1})
+        await queue.join()
+        await queue.stop()
+
+        assert await journal.claim(job_id)
+
+    async def test_rejects_unknown_operation(self, queue):
+        with pytest.raises(ValueError):
+            await queue.enqueue("unknown", {})
+
+    def test_job_round_trips_through_json(self):
+        job = WriteBehindJob(operation="save", payload={"value": 1})
+
+        assert WriteBehindJob.from_json(job.to_json()) == job
@@ -0,0 +1,153 @@
+"""Tests for the keyset pagination engine."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import column, select, table
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.pagination.keyset import (
+    CursorCodec,
+    InvalidCursorError,
+    KeysetPaginator,
+    KeysetPosition,
+)
+
+SECRET = "s" * 32
+
+conversations = table("conversations", column("id"), column("start_time"))
+
+
+@pytest.fixture
+def paginator():
+    return KeysetPaginator(CursorCodec(SECRET), default_size=2, max_size=10)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestCursorCodec:
+    """Tests for signed cursors."""
+
+    def test_round_trip(self):
+        codec = CursorCodec(SECRET)
+        position = KeysetPosition(datetime(2025, 7, 4, 10, tzinfo=UTC), "abc", backward=True)
+
+        assert codec.decode(codec.encode(position, "scope"), "scope") == position
+
+    def test_string_timestamps_stay_strings(self):
+        codec = CursorCodec(SECRET)
+        position = KeysetPosition("2025-07-04 10:00:00", 42)
+
+        assert codec.decode(codec.encode(position)) == position
+
+    @pytest.mark.parametrize("cursor", ["", "abc", "a.b.c", "!!!.???"])
+    def test_malformed(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            CursorCodec(SECRET).decode(cursor)
+
+    def test_other_key(self):
+        cursor = CursorCodec("k" * 32).encode(KeysetPosition("t", 1))
+
+        with pytest.raises(InvalidCursorError):
+            CursorCodec(SECRET).decode(cursor)
+
+    def test_other_scope(self):
+        codec = CursorCodec(SECRET)
+        cursor = codec.encode(KeysetPosition("t", 1), "children:parent-a")
+
+        with pytest.raises(InvalidCursorError):
+            codec.decode(cursor, "children:parent-b")
+
+    def test_short_secret(self):
+        with pytest.raises(ValueError):
+            CursorCodec("short")
+
+
+class TestKeysetPaginator:
+    """Tests for query building and page assembly."""
+
+    def test_first_page_query(self, paginator):
+        statement = paginator.apply(
+            select(conversations.c.id),
+            conversations.c.start_time,
+            conversations.c.id,
+            None,
+            20,
+        )
+
+        sql = _sql(statement)
+        assert "WHERE" not in sql
+        assert "ORDER BY conversations.start_time DESC, conversations.id DESC" in sql
+        assert statement.compile().params["param_1"] == 21
+
+    def test_forward_and_backward_queries(self, paginator):
+        at = datetime(2025, 7, 4, tzinfo=UTC)
+        forward = _sql(
+            paginator.apply(
+                select(conversations.c.id),
+                conversations.c.start_time,
+                conversations.c.id,
+                KeysetPosition(at, "x"),
+                5,
+            ),
+        )
+        backward = _sql(
+            paginator.apply(
+                select(conversations.c.id),
+                conversations.c.start_time,
+                conversations.c.id,
+                KeysetPosition(at, "x", backward=True),
+                5,
+            ),
+        )
+
+        assert "(conversations.start_time, conversations.id) < (" in forward
+        assert "(conversations.start_time, conversations.id) > (" in backward
+        assert "ORDER BY conversations.start_time ASC, conversations.id ASC" in backward
+
+    def test_sql_fragments(self, paginator):
+        assert paginator.sql(None) == ("", "ORDER BY timestamp DESC, id DESC", ())
+        assert paginator.sql(KeysetPosition("t", 3, backward=True)) == (
+            "AND (timestamp, id) > (?, ?)",
+            "ORDER BY timestamp ASC, id ASC",
+            ("t", 3),
+        )
+
+    def test_page_walk(self, paginator):
+        rows = [(f"t{i:02d}", i) for i in range(9, -1, -1)]
+
+        def query(position, size):
+            if position is None:
+                matching = rows
+            elif position.backward:
+                matching = sorted(r for r in rows if r > (position.timestamp, position.id))
+            else:
+                matching = [r for r in rows if r < (position.timestamp, position.id)]
+            return matching[: size + 1]
+
+        pages, position = [], None
+        while True:
+            page = paginator.page(query(position, 4), position, 4, key=tuple)
+            pages.append(page)
+            if not page.next_cursor:
+                break
+            position = paginator.position(page.next_cursor)
+
+        assert [[row[1] for row in page.items] for page in pages] == [
+            [9, 8, 7, 6],
+            [5, 4, 3, 2],
+            [1, 0],
+        ]
+        position = paginator.position(pages[-1].prev_cursor)
+        previous = paginator.page(query(position, 4), position, 4, key=tuple)
+        assert previous.items == pages[1].items
+        assert previous.has_next and previous.has_prev
+
+    def test_page_size(self, paginator):
+        assert paginator.page_size(None) == 2
+        with pytest.raises(ValueError):
+            paginator.page_size(11)
+        with pytest.raises(ValueError):
+            paginator.page_size(0)
@@ -0,0 +1,237 @@
+"""Tests for request-scoped batch loaders."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.application.use_cases.manage_child_profile import ManageChildProfileUseCase
+from src.infrastructure.performance.batch_loader import (
+    BatchLoader,
+    loader_scope,
+    request_loader,
+)
+from src.infrastructure.persistence.repositories import consent_repository
+from src.infrastructure.persistence.repositories.consent_repository import (
+    ConsentRepository,
+)
+from src.infrastructure.read_models.child_profile_read_model import (
+    ChildProfileReadModel,
+    ChildProfileReadModelStore,
+)
+from src.presentation.api.middleware.data_loader import DataLoaderMiddleware
+
+
+class _Source:
+    """Batch function recording the keys of each call."""
+
+    def __init__(self, fail: bool = False):
+        self.calls: list[list] = []
+        self.fail = fail
+
+    async def __call__(self, keys):
+        self.calls.append(list(keys))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("database down")
+        return {key: f"value-{key}" for key in keys if key != "missing"}
+
+
+class TestBatchLoader:
+    """Tests for batching, caching and errors."""
+
+    async def test_loads_of_one_tick_share_a_batch(self):
+        source = _Source()
+        loader = BatchLoader(source)
+
+        values = await asyncio.gather(
+            loader.load("a"),
+            loader.load("b"),
+            loader.load("a"),
+            loader.load("missing"),
+        )
+
+        assert values == ["value-a", "value-b", "value-a", None]
+        assert source.calls == [["a", "b", "missing"]]
+
+    async def test_cached_for_the_loader(self):
+        source = _Source()
+        loader = BatchLoader(source)
+
+        await loader.load_many(["a", "b"])
+        assert await loader.load_many(["b", "a", "c"]) == {
+            "b": "value-b",
+            "a": "value-a",
+            "c": "value-c",
+        }
+
+        assert source.calls == [["a", "b"], ["c"]]
+        assert loader.stats == {"batches": 2, "batched": 3, "cached": 2}
+
+    async def test_clear_reloads(self):
+        source = _Source()
+        loader = BatchLoader(source)
+        await loader.load("a")
+
+        loader.clear("a")
+        await loader.load("a")
+
+        assert source.calls == [["a"], ["a"]]
+
+    async def test_prime(self):
+        source = _Source()
+        loader = BatchLoader(source)
+
+        loader.prime("a", "primed")
+
+        assert await loader.load("a") == "primed"
+        assert source.calls == []
+
+    async def test_max_batch_size(self):
+        source = _Source()
+        loader = BatchLoader(source, max_batch_size=2)
+
+        await loader.load_many(["a", "b", "c", "d", "e"])
+
+        assert source.calls == [["a", "b"], ["c", "d"], ["e"]]
+
+    async def test_errors_reach_every_load_and_are_not_cached(self):
+        source = _Source(fail=True)
+        loader = BatchLoader(source)
+
+        results = await asyncio.gather(
+            loader.load("a"),
+            loader.load("b"),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        source.fail = False
+        assert await loader.load("a") == "value-a"
+        assert len(source.calls) == 2
+
+    async def test_cancelled_load_does_not_cancel_the_batch(self):
+        source = _Source()
+        loader = BatchLoader(source)
+        first = asyncio.ensure_future(loader.load("a"))
+        second = asyncio.ensure_future(loader.load("a"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert await second == "value-a"
+
+
+class TestRequestScope:
+    """Tests for per-request loaders."""
+
+    async def test_scope_shares_loaders(self):
+        source = _Source()
+
+        with loader_scope():
+            assert request_loader(source) is request_loader(source)
+            await request_loader(source).load("a")
+            await request_loader(source).load("a")
+        await request_loader(source).load("a")
+
+        assert source.calls == [["a"], ["a"]]
+
+    async def test_outside_a_scope_loaders_are_not_shared(self):
+        source = _Source()
+
+        assert request_loader(source) is not request_loader(source)
+
+    async def test_middleware_opens_a_scope_per_request(self):
+        source = _Source()
+
+        async def app(scope, receive, send):
+            await request_loader(source).load("a")
+            await request_loader(source).load("a")
+
+        middleware = DataLoaderMiddleware(app)
+        await middleware({"type": "http"}, None, None)
+        await middleware({"type": "http"}, None, None)
+
+        assert source.calls == [["a"], ["a"]]
+
+
+class TestManageChildProfileLoader:
+    """Tests for the child profile loader of ManageChildProfileUseCase."""
+
+    async def test_concurrent_profiles_read_together(self):
+        store = ChildProfileReadModelStore()
+        child_ids = [uuid4() for _ in range(3)]
+        for child_id in child_ids:
+            store.save(ChildProfileReadModel(child_id, "Child", 13, {}))
+        reads = []
+        get_many = store.async_get_many
+
+        async def _get_many(ids):
+            reads.append(list(ids))
+            return await get_many(ids)
+
+        store.async_get_many = _get_many
+        use_case = ManageChildProfileUseCase(MagicMock(), store, MagicMock())
+        unknown = uuid4()
+
+        with loader_scope():
+            profiles = await asyncio.gather(
+                *(use_case.get_child_profile(child_id) for child_id in child_ids),
+            )
+            listed = await use_case.list_child_profiles([*child_ids, unknown])
+
+        assert [profile.id for profile in profiles] == child_ids
+        assert [profile.id for profile in listed] == child_ids
+        assert reads == [child_ids, [unknown]]
+
+    async def test_missing_profile(self):
+        use_case = ManageChildProfileUseCase(
+            MagicMock(),
+            ChildProfileReadModelStore(),
+            MagicMock(),
+        )
+
+        assert await use_case.get_child_profile(uuid4()) is None
+
+
+class TestConsentRepositoryLoader:
+    """Tests for the consent verification loader of ConsentRepository."""
+
+    async def test_revoke_clears_the_cached_verification(self, monkeypatch):
+        consent = SimpleNamespace(
+            parent_id="parent-1",
+            consent_type="data_collection",
+            granted=True,
+            revoked_at=None,
+            verification_metadata={"child_id": "child-1"},
+        )
+        session = MagicMock()
+        session.execute = AsyncMock(
+            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=consent)),
+        )
+        session.commit = AsyncMock()
+
+        @asynccontextmanager
+        async def _session(database):
+            yield session
+
+        monkeypatch.setattr(
+            consent_repository, "create_safe_database_session", _session
+        )
+        repository = ConsentRepository(MagicMock())
+        loads = []
+
+        async def _load_valid_consents(keys):
+            loads.append(list(keys))
+            return {key: consent.granted for key in keys}
+
+        repository._load_valid_consents = _load_valid_consents
+        key = ("parent-1", "child-1", "data_collection")
+
+        with loader_scope():
+            assert await repository.verify_consent(*key) is True
+            assert await repository.revoke_consent("consent-1", "parent request")
+            assert await repository.verify_consent(*key) is False
+
+        assert loads == [[key], [key]]
@@ -0,0 +1,122 @@
+"""Tests for single-flight coalescing of identical concurrent calls."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.domain.value_objects.child_preferences import AgeGroup
+from src.infrastructure.external_apis.openai_client import OpenAIClient
+from src.infrastructure.performance.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test leader/follower behaviour and metrics."""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def _call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flight.do("key", _call) for _ in range(5)))
+
+        assert results == [1] * 5
+        assert flight.stats == {"leaders": 1, "coalesced": 4}
+        assert flight.in_flight == 0
+
+    async def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight("test")
+        func = AsyncMock(return_value="reply")
+
+        await flight.do("key", func)
+        await flight.do("key", func)
+
+        assert func.await_count == 2
+
+    async def test_exception_reaches_every_caller(self):
+        flight = SingleFlight("test")
+
+        async def _fail():
+            await asyncio.sleep(0.01)
+            raise TimeoutError("upstream")
+
+        results = await asyncio.gather(
+            flight.do("key", _fail),
+            flight.do("key", _fail),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, TimeoutError) for result in results)
+
+
+@pytest.fixture
+def openai_client():
+    with patch("src.infrastructure.external_apis.openai_client.AsyncOpenAI"):
+        client = OpenAIClient("key", single_flight=SingleFlight("test_openai"))
+
+    async def _create(**kwargs):
+        await asyncio.sleep(0.01)
+        message = Mock(content="A volcano is a mountain that erupts.")
+        return Mock(choices=[Mock(message=message)])
+
+    client.client.chat.completions.create = AsyncMock(side_effect=_create)
+    return client
+
+
+def _preferences(age_group=AgeGroup.EARLY_SCHOOL):
+    return SimpleNamespace(
+        language="en",
+        favorite_topics=["science"],
+        learning_level="beginner",
+        age_group=age_group,
+    )
+
+
+class TestOpenAIClientCoalescing:
+    """Test that identical prompts share one upstream completion."""
+
+    async def test_identical_prompts_share_one_completion(self, openai_client):
+        replies = await asyncio.gather(
+            *(
+                openai_client.generate_response(
+                    uuid4(),
+                    [],
+                    prompt,
+                    _preferences(),
+                )
+                for prompt in (
+                    "What's a volcano?",
+                    "what is a volcano",
+                    "What is a volcano",
+                )
+            ),
+        )
+
+        assert set(replies) == {"A volcano is a mountain that erupts."}
+        assert openai_client.client.chat.completions.create.await_count == 1
+        assert openai_client.single_flight.stats["coalesced"] == 2
+
+    async def test_different_age_groups_are_not_coalesced(self, openai_client):
+        await asyncio.gather(
+            openai_client.generate_response(
+                uuid4(),
+                [],
+                "What is a volcano?",
+                _preferences(AgeGroup.EARLY_SCHOOL),
+            ),
+            openai_client.generate_response(
+                uuid4(),
+                [],
+                "What is a volcano?",
+                _preferences(AgeGroup.PRE_TEEN),
+            ),
+        )
+
+        assert openai_client.client.chat.completions.create.await_count == 2
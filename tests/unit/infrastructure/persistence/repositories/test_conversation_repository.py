@@ -468,3 +468,38 @@ class TestConversationRepositoryEdgeCases:
         # Assert
         assert len(result) == 1
         assert result[0]["metadata"] == {"emotion": "happy", "topic": "story"}
+
+
+class TestConversationRepositorySummaries:
+    """Test summary reads of AsyncSQLAlchemyConversationRepo."""
+
+    @pytest.mark.asyncio
+    async def test_find_summaries_reads_only_the_summary_column(self):
+        """Summaries come from a projected query, oldest first."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = ["newest", "older", None]
+        session.execute.return_value = result
+        repository = ConversationRepository(session)
+
+        summaries = await repository.find_summaries_by_child_id(uuid4(), limit=3)
+
+        assert summaries == ["", "older", "newest"]
+        statement = session.execute.await_args.args[0]
+        assert [column.name for column in statement.selected_columns] == ["summary"]
+
+    @pytest.mark.asyncio
+    async def test_find_recent_limits_the_query(self):
+        """Only the newest conversations are read, and returned oldest first."""
+        session = AsyncMock()
+        newest, older = MagicMock(), MagicMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [newest, older]
+        session.execute.return_value = result
+        repository = ConversationRepository(session)
+
+        conversations = await repository.find_recent_by_child_id(uuid4(), limit=2)
+
+        assert conversations == [older.to_entity(), newest.to_entity()]
+        statement = session.execute.await_args.args[0]
+        assert statement._limit_clause.value == 2
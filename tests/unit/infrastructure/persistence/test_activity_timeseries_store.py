@@ -0,0 +1,316 @@
+"""Tests for the time-series usage and safety event store."""
+
+import json
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from src.domain.models.activity_models import UsageEventModel
+from src.infrastructure.persistence.activity_timeseries_store import (
+    ActivityTimeSeriesStore,
+    next_month,
+    partition_name,
+)
+from src.infrastructure.persistence.database_manager import Database
+from src.infrastructure.persistence.repositories.usage_repository import (
+    UsageRepository,
+)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _result(rows=()):
+    result = MagicMock()
+    result.all.return_value = list(rows)
+    result.rowcount = len(rows)
+    return result
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result())
+    session.scalar = AsyncMock(return_value=0)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+@pytest.fixture
+def database(session):
+    """A real Database, so stores go through its ``get_session``."""
+    database = Database.__new__(Database)
+    database.async_session = MagicMock(return_value=session)
+    return database
+
+
+@pytest.fixture
+def store(database):
+    return ActivityTimeSeriesStore(database, months_ahead=1)
+
+
+def _executed(session) -> list[str]:
+    return [_sql(call.args[0]) for call in session.execute.await_args_list]
+
+
+class TestPartitions:
+    """Tests for monthly partition management."""
+
+    def test_event_tables_are_partitioned_by_month(self):
+        ddl = str(CreateTable(UsageEventModel.__table__).compile(dialect=postgresql.dialect()))
+
+        assert "PARTITION BY RANGE (occurred_at)" in ddl
+        assert "PRIMARY KEY (id, occurred_at)" in ddl
+
+    def test_month_helpers(self):
+        assert next_month(date(2025, 12, 31)) == date(2026, 1, 1)
+        assert partition_name("usage_events", date(2025, 7, 1)) == "usage_events_y2025m07"
+
+    async def test_ensure_partitions_is_idempotent(self, store, session):
+        created = await store.ensure_partitions(date(2025, 12, 15))
+
+        assert created == [
+            "usage_events_y2025m12",
+            "usage_events_y2026m01",
+            "safety_event_log_y2025m12",
+            "safety_event_log_y2026m01",
+        ]
+        assert (
+            "CREATE TABLE IF NOT EXISTS usage_events_y2025m12 PARTITION OF usage_events "
+            "FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')"
+        ) in _executed(session)
+        assert await store.ensure_partitions(date(2025, 12, 1)) == []
+        assert session.execute.await_count == 4
+
+    async def test_drop_partitions_before_keeps_the_cutoff_month(self, store, session):
+        session.execute.side_effect = [
+            _result([("usage_events_y2025m01",), ("usage_events_y2025m02",), ("usage_events_default",)]),
+            None,
+            None,
+            _result([("safety_event_log_y2025m03",)]),
+        ]
+
+        dropped = await store.drop_partitions_before(date(2025, 3, 1))
+
+        assert dropped == ["usage_events_y2025m01", "usage_events_y2025m02"]
+        assert "DROP TABLE IF EXISTS usage_events_y2025m02" in _executed(session)
+
+
+class TestWrites:
+    """Tests for appending events and maintaining rollups."""
+
+    async def test_record_usage_updates_rollups_in_one_transaction(
+        self, store, database, session
+    ):
+        occurred_at = datetime(2025, 7, 4, 15, 42, tzinfo=UTC)
+        await store.ensure_partitions(occurred_at.date())
+        session.execute.reset_mock()
+        sessions = database.async_session.call_count
+
+        event_id = await store.record_usage("child-1", "story", 12.5, occurred_at)
+
+        assert event_id
+        assert database.async_session.call_count == sessions + 1
+        session.commit.assert_awaited()
+        session.close.assert_awaited()
+        event, hourly, daily = _executed(session)
+        assert event.startswith("INSERT INTO usage_events ")
+        assert "ON CONFLICT (child_id, bucket, activity_type) DO UPDATE" in hourly
+        assert "event_count = (usage_rollups_hourly.event_count +" in hourly
+        assert "greatest(usage_rollups_daily.last_event_at" in daily
+        hourly_params = session.execute.await_args_list[1].args[0].compile().params
+        assert hourly_params["bucket"] == datetime(2025, 7, 4, 15, tzinfo=UTC)
+
+    async def test_failed_write_rolls_back(self, store, session):
+        occurred_at = datetime(2025, 7, 4, 15, 42, tzinfo=UTC)
+        await store.ensure_partitions(occurred_at.date())
+        session.commit.reset_mock()
+        session.execute.side_effect = ValueError("bad duration")
+
+        with pytest.raises(RuntimeError):
+            await store.record_usage("child-1", "story", 12.5, occurred_at)
+
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    async def test_partition_is_created_on_first_write_of_a_month(self, store, session):
+        await store.record_usage("child-1", "story", 1, datetime(2025, 7, 4, tzinfo=UTC))
+        await store.record_usage("child-1", "story", 1, datetime(2025, 7, 5, tzinfo=UTC))
+
+        creates = [sql for sql in _executed(session) if sql.startswith("CREATE TABLE")]
+        assert len(creates) == 4
+
+    async def test_record_safety_event(self, store, session):
+        await store.ensure_partitions()
+        session.execute.reset_mock()
+
+        await store.record_safety_event("child-1", "content_filtered", {"word": "x"}, "high")
+
+        event, daily = _executed(session)
+        assert event.startswith("INSERT INTO safety_event_log ")
+        assert "ON CONFLICT (child_id, bucket, event_type, severity) DO UPDATE" in daily
+
+
+class TestReads:
+    """Tests for queries over the rollups."""
+
+    async def test_activity_summaries_use_two_queries(self, store, database, session):
+        today = datetime.now(UTC).date()
+        last = datetime.now(UTC)
+        session.execute.side_effect = [
+            _result(
+                [
+                    ("a", today, "story", 3, 30.0, last),
+                    ("a", today - timedelta(days=1), "game", 2, 50.0, last - timedelta(days=1)),
+                    ("b", today, "song", 1, 5.0, last),
+                ],
+            ),
+            _result([("a", 2)]),
+        ]
+
+        summaries = await store.get_activity_summaries(["a", "b", "c"], days=7)
+
+        assert database.async_session.call_count == 1
+        assert session.execute.await_count == 2
+        assert "usage_rollups_daily.child_id IN" in _executed(session)[0]
+        assert summaries["a"]["total_interactions"] == 5
+        assert summaries["a"]["favorite_activities"] == ["game", "story"]
+        assert summaries["a"]["daily_activities"][today.isoformat()] == {
+            "interactions": 3,
+            "minutes": 30.0,
+        }
+        assert summaries["a"]["daily_average_minutes"] == pytest.approx(80 / 7)
+        assert summaries["a"]["last_active"] == last.isoformat()
+        assert summaries["a"]["safety_incidents"] == 2
+        assert summaries["c"]["total_interactions"] == 0
+
+    async def test_no_children_no_query(self, store, database):
+        assert await store.get_activity_summaries([]) == {}
+        assert database.async_session.call_count == 0
+
+    async def test_child_statistics(self, store, session):
+        today = datetime.now(UTC).date()
+        session.execute.side_effect = [
+            _result([("a", today, "story", 4, 20.0, datetime.now(UTC))]),
+            _result(),
+        ]
+
+        stats = await store.get_child_statistics("a", "week")
+
+        assert stats["interaction_count"] == 4
+        assert stats["learning_time"] == 20.0
+        assert stats["topics"] == ["story"]
+        assert stats["daily_activities"] == [
+            {"date": today.isoformat(), "interactions": 4, "minutes": 20.0},
+        ]
+
+    async def test_usage_by_day_fills_missing_days(self, store, session):
+        today = datetime.now(UTC).date()
+        session.execute.return_value = _result([(today, 15.0)])
+
+        usage = await store.usage_by_day("a", days=3)
+
+        assert list(usage.values()) == [15.0, 0.0, 0.0]
+        assert next(iter(usage)) == today.isoformat()
+
+    async def test_recent_safety_events_oldest_first(self, store, session):
+        now = datetime.now(UTC)
+        session.execute.return_value = _result(
+            [
+                ("e2", "content_filtered", "x", "high", now),
+                ("e1", "excessive_usage", "y", "low", now - timedelta(hours=1)),
+            ],
+        )
+
+        events = await store.recent_safety_events("a", limit=2)
+
+        assert [event["event_id"] for event in events] == ["e1", "e2"]
+        assert "ORDER BY safety_event_log.occurred_at DESC" in _executed(session)[0]
+
+
+class TestBackfill:
+    """Tests for copying the legacy JSON arrays of the children rows."""
+
+    async def test_copies_and_empties_legacy_arrays(self, store, session):
+        child_id = str(uuid4())
+        legacy = MagicMock()
+        legacy.mappings.return_value.first.return_value = {
+            "usage_records": [
+                {"activity_type": "story", "duration": 5, "timestamp": "2025-07-01T10:00:00"},
+                {"activity_type": "song", "duration": 2},
+            ],
+            "safety_events": json.dumps(
+                [
+                    {
+                        "event_type": "content_filter",
+                        "details": "blocked",
+                        "severity": "high",
+                        "timestamp": "2025-07-02T09:00:00",
+                    },
+                ],
+            ),
+        }
+        executed = []
+
+        def _execute(statement, params=None):
+            sql = _sql(statement)
+            executed.append(sql)
+            if "information_schema" in sql:
+                return _result([("usage_records",), ("safety_events",)])
+            if "FOR UPDATE" in sql:
+                return legacy
+            if sql.startswith("SELECT id FROM children"):
+                emptied = any(s.startswith("UPDATE children") for s in executed)
+                return _result([] if emptied else [(child_id,)])
+            return _result()
+
+        session.execute.side_effect = _execute
+
+        copied = await store.backfill_legacy_records()
+
+        assert copied == {"usage_events": 1, "safety_events": 1}
+        assert sum("INSERT INTO usage_events " in sql for sql in executed) == 1
+        assert sum("INSERT INTO usage_rollups_hourly" in sql for sql in executed) == 1
+        assert sum("INSERT INTO safety_event_log " in sql for sql in executed) == 1
+        assert any("PARTITION OF usage_events" in sql for sql in executed)
+        assert "UPDATE children SET safety_events = '[]', usage_records = '[]'" in executed[-2]
+
+    async def test_nothing_to_copy_without_legacy_columns(self, store, database, session):
+        copied = await store.backfill_legacy_records()
+
+        assert copied == {"usage_events": 0, "safety_events": 0}
+        assert database.async_session.call_count == 1
+
+
+class TestConsumers:
+    """Tests for the services reading through the store."""
+
+    async def test_usage_summary(self):
+        store = MagicMock()
+        store.usage_by_activity = AsyncMock(return_value={"story": 30.0, "game": 10.0})
+        repository = UsageRepository(MagicMock(), activity_store=store)
+
+        summary = await repository.get_usage_summary("child-1", days=7)
+
+        store.usage_by_activity.assert_awaited_once_with("child-1", 7)
+        assert summary["total_duration_minutes"] == 40.0
+        assert summary["most_common_activity"] == "story"
+
+    async def test_daily_usage_lists_days(self):
+        store = MagicMock()
+        store.usage_by_day = AsyncMock(return_value={"2025-07-04": 12.0, "2025-07-03": 0.0})
+        repository = UsageRepository(MagicMock(), activity_store=store)
+
+        assert await repository.get_daily_usage("child-1", days=2) == [
+            {"date": "2025-07-04", "duration_minutes": 12.0},
+            {"date": "2025-07-03", "duration_minutes": 0.0},
+        ]
@@ -0,0 +1,390 @@
+"""Tests for the pooled SQLite conversation repository."""
+
+import asyncio
+import sqlite3
+from unittest.mock import patch
+from datetime import datetime, timedelta
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.infrastructure.pagination.keyset import InvalidCursorError
+
+from src.infrastructure.persistence.conversation_sqlite_repository import (
+    ConversationSQLiteRepository,
+)
+from src.infrastructure.persistence.sqlite_connection_pool import (
+    SQLiteConnectionPool,
+)
+
+CHILD_ID = "child-0001"
+
+
+def _conversation(i: int, child_id: str = CHILD_ID) -> dict:
+    return {"child_id": child_id, "message": f"hello {i}", "response": f"hi {i}"}
+
+
+def _expire(db_path, count: int) -> None:
+    """Backdate the expiry of the first ``count`` conversations."""
+    expired = (datetime.utcnow() - timedelta(days=1)).isoformat()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE conversations SET expires_at = ? WHERE id IN "
+            "(SELECT id FROM conversations ORDER BY id LIMIT ?)",
+            (expired, count),
+        )
+
+
+@pytest.fixture(autouse=True)
+def encryption_key(monkeypatch):
+    """Keep the encryption key in memory instead of a key file."""
+    key = Fernet.generate_key()
+    monkeypatch.setattr(
+        ConversationSQLiteRepository,
+        "_get_or_create_encryption_key",
+        lambda self: key,
+    )
+    return key
+
+
+@pytest.fixture
+async def repository(tmp_path):
+    repository = ConversationSQLiteRepository(
+        str(tmp_path / "conversations.db"),
+        purge_batch_size=3,
+        purge_interval_seconds=3600,
+    )
+    yield repository
+    await repository.close()
+
+
+class TestSQLiteConnectionPool:
+    """Tests for SQLiteConnectionPool."""
+
+    async def test_connections_are_tuned(self, tmp_path):
+        pool = SQLiteConnectionPool(tmp_path / "pool.db", readers=2)
+
+        journal_mode = await pool.read(
+            lambda conn: conn.execute("PRAGMA journal_mode").fetchone()[0],
+        )
+        synchronous = await pool.read(
+            lambda conn: conn.execute("PRAGMA synchronous").fetchone()[0],
+        )
+        await pool.close()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    async def test_connections_are_reused(self, tmp_path):
+        pool = SQLiteConnectionPool(tmp_path / "pool.db", readers=2)
+
+        for _ in range(20):
+            await pool.write(lambda conn: id(conn))
+            await asyncio.gather(*(pool.read(lambda conn: id(conn)) for _ in range(10)))
+
+        assert len(pool._connections) <= 3
+        await pool.close()
+
+    async def test_write_rolls_back_on_error(self, tmp_path):
+        pool = SQLiteConnectionPool(tmp_path / "pool.db")
+        await pool.write(lambda conn: conn.execute("CREATE TABLE t (x INTEGER)"))
+
+        def _fail(conn):
+            conn.execute("INSERT INTO t VALUES (1)")
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await pool.write(_fail)
+
+        count = await pool.read(lambda conn: conn.execute("SELECT COUNT(*) FROM t").fetchone()[0])
+        assert count == 0
+        await pool.close()
+
+    async def test_closed_pool(self, tmp_path):
+        pool = SQLiteConnectionPool(tmp_path / "pool.db")
+        await pool.close()
+
+        with pytest.raises(RuntimeError):
+            await pool.read(lambda conn: None)
+
+
+class TestConversationSQLiteRepository:
+    """Tests for ConversationSQLiteRepository."""
+
+    async def test_save_and_get(self, repository):
+        saved = await repository.save_conversation(_conversation(1))
+
+        conversations = await repository.get_conversations(CHILD_ID)
+
+        assert saved["success"]
+        assert len(conversations) == 1
+        assert conversations[0]["id"] == saved["conversation_id"]
+        assert conversations[0]["content"]["message"] == "hello 1"
+
+    async def test_concurrent_saves(self, repository):
+        await asyncio.gather(*(repository.save_conversation(_conversation(i)) for i in range(50)))
+
+        assert await repository._get_conversation_count(CHILD_ID) == 50
+
+    async def test_no_cleanup_trigger(self, repository):
+        with sqlite3.connect(repository.db_path) as conn:
+            triggers = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'",
+            ).fetchall()
+
+        assert triggers == []
+
+    async def test_drops_trigger_of_existing_databases(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        await ConversationSQLiteRepository(str(db_path)).close()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TRIGGER cleanup_expired_conversations AFTER INSERT ON conversations "
+                "BEGIN DELETE FROM conversations WHERE expires_at < datetime('now'); END",
+            )
+
+        repository = ConversationSQLiteRepository(str(db_path))
+        await repository.close()
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger'").fetchone()[0] == 0
+
+    async def test_expired_conversations_are_hidden_before_purge(self, repository):
+        for i in range(4):
+            await repository.save_conversation(_conversation(i))
+        _expire(repository.db_path, 3)
+
+        conversations = await repository.get_conversations(CHILD_ID)
+
+        assert [c["content"]["message"] for c in conversations] == ["hello 3"]
+
+    async def test_purge_expired_in_batches(self, repository):
+        for i in range(10):
+            await repository.save_conversation(_conversation(i))
+        _expire(repository.db_path, 7)
+
+        assert await repository.purge_expired() == 7
+
+        with sqlite3.connect(repository.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM conversations").fetchone()[0] == 3
+        assert await repository.purge_expired() == 0
+
+    async def test_background_purge_starts_with_first_save(self, tmp_path):
+        repository = ConversationSQLiteRepository(
+            str(tmp_path / "conversations.db"),
+            purge_interval_seconds=0.01,
+        )
+        await repository.save_conversation(_conversation(1))
+        _expire(repository.db_path, 1)
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            with sqlite3.connect(repository.db_path) as conn:
+                if conn.execute("SELECT COUNT(*) FROM conversations").fetchone()[0] == 0:
+                    break
+        else:
+            pytest.fail("expired conversation was not purged")
+        await repository.close()
+
+    async def test_delete_child_conversations(self, repository):
+        for i in range(3):
+            await repository.save_conversation(_conversation(i))
+        await repository.save_conversation(_conversation(1, child_id="child-0002"))
+
+        result = await repository.delete_child_conversations(CHILD_ID)
+
+        assert result["deleted_count"] == 3
+        assert len(await repository.get_conversations("child-0002")) == 1
+
+    async def test_cleanup_reports_deleted_rows(self, repository):
+        for i in range(5):
+            await repository.save_conversation(_conversation(i))
+
+        await repository._cleanup_old_conversations(CHILD_ID, keep_latest=2)
+
+        assert await repository._get_conversation_count(CHILD_ID) == 2
+
+
+class TestConversationProjections:
+    """Tests for field projections of conversation reads."""
+
+    async def test_summary_only(self, repository):
+        conversation = _conversation(1)
+        conversation["summary"] = "talked about volcanoes"
+        await repository.save_conversation(conversation)
+        await repository.save_conversation(_conversation(2))
+
+        with patch.object(
+            repository,
+            "_decode_field",
+            wraps=repository._decode_field,
+        ) as decode:
+            conversations = await repository.get_conversations(CHILD_ID, summary_only=True)
+
+        assert {c["summary"] for c in conversations} == {"talked about volcanoes", "hello 2"}
+        assert all(set(c) == {"id", "summary", "timestamp"} for c in conversations)
+        assert "content" not in {call.args[1] for call in decode.call_args_list}
+
+    async def test_fields(self, repository):
+        await repository.save_conversation(_conversation(1))
+
+        conversations = await repository.get_conversations(
+            CHILD_ID,
+            fields=["hash", "parent_approved"],
+        )
+
+        assert conversations == [
+            {"hash": conversations[0]["hash"], "parent_approved": False},
+        ]
+
+    async def test_default_fields_are_unchanged(self, repository):
+        await repository.save_conversation(_conversation(1))
+
+        (conversation,) = await repository.get_conversations(CHILD_ID)
+
+        assert set(conversation) == {
+            "id",
+            "hash",
+            "content",
+            "timestamp",
+            "safety_score",
+            "parent_approved",
+        }
+
+    async def test_unknown_fields(self, repository):
+        with pytest.raises(ValueError):
+            await repository.get_conversations(CHILD_ID, fields=["transcript"])
+
+    async def test_summaries_are_truncated(self, repository):
+        conversation = _conversation(1)
+        conversation["message"] = "why " * 200
+
+        await repository.save_conversation(conversation)
+
+        (summary,) = await repository.get_conversation_summaries(CHILD_ID)
+        assert summary == conversation["message"][:280]
+
+    async def test_rows_without_summary_fall_back_to_content(self, repository):
+        await repository.save_conversation(_conversation(1))
+        with sqlite3.connect(repository.db_path) as conn:
+            conn.execute("UPDATE conversations SET encrypted_summary = NULL")
+
+        assert await repository.get_conversation_summaries(CHILD_ID) == ["hello 1"]
+
+    async def test_adds_summary_column_to_existing_databases(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE conversations (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "child_id TEXT NOT NULL, conversation_hash TEXT UNIQUE NOT NULL, "
+                "encrypted_content BLOB NOT NULL, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, "
+                "safety_score REAL DEFAULT 1.0, parent_approved BOOLEAN DEFAULT FALSE, "
+                "expires_at DATETIME NOT NULL, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)",
+            )
+
+        repository = ConversationSQLiteRepository(str(db_path))
+        await repository.save_conversation(_conversation(1))
+
+        assert await repository.get_conversation_summaries(CHILD_ID) == ["hello 1"]
+        await repository.close()
+
+    async def test_large_pages_are_decrypted_off_the_event_loop(self, tmp_path):
+        repository = ConversationSQLiteRepository(
+            str(tmp_path / "conversations.db"),
+            inline_decrypt_bytes=0,
+        )
+        for i in range(20):
+            await repository.save_conversation(_conversation(i))
+
+        with patch.object(
+            repository,
+            "_decode_rows",
+            wraps=repository._decode_rows,
+        ) as decode_rows:
+            conversations = await repository.get_conversations(CHILD_ID, limit=20)
+
+        assert len(conversations) == 20
+        assert decode_rows.call_count == 4
+        assert {c["content"]["message"] for c in conversations} == {
+            f"hello {i}" for i in range(20)
+        }
+        await repository.close()
+
+
+class TestKeysetPagination:
+    """Tests for get_conversations_page."""
+
+    async def _save(self, repository, count: int) -> list[str]:
+        for i in range(count):
+            await repository.save_conversation(_conversation(i))
+        # Saves within one second share a timestamp; the id breaks the tie
+        return [f"hello {i}" for i in reversed(range(count))]
+
+    @staticmethod
+    def _messages(page) -> list[str]:
+        return [conversation["content"]["message"] for conversation in page.items]
+
+    async def test_pages_forward_and_backward(self, repository):
+        expected = await self._save(repository, 7)
+
+        first = await repository.get_conversations_page(CHILD_ID, size=3)
+        second = await repository.get_conversations_page(
+            CHILD_ID, cursor=first.next_cursor, size=3
+        )
+        third = await repository.get_conversations_page(
+            CHILD_ID, cursor=second.next_cursor, size=3
+        )
+        back = await repository.get_conversations_page(
+            CHILD_ID, cursor=second.prev_cursor, size=3
+        )
+
+        assert (
+            self._messages(first) + self._messages(second) + self._messages(third)
+        ) == expected
+        assert (first.has_prev, first.has_next) == (False, True)
+        assert (third.has_prev, third.has_next) == (True, False)
+        assert third.next_cursor is None
+        assert self._messages(back) == self._messages(first)
+        assert not back.has_prev
+
+    async def test_new_conversations_do_not_shift_pages(self, repository):
+        await self._save(repository, 4)
+        first = await repository.get_conversations_page(CHILD_ID, size=2)
+
+        await repository.save_conversation(_conversation(99))
+        second = await repository.get_conversations_page(
+            CHILD_ID, cursor=first.next_cursor, size=2
+        )
+
+        assert self._messages(second) == ["hello 1", "hello 0"]
+
+    async def test_summary_pages(self, repository):
+        await self._save(repository, 2)
+
+        page = await repository.get_conversations_page(CHILD_ID, summary_only=True)
+
+        assert [c["summary"] for c in page.items] == ["hello 1", "hello 0"]
+        assert set(page.items[0]) == {"id", "summary", "timestamp"}
+
+    async def test_cursor_is_bound_to_the_child(self, repository):
+        await self._save(repository, 3)
+        page = await repository.get_conversations_page(CHILD_ID, size=1)
+
+        with pytest.raises(InvalidCursorError):
+            await repository.get_conversations_page(
+                "child-0002", cursor=page.next_cursor
+            )
+
+    async def test_tampered_cursor(self, repository):
+        await self._save(repository, 3)
+        page = await repository.get_conversations_page(CHILD_ID, size=1)
+        payload, signature = page.next_cursor.split(".")
+
+        with pytest.raises(InvalidCursorError):
+            await repository.get_conversations_page(
+                CHILD_ID, cursor=f"{payload[:-2]}AA.{signature}"
+            )
+
+    async def test_page_size_is_bounded(self, repository):
+        with pytest.raises(ValueError):
+            await repository.get_conversations_page(CHILD_ID, size=101)
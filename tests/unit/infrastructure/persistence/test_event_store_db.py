@@ -0,0 +1,159 @@
+"""Tests for batched appends in EventStoreDB."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.events.child_registered import ChildRegistered
+from src.infrastructure.persistence.database_manager import Database
+from src.infrastructure.persistence.event_store_db import (
+    ConcurrencyError,
+    DatabaseError,
+    EventStoreDB,
+)
+
+
+def _result(rowcount: int = 1, rows=()):
+    result = MagicMock()
+    result.rowcount = rowcount
+    result.fetchall.return_value = list(rows)
+    result.fetchone.return_value = rows[0] if rows else None
+    return result
+
+
+def _sequence_conflict() -> IntegrityError:
+    return IntegrityError(
+        "INSERT",
+        {},
+        Exception('duplicate key value violates unique constraint "idx_aggregate_sequence"'),
+    )
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result())
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+@pytest.fixture
+def store(session):
+    """Store on a real Database, whose ``get_session`` re-raises errors wrapped."""
+    database = Database.__new__(Database)
+    database.async_session = MagicMock(return_value=session)
+    return EventStoreDB(database)
+
+
+class TestSaveEvents:
+    """Tests for EventStoreDB.save_events."""
+
+    async def test_single_statement_per_save(self, store, session):
+        """All events go out in one INSERT, without a version lookup first."""
+        child_id = uuid4()
+        events = [ChildRegistered.create(child_id, "Sam", 7, {}), {"event_type": "Noted"}]
+
+        await store.save_events(child_id, events)
+
+        session.execute.assert_awaited_once()
+        statement, params = session.execute.await_args.args
+        assert "INSERT INTO domain_events" in str(statement)
+        assert "MAX(sequence_number)" in str(statement)
+        assert params["aggregate_id"] == str(child_id)
+        assert params["expected_version"] is None
+        assert params["event_type_0"] == "ChildRegistered"
+        assert params["event_type_1"] == "Noted"
+        assert json.loads(params["event_data_0"])["name"] == "Sam"
+        session.commit.assert_awaited()
+
+    async def test_expected_version_mismatch(self, store, session):
+        """No rows inserted means the expected version was not the last one."""
+        session.execute.side_effect = [_result(rowcount=0), _result(rows=[(5,)])]
+
+        with pytest.raises(ConcurrencyError, match="current version is 5"):
+            await store.save_events(uuid4(), [{"a": 1}], expected_version=3)
+
+        session.commit.assert_not_awaited()
+
+    async def test_unique_violation_with_expected_version(self, store, session):
+        session.execute.side_effect = _sequence_conflict()
+
+        with pytest.raises(ConcurrencyError):
+            await store.save_events(uuid4(), [{"a": 1}], expected_version=0)
+
+        assert session.execute.await_count == 1
+
+    async def test_unique_violation_is_retried_without_expected_version(
+        self, store, session,
+    ):
+        """Without an expectation, losing the race just renumbers the events."""
+        session.execute.side_effect = [_sequence_conflict(), _result()]
+
+        await store.save_events(uuid4(), [{"a": 1}])
+
+        assert session.execute.await_count == 2
+        session.rollback.assert_awaited_once()
+        session.commit.assert_awaited()
+
+    async def test_other_integrity_errors(self, store, session):
+        session.execute.side_effect = IntegrityError("INSERT", {}, Exception("not null"))
+
+        with pytest.raises(DatabaseError):
+            await store.save_events(uuid4(), [{"a": 1}])
+
+
+class TestAppendMany:
+    """Tests for EventStoreDB.append_many."""
+
+    async def test_numbers_events_after_current_versions(self, store, session):
+        first, second = uuid4(), uuid4()
+        session.execute.side_effect = [_result(rows=[(first, 4)]), _result()]
+
+        written = await store.append_many(
+            {first: [{"n": 1}, {"n": 2}], second: [{"n": 1}], uuid4(): []},
+        )
+
+        assert written == 3
+        assert session.execute.await_count == 2
+        _, params = session.execute.await_args_list[1].args
+        assert [params[f"sequence_number_{i}"] for i in range(3)] == [5, 6, 1]
+        assert params["aggregate_id_2"] == str(second)
+
+    async def test_chunks_inserts(self, store, session):
+        session.execute.side_effect = [_result()] + [_result()] * 3
+
+        await store.append_many({uuid4(): [{"n": i} for i in range(5)]}, chunk_size=2)
+
+        assert session.execute.await_count == 4
+
+    async def test_expected_versions_are_checked_up_front(self, store, session):
+        child_id = uuid4()
+        session.execute.side_effect = [_result(rows=[(child_id, 2)])]
+
+        with pytest.raises(ConcurrencyError):
+            await store.append_many({child_id: [{"n": 1}]}, expected_versions={child_id: 0})
+
+        session.commit.assert_not_awaited()
+
+    async def test_uses_copy_for_large_batches(self, store, session):
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        raw_connection = MagicMock(driver_connection=driver)
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+        session.connection = AsyncMock(return_value=connection)
+        session.execute.side_effect = [_result()]
+
+        await store.append_many({uuid4(): [{"n": i} for i in range(10)]}, copy_threshold=10)
+
+        driver.copy_records_to_table.assert_awaited_once()
+        records = driver.copy_records_to_table.await_args.kwargs["records"]
+        assert [record[5] for record in records] == list(range(1, 11))
+        assert session.execute.await_count == 1
@@ -0,0 +1,197 @@
+"""Tests for indexed per-aggregate reads in KafkaEventStore.
+
+Runs against the in-process broker stand-in in ``tests.utils``.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+from aiokafka.structs import TopicPartition
+
+from src.domain.events.child_profile_updated import ChildProfileUpdated
+from src.domain.events.child_registered import ChildRegistered
+from src.infrastructure.persistence.kafka_event_index import AggregateOffsetIndex
+from src.infrastructure.persistence.kafka_event_store import KafkaEventStore
+from tests.utils.local_kafka_broker import LocalKafkaBroker
+
+MODULE = "src.infrastructure.persistence.kafka_event_store"
+
+
+@pytest.fixture
+def broker():
+    return LocalKafkaBroker(partitions=3)
+
+
+@pytest.fixture
+async def store(broker):
+    with patch(f"{MODULE}.AIOKafkaProducer", broker.producer), patch(
+        f"{MODULE}.AIOKafkaConsumer",
+        broker.consumer,
+    ):
+        store = KafkaEventStore(
+            SimpleNamespace(kafka=SimpleNamespace(KAFKA_BOOTSTRAP_SERVERS="local")),
+            max_offset_gap=0,
+        )
+        await store.initialize()
+        yield store
+        await store.close()
+
+
+def _registered(child_id: UUID) -> ChildRegistered:
+    return ChildRegistered.create(child_id, "Sam", 7, {})
+
+
+def _updated(child_id: UUID, i: int) -> ChildProfileUpdated:
+    return ChildProfileUpdated(child_id=child_id, preferences={"story": i})
+
+
+async def _populate(store, aggregates: int, events_each: int) -> list[UUID]:
+    ids = [uuid4() for _ in range(aggregates)]
+    for i in range(events_each):
+        for child_id in ids:
+            await store.save_events(
+                child_id,
+                [_registered(child_id) if i == 0 else _updated(child_id, i)],
+            )
+    return ids
+
+
+class TestKafkaEventStore:
+    """Tests for KafkaEventStore loads."""
+
+    async def test_load_events_round_trip(self, store):
+        child_id = uuid4()
+        await store.save_events(
+            child_id,
+            [_registered(child_id), _updated(child_id, 1), _updated(child_id, 2)],
+        )
+
+        events = await store.load_events(child_id)
+
+        assert [type(event).__name__ for event in events] == [
+            "ChildRegistered",
+            "ChildProfileUpdated",
+            "ChildProfileUpdated",
+        ]
+        assert events[2].preferences == {"story": 2}
+
+    async def test_unknown_aggregate(self, store):
+        assert await store.load_events(uuid4()) == []
+
+    async def test_load_reads_only_the_aggregates_records(self, store):
+        """With the index, a load fetches the aggregate's own offsets only."""
+        ids = await _populate(store, aggregates=40, events_each=5)
+        store.consumer.fetched = 0
+
+        events = await store.load_events(ids[7])
+
+        assert len(events) == 5
+        assert all(str(event.child_id) == str(ids[7]) for event in events)
+        assert store.consumer.fetched == 5
+
+    async def test_cached_stream_is_extended_with_new_offsets(self, store):
+        ids = await _populate(store, aggregates=5, events_each=3)
+        await store.load_events(ids[0])
+        store.consumer.fetched = 0
+
+        assert len(await store.load_events(ids[0])) == 3
+        assert store.consumer.fetched == 0
+
+        await store.save_events(ids[0], [_updated(ids[0], 99)])
+        events = await store.load_events(ids[0])
+
+        assert len(events) == 4
+        assert events[-1].preferences == {"story": 99}
+        assert store.consumer.fetched == 1
+
+    async def test_cache_is_bounded(self, store):
+        store.cache.max_aggregates = 2
+        ids = await _populate(store, aggregates=4, events_each=1)
+
+        for child_id in ids:
+            await store.load_events(child_id)
+
+        assert len(store.cache) == 2
+
+    async def test_falls_back_to_scan_while_index_is_behind(self, store):
+        """Loads stay correct when the indexer has not caught up."""
+        ids = await _populate(store, aggregates=10, events_each=2)
+        store._index_task.cancel()
+        store.index = AggregateOffsetIndex()
+        store.index_wait_timeout = 0.01
+
+        events = await store.load_events(ids[3])
+
+        assert len(events) == 2
+        assert len(store.cache) == 0
+
+    async def test_load_events_from_offset(self, store):
+        child_id = uuid4()
+        await store.save_events(
+            child_id,
+            [_registered(child_id)] + [_updated(child_id, i) for i in range(1, 4)],
+        )
+
+        events = await store.load_events_from_offset(child_id, 2)
+
+        assert [event.preferences for event in events] == [
+            {"story": 2},
+            {"story": 3},
+        ]
+
+    async def test_get_events_numbers_stored_events(self, store):
+        """The EventStore interface returns stored payloads with versions."""
+        child_id = uuid4()
+        await store.append_events(
+            child_id,
+            "ChildProfile",
+            "ChildProfileUpdated",
+            [{"name": "Sam"}, {"name": "Samira"}],
+        )
+
+        events = await store.get_events(child_id, after_version=1)
+
+        assert [(event["version"], event["data"]) for event in events] == [
+            (2, {"name": "Samira"}),
+        ]
+
+    def test_topic_name_is_stable(self, store):
+        """Topic assignment must not depend on the per-process hash seed."""
+        child_id = UUID("12345678-1234-5678-1234-567812345678")
+
+        assert store._get_topic_name(child_id) == "ai-teddy-events-3"
+
+
+class TestAggregateOffsetIndex:
+    """Tests for AggregateOffsetIndex."""
+
+    def test_offsets_merge_into_ranges(self):
+        index = AggregateOffsetIndex()
+        partition = TopicPartition("events", 0)
+        for offset in [3, 4, 5, 9, 7, 8, 1, 4]:
+            index.add("a", partition, offset)
+
+        assert index.ranges("a") == {partition: [[1, 1], [3, 5], [7, 9]]}
+        index.add("a", partition, 6)
+        assert index.ranges("a") == {partition: [[1, 1], [3, 9]]}
+
+    def test_ranges_after_offset(self):
+        index = AggregateOffsetIndex()
+        partition = TopicPartition("events", 0)
+        for offset in [1, 2, 3, 10, 11]:
+            index.add("a", partition, offset)
+
+        assert index.ranges("a", after={partition: 2}) == {
+            partition: [[3, 3], [10, 11]],
+        }
+        assert index.ranges("a", after={partition: 11}) == {}
+
+    async def test_wait_until_times_out(self):
+        index = AggregateOffsetIndex()
+        partition = TopicPartition("events", 0)
+        await index.advance({partition: 3})
+
+        assert await index.wait_until({partition: 3}, timeout=0.01) is True
+        assert await index.wait_until({partition: 4}, timeout=0.01) is False
@@ -0,0 +1,69 @@
+"""Tests for the PostgreSQL snapshot store."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.repositories.snapshot_store import Snapshot
+from src.infrastructure.persistence.database_manager import Database
+from src.infrastructure.persistence.snapshot_store import PostgresSnapshotStore
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=3))
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+@pytest.fixture
+def store(session):
+    """Store on a real Database, so it goes through ``get_session``."""
+    database = Database.__new__(Database)
+    database.async_session = MagicMock(return_value=session)
+    return PostgresSnapshotStore(database)
+
+
+class TestPostgresSnapshotStore:
+    """Tests for PostgresSnapshotStore."""
+
+    async def test_save_upserts_on_version(self, store, session):
+        await store.save_snapshot(
+            Snapshot(
+                aggregate_id=uuid4(),
+                aggregate_type="ChildProfile",
+                version=10,
+                schema_version=1,
+                state={"name": "Sam"},
+            ),
+        )
+
+        sql = _sql(session.execute.await_args.args[0])
+        assert sql.startswith("INSERT INTO aggregate_snapshots ")
+        assert "ON CONFLICT ON CONSTRAINT uq_snapshot_aggregate_version DO UPDATE" in sql
+        session.commit.assert_awaited()
+        session.close.assert_awaited()
+
+    async def test_missing_snapshot(self, store, session):
+        session.execute.return_value.scalar_one_or_none.return_value = None
+
+        assert await store.get_latest_snapshot(uuid4()) is None
+
+    async def test_compact_deletes_ranked_snapshots(self, store, session):
+        deleted = await store.compact(keep_last=2)
+
+        assert deleted == 3
+        sql = _sql(session.execute.await_args.args[0])
+        assert sql.startswith("DELETE FROM aggregate_snapshots ")
+        assert "row_number() OVER (PARTITION BY aggregate_snapshots.aggregate_id" in sql
@@ -0,0 +1,237 @@
+"""Tests for the incremental child profile projection."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import fakeredis.aioredis
+import pytest
+
+from src.domain.entities.child_profile import ChildProfile
+from src.domain.repositories.event_store import InMemoryEventStore
+from src.infrastructure.read_models.child_profile_projection import (
+    ChildProfileProjection,
+)
+from src.infrastructure.read_models.child_profile_read_model import (
+    ChildProfileReadModel,
+    ChildProfileReadModelStore,
+    RedisChildProfileReadModelStore,
+)
+from src.infrastructure.repositories.event_sourced_child_repository import (
+    EventSourcedChildRepository,
+)
+
+
+class CountingEventStore(InMemoryEventStore):
+    """In-memory event store that records how many events each load returns."""
+
+    def __init__(self):
+        super().__init__()
+        self.loaded = 0
+
+    async def get_events(self, aggregate_id, after_version=None):
+        events = await super().get_events(aggregate_id, after_version)
+        self.loaded += len(events)
+        return events
+
+
+@pytest.fixture
+def event_store():
+    return CountingEventStore()
+
+
+@pytest.fixture
+def read_model_store():
+    return ChildProfileReadModelStore()
+
+
+@pytest.fixture
+def projection(event_store, read_model_store):
+    return ChildProfileProjection(event_store, read_model_store, concurrency=4)
+
+
+async def _create_profile(event_store, name: str = "Sam", updates: int = 0) -> ChildProfile:
+    repository = EventSourcedChildRepository(event_store)
+    profile = ChildProfile.create(name, 7, {"color": "blue"})
+    await repository.save(profile)
+    for i in range(updates):
+        profile.update_profile(preferences={"color": f"shade-{i}"})
+        await repository.save(profile)
+    return profile
+
+
+class TestChildProfileProjection:
+    """Tests for ChildProfileProjection."""
+
+    async def test_project_new_profile(self, projection, event_store, read_model_store):
+        profile = await _create_profile(event_store, updates=2)
+
+        model = await projection.project(profile.id)
+
+        assert model.name == "Sam"
+        assert model.preferences == {"color": "shade-1"}
+        assert model.version == 3
+        assert await read_model_store.async_get_by_id(profile.id) == model
+
+    async def test_project_applies_only_new_events(self, projection, event_store):
+        """Projecting again reads only the events after the stored version."""
+        profile = await _create_profile(event_store, updates=5)
+        await projection.project(profile.id)
+        profile.update_profile(name="Samira")
+        await EventSourcedChildRepository(event_store).save(profile)
+        event_store.loaded = 0
+
+        model = await projection.project(profile.id)
+
+        assert event_store.loaded == 1
+        assert model.name == "Samira"
+        assert model.preferences == {"color": "shade-4"}
+        assert model.version == 7
+
+    async def test_concurrent_projections_of_one_profile(self, projection, event_store):
+        profile = await _create_profile(event_store, updates=3)
+
+        await asyncio.gather(*(projection.project(profile.id) for _ in range(5)))
+
+        assert event_store.loaded == 4
+
+    async def test_unknown_profile(self, projection):
+        assert await projection.project(uuid4()) is None
+
+    async def test_catch_up_projects_only_stale_profiles(
+        self, projection, event_store, read_model_store,
+    ):
+        """After a restart, only profiles with newer events are replayed."""
+        profiles = [await _create_profile(event_store, f"child-{i}") for i in range(5)]
+        assert await projection.catch_up() == 5
+        changed = profiles[2]
+        changed.update_profile(age=8)
+        await EventSourcedChildRepository(event_store).save(changed)
+        event_store.loaded = 0
+
+        restarted = ChildProfileProjection(event_store, read_model_store)
+        assert await restarted.catch_up() == 1
+
+        assert event_store.loaded == 1
+        assert (await read_model_store.async_get_by_id(changed.id)).age == 8
+
+    async def test_catch_up_skips_profiles_before_checkpoint(
+        self, projection, event_store, read_model_store,
+    ):
+        """Profiles without events since the checkpoint are not even looked up."""
+        await _create_profile(event_store)
+        await read_model_store.save_checkpoint(datetime.now(UTC) + timedelta(hours=1))
+
+        assert await projection.catch_up() == 0
+        assert read_model_store.get_all() == []
+
+    async def test_failed_catch_up_keeps_checkpoint(
+        self, projection, event_store, read_model_store,
+    ):
+        await _create_profile(event_store)
+
+        async def fail(*args, **kwargs):
+            raise ConnectionError("down")
+
+        read_model_store.async_save = fail
+        await projection.catch_up()
+
+        assert await read_model_store.get_checkpoint() is None
+
+    async def test_rebuild(self, projection, event_store, read_model_store):
+        profiles = [await _create_profile(event_store, f"child-{i}", 2) for i in range(20)]
+        stale_id = uuid4()
+        read_model_store.save(ChildProfileReadModel(stale_id, "gone", 5, {}, 1))
+
+        assert await projection.rebuild() == 20
+
+        assert read_model_store.get_by_id(stale_id) is None
+        assert len(read_model_store.get_all()) == 20
+        assert all(
+            read_model_store.get_by_id(profile.id).version == 3 for profile in profiles
+        )
+        assert await read_model_store.get_checkpoint() is not None
+
+    async def test_deleted_profile_is_dropped(
+        self, projection, event_store, read_model_store,
+    ):
+        profile = await _create_profile(event_store)
+        await projection.project(profile.id)
+        profile.delete()
+        await EventSourcedChildRepository(event_store).save(profile)
+
+        assert await projection.project(profile.id) is None
+        assert await read_model_store.async_get_by_id(profile.id) is None
+        assert await EventSourcedChildRepository(event_store).get_by_id(profile.id) is None
+
+    async def test_rebuild_and_catch_up_do_not_resurrect_deleted_profiles(
+        self, projection, event_store, read_model_store,
+    ):
+        kept = await _create_profile(event_store, "kept")
+        deleted = await _create_profile(event_store, "deleted")
+        deleted.delete()
+        await EventSourcedChildRepository(event_store).save(deleted)
+
+        await projection.rebuild()
+        assert await read_model_store.async_get_by_id(deleted.id) is None
+
+        fresh_store = ChildProfileReadModelStore()
+        await ChildProfileProjection(event_store, fresh_store).catch_up()
+        assert await fresh_store.async_get_by_id(deleted.id) is None
+        assert (await fresh_store.async_get_by_id(kept.id)).name == "kept"
+
+
+class TestReadModelStores:
+    """Tests shared by the in-memory and Redis read model stores."""
+
+    @pytest.fixture(params=["memory", "redis"])
+    def store(self, request):
+        if request.param == "memory":
+            return ChildProfileReadModelStore()
+        return RedisChildProfileReadModelStore(fakeredis.aioredis.FakeRedis())
+
+    async def test_round_trip(self, store):
+        model = ChildProfileReadModel(uuid4(), "Sam", 7, {"color": "blue"}, 3)
+
+        assert await store.async_save(model)
+
+        assert await store.async_get_by_id(model.id) == model
+        assert await store.async_get_by_id(uuid4()) is None
+
+    async def test_older_versions_are_not_saved(self, store):
+        child_id = uuid4()
+        await store.async_save(ChildProfileReadModel(child_id, "new", 7, {}, 4))
+
+        assert not await store.async_save(ChildProfileReadModel(child_id, "old", 7, {}, 3))
+
+        assert (await store.async_get_by_id(child_id)).name == "new"
+
+    async def test_get_many(self, store):
+        models = [ChildProfileReadModel(uuid4(), f"child-{i}", 7, {}, 1) for i in range(3)]
+        for model in models:
+            await store.async_save(model)
+
+        found = await store.async_get_many([models[0].id, uuid4(), models[2].id])
+
+        assert found == {models[0].id: models[0], models[2].id: models[2]}
+
+    async def test_delete_and_clear(self, store):
+        first = ChildProfileReadModel(uuid4(), "a", 7, {}, 1)
+        second = ChildProfileReadModel(uuid4(), "b", 7, {}, 1)
+        await store.async_save(first)
+        await store.async_save(second)
+        await store.save_checkpoint(datetime.now(UTC))
+
+        await store.async_delete(first.id)
+        assert await store.async_get_by_id(first.id) is None
+
+        await store.async_clear()
+        assert await store.async_get_by_id(second.id) is None
+        assert await store.get_checkpoint() is None
+
+    async def test_checkpoint(self, store):
+        checkpoint = datetime(2024, 5, 1, 12, 30, tzinfo=UTC)
+
+        await store.save_checkpoint(checkpoint)
+
+        assert await store.get_checkpoint() == checkpoint
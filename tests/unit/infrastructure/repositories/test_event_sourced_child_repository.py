@@ -0,0 +1,195 @@
+"""Tests for snapshot-backed loading in EventSourcedChildRepository."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.child_profile import ChildProfile
+from src.domain.repositories.event_store import InMemoryEventStore
+from src.domain.repositories.snapshot_store import (
+    InMemorySnapshotStore,
+    Snapshot,
+    SnapshotPolicy,
+)
+from src.infrastructure.repositories.event_sourced_child_repository import (
+    EventSourcedChildRepository,
+)
+
+
+class CountingEventStore(InMemoryEventStore):
+    """In-memory event store that records how many events each load returns."""
+
+    def __init__(self):
+        super().__init__()
+        self.loaded = 0
+
+    async def get_events(self, aggregate_id, after_version=None):
+        events = await super().get_events(aggregate_id, after_version)
+        self.loaded += len(events)
+        return events
+
+
+@pytest.fixture
+def event_store():
+    return CountingEventStore()
+
+
+@pytest.fixture
+def snapshot_store():
+    return InMemorySnapshotStore()
+
+
+@pytest.fixture
+def repository(event_store, snapshot_store):
+    return EventSourcedChildRepository(
+        event_store,
+        snapshot_store,
+        SnapshotPolicy(every_n_events=10),
+    )
+
+
+async def _profile_with_updates(repository, updates: int) -> ChildProfile:
+    profile = ChildProfile.create("Sam", 7, {"color": "blue"})
+    await repository.save(profile)
+    for i in range(updates):
+        profile.update_profile(preferences={"color": f"shade-{i}"})
+        await repository.save(profile)
+    return profile
+
+
+class TestEventSourcedChildRepository:
+    """Tests for EventSourcedChildRepository."""
+
+    async def test_round_trip_without_snapshot_store(self, event_store):
+        """Without snapshots, profiles are rebuilt from all of their events."""
+        repository = EventSourcedChildRepository(event_store)
+        profile = await _profile_with_updates(repository, 3)
+
+        loaded = await repository.get_by_id(profile.id)
+
+        assert loaded.name == "Sam"
+        assert loaded.age == 7
+        assert loaded.preferences == {"color": "shade-2"}
+        assert loaded.version == 4
+        assert loaded.get_uncommitted_events() == []
+
+    async def test_missing_profile(self, repository):
+        assert await repository.get_by_id(uuid4()) is None
+
+    async def test_save_snapshots_every_n_events(self, repository, snapshot_store):
+        """A snapshot is taken each time the version crosses a multiple of N."""
+        profile = await _profile_with_updates(repository, 24)
+
+        snapshot = await snapshot_store.get_latest_snapshot(profile.id)
+
+        assert profile.version == 25
+        assert snapshot.version == 20
+        assert snapshot.state["preferences"] == {"color": "shade-18"}
+        assert len(snapshot_store._snapshots[str(profile.id)]) == 2
+
+    async def test_load_replays_only_the_tail(self, repository, event_store):
+        """Loading starts from the snapshot and applies only later events."""
+        profile = await _profile_with_updates(repository, 24)
+        event_store.loaded = 0
+
+        loaded = await repository.get_by_id(profile.id)
+
+        assert event_store.loaded == 5
+        assert loaded.version == 25
+        assert loaded.preferences == {"color": "shade-23"}
+        assert loaded.name == "Sam"
+
+    async def test_loaded_profile_keeps_snapshotting(self, repository, snapshot_store):
+        profile = await _profile_with_updates(repository, 8)
+        loaded = await repository.get_by_id(profile.id)
+
+        loaded.update_profile(name="Samira")
+        loaded.update_profile(age=8)
+        await repository.save(loaded)
+
+        snapshot = await snapshot_store.get_latest_snapshot(profile.id)
+        assert snapshot.version == 11
+        assert snapshot.state["name"] == "Samira"
+        assert snapshot.state["age"] == 8
+
+    async def test_outdated_snapshot_schema_is_ignored(
+        self, repository, event_store, snapshot_store,
+    ):
+        """Snapshots of an older layout fall back to a full replay."""
+        profile = await _profile_with_updates(repository, 4)
+        await snapshot_store.save_snapshot(
+            Snapshot(
+                aggregate_id=profile.id,
+                aggregate_type="ChildProfile",
+                version=5,
+                schema_version=ChildProfile.SNAPSHOT_SCHEMA_VERSION - 1,
+                state={"legacy": True},
+            ),
+        )
+        event_store.loaded = 0
+
+        loaded = await repository.get_by_id(profile.id)
+
+        assert event_store.loaded == 5
+        assert loaded.preferences == {"color": "shade-3"}
+
+    async def test_backfills_snapshot_for_long_histories(
+        self, event_store, snapshot_store,
+    ):
+        """Profiles written before snapshots were enabled get one on load."""
+        profile = await _profile_with_updates(
+            EventSourcedChildRepository(event_store),
+            14,
+        )
+        repository = EventSourcedChildRepository(
+            event_store,
+            snapshot_store,
+            SnapshotPolicy(every_n_events=10),
+        )
+
+        await repository.get_by_id(profile.id)
+
+        snapshot = await snapshot_store.get_latest_snapshot(profile.id)
+        assert snapshot.version == 15
+
+    async def test_snapshot_failures_do_not_fail_loads(self, event_store):
+        snapshot_store = InMemorySnapshotStore()
+        snapshot_store.get_latest_snapshot = AsyncMock(side_effect=OSError("down"))
+        snapshot_store.save_snapshot = AsyncMock(side_effect=OSError("down"))
+        repository = EventSourcedChildRepository(
+            event_store,
+            snapshot_store,
+            SnapshotPolicy(every_n_events=2),
+        )
+        profile = await _profile_with_updates(repository, 3)
+
+        loaded = await repository.get_by_id(profile.id)
+
+        assert loaded.version == 4
+
+    async def test_stale_writer_is_rejected(self, repository, snapshot_store):
+        """A writer that loaded an older version cannot overwrite the stream."""
+        profile = await _profile_with_updates(repository, 8)
+        first = await repository.get_by_id(profile.id)
+        second = await repository.get_by_id(profile.id)
+
+        first.delete()
+        await repository.save(first)
+        second.update_profile(name="Samira")
+        with pytest.raises(ValueError, match="Concurrency conflict"):
+            await repository.save(second)
+
+        assert await repository.get_by_id(profile.id) is None
+        snapshot = await snapshot_store.get_latest_snapshot(profile.id)
+        assert snapshot.version == 10
+        assert snapshot.state["deleted"] is True
+
+    async def test_compact_keeps_newest(self, repository, snapshot_store):
+        profile = await _profile_with_updates(repository, 34)
+
+        deleted = await snapshot_store.compact(keep_last=1)
+
+        assert deleted == 2
+        snapshot = await snapshot_store.get_latest_snapshot(profile.id)
+        assert snapshot.version == 30
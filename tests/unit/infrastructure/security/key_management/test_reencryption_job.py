@@ -0,0 +1,246 @@
+"""Tests for online re-encryption after a key rotation."""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.infrastructure.persistence.conversation_sqlite_repository import (
+    ConversationSQLiteRepository,
+)
+from src.infrastructure.security.key_management.reencryption_job import (
+    FileCheckpointStore,
+    ReencryptionBudget,
+    ReencryptionJob,
+)
+
+CHILD_ID = "child-0001"
+UNLIMITED = ReencryptionBudget(rows_per_second=None, max_busy_fraction=1.0)
+
+
+@pytest.fixture
+def old_key(monkeypatch):
+    key = Fernet.generate_key()
+    monkeypatch.setattr(
+        ConversationSQLiteRepository,
+        "_get_or_create_encryption_key",
+        lambda self: key,
+    )
+    return key
+
+
+def _repository(tmp_path) -> ConversationSQLiteRepository:
+    return ConversationSQLiteRepository(
+        str(tmp_path / "conversations.db"),
+        key_file=str(tmp_path / "conversation_key.key"),
+    )
+
+
+@pytest.fixture
+async def repository(tmp_path, old_key):
+    repository = _repository(tmp_path)
+    for i in range(7):
+        await repository.save_conversation(
+            {"child_id": CHILD_ID, "message": f"hello {i}", "response": f"hi {i}"}
+        )
+    yield repository
+    await repository.close()
+
+
+@pytest.fixture
+def checkpoints(tmp_path):
+    return FileCheckpointStore(tmp_path / "checkpoints")
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def _job(repository, new_key, old_key, checkpoints, executor, **options):
+    return ReencryptionJob(
+        repository,
+        new_key,
+        [old_key],
+        checkpoints,
+        executor=executor,
+        **{"batch_size": 3, "budget": UNLIMITED, **options},
+    )
+
+
+def _ciphertexts(repository) -> dict[int, bytes]:
+    with sqlite3.connect(repository.db_path) as conn:
+        return dict(conn.execute("SELECT id, encrypted_content FROM conversations"))
+
+
+class TestReencryptionJob:
+    """Tests for moving stored conversations to a new key."""
+
+    async def test_rows_move_to_the_new_key(self, repository, old_key, checkpoints):
+        new_key = Fernet.generate_key()
+        repository.use_encryption_keys(new_key, previous=[old_key])
+
+        checkpoint = await _job(
+            repository, new_key, old_key, checkpoints, None, workers=1
+        ).run()
+
+        assert checkpoint.done
+        assert (checkpoint.total, checkpoint.rewritten) == (7, 7)
+        repository.use_encryption_keys(new_key)
+        conversations = await repository.get_conversations(CHILD_ID, limit=10)
+        summaries = await repository.get_conversation_summaries(CHILD_ID)
+        assert len(conversations) == 7
+        assert len(summaries) == 7
+
+    async def test_resumes_from_the_checkpoint(
+        self, repository, old_key, checkpoints, executor
+    ):
+        new_key = Fernet.generate_key()
+        repository.use_encryption_keys(new_key, previous=[old_key])
+        first = _job(repository, new_key, old_key, checkpoints, executor)
+        replace = repository.replace_ciphertexts
+
+        async def _replace_then_stop(rows):
+            first.stop()
+            return await replace(rows)
+
+        repository.replace_ciphertexts = _replace_then_stop
+        stopped = await first.run()
+        repository.replace_ciphertexts = replace
+        assert not stopped.done
+        assert stopped.processed == 3
+
+        fetched_after = []
+        fetch = repository.fetch_ciphertexts
+
+        async def _fetch(after, limit):
+            fetched_after.append(after)
+            return await fetch(after, limit)
+
+        repository.fetch_ciphertexts = _fetch
+        resumed = await _job(repository, new_key, old_key, checkpoints, executor).run()
+
+        assert resumed.done
+        assert fetched_after[0] == stopped.last_key
+        assert (resumed.processed, resumed.rewritten) == (7, 7)
+        assert resumed.started_at == stopped.started_at
+
+    async def test_concurrent_writes_are_not_overwritten(
+        self, repository, old_key, checkpoints, executor
+    ):
+        new_key = Fernet.generate_key()
+        repository.use_encryption_keys(new_key, previous=[old_key])
+        written = Fernet(new_key).encrypt(b'{"message": "written meanwhile"}')
+        replace = repository.replace_ciphertexts
+
+        async def _write_then_replace(rows):
+            with sqlite3.connect(repository.db_path) as conn:
+                conn.execute(
+                    "UPDATE conversations SET encrypted_content = ? WHERE id = ?",
+                    (written, rows[0][0]),
+                )
+            return await replace(rows)
+
+        repository.replace_ciphertexts = _write_then_replace
+        checkpoint = await _job(
+            repository, new_key, old_key, checkpoints, executor, batch_size=10
+        ).run()
+
+        assert checkpoint.conflicts == 1
+        assert checkpoint.rewritten == 6
+        assert _ciphertexts(repository)[1] == written
+
+    async def test_rows_under_the_new_key_are_left_alone(
+        self, repository, old_key, checkpoints, executor
+    ):
+        new_key = Fernet.generate_key()
+        repository.use_encryption_keys(new_key, previous=[old_key])
+        await _job(repository, new_key, old_key, checkpoints, executor).run()
+        before = _ciphertexts(repository)
+
+        checkpoint = await _job(
+            repository, new_key, old_key, checkpoints, executor, job_id="again"
+        ).run()
+
+        assert (checkpoint.current, checkpoint.rewritten) == (7, 0)
+        assert _ciphertexts(repository) == before
+
+    async def test_rows_no_key_decrypts_are_reported(
+        self, repository, checkpoints, executor
+    ):
+        new_key = Fernet.generate_key()
+        before = _ciphertexts(repository)
+
+        checkpoint = await _job(
+            repository, new_key, Fernet.generate_key(), checkpoints, executor
+        ).run()
+
+        assert checkpoint.failed == 7
+        assert _ciphertexts(repository) == before
+
+    async def test_progress(self, repository, old_key, checkpoints, executor):
+        new_key = Fernet.generate_key()
+        job = _job(repository, new_key, old_key, checkpoints, executor)
+        assert job.progress()["started"] is False
+
+        await job.run()
+
+        progress = job.progress()
+        assert progress["percent"] == 100.0
+        assert progress["done"]
+
+
+class TestKeyringPersistence:
+    """Tests for sharing rotated keys through the keyring file."""
+
+    async def test_rotated_keys_survive_a_restart(
+        self, tmp_path, repository, old_key, checkpoints, monkeypatch
+    ):
+        new_key = Fernet.generate_key()
+        repository.use_encryption_keys(new_key, previous=[old_key])
+        await _job(repository, new_key, old_key, checkpoints, None, workers=1).run()
+        monkeypatch.undo()  # read the key from the keyring file again
+
+        restarted = _repository(tmp_path)
+        try:
+            assert restarted.encryption_key == new_key
+            conversations = await restarted.get_conversations(CHILD_ID, limit=10)
+            assert len(conversations) == 7
+        finally:
+            await restarted.close()
+
+    async def test_other_workers_reload_the_keyring(
+        self, tmp_path, repository, old_key, checkpoints
+    ):
+        worker = _repository(tmp_path)
+        try:
+            new_key = Fernet.generate_key()
+            repository.use_encryption_keys(new_key, previous=[old_key])
+            await _job(
+                repository, new_key, old_key, checkpoints, None, workers=1
+            ).run()
+
+            conversations = await worker.get_conversations(CHILD_ID, limit=10)
+
+            assert len(conversations) == 7
+            assert worker.encryption_key == new_key
+        finally:
+            await worker.close()
+
+
+class TestReencryptionBudget:
+    """Tests for pacing the job."""
+
+    def test_busy_fraction(self):
+        budget = ReencryptionBudget(rows_per_second=None, max_busy_fraction=0.25)
+
+        assert budget.pause(1000, 0.1) == pytest.approx(0.3)
+
+    def test_rows_per_second(self):
+        budget = ReencryptionBudget(rows_per_second=1000, max_busy_fraction=1.0)
+
+        assert budget.pause(500, 0.1) == pytest.approx(0.4)
+        assert budget.pause(500, 0.6) == 0.0
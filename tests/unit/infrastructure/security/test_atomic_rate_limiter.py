@@ -0,0 +1,252 @@
+"""Tests for the atomic Redis-side rate limiter.
+
+The Lua scripts run against fakeredis with its embedded Lua interpreter.
+"""
+
+import asyncio
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.security.rate_limiter.atomic import AtomicRateLimiter
+from src.infrastructure.security.rate_limiter.core import (
+    RateLimitConfig,
+    RateLimitStrategy,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+
+class FakeClock:
+    """Manually advanced clock passed to the scripts."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(redis_client, clock):
+    return AtomicRateLimiter(redis_client, clock=clock)
+
+
+async def _allowed(check, times: int) -> list[bool]:
+    return [(await check()).allowed for _ in range(times)]
+
+
+class TestAtomicRateLimiter:
+    """Tests for AtomicRateLimiter."""
+
+    async def test_sliding_window_log(self, limiter, clock):
+        """The log allows exactly the limit within any window."""
+        check = partial(limiter.sliding_window_log, "rl:log", 3, 60)
+
+        assert await _allowed(check, 4) == [True, True, True, False]
+        denied = await check()
+        assert denied.remaining == 0
+        assert denied.retry_after == 60
+
+        clock.now += 61
+        result = await check()
+        assert result.allowed is True
+        assert result.remaining == 2
+
+    async def test_sliding_window_log_counts_requests_in_the_same_second(
+        self, limiter,
+    ):
+        """Requests at the same timestamp are all counted."""
+        check = partial(limiter.sliding_window_log, "rl:same", 2, 60)
+
+        assert await _allowed(check, 3) == [True, True, False]
+
+    async def test_sliding_window_counter_weights_previous_window(
+        self, limiter, clock,
+    ):
+        """Half way into a window, half of the previous window still counts."""
+        clock.now = 6_000.0  # start of a 60s window
+        check = partial(limiter.sliding_window_counter, "rl:counter", 10, 60)
+        assert await _allowed(check, 10) == [True] * 10
+
+        clock.now += 90  # half way into the next window
+        assert await _allowed(check, 6) == [True] * 5 + [False]
+
+    async def test_token_bucket(self, limiter, clock):
+        """New buckets start full and refill at the configured rate."""
+        check = partial(limiter.token_bucket, "rl:bucket", 2, 1.0)
+
+        assert await _allowed(check, 3) == [True, True, False]
+        clock.now += 1
+        assert await _allowed(check, 2) == [True, False]
+
+    async def test_gcra(self, limiter, clock):
+        """GCRA allows the burst at once, then one request per interval."""
+        check = partial(limiter.gcra, "rl:gcra", 60, 60, burst=3)
+
+        results = [await check() for _ in range(4)]
+        assert [result.allowed for result in results] == [True, True, True, False]
+        assert [result.remaining for result in results[:3]] == [2, 1, 0]
+        assert results[3].retry_after == 1
+
+        clock.now += 1
+        assert await _allowed(check, 2) == [True, False]
+
+    async def test_fixed_window_via_config(self, limiter, clock):
+        """``check`` maps the configured strategy onto its script."""
+        clock.now = 9_000.0
+        config = RateLimitConfig(
+            strategy=RateLimitStrategy.FIXED_WINDOW,
+            max_requests=2,
+            window_seconds=60,
+            child_safe_mode=False,
+        )
+
+        assert await _allowed(lambda: limiter.check("user", config), 3) == [
+            True,
+            True,
+            False,
+        ]
+        clock.now += 60
+        assert (await limiter.check("user", config)).allowed is True
+
+    async def test_child_safe_denial_blocks_key(self, limiter, clock):
+        """A denial under a child-safe config blocks the key for its duration."""
+        config = RateLimitConfig(
+            strategy=RateLimitStrategy.SLIDING_WINDOW,
+            max_requests=1,
+            window_seconds=60,
+            block_duration_seconds=300,
+            child_safe_mode=True,
+        )
+
+        assert (await limiter.check("child", config)).allowed is True
+        denied = await limiter.check("child", config)
+        assert denied.blocked_reason == "blocked_due_to_suspicious_activity"
+        assert denied.retry_after == 300
+
+        clock.now += 120  # the window has passed, the block has not
+        blocked = await limiter.check("child", config)
+        assert blocked.allowed is False
+        assert blocked.blocked_reason == "blocked"
+
+    async def test_concurrent_checks_never_exceed_limit(self, limiter):
+        """Concurrent checks for one key do not lose updates."""
+        results = await asyncio.gather(
+            *(limiter.sliding_window_log("rl:concurrent", 10, 60) for _ in range(50)),
+        )
+
+        assert sum(result.allowed for result in results) == 10
+
+    async def test_server_clock_by_default(self, redis_client):
+        """Without a clock the scripts use the Redis server time."""
+        limiter = AtomicRateLimiter(redis_client)
+
+        assert await _allowed(lambda: limiter.gcra("rl:server", 1, 60, 1), 2) == [
+            True,
+            False,
+        ]
+
+    async def test_one_script_call_per_check(self):
+        """Each check is a single script invocation with both keys."""
+        script = AsyncMock(return_value=[1, 4, 1_000, 0, 0])
+        redis_client = MagicMock()
+        redis_client.register_script.return_value = script
+        limiter = AtomicRateLimiter(redis_client)
+
+        result = await limiter.sliding_window_counter("rl:one", 5, 60)
+
+        assert result.allowed is True
+        assert result.remaining == 4
+        script.assert_awaited_once()
+        assert script.await_args.kwargs["keys"] == ["rl:one", "rl:one:blocked"]
+
+
+class TestComprehensiveRateLimiterAtomic:
+    """ComprehensiveRateLimiter checks through the atomic scripts."""
+
+    @pytest.fixture
+    def audit(self):
+        audit = MagicMock()
+        audit.log_rate_limit_event = AsyncMock()
+        audit.log_security_event = AsyncMock()
+        with patch(
+            "src.infrastructure.security.rate_limiter.service.get_audit_integration",
+            return_value=audit,
+        ), patch(
+            "src.infrastructure.security.rate_limiter.child_safety.get_audit_integration",
+            return_value=audit,
+        ):
+            yield audit
+
+    async def test_uses_redis_scripts(self, audit, redis_client):
+        from src.infrastructure.security.rate_limiter.service import (
+            ComprehensiveRateLimiter,
+        )
+
+        rate_limiter = ComprehensiveRateLimiter(redis_client)
+        results = [
+            await rate_limiter.check_rate_limit("child-1", "child_interaction")
+            for _ in range(12)
+        ]
+
+        assert [result.allowed for result in results] == [True] * 10 + [False] * 2
+        assert results[10].child_safety_triggered is True
+        assert results[11].blocked_reason == "blocked"
+        assert rate_limiter.storage.local_state == {}
+        assert await redis_client.exists("rate_limit:blocked:child-1")
+        assert audit.log_rate_limit_event.await_count == 11
+
+    async def test_repeated_denials_block_the_key(self, audit, redis_client):
+        from src.infrastructure.security.rate_limiter.service import (
+            ComprehensiveRateLimiter,
+        )
+
+        rate_limiter = ComprehensiveRateLimiter(redis_client)
+        rate_limiter.configs["test"] = RateLimitConfig(
+            strategy=RateLimitStrategy.SLIDING_WINDOW,
+            max_requests=1,
+            window_seconds=60,
+            block_duration_seconds=300,
+            child_safe_mode=False,
+        )
+        results = [
+            await rate_limiter.check_rate_limit("user-1", "test") for _ in range(6)
+        ]
+
+        # One allowed request, then more than 3 times the limit in denials
+        assert [result.allowed for result in results] == [True] + [False] * 5
+        assert [result.blocked_reason for result in results[1:4]] == [None] * 3
+        assert results[4].blocked_reason == "blocked_due_to_suspicious_activity"
+        assert results[4].retry_after == 300
+        assert results[5].blocked_reason == "blocked"
+        assert results[4].child_safety_triggered is False
+        assert rate_limiter.storage.local_state == {}
+
+    async def test_falls_back_to_local_state_when_redis_fails(self, audit):
+        from src.infrastructure.security.rate_limiter.service import (
+            ComprehensiveRateLimiter,
+        )
+
+        redis_client = MagicMock()
+        redis_client.register_script.return_value = AsyncMock(
+            side_effect=ConnectionError("down"),
+        )
+        rate_limiter = ComprehensiveRateLimiter(redis_client)
+
+        result = await rate_limiter.check_rate_limit("user-1", "child_data_access")
+
+        assert result.allowed is True
+        assert "user-1" in rate_limiter.storage.local_state
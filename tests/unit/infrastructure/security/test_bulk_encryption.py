@@ -0,0 +1,168 @@
+"""Tests for batch and envelope encryption in RobustEncryptionService."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.security.encryption.robust_encryption_service import (
+    ENVELOPE_PREFIX,
+    EncryptionConfig,
+    EncryptionPolicy,
+    RobustEncryptionService,
+)
+
+
+def _service(**options) -> RobustEncryptionService:
+    service = RobustEncryptionService(EncryptionConfig(key_iterations=1000, **options))
+    service.audit_integration.log_security_event = AsyncMock()
+    return service
+
+
+@pytest.fixture
+async def service():
+    return _service()
+
+
+def _audit_events(service) -> list[str]:
+    return [
+        call.kwargs["event_type"]
+        for call in service.audit_integration.log_security_event.await_args_list
+    ]
+
+
+class TestEncryptMany:
+    """Tests for encrypting batches with the service key."""
+
+    async def test_round_trip(self, service):
+        values = [f"note {i}" for i in range(10)]
+
+        encrypted = await service.encrypt_many(values)
+        decrypted = await service.decrypt_many([result.data for result in encrypted])
+
+        assert all(result.success for result in encrypted)
+        assert [result.data for result in decrypted] == values
+
+    async def test_compatible_with_single_calls(self, service):
+        encrypted = await service.encrypt_many(["favourite colour: blue"])
+        single = await service.encrypt("favourite animal: fox")
+
+        assert (await service.decrypt(encrypted[0].data)).data == "favourite colour: blue"
+        decrypted = await service.decrypt_many([single.data])
+        assert decrypted[0].data == "favourite animal: fox"
+
+    async def test_one_audit_record_per_batch(self, service):
+        await service.encrypt_many(["a", "b", "c"], context={"job": "export"})
+
+        service.audit_integration.log_security_event.assert_awaited_once()
+        details = service.audit_integration.log_security_event.await_args.kwargs[
+            "details"
+        ]
+        assert details["count"] == 3
+        assert details["failed"] == 0
+        assert details["job"] == "export"
+        assert _audit_events(service) == ["encryption_batch_encryption_success"]
+
+    async def test_invalid_items_fail_alone(self, service):
+        results = await service.encrypt_many(["kept", ""])
+
+        assert results[0].success
+        assert not results[1].success
+        assert _audit_events(service) == ["encryption_batch_encryption_failed"]
+
+    async def test_optional_policy_passes_values_through(self, service):
+        results = await service.encrypt_many(
+            ["", "x" * 20], policy=EncryptionPolicy.OPTIONAL
+        )
+        decrypted = await service.decrypt_many(
+            ["plain text", results[1].data], policy=EncryptionPolicy.OPTIONAL
+        )
+
+        assert results[0].success and results[0].data == ""
+        assert [result.data for result in decrypted] == ["plain text", "x" * 20]
+
+    async def test_unknown_key_fails_every_item(self, service):
+        results = await service.encrypt_many(["a", "b"], key_id="missing")
+
+        assert [result.success for result in results] == [False, False]
+        assert "missing" in results[0].error
+
+    async def test_large_batches_run_in_chunks(self):
+        service = _service(batch_parallel_threshold=8, batch_chunk_size=5)
+        values = [f"value {i}" for i in range(23)]
+
+        encrypted = await service.encrypt_many(values)
+        decrypted = await service.decrypt_many([result.data for result in encrypted])
+
+        assert [result.data for result in decrypted] == values
+        assert service._batch_executor is not None
+
+    async def test_tampered_value_fails_alone(self, service):
+        encrypted = [result.data for result in await service.encrypt_many(["a", "b"])]
+        encrypted[0] = encrypted[0][:-4] + "AAA="
+
+        results = await service.decrypt_many(encrypted)
+
+        assert not results[0].success
+        assert results[1].data == "b"
+
+
+class TestEnvelopeEncryption:
+    """Tests for per-child data keys."""
+
+    async def test_round_trip_for_the_child(self, service):
+        encrypted = await service.encrypt_many(["Emma", "allergic to nuts"], "child-1")
+        ciphertexts = [result.data for result in encrypted]
+
+        decrypted = await service.decrypt_many(ciphertexts, "child-1")
+
+        assert all(value.startswith(ENVELOPE_PREFIX) for value in ciphertexts)
+        assert [result.data for result in decrypted] == ["Emma", "allergic to nuts"]
+
+    async def test_other_child_cannot_decrypt(self, service):
+        encrypted = await service.encrypt_many(["Emma"], "child-1")
+
+        results = await service.decrypt_many([encrypted[0].data], "child-2")
+
+        assert not results[0].success
+
+    async def test_data_key_reused_until_it_expires(self):
+        service = _service(data_key_max_uses=3)
+        first = await service.encrypt_many(["a", "b"], "child-1")
+        second = await service.encrypt_many(["c"], "child-1")
+        third = await service.encrypt_many(["d"], "child-1")
+
+        def wrapped(result):
+            return result.data[len(ENVELOPE_PREFIX) :].rpartition(":")[0]
+
+        assert wrapped(first[0]) == wrapped(first[1]) == wrapped(second[0])
+        assert wrapped(third[0]) != wrapped(first[0])
+        decrypted = await service.decrypt_many(
+            [first[0].data, third[0].data], "child-1"
+        )
+        assert [result.data for result in decrypted] == ["a", "d"]
+
+    async def test_data_keys_unwrapped_once(self, service):
+        encrypted = await service.encrypt_many(["a", "b", "c"], "child-1")
+        service._unwrapped_keys.clear()
+        unwrap = service._unwrap
+        calls = []
+
+        def _unwrap(wrapped, child_id):
+            calls.append(wrapped)
+            return unwrap(wrapped, child_id)
+
+        service._unwrap = _unwrap
+        await service.decrypt_many([result.data for result in encrypted], "child-1")
+        await service.decrypt_many([result.data for result in encrypted], "child-1")
+
+        assert len(calls) == 1
+
+    async def test_forgotten_keys_still_decrypt_from_the_wrapped_key(self, service):
+        encrypted = await service.encrypt_many(["a"], "child-1")
+        service.forget_data_keys("child-1")
+
+        assert not service._unwrapped_keys
+        results = await service.decrypt_many([encrypted[0].data], "child-1")
+
+        assert results[0].data == "a"
+        assert service.get_encryption_status()["cached_data_keys"] == 0
@@ -0,0 +1,192 @@
+"""Tests for off-loop password hashing with PasswordHashingPool."""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import bcrypt
+import pytest
+
+from src.infrastructure.security import password_hasher
+from src.infrastructure.security.auth.real_auth_service import RealAuthService
+from src.infrastructure.security.core import real_auth_service
+from src.infrastructure.security.password_hasher import (
+    HashingPoolSaturatedError,
+    PasswordHasher,
+    PasswordHashingPool,
+    bcrypt_cost,
+)
+
+
+def _settings(rounds: int = 4):
+    return SimpleNamespace(
+        security=SimpleNamespace(PASSWORD_MIN_LENGTH=8, PASSWORD_HASH_ROUNDS=rounds),
+    )
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashingPool(executor=ThreadPoolExecutor(max_workers=2))
+    yield pool
+    pool.executor.shutdown()
+
+
+class TestPasswordHashingPool:
+    """Tests for the bounded hashing pool."""
+
+    async def test_hash_and_verify_in_worker_processes(self):
+        pool = PasswordHashingPool(workers=2)
+        hasher = PasswordHasher(_settings(), pool=pool)
+        try:
+            hashed = await hasher.hash_password_async("correct horse")
+
+            assert bcrypt_cost(hashed) == 4
+            assert await hasher.verify_password_async("correct horse", hashed)
+            assert not await hasher.verify_password_async("wrong horse", hashed)
+            assert hasher.verify_password("correct horse", hashed)
+        finally:
+            pool.shutdown()
+
+    async def test_rejects_when_saturated(self):
+        release = threading.Event()
+        pool = PasswordHashingPool(
+            max_pending=2,
+            executor=ThreadPoolExecutor(max_workers=1),
+        )
+        blocked = [asyncio.ensure_future(pool.run("hash", release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(HashingPoolSaturatedError):
+            await pool.run("hash", release.wait)
+
+        release.set()
+        await asyncio.gather(*blocked)
+        assert pool.pending == 0
+        assert await pool.run("hash", release.wait)
+        pool.executor.shutdown()
+
+    async def test_broken_pool_is_replaced_once(self, monkeypatch):
+        """Tasks failing on the same broken pool start a single new one."""
+
+        class FakeProcessPool:
+            instances = []
+
+            def __init__(self, max_workers):
+                self.broken = not FakeProcessPool.instances
+                self.shutdown = MagicMock()
+                FakeProcessPool.instances.append(self)
+
+            def submit(self, func, *args):
+                future = Future()
+                if self.broken:
+                    future.set_exception(BrokenProcessPool("worker died"))
+                else:
+                    future.set_result(func(*args))
+                return future
+
+        monkeypatch.setattr(password_hasher, "ProcessPoolExecutor", FakeProcessPool)
+        pool = PasswordHashingPool(workers=1)
+
+        results = await asyncio.gather(*(pool.run("hash", str, i) for i in range(3)))
+
+        assert results == ["0", "1", "2"]
+        broken, fresh = FakeProcessPool.instances
+        broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert pool.executor is fresh
+
+    async def test_policy_is_checked_before_queueing(self, pool):
+        hasher = PasswordHasher(_settings(), pool=pool)
+
+        with pytest.raises(ValueError):
+            await hasher.hash_password_async("short")
+        assert pool.pending == 0
+
+    async def test_missing_hash_still_costs_a_check(self, pool):
+        hasher = PasswordHasher(_settings(), pool=pool)
+        pool.run = AsyncMock(wraps=pool.run)
+
+        assert not await hasher.verify_password_async("password123", None)
+
+        operations = [call.args[0] for call in pool.run.await_args_list]
+        assert operations == ["hash", "verify"]
+
+    async def test_malformed_hash_does_not_match(self, pool):
+        hasher = PasswordHasher(_settings(), pool=pool)
+
+        assert not await hasher.verify_password_async("password123", "not-a-hash")
+
+
+class TestRehashOnLogin:
+    """Tests for rehashing passwords when the configured cost changes."""
+
+    async def test_rehash_after_cost_change(self, pool):
+        old_hash = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=4)).decode()
+        hasher = PasswordHasher(_settings(rounds=5), pool=pool)
+
+        valid, new_hash = await hasher.verify_and_update("password123", old_hash)
+
+        assert valid
+        assert bcrypt_cost(new_hash) == 5
+        assert bcrypt.checkpw(b"password123", new_hash.encode())
+
+    async def test_no_rehash_at_the_configured_cost(self, pool):
+        hashed = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=4)).decode()
+        hasher = PasswordHasher(_settings(), pool=pool)
+
+        assert await hasher.verify_and_update("password123", hashed) == (True, None)
+        assert await hasher.verify_and_update("password124", hashed) == (False, None)
+
+    async def test_login_stores_the_new_hash(self, pool):
+        old_hash = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=4)).decode()
+        user = SimpleNamespace(password_hash=old_hash, is_active=True)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = user
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        db.commit = AsyncMock()
+        service = RealAuthService(
+            settings=MagicMock(),
+            password_hasher=PasswordHasher(_settings(rounds=5), pool=pool),
+            token_service=MagicMock(),
+        )
+
+        assert await service.authenticate("parent@example.com", "password123", db) is user
+
+        assert bcrypt_cost(user.password_hash) == 5
+        db.commit.assert_awaited_once()
+
+    async def test_saturation_reaches_the_login_handler(self):
+        pool = MagicMock()
+        pool.run = AsyncMock(side_effect=HashingPoolSaturatedError("full"))
+        user = SimpleNamespace(password_hash="$2b$04$" + "a" * 53, is_active=True)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = user
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        service = RealAuthService(
+            settings=MagicMock(),
+            password_hasher=PasswordHasher(_settings(), pool=pool),
+            token_service=MagicMock(),
+        )
+
+        with pytest.raises(HashingPoolSaturatedError):
+            await service.authenticate("parent@example.com", "password123", db)
+
+    async def test_saturation_reaches_the_password_change_handler(self, monkeypatch):
+        monkeypatch.setattr(real_auth_service, "get_settings", MagicMock)
+        pool = MagicMock()
+        pool.run = AsyncMock(side_effect=HashingPoolSaturatedError("full"))
+        user = SimpleNamespace(password_hash="$2b$04$" + "a" * 53)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = user
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        db.rollback = AsyncMock()
+        service = real_auth_service.ProductionAuthService(database_session=db)
+        service.password_hasher = PasswordHasher(_settings(), pool=pool)
+
+        with pytest.raises(HashingPoolSaturatedError):
+            await service.change_password("user-1", "password123", "password456")
@@ -0,0 +1,245 @@
+"""Tests for the cached JWT verification path and token revocation."""
+
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.infrastructure.security.auth import token_verification
+from src.infrastructure.security.auth.token_verification import (
+    RevocationBloomFilter,
+    RevocationList,
+    VerifiedTokenCache,
+)
+from src.infrastructure.security.token_service import TokenService
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+async def revocations(server):
+    revocations = RevocationList(fakeredis.FakeAsyncRedis(server=server), capacity=1000)
+    await revocations.start()
+    yield revocations
+    await revocations.close()
+
+
+@pytest.fixture
+def token_service():
+    settings = Mock()
+    settings.security.SECRET_KEY = "test_secret_key_that_is_longer_than_32_characters"
+    settings.security.JWT_ALGORITHM = "HS256"
+    settings.security.ACCESS_TOKEN_EXPIRE_MINUTES = 15
+    settings.security.REFRESH_TOKEN_EXPIRE_DAYS = 7
+    service = TokenService(settings)
+    service.token_cache = VerifiedTokenCache()
+    service.revocations = RevocationList(capacity=1000)
+    return service
+
+
+def _later(seconds: float):
+    now = time.time()
+    return patch.object(token_verification, "time", Mock(time=lambda: now + seconds))
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+class TestVerifiedTokenCache:
+    """Tests for the LRU of verified tokens."""
+
+    def test_hit_until_expiry(self):
+        cache = VerifiedTokenCache()
+        cache.put("token", {"sub": "user", "exp": time.time() + 60})
+
+        assert cache.get("token")["sub"] == "user"
+        assert cache.get("other") is None
+
+        with _later(61):
+            assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_tokens_without_exp_are_not_kept(self):
+        cache = VerifiedTokenCache()
+        cache.put("token", {"sub": "user"})
+        cache.put("expired", {"sub": "user", "exp": time.time() - 1})
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = VerifiedTokenCache(max_size=2)
+        exp = time.time() + 60
+        cache.put("a", {"exp": exp})
+        cache.put("b", {"exp": exp})
+        cache.get("a")
+        cache.put("c", {"exp": exp})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+    def test_namespaces_are_separate(self):
+        cache = VerifiedTokenCache()
+        cache.put("token", {"exp": time.time() + 60}, namespace="key-1")
+
+        assert cache.get("token", namespace="key-2") is None
+
+    def test_payload_copies_are_returned(self):
+        cache = VerifiedTokenCache()
+        cache.put("token", {"role": "parent", "exp": time.time() + 60})
+        cache.get("token")["role"] = "admin"
+
+        assert cache.get("token")["role"] == "parent"
+
+
+class TestRevocationBloomFilter:
+    """Tests for the bloom filter of revoked token ids."""
+
+    def test_no_false_negatives(self):
+        bloom = RevocationBloomFilter(capacity=1000, error_rate=0.001)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        assert all(f"jti-{i}" in bloom for i in range(1000))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+        assert false_positives < 50
+
+    async def test_bits_match_redis_bitmaps(self):
+        client = fakeredis.FakeAsyncRedis()
+        bloom = RevocationBloomFilter(capacity=100, error_rate=0.01)
+        for position in bloom.positions("jti"):
+            await client.setbit("bloom", position, 1)
+
+        loaded = RevocationBloomFilter(100, 0.01, await client.get("bloom"))
+
+        assert "jti" in loaded
+
+
+class TestRevocationList:
+    """Tests for revocations shared through Redis."""
+
+    async def test_revocation_reaches_other_instances(self, server, revocations):
+        other = RevocationList(fakeredis.FakeAsyncRedis(server=server), capacity=1000)
+        await other.start()
+        try:
+            await revocations.revoke("jti-1", time.time() + 60)
+
+            await _until(lambda: other.is_revoked("jti-1"))
+            assert await other.is_revoked_async("jti-1")
+            assert not other.is_revoked("jti-2")
+        finally:
+            await other.close()
+
+    async def test_new_instances_load_the_filter(self, server, revocations):
+        await revocations.revoke("jti-1", time.time() + 60)
+
+        late = RevocationList(fakeredis.FakeAsyncRedis(server=server), capacity=1000)
+        await late.start()
+        try:
+            assert late.might_be_revoked("jti-1")
+            assert await late.is_revoked_async("jti-1")
+        finally:
+            await late.close()
+
+    async def test_listener_resyncs_after_an_error(self, server, revocations):
+        other = RevocationList(fakeredis.FakeAsyncRedis(server=server), capacity=1000)
+        other.poll_seconds = 0.01
+        await other.start()
+        revoked = asyncio.Event()
+
+        async def _drop_connection(**kwargs):
+            await revoked.wait()
+            raise ConnectionError("connection lost")
+
+        try:
+            other._pubsub.get_message = _drop_connection
+            await asyncio.sleep(10 * other.poll_seconds)
+            # Revocations published while the subscription is broken are lost
+            await other._pubsub.unsubscribe(other.channel)
+            await revocations.revoke("jti-1", time.time() + 60)
+            revoked.set()
+
+            await _until(lambda: other.might_be_revoked("jti-1"))
+            assert await other.is_revoked_async("jti-1")
+
+            await revocations.revoke("jti-2", time.time() + 60)
+            await _until(lambda: other.is_revoked("jti-2"))
+        finally:
+            await other.close()
+
+    async def test_start_survives_redis_being_down(self, server, revocations):
+        other = RevocationList(fakeredis.FakeAsyncRedis(server=server), capacity=1000)
+        other.poll_seconds = 0.01
+        server.connected = False
+
+        await other.start()
+
+        try:
+            server.connected = True
+            await revocations.revoke("jti-1", time.time() + 60)
+            await _until(lambda: other.might_be_revoked("jti-1"))
+        finally:
+            await other.close()
+
+    async def test_filter_hits_are_confirmed_against_redis(self, revocations):
+        # A false positive: in the filter, but never revoked
+        revocations._filter(revocations._generation()).add("jti-valid")
+
+        assert revocations.might_be_revoked("jti-valid")
+        assert not await revocations.is_revoked_async("jti-valid")
+
+    async def test_revocations_end_with_the_token(self, revocations):
+        await revocations.revoke("jti-1", time.time() + 60)
+
+        with _later(61):
+            assert not revocations.is_revoked("jti-1")
+
+    async def test_without_redis_revocations_stay_local(self):
+        revocations = RevocationList(capacity=1000)
+        await revocations.revoke("jti-1", time.time() + 60)
+
+        assert revocations.is_revoked("jti-1")
+        assert await revocations.is_revoked_async("jti-1")
+
+
+class TestTokenServiceFastPath:
+    """Tests for verify_token with the cache and the revocation list."""
+
+    async def test_repeat_verifications_skip_decoding(self, token_service):
+        token = token_service.create_access_token({"id": "user_123", "role": "parent"})
+
+        with patch("jwt.decode", wraps=__import__("jwt").decode) as decode:
+            first = await token_service.verify_token(token)
+            second = await token_service.verify_token(token)
+
+        assert decode.call_count == 1
+        assert first == second
+        assert first["sub"] == "user_123"
+        assert first["jti"]
+
+    async def test_tampered_tokens_are_still_rejected(self, token_service):
+        token = token_service.create_access_token({"id": "user_123"})
+        await token_service.verify_token(token)
+
+        with pytest.raises(ValueError):
+            await token_service.verify_token(token[:-2] + "xx")
+
+    async def test_revoked_tokens_are_rejected(self, token_service):
+        token = token_service.create_access_token({"id": "user_123"})
+        other = token_service.create_access_token({"id": "user_123"})
+        await token_service.verify_token(token)
+
+        await token_service.revoke_token(token)
+
+        with pytest.raises(ValueError, match="revoked"):
+            await token_service.verify_token(token)
+        assert (await token_service.verify_token(other))["sub"] == "user_123"
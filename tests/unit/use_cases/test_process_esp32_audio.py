@@ -0,0 +1,187 @@
+"""Tests for ProcessESP32AudioUseCase stage scheduling."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.application.dto.ai_response import AIResponse
+from src.application.dto.esp32_request import ESP32Request
+from src.application.services.ai.context_window import (
+    ContextWindowManager,
+    InMemoryConversationContextStore,
+)
+from src.application.use_cases.process_esp32_audio import (
+    MAX_INTERACTION_SUMMARY_CHARS,
+    UNSAFE_AUDIO_REPLY,
+    ProcessESP32AudioUseCase,
+)
+from src.domain.value_objects.safety_level import SafetyLevel
+from src.infrastructure.messaging.write_behind_queue import WriteBehindQueue
+
+STAGE_DELAY = 0.05
+
+
+def _delayed(value):
+    async def _run(*args, **kwargs):
+        await asyncio.sleep(STAGE_DELAY)
+        return value
+
+    return AsyncMock(side_effect=_run)
+
+
+@pytest.fixture
+def child_profile():
+    preferences = SimpleNamespace(
+        voice_preference="teddy_voice",
+        vocabulary_size=100,
+        interaction_history_summary="",
+        emotional_tendencies={},
+    )
+    return SimpleNamespace(id=uuid4(), preferences=preferences)
+
+
+@pytest.fixture
+def dependencies(child_profile):
+    audio_processing_service = MagicMock()
+    audio_processing_service.process_audio_input = _delayed(
+        ("what is a volcano", SafetyLevel.NONE),
+    )
+    audio_processing_service.generate_audio_response = AsyncMock(return_value=b"mp3")
+    ai_orchestration_service = MagicMock()
+    ai_orchestration_service.get_ai_response = AsyncMock(
+        return_value=AIResponse(
+            response_text="A volcano is a mountain.",
+            audio_response=b"",
+            emotion="curious",
+            sentiment=0.5,
+            safe=True,
+        ),
+    )
+    conversation_service = MagicMock()
+    conversation_service.get_conversation_summaries = _delayed(["dinosaurs"])
+    conversation_service.start_new_conversation = AsyncMock(
+        return_value=SimpleNamespace(id=uuid4()),
+    )
+    conversation_service.update_conversation_analysis = AsyncMock()
+    child_repository = MagicMock()
+    child_repository.get_by_id = _delayed(child_profile)
+    child_repository.save = AsyncMock()
+    return {
+        "audio_processing_service": audio_processing_service,
+        "ai_orchestration_service": ai_orchestration_service,
+        "conversation_service": conversation_service,
+        "child_repository": child_repository,
+    }
+
+
+class TestProcessESP32Audio:
+    """Test concurrent reads and off-path writes."""
+
+    async def test_reads_run_concurrently_with_transcription(
+        self,
+        dependencies,
+        child_profile,
+    ):
+        use_case = ProcessESP32AudioUseCase(**dependencies)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        response = await use_case.execute(
+            ESP32Request(child_id=child_profile.id, audio_data=b"pcm"),
+        )
+        elapsed = loop.time() - started
+
+        assert response.audio_response == b"mp3"
+        assert elapsed < STAGE_DELAY * 2.5
+        dependencies["ai_orchestration_service"].get_ai_response.assert_awaited_once()
+        history = dependencies["ai_orchestration_service"].get_ai_response.await_args.args[1]
+        assert history == ["dinosaurs"]
+        dependencies["child_repository"].save.assert_awaited_once_with(child_profile)
+
+    async def test_writes_go_through_write_behind_queue(
+        self,
+        dependencies,
+        child_profile,
+    ):
+        queue = WriteBehindQueue()
+        use_case = ProcessESP32AudioUseCase(**dependencies, write_behind_queue=queue)
+
+        await use_case.execute(ESP32Request(child_id=child_profile.id, audio_data=b"pcm"))
+
+        dependencies["child_repository"].save.assert_not_awaited()
+        assert len(await queue.journal.pending()) == 1
+
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+        dependencies["conversation_service"].start_new_conversation.assert_awaited_once()
+        dependencies["child_repository"].save.assert_awaited_once_with(child_profile)
+        assert child_profile.preferences.emotional_tendencies["curious"] == 0.5
+
+    async def test_turns_go_to_context_window(self, dependencies, child_profile):
+        context_window = ContextWindowManager(
+            InMemoryConversationContextStore(),
+            max_recent_turns=1,
+            summarize_every=1,
+        )
+        use_case = ProcessESP32AudioUseCase(**dependencies, context_window=context_window)
+
+        for _ in range(2):
+            await use_case.execute(ESP32Request(child_id=child_profile.id, audio_data=b"pcm"))
+
+        context = await context_window.get_context(child_profile.id)
+        assert context.recent_turns[0].child_text == "what is a volcano"
+        assert context.rolling_summary == "what is a volcano / A volcano is a mountain."
+        assert child_profile.preferences.interaction_history_summary == context.rolling_summary
+
+    async def test_interaction_summary_is_bounded(self, dependencies, child_profile):
+        use_case = ProcessESP32AudioUseCase(**dependencies)
+        dependencies["child_repository"].get_by_id = AsyncMock(return_value=child_profile)
+        dependencies["audio_processing_service"].process_audio_input = AsyncMock(
+            return_value=("what is a volcano", SafetyLevel.NONE),
+        )
+        dependencies["conversation_service"].get_conversation_summaries = AsyncMock(
+            return_value=[],
+        )
+
+        for _ in range(100):
+            await use_case.execute(ESP32Request(child_id=child_profile.id, audio_data=b"pcm"))
+
+        summary = child_profile.preferences.interaction_history_summary
+        assert len(summary) == MAX_INTERACTION_SUMMARY_CHARS
+        assert summary.endswith("A volcano is a mountain.")
+
+    async def test_critical_audio_skips_ai_tts_and_writes(
+        self,
+        dependencies,
+        child_profile,
+    ):
+        dependencies["audio_processing_service"].process_audio_input = AsyncMock(
+            return_value=("bad", SafetyLevel.CRITICAL),
+        )
+        dependencies["child_repository"].get_by_id = AsyncMock(return_value=None)
+        use_case = ProcessESP32AudioUseCase(**dependencies)
+
+        response = await use_case.execute(
+            ESP32Request(child_id=child_profile.id, audio_data=b"pcm"),
+        )
+
+        assert response.response_text == UNSAFE_AUDIO_REPLY
+        assert response.safe is False
+        dependencies["ai_orchestration_service"].get_ai_response.assert_not_awaited()
+        dependencies["audio_processing_service"].generate_audio_response.assert_not_awaited()
+        dependencies["child_repository"].save.assert_not_awaited()
+
+    async def test_missing_child_raises_404(self, dependencies):
+        dependencies["child_repository"].get_by_id = AsyncMock(return_value=None)
+        use_case = ProcessESP32AudioUseCase(**dependencies)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await use_case.execute(ESP32Request(child_id=uuid4(), audio_data=b"pcm"))
+
+        assert exc_info.value.status_code == 404
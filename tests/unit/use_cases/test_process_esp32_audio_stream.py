@@ -0,0 +1,183 @@
+"""Tests for the streaming mode of ProcessESP32AudioUseCase."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.application.dto.esp32_stream import StreamFrameType
+from src.application.services.ai.ai_orchestration_service import (
+    UNSAFE_INPUT_REPLY,
+)
+from src.application.use_cases.process_esp32_audio import (
+    UNSAFE_AUDIO_REPLY,
+    ProcessESP32AudioUseCase,
+)
+from src.domain.value_objects.safety_level import SafetyLevel
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def _stream(*sentences: str):
+    async def _generate(*args, **kwargs):
+        for sentence in sentences:
+            yield sentence
+
+    return _generate
+
+
+@pytest.fixture
+def child_profile():
+    preferences = SimpleNamespace(
+        voice_preference="teddy_voice",
+        vocabulary_size=100,
+        interaction_history_summary="",
+        emotional_tendencies={},
+    )
+    return SimpleNamespace(id=uuid4(), preferences=preferences)
+
+
+@pytest.fixture
+def audio_processing_service():
+    service = MagicMock()
+    service.process_audio_stream = AsyncMock(
+        return_value=("what is a volcano", SafetyLevel.NONE),
+    )
+
+    async def _stream_audio_response(text, voice_id):
+        yield b"audio:"
+        yield text.encode()
+
+    service.stream_audio_response = MagicMock(side_effect=_stream_audio_response)
+    return service
+
+
+@pytest.fixture
+def use_case(audio_processing_service, child_profile):
+    ai_orchestration_service = MagicMock()
+    ai_orchestration_service.is_text_safe = MagicMock(return_value=True)
+    ai_orchestration_service.stream_ai_response = _stream(
+        "A volcano is a mountain.",
+        "It can erupt with lava!",
+    )
+    conversation_service = MagicMock()
+    conversation_service.get_conversation_summaries = AsyncMock(
+        return_value=["we talked about dinosaurs"],
+    )
+    conversation_service.start_new_conversation = AsyncMock(
+        return_value=SimpleNamespace(id=uuid4()),
+    )
+    conversation_service.update_conversation_analysis = AsyncMock()
+    child_repository = MagicMock()
+    child_repository.get_by_id = AsyncMock(return_value=child_profile)
+    child_repository.save = AsyncMock()
+    return ProcessESP32AudioUseCase(
+        audio_processing_service=audio_processing_service,
+        ai_orchestration_service=ai_orchestration_service,
+        conversation_service=conversation_service,
+        child_repository=child_repository,
+    )
+
+
+class TestProcessESP32AudioStream:
+    """Test the streaming voice turn pipeline."""
+
+    async def test_streams_sentences_with_audio(self, use_case, child_profile):
+        frames = [
+            frame
+            async for frame in use_case.execute_stream(
+                child_profile.id,
+                _chunks(b"chunk-1", b"chunk-2"),
+                "en-US",
+            )
+        ]
+
+        assert [frame.frame_type for frame in frames] == [
+            StreamFrameType.TRANSCRIPT,
+            StreamFrameType.SENTENCE,
+            StreamFrameType.AUDIO,
+            StreamFrameType.AUDIO,
+            StreamFrameType.SENTENCE,
+            StreamFrameType.AUDIO,
+            StreamFrameType.AUDIO,
+            StreamFrameType.COMPLETE,
+        ]
+        assert frames[0].text == "what is a volcano"
+        assert frames[2].audio + frames[3].audio == b"audio:A volcano is a mountain."
+        assert frames[5].sequence == 1
+        assert frames[-1].text == "A volcano is a mountain. It can erupt with lava!"
+
+    async def test_records_turn_after_streaming(self, use_case, child_profile):
+        async for _ in use_case.execute_stream(
+            child_profile.id,
+            _chunks(b"chunk"),
+            "en-US",
+        ):
+            pass
+
+        use_case.conversation_service.start_new_conversation.assert_awaited_once()
+        use_case.child_repository.save.assert_awaited_once_with(child_profile)
+        assert "It can erupt with lava!" in (
+            child_profile.preferences.interaction_history_summary
+        )
+
+    async def test_critical_audio_is_not_sent_to_ai(
+        self,
+        use_case,
+        audio_processing_service,
+        child_profile,
+    ):
+        audio_processing_service.process_audio_stream.return_value = (
+            "bad words",
+            SafetyLevel.CRITICAL,
+        )
+
+        frames = [
+            frame
+            async for frame in use_case.execute_stream(
+                child_profile.id,
+                _chunks(b"chunk"),
+                "en-US",
+            )
+        ]
+
+        assert all(not frame.safe for frame in frames)
+        assert frames[-1].text == UNSAFE_AUDIO_REPLY
+        audio_processing_service.stream_audio_response.assert_not_called()
+        use_case.child_repository.save.assert_not_awaited()
+
+    async def test_unsafe_transcript_is_not_echoed(
+        self,
+        use_case,
+        audio_processing_service,
+        child_profile,
+    ):
+        use_case.ai_orchestration_service.is_text_safe.return_value = False
+
+        frames = [
+            frame
+            async for frame in use_case.execute_stream(
+                child_profile.id,
+                _chunks(b"chunk"),
+                "en-US",
+            )
+        ]
+
+        assert StreamFrameType.TRANSCRIPT not in [f.frame_type for f in frames]
+        assert all(not frame.safe for frame in frames)
+        assert frames[-1].text == UNSAFE_INPUT_REPLY
+        audio_processing_service.stream_audio_response.assert_not_called()
+
+    async def test_missing_child_raises_404(self, use_case):
+        use_case.child_repository.get_by_id.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            async for _ in use_case.execute_stream(uuid4(), _chunks(b"x"), "en-US"):
+                pass
+
+        assert exc_info.value.status_code == 404
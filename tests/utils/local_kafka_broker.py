@@ -0,0 +1,169 @@
+"""In-process single-node Kafka stand-in for event store tests.
+
+Implements the parts of the ``AIOKafkaProducer`` / ``AIOKafkaConsumer`` API
+the event store uses, with the same serializer arguments and the same
+key-to-partition stickiness. Patch ``AIOKafkaProducer`` and
+``AIOKafkaConsumer`` in the module under test with ``broker.producer`` and
+``broker.consumer``.
+"""
+
+import asyncio
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+from aiokafka.structs import RecordMetadata, TopicPartition
+
+
+@dataclass
+class LocalRecord:
+    topic: str
+    partition: int
+    offset: int
+    key: Any
+    value: Any
+
+
+class LocalKafkaBroker:
+    """Topics are created on first write with ``partitions`` partitions each."""
+
+    def __init__(self, partitions: int = 3, max_poll_records: int = 500) -> None:
+        self.partitions = partitions
+        self.max_poll_records = max_poll_records
+        self.topics: dict[str, list[list[tuple[bytes | None, bytes]]]] = {}
+        self.consumers: list["LocalConsumer"] = []
+
+    def producer(self, **config) -> "LocalProducer":
+        return LocalProducer(self, config)
+
+    def consumer(self, *topics, **config) -> "LocalConsumer":
+        consumer = LocalConsumer(self, config)
+        self.consumers.append(consumer)
+        return consumer
+
+    def end_offset(self, partition: TopicPartition) -> int:
+        return len(self.topics[partition.topic][partition.partition])
+
+
+class LocalProducer:
+    def __init__(self, broker: LocalKafkaBroker, config: dict) -> None:
+        self.broker = broker
+        self.key_serializer = config.get("key_serializer") or (lambda k: k)
+        self.value_serializer = config.get("value_serializer") or (lambda v: v)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def partitions_for(self, topic: str) -> set[int]:
+        self.broker.topics.setdefault(
+            topic,
+            [[] for _ in range(self.broker.partitions)],
+        )
+        return set(range(self.broker.partitions))
+
+    async def send(self, topic: str, value: Any = None, key: Any = None):
+        partitions = await self.partitions_for(topic)
+        key_bytes = self.key_serializer(key)
+        partition = zlib.crc32(key_bytes or b"") % len(partitions)
+        log = self.broker.topics[topic][partition]
+        log.append((key_bytes, self.value_serializer(value)))
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(
+            RecordMetadata(
+                topic,
+                partition,
+                TopicPartition(topic, partition),
+                len(log) - 1,
+                -1,
+                0,
+                0,
+            ),
+        )
+        return future
+
+
+class LocalConsumer:
+    def __init__(self, broker: LocalKafkaBroker, config: dict) -> None:
+        self.broker = broker
+        self.key_deserializer = config.get("key_deserializer") or (lambda k: k)
+        self.value_deserializer = config.get("value_deserializer") or (lambda v: v)
+        self.max_poll_records = config.get("max_poll_records", broker.max_poll_records)
+        self.fetched = 0
+        self._subscription: list[str] | None = None
+        self._assignment: list[TopicPartition] = []
+        self._positions: dict[TopicPartition, int] = {}
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def subscribe(self, topics=(), pattern=None) -> None:
+        self._subscription = list(topics)
+
+    def assign(self, partitions) -> None:
+        self._subscription = None
+        self._assignment = list(partitions)
+        self._positions = {partition: 0 for partition in self._assignment}
+
+    def assignment(self) -> set[TopicPartition]:
+        if self._subscription is not None:
+            # Subscriptions pick up topics as they are created
+            for topic in self._subscription:
+                for partition in range(len(self.broker.topics.get(topic, []))):
+                    tp = TopicPartition(topic, partition)
+                    if tp not in self._positions:
+                        self._assignment.append(tp)
+                        self._positions[tp] = 0
+        return set(self._assignment)
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self._positions[partition] = offset
+
+    async def position(self, partition: TopicPartition) -> int:
+        return self._positions[partition]
+
+    def partitions_for_topic(self, topic: str) -> set[int] | None:
+        if topic not in self.broker.topics:
+            return None
+        return set(range(len(self.broker.topics[topic])))
+
+    async def topics(self) -> set[str]:
+        return set(self.broker.topics)
+
+    async def beginning_offsets(self, partitions) -> dict[TopicPartition, int]:
+        return {partition: 0 for partition in partitions}
+
+    async def end_offsets(self, partitions) -> dict[TopicPartition, int]:
+        return {partition: self.broker.end_offset(partition) for partition in partitions}
+
+    async def getmany(self, *partitions, timeout_ms: int = 0, max_records=None):
+        limit = max_records or self.max_poll_records
+        batches = {}
+        for partition in partitions or sorted(self.assignment()):
+            position = self._positions[partition]
+            log = self.broker.topics[partition.topic][partition.partition]
+            chunk = log[position : position + limit]
+            if not chunk:
+                continue
+            batches[partition] = [
+                LocalRecord(
+                    partition.topic,
+                    partition.partition,
+                    position + i,
+                    self.key_deserializer(key),
+                    self.value_deserializer(value),
+                )
+                for i, (key, value) in enumerate(chunk)
+            ]
+            self._positions[partition] = position + len(chunk)
+            self.fetched += len(chunk)
+        if not batches:
+            await asyncio.sleep(min(timeout_ms, 10) / 1000)
+        else:
+            await asyncio.sleep(0)
+        return batches
@@ -0,0 +1,49 @@
+"""Event-loop lag probe used by the performance benchmarks."""
+
+import asyncio
+import statistics
+import time
+
+
+class EventLoopLagProbe:
+    """Measures how late a periodic timer fires on the running loop.
+
+    A blocked loop shows up as ticks that fire long after they were due;
+    a healthy loop keeps the lag close to zero regardless of load.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples_ms: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "EventLoopLagProbe":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Let a tick that was due while the loop was blocked record its lag.
+        await asyncio.sleep(self.interval * 2)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            due = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples_ms.append(max(0.0, (time.perf_counter() - due) * 1000))
+
+    @property
+    def max_ms(self) -> float:
+        return max(self.samples_ms, default=0.0)
+
+    def percentile_ms(self, percentile: float) -> float:
+        if not self.samples_ms:
+            return 0.0
+        if len(self.samples_ms) == 1:
+            return self.samples_ms[0]
+        cut_points = statistics.quantiles(self.samples_ms, n=100, method="inclusive")
+        return cut_points[min(98, max(0, int(percentile) - 1))]